@@ -3,6 +3,41 @@
 """ Blue Gecko BGAPI/BGLib implementation
 
 Changelog:
+    2026-10-18 - Added parse_bytes() for parsing whole read chunks in one pass
+               - Added buffered_read mode to check_activity()
+               - Replaced the if/elif parser chain with table-driven dispatch
+               - Decoders use precompiled struct.Struct objects and unpack_from()
+               - Added zero_copy mode passing memoryviews for uint8array fields
+               - Packets are not decoded for events without handlers
+               - Slotted per-message argument records (BGAPIArgs) replace event dicts
+               - Add iter_frames() and iter_packets() pull-style iterators
+               - Add on_raw_frame hook with raw_frame_filter and raw_frame_only
+               - Add resync mode with plausibility checks and partial-frame timeouts
+               - Add start_reader()/stop() background reader thread with optional event queue
+               - Add AsyncBGLib asyncio protocol with awaitable commands and event streams
+               - Add submit() response-correlated command queue
+               - Add blocking call() returning the matched response args
+               - Add BGLibPool for staggered scanning across several adapters
+               - Add BGLibProcessPool with per-adapter processes and BGAPIRing shared-memory records
+               - Add BGAPIBridge socket server and BGAPISocketPort client port
+               - Add send_many() for coalesced command writes
+               - Add BGAPISimulator device simulator generated from the API definitions
+               - Add start_capture() and BGAPIReplay for timestamped capture and replay
+               - Cache event handlers per object and fire them from a tuple, so dispatch no longer allocates per packet
+               - Add subscribe_attribute() to route notifications by connection and handle before decoding
+               - Add on_any() and off_any() for wildcard handlers on decoded messages or raw frames
+               - Add BGAPIExecutorHandler to run handlers on an executor, in order per key
+               - Add on_batch() to deliver an event in lists or columnar blocks
+               - parse_bytes() can be re-entered from handlers (e.g. send_command() followed by check_activity() or call())
+               - check_activity() called from a handler parses the rest of that handler's chunk first
+               - call() from a handler on the reader thread reads the port itself instead of waiting on the blocked reader
+               - The reader thread survives handler exceptions, clears itself when it exits and no longer spins on non-blocking ports
+               - zero_copy passes memoryviews on every parse path
+               - Resolving a command future no longer fails when it was cancelled on another thread
+               - Faster key lookup and membership tests on argument records
+               - send_many() keeps command order with submit() and call()
+               - raw_frame_only no longer stops submit() and call() from getting their responses
+               - Captures made through parse() store one record per packet instead of one per byte
     2020-08-03 - Ported to Blue Gecko (Kris Young)
     2017-06-26 - Moved to python3
     2013-05-04 - Fixed single-item struct.unpack returns (@zwasson on Github)
@@ -50,7 +85,24 @@ __license__ = "MIT"
 __version__ = "2013-05-04"
 __email__ = "jeff@rowberg.net"
 
+import asyncio
+import concurrent.futures
+import heapq
+import itertools
+import multiprocessing
+import operator
+import os
+import queue
+import random
+import select
+import socket
 import struct
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Mapping
+from multiprocessing import shared_memory
 
 
 # thanks to Masaaki Shibata for Python event handler code
@@ -58,13 +110,27 @@ import struct
 
 class BGAPIEvent(object):
 
+    name = None
+    kind = None
+
     def __init__(self, doc=None):
         self.__doc__ = doc
 
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.kind = 'response' if '_rsp_' in name else 'event'
+
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        return BGAPIEventHandler(self, obj)
+        try:
+            return obj.__eventhandlers__[self]
+        except AttributeError:
+            obj.__eventhandlers__ = {}
+        except KeyError:
+            pass
+        handler = obj.__eventhandlers__[self] = BGAPIEventHandler(self, obj)
+        return handler
 
     def __set__(self, obj, value):
         pass
@@ -72,20 +138,40 @@ class BGAPIEvent(object):
 
 class BGAPIEventHandler(object):
 
+    """The handlers of one event on one object.
+
+    There is one of these per object and event, created on first access.
+    The handler functions are kept as a tuple that add() and remove()
+    replace, so fire() is a plain loop over it. The same tuple is stored
+    in obj.__eventhandler__, where the receive path looks it up to decide
+    whether a packet needs decoding at all.
+    """
+
     def __init__(self, event, obj):
 
         self.event = event
         self.obj = obj
+        try:
+            eventhandler = obj.__eventhandler__
+        except AttributeError:
+            eventhandler = obj.__eventhandler__ = {}
+        self.functions = eventhandler.get(event, ())
 
     def _getfunctionlist(self):
 
         """(internal use) """
 
-        try:
-            eventhandler = self.obj.__eventhandler__
-        except AttributeError:
-            eventhandler = self.obj.__eventhandler__ = {}
-        return eventhandler.setdefault(self.event, [])
+        return self.functions
+
+    def _setfunctionlist(self, functions):
+
+        """(internal use) """
+
+        self.functions = functions
+        if functions:
+            self.obj.__eventhandler__[self.event] = functions
+        else:
+            self.obj.__eventhandler__.pop(self.event, None)
 
     def add(self, func):
 
@@ -95,7 +181,7 @@ class BGAPIEventHandler(object):
         You can add handler also by using '+=' operator.
         """
 
-        self._getfunctionlist().append(func)
+        self._setfunctionlist(self.functions + (func,))
         return self
 
     def remove(self, func):
@@ -105,7 +191,9 @@ class BGAPIEventHandler(object):
         You can remove handler also by using '-=' operator.
         """
 
-        self._getfunctionlist().remove(func)
+        functions = list(self.functions)
+        functions.remove(func)
+        self._setfunctionlist(tuple(functions))
         return self
 
     def fire(self, earg=None):
@@ -116,7 +204,7 @@ class BGAPIEventHandler(object):
         e.fire(earg).
         """
 
-        for func in self._getfunctionlist():
+        for func in self.functions:
             func(self.obj, earg)
 
     __iadd__ = add
@@ -124,6 +212,2029 @@ class BGAPIEventHandler(object):
     __call__ = fire
 
 
+class BGAPIArgs(Mapping):
+
+    """Base class for the argument records passed to event handlers.
+
+    Each response and event has its own slotted subclass, so a record
+    costs no per-instance dict. Arguments can be read as attributes
+    (args.rssi) or, as before, by key (args['rssi']); a record compares
+    equal to a dict with the same items and dict(args) makes a copy.
+    Fields that would shadow a Mapping method (e.g. 'keys') are only
+    stored under a trailing underscore (args.keys_), but keep their
+    original key.
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _getters = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # key => attribute getter, so that args[key] is one dict lookup (an
+        # unknown key raises KeyError from it), and 'key in args' is the
+        # dict's own __contains__, which is called without self
+        cls._getters = {key: operator.attrgetter(key if key in cls.__slots__ else key + '_') for key in cls._fields}
+        cls.__contains__ = cls._getters.__contains__
+
+    def __getitem__(self, key):
+        return self._getters[key](self)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __repr__(self):
+        return type(self).__name__ + '(' + ', '.join(['%s=%r' % (key, self[key]) for key in self._fields]) + ')'
+
+
+class BGAPIRawFrame(BGAPIArgs):
+
+    """Undecoded packet passed to on_raw_frame handlers."""
+
+    __slots__ = _fields = ('header', 'payload')
+
+    def __init__(self, header, payload):
+        self.header = header
+        self.payload = payload
+
+
+# packet payload decoders and argument records, one per response and event
+class gecko_rsp_dfu_reset_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_gecko_rsp_dfu_reset(rx_buf, rx_start, rx_end):
+    return gecko_rsp_dfu_reset_args()
+class gecko_rsp_dfu_flash_set_address_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_dfu_flash_set_address = struct.Struct('<H')
+def _decode_gecko_rsp_dfu_flash_set_address(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_dfu_flash_set_address.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_dfu_flash_set_address_args(result)
+class gecko_rsp_dfu_flash_upload_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_dfu_flash_upload = struct.Struct('<H')
+def _decode_gecko_rsp_dfu_flash_upload(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_dfu_flash_upload.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_dfu_flash_upload_args(result)
+class gecko_rsp_dfu_flash_upload_finish_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_dfu_flash_upload_finish = struct.Struct('<H')
+def _decode_gecko_rsp_dfu_flash_upload_finish(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_dfu_flash_upload_finish.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_dfu_flash_upload_finish_args(result)
+class gecko_rsp_system_hello_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_system_hello = struct.Struct('<H')
+def _decode_gecko_rsp_system_hello(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_system_hello.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_hello_args(result)
+class gecko_rsp_system_reset_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_gecko_rsp_system_reset(rx_buf, rx_start, rx_end):
+    return gecko_rsp_system_reset_args()
+class gecko_rsp_system_get_bt_address_args(BGAPIArgs):
+    __slots__ = _fields = ('address',)
+    def __init__(self, address):
+        self.address = address
+_struct_gecko_rsp_system_get_bt_address = struct.Struct('<6s')
+def _decode_gecko_rsp_system_get_bt_address(rx_buf, rx_start, rx_end):
+    address = _struct_gecko_rsp_system_get_bt_address.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_get_bt_address_args(address)
+class gecko_rsp_system_set_bt_address_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_system_set_bt_address = struct.Struct('<H')
+def _decode_gecko_rsp_system_set_bt_address(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_system_set_bt_address.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_set_bt_address_args(result)
+class gecko_rsp_system_set_tx_power_args(BGAPIArgs):
+    __slots__ = _fields = ('set_power',)
+    def __init__(self, set_power):
+        self.set_power = set_power
+_struct_gecko_rsp_system_set_tx_power = struct.Struct('<h')
+def _decode_gecko_rsp_system_set_tx_power(rx_buf, rx_start, rx_end):
+    set_power = _struct_gecko_rsp_system_set_tx_power.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_set_tx_power_args(set_power)
+class gecko_rsp_system_get_random_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'data')
+    def __init__(self, result, data):
+        self.result = result
+        self.data = data
+_struct_gecko_rsp_system_get_random_data = struct.Struct('<HB')
+def _decode_gecko_rsp_system_get_random_data(rx_buf, rx_start, rx_end):
+    result, data_len = _struct_gecko_rsp_system_get_random_data.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_system_get_random_data_args(result, data_data)
+class gecko_rsp_system_halt_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_system_halt = struct.Struct('<H')
+def _decode_gecko_rsp_system_halt(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_system_halt.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_halt_args(result)
+class gecko_rsp_system_set_device_name_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_system_set_device_name = struct.Struct('<H')
+def _decode_gecko_rsp_system_set_device_name(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_system_set_device_name.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_set_device_name_args(result)
+class gecko_rsp_system_linklayer_configure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_system_linklayer_configure = struct.Struct('<H')
+def _decode_gecko_rsp_system_linklayer_configure(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_system_linklayer_configure.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_linklayer_configure_args(result)
+class gecko_rsp_system_get_counters_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'tx_packets', 'rx_packets', 'crc_errors', 'failures')
+    def __init__(self, result, tx_packets, rx_packets, crc_errors, failures):
+        self.result = result
+        self.tx_packets = tx_packets
+        self.rx_packets = rx_packets
+        self.crc_errors = crc_errors
+        self.failures = failures
+_struct_gecko_rsp_system_get_counters = struct.Struct('<HHHHH')
+def _decode_gecko_rsp_system_get_counters(rx_buf, rx_start, rx_end):
+    result, tx_packets, rx_packets, crc_errors, failures = _struct_gecko_rsp_system_get_counters.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_system_get_counters_args(result, tx_packets, rx_packets, crc_errors, failures)
+class gecko_rsp_system_data_buffer_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_system_data_buffer_write = struct.Struct('<H')
+def _decode_gecko_rsp_system_data_buffer_write(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_system_data_buffer_write.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_data_buffer_write_args(result)
+class gecko_rsp_system_set_identity_address_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_system_set_identity_address = struct.Struct('<H')
+def _decode_gecko_rsp_system_set_identity_address(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_system_set_identity_address.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_set_identity_address_args(result)
+class gecko_rsp_system_data_buffer_clear_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_system_data_buffer_clear = struct.Struct('<H')
+def _decode_gecko_rsp_system_data_buffer_clear(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_system_data_buffer_clear.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_system_data_buffer_clear_args(result)
+class gecko_rsp_le_gap_open_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'connection')
+    def __init__(self, result, connection):
+        self.result = result
+        self.connection = connection
+_struct_gecko_rsp_le_gap_open = struct.Struct('<HB')
+def _decode_gecko_rsp_le_gap_open(rx_buf, rx_start, rx_end):
+    result, connection = _struct_gecko_rsp_le_gap_open.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_le_gap_open_args(result, connection)
+class gecko_rsp_le_gap_set_mode_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_mode = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_mode(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_mode.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_mode_args(result)
+class gecko_rsp_le_gap_discover_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_discover = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_discover(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_discover.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_discover_args(result)
+class gecko_rsp_le_gap_end_procedure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_end_procedure = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_end_procedure(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_end_procedure.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_end_procedure_args(result)
+class gecko_rsp_le_gap_set_adv_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_adv_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_adv_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_adv_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_adv_parameters_args(result)
+class gecko_rsp_le_gap_set_conn_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_conn_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_conn_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_conn_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_conn_parameters_args(result)
+class gecko_rsp_le_gap_set_scan_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_scan_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_scan_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_scan_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_scan_parameters_args(result)
+class gecko_rsp_le_gap_set_adv_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_adv_data = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_adv_data(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_adv_data.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_adv_data_args(result)
+class gecko_rsp_le_gap_set_adv_timeout_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_adv_timeout = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_adv_timeout(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_adv_timeout.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_adv_timeout_args(result)
+class gecko_rsp_le_gap_set_conn_phy_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_conn_phy = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_conn_phy(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_conn_phy.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_conn_phy_args(result)
+class gecko_rsp_le_gap_bt5_set_mode_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_bt5_set_mode = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_bt5_set_mode(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_bt5_set_mode.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_bt5_set_mode_args(result)
+class gecko_rsp_le_gap_bt5_set_adv_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_bt5_set_adv_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_bt5_set_adv_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_bt5_set_adv_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_bt5_set_adv_parameters_args(result)
+class gecko_rsp_le_gap_bt5_set_adv_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_bt5_set_adv_data = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_bt5_set_adv_data(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_bt5_set_adv_data.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_bt5_set_adv_data_args(result)
+class gecko_rsp_le_gap_set_privacy_mode_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_privacy_mode = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_privacy_mode(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_privacy_mode.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_privacy_mode_args(result)
+class gecko_rsp_le_gap_set_advertise_timing_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_advertise_timing = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_advertise_timing(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_advertise_timing.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_advertise_timing_args(result)
+class gecko_rsp_le_gap_set_advertise_channel_map_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_advertise_channel_map = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_advertise_channel_map(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_advertise_channel_map.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_advertise_channel_map_args(result)
+class gecko_rsp_le_gap_set_advertise_report_scan_request_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_advertise_report_scan_request = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_advertise_report_scan_request(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_advertise_report_scan_request.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_advertise_report_scan_request_args(result)
+class gecko_rsp_le_gap_set_advertise_phy_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_advertise_phy = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_advertise_phy(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_advertise_phy.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_advertise_phy_args(result)
+class gecko_rsp_le_gap_set_advertise_configuration_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_advertise_configuration = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_advertise_configuration(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_advertise_configuration.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_advertise_configuration_args(result)
+class gecko_rsp_le_gap_clear_advertise_configuration_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_clear_advertise_configuration = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_clear_advertise_configuration(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_clear_advertise_configuration.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_clear_advertise_configuration_args(result)
+class gecko_rsp_le_gap_start_advertising_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_start_advertising = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_start_advertising(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_start_advertising.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_start_advertising_args(result)
+class gecko_rsp_le_gap_stop_advertising_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_stop_advertising = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_stop_advertising(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_stop_advertising.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_stop_advertising_args(result)
+class gecko_rsp_le_gap_set_discovery_timing_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_discovery_timing = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_discovery_timing(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_discovery_timing.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_discovery_timing_args(result)
+class gecko_rsp_le_gap_set_discovery_type_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_discovery_type = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_discovery_type(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_discovery_type.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_discovery_type_args(result)
+class gecko_rsp_le_gap_start_discovery_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_start_discovery = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_start_discovery(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_start_discovery.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_start_discovery_args(result)
+class gecko_rsp_le_gap_set_data_channel_classification_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_data_channel_classification = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_data_channel_classification(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_data_channel_classification.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_data_channel_classification_args(result)
+class gecko_rsp_le_gap_connect_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'connection')
+    def __init__(self, result, connection):
+        self.result = result
+        self.connection = connection
+_struct_gecko_rsp_le_gap_connect = struct.Struct('<HB')
+def _decode_gecko_rsp_le_gap_connect(rx_buf, rx_start, rx_end):
+    result, connection = _struct_gecko_rsp_le_gap_connect.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_le_gap_connect_args(result, connection)
+class gecko_rsp_le_gap_set_advertise_tx_power_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'set_power')
+    def __init__(self, result, set_power):
+        self.result = result
+        self.set_power = set_power
+_struct_gecko_rsp_le_gap_set_advertise_tx_power = struct.Struct('<Hh')
+def _decode_gecko_rsp_le_gap_set_advertise_tx_power(rx_buf, rx_start, rx_end):
+    result, set_power = _struct_gecko_rsp_le_gap_set_advertise_tx_power.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_le_gap_set_advertise_tx_power_args(result, set_power)
+class gecko_rsp_le_gap_set_discovery_extended_scan_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_discovery_extended_scan_response = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_discovery_extended_scan_response(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_discovery_extended_scan_response.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_discovery_extended_scan_response_args(result)
+class gecko_rsp_le_gap_start_periodic_advertising_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_start_periodic_advertising = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_start_periodic_advertising(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_start_periodic_advertising.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_start_periodic_advertising_args(result)
+class gecko_rsp_le_gap_stop_periodic_advertising_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_stop_periodic_advertising = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_stop_periodic_advertising(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_stop_periodic_advertising.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_stop_periodic_advertising_args(result)
+class gecko_rsp_le_gap_set_long_advertising_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_long_advertising_data = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_long_advertising_data(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_long_advertising_data.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_long_advertising_data_args(result)
+class gecko_rsp_le_gap_enable_whitelisting_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_enable_whitelisting = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_enable_whitelisting(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_enable_whitelisting.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_enable_whitelisting_args(result)
+class gecko_rsp_le_gap_set_conn_timing_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_set_conn_timing_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_set_conn_timing_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_set_conn_timing_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_set_conn_timing_parameters_args(result)
+class gecko_rsp_le_gap_set_advertise_random_address_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'address_out')
+    def __init__(self, result, address_out):
+        self.result = result
+        self.address_out = address_out
+_struct_gecko_rsp_le_gap_set_advertise_random_address = struct.Struct('<H6s')
+def _decode_gecko_rsp_le_gap_set_advertise_random_address(rx_buf, rx_start, rx_end):
+    result, address_out = _struct_gecko_rsp_le_gap_set_advertise_random_address.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_le_gap_set_advertise_random_address_args(result, address_out)
+class gecko_rsp_le_gap_clear_advertise_random_address_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_gap_clear_advertise_random_address = struct.Struct('<H')
+def _decode_gecko_rsp_le_gap_clear_advertise_random_address(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_gap_clear_advertise_random_address.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_gap_clear_advertise_random_address_args(result)
+class gecko_rsp_sync_open_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'sync')
+    def __init__(self, result, sync):
+        self.result = result
+        self.sync = sync
+_struct_gecko_rsp_sync_open = struct.Struct('<HB')
+def _decode_gecko_rsp_sync_open(rx_buf, rx_start, rx_end):
+    result, sync = _struct_gecko_rsp_sync_open.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_sync_open_args(result, sync)
+class gecko_rsp_sync_close_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sync_close = struct.Struct('<H')
+def _decode_gecko_rsp_sync_close(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sync_close.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sync_close_args(result)
+class gecko_rsp_le_connection_set_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_connection_set_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_le_connection_set_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_connection_set_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_connection_set_parameters_args(result)
+class gecko_rsp_le_connection_get_rssi_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_connection_get_rssi = struct.Struct('<H')
+def _decode_gecko_rsp_le_connection_get_rssi(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_connection_get_rssi.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_connection_get_rssi_args(result)
+class gecko_rsp_le_connection_disable_slave_latency_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_connection_disable_slave_latency = struct.Struct('<H')
+def _decode_gecko_rsp_le_connection_disable_slave_latency(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_connection_disable_slave_latency.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_connection_disable_slave_latency_args(result)
+class gecko_rsp_le_connection_set_phy_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_connection_set_phy = struct.Struct('<H')
+def _decode_gecko_rsp_le_connection_set_phy(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_connection_set_phy.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_connection_set_phy_args(result)
+class gecko_rsp_le_connection_close_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_connection_close = struct.Struct('<H')
+def _decode_gecko_rsp_le_connection_close(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_connection_close.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_connection_close_args(result)
+class gecko_rsp_le_connection_set_timing_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_connection_set_timing_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_le_connection_set_timing_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_connection_set_timing_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_connection_set_timing_parameters_args(result)
+class gecko_rsp_le_connection_read_channel_map_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'channel_map')
+    def __init__(self, result, channel_map):
+        self.result = result
+        self.channel_map = channel_map
+_struct_gecko_rsp_le_connection_read_channel_map = struct.Struct('<HB')
+def _decode_gecko_rsp_le_connection_read_channel_map(rx_buf, rx_start, rx_end):
+    result, channel_map_len = _struct_gecko_rsp_le_connection_read_channel_map.unpack_from(rx_buf, rx_start)
+    channel_map_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_le_connection_read_channel_map_args(result, channel_map_data)
+class gecko_rsp_le_connection_set_preferred_phy_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_le_connection_set_preferred_phy = struct.Struct('<H')
+def _decode_gecko_rsp_le_connection_set_preferred_phy(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_le_connection_set_preferred_phy.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_le_connection_set_preferred_phy_args(result)
+class gecko_rsp_gatt_set_max_mtu_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'max_mtu')
+    def __init__(self, result, max_mtu):
+        self.result = result
+        self.max_mtu = max_mtu
+_struct_gecko_rsp_gatt_set_max_mtu = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_set_max_mtu(rx_buf, rx_start, rx_end):
+    result, max_mtu = _struct_gecko_rsp_gatt_set_max_mtu.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_set_max_mtu_args(result, max_mtu)
+class gecko_rsp_gatt_discover_primary_services_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_discover_primary_services = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_discover_primary_services(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_discover_primary_services.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_discover_primary_services_args(result)
+class gecko_rsp_gatt_discover_primary_services_by_uuid_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_discover_primary_services_by_uuid = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_discover_primary_services_by_uuid(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_discover_primary_services_by_uuid.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_discover_primary_services_by_uuid_args(result)
+class gecko_rsp_gatt_discover_characteristics_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_discover_characteristics = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_discover_characteristics(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_discover_characteristics.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_discover_characteristics_args(result)
+class gecko_rsp_gatt_discover_characteristics_by_uuid_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_discover_characteristics_by_uuid = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_discover_characteristics_by_uuid(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_discover_characteristics_by_uuid.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_discover_characteristics_by_uuid_args(result)
+class gecko_rsp_gatt_set_characteristic_notification_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_set_characteristic_notification = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_set_characteristic_notification(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_set_characteristic_notification.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_set_characteristic_notification_args(result)
+class gecko_rsp_gatt_discover_descriptors_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_discover_descriptors = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_discover_descriptors(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_discover_descriptors.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_discover_descriptors_args(result)
+class gecko_rsp_gatt_read_characteristic_value_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_read_characteristic_value = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_read_characteristic_value(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_read_characteristic_value.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_read_characteristic_value_args(result)
+class gecko_rsp_gatt_read_characteristic_value_by_uuid_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_read_characteristic_value_by_uuid = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_read_characteristic_value_by_uuid(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_read_characteristic_value_by_uuid.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_read_characteristic_value_by_uuid_args(result)
+class gecko_rsp_gatt_write_characteristic_value_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_write_characteristic_value = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_write_characteristic_value(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_write_characteristic_value.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_write_characteristic_value_args(result)
+class gecko_rsp_gatt_write_characteristic_value_without_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'sent_len')
+    def __init__(self, result, sent_len):
+        self.result = result
+        self.sent_len = sent_len
+_struct_gecko_rsp_gatt_write_characteristic_value_without_response = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_write_characteristic_value_without_response(rx_buf, rx_start, rx_end):
+    result, sent_len = _struct_gecko_rsp_gatt_write_characteristic_value_without_response.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_write_characteristic_value_without_response_args(result, sent_len)
+class gecko_rsp_gatt_prepare_characteristic_value_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'sent_len')
+    def __init__(self, result, sent_len):
+        self.result = result
+        self.sent_len = sent_len
+_struct_gecko_rsp_gatt_prepare_characteristic_value_write = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_prepare_characteristic_value_write(rx_buf, rx_start, rx_end):
+    result, sent_len = _struct_gecko_rsp_gatt_prepare_characteristic_value_write.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_prepare_characteristic_value_write_args(result, sent_len)
+class gecko_rsp_gatt_execute_characteristic_value_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_execute_characteristic_value_write = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_execute_characteristic_value_write(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_execute_characteristic_value_write.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_execute_characteristic_value_write_args(result)
+class gecko_rsp_gatt_send_characteristic_confirmation_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_send_characteristic_confirmation = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_send_characteristic_confirmation(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_send_characteristic_confirmation.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_send_characteristic_confirmation_args(result)
+class gecko_rsp_gatt_read_descriptor_value_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_read_descriptor_value = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_read_descriptor_value(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_read_descriptor_value.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_read_descriptor_value_args(result)
+class gecko_rsp_gatt_write_descriptor_value_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_write_descriptor_value = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_write_descriptor_value(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_write_descriptor_value.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_write_descriptor_value_args(result)
+class gecko_rsp_gatt_find_included_services_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_find_included_services = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_find_included_services(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_find_included_services.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_find_included_services_args(result)
+class gecko_rsp_gatt_read_multiple_characteristic_values_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_read_multiple_characteristic_values = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_read_multiple_characteristic_values(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_read_multiple_characteristic_values.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_read_multiple_characteristic_values_args(result)
+class gecko_rsp_gatt_read_characteristic_value_from_offset_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_read_characteristic_value_from_offset = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_read_characteristic_value_from_offset(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_read_characteristic_value_from_offset.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_read_characteristic_value_from_offset_args(result)
+class gecko_rsp_gatt_prepare_characteristic_value_reliable_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'sent_len')
+    def __init__(self, result, sent_len):
+        self.result = result
+        self.sent_len = sent_len
+_struct_gecko_rsp_gatt_prepare_characteristic_value_reliable_write = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_prepare_characteristic_value_reliable_write(rx_buf, rx_start, rx_end):
+    result, sent_len = _struct_gecko_rsp_gatt_prepare_characteristic_value_reliable_write.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_prepare_characteristic_value_reliable_write_args(result, sent_len)
+class gecko_rsp_gatt_server_read_attribute_value_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'value')
+    def __init__(self, result, value):
+        self.result = result
+        self.value = value
+_struct_gecko_rsp_gatt_server_read_attribute_value = struct.Struct('<HB')
+def _decode_gecko_rsp_gatt_server_read_attribute_value(rx_buf, rx_start, rx_end):
+    result, value_len = _struct_gecko_rsp_gatt_server_read_attribute_value.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_gatt_server_read_attribute_value_args(result, value_data)
+class gecko_rsp_gatt_server_read_attribute_type_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'type')
+    def __init__(self, result, type):
+        self.result = result
+        self.type = type
+_struct_gecko_rsp_gatt_server_read_attribute_type = struct.Struct('<HB')
+def _decode_gecko_rsp_gatt_server_read_attribute_type(rx_buf, rx_start, rx_end):
+    result, type_len = _struct_gecko_rsp_gatt_server_read_attribute_type.unpack_from(rx_buf, rx_start)
+    type_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_gatt_server_read_attribute_type_args(result, type_data)
+class gecko_rsp_gatt_server_write_attribute_value_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_server_write_attribute_value = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_server_write_attribute_value(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_server_write_attribute_value.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_server_write_attribute_value_args(result)
+class gecko_rsp_gatt_server_send_user_read_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'sent_len')
+    def __init__(self, result, sent_len):
+        self.result = result
+        self.sent_len = sent_len
+_struct_gecko_rsp_gatt_server_send_user_read_response = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_server_send_user_read_response(rx_buf, rx_start, rx_end):
+    result, sent_len = _struct_gecko_rsp_gatt_server_send_user_read_response.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_server_send_user_read_response_args(result, sent_len)
+class gecko_rsp_gatt_server_send_user_write_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_server_send_user_write_response = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_server_send_user_write_response(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_server_send_user_write_response.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_server_send_user_write_response_args(result)
+class gecko_rsp_gatt_server_send_characteristic_notification_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'sent_len')
+    def __init__(self, result, sent_len):
+        self.result = result
+        self.sent_len = sent_len
+_struct_gecko_rsp_gatt_server_send_characteristic_notification = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_server_send_characteristic_notification(rx_buf, rx_start, rx_end):
+    result, sent_len = _struct_gecko_rsp_gatt_server_send_characteristic_notification.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_server_send_characteristic_notification_args(result, sent_len)
+class gecko_rsp_gatt_server_find_attribute_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'attribute')
+    def __init__(self, result, attribute):
+        self.result = result
+        self.attribute = attribute
+_struct_gecko_rsp_gatt_server_find_attribute = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_server_find_attribute(rx_buf, rx_start, rx_end):
+    result, attribute = _struct_gecko_rsp_gatt_server_find_attribute.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_server_find_attribute_args(result, attribute)
+class gecko_rsp_gatt_server_set_capabilities_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_server_set_capabilities = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_server_set_capabilities(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_server_set_capabilities.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_server_set_capabilities_args(result)
+class gecko_rsp_gatt_server_find_primary_service_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'start', 'end')
+    def __init__(self, result, start, end):
+        self.result = result
+        self.start = start
+        self.end = end
+_struct_gecko_rsp_gatt_server_find_primary_service = struct.Struct('<HHH')
+def _decode_gecko_rsp_gatt_server_find_primary_service(rx_buf, rx_start, rx_end):
+    result, start, end = _struct_gecko_rsp_gatt_server_find_primary_service.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_server_find_primary_service_args(result, start, end)
+class gecko_rsp_gatt_server_set_max_mtu_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'max_mtu')
+    def __init__(self, result, max_mtu):
+        self.result = result
+        self.max_mtu = max_mtu
+_struct_gecko_rsp_gatt_server_set_max_mtu = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_server_set_max_mtu(rx_buf, rx_start, rx_end):
+    result, max_mtu = _struct_gecko_rsp_gatt_server_set_max_mtu.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_server_set_max_mtu_args(result, max_mtu)
+class gecko_rsp_gatt_server_get_mtu_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'mtu')
+    def __init__(self, result, mtu):
+        self.result = result
+        self.mtu = mtu
+_struct_gecko_rsp_gatt_server_get_mtu = struct.Struct('<HH')
+def _decode_gecko_rsp_gatt_server_get_mtu(rx_buf, rx_start, rx_end):
+    result, mtu = _struct_gecko_rsp_gatt_server_get_mtu.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_server_get_mtu_args(result, mtu)
+class gecko_rsp_gatt_server_enable_capabilities_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_server_enable_capabilities = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_server_enable_capabilities(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_server_enable_capabilities.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_server_enable_capabilities_args(result)
+class gecko_rsp_gatt_server_disable_capabilities_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_gatt_server_disable_capabilities = struct.Struct('<H')
+def _decode_gecko_rsp_gatt_server_disable_capabilities(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_gatt_server_disable_capabilities.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_gatt_server_disable_capabilities_args(result)
+class gecko_rsp_gatt_server_get_enabled_capabilities_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'caps')
+    def __init__(self, result, caps):
+        self.result = result
+        self.caps = caps
+_struct_gecko_rsp_gatt_server_get_enabled_capabilities = struct.Struct('<HI')
+def _decode_gecko_rsp_gatt_server_get_enabled_capabilities(rx_buf, rx_start, rx_end):
+    result, caps = _struct_gecko_rsp_gatt_server_get_enabled_capabilities.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_gatt_server_get_enabled_capabilities_args(result, caps)
+class gecko_rsp_hardware_set_soft_timer_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_hardware_set_soft_timer = struct.Struct('<H')
+def _decode_gecko_rsp_hardware_set_soft_timer(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_hardware_set_soft_timer.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_hardware_set_soft_timer_args(result)
+class gecko_rsp_hardware_get_time_args(BGAPIArgs):
+    __slots__ = _fields = ('seconds', 'ticks')
+    def __init__(self, seconds, ticks):
+        self.seconds = seconds
+        self.ticks = ticks
+_struct_gecko_rsp_hardware_get_time = struct.Struct('<IH')
+def _decode_gecko_rsp_hardware_get_time(rx_buf, rx_start, rx_end):
+    seconds, ticks = _struct_gecko_rsp_hardware_get_time.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_hardware_get_time_args(seconds, ticks)
+class gecko_rsp_hardware_set_lazy_soft_timer_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_hardware_set_lazy_soft_timer = struct.Struct('<H')
+def _decode_gecko_rsp_hardware_set_lazy_soft_timer(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_hardware_set_lazy_soft_timer.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_hardware_set_lazy_soft_timer_args(result)
+class gecko_rsp_flash_ps_erase_all_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_flash_ps_erase_all = struct.Struct('<H')
+def _decode_gecko_rsp_flash_ps_erase_all(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_flash_ps_erase_all.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_flash_ps_erase_all_args(result)
+class gecko_rsp_flash_ps_save_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_flash_ps_save = struct.Struct('<H')
+def _decode_gecko_rsp_flash_ps_save(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_flash_ps_save.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_flash_ps_save_args(result)
+class gecko_rsp_flash_ps_load_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'value')
+    def __init__(self, result, value):
+        self.result = result
+        self.value = value
+_struct_gecko_rsp_flash_ps_load = struct.Struct('<HB')
+def _decode_gecko_rsp_flash_ps_load(rx_buf, rx_start, rx_end):
+    result, value_len = _struct_gecko_rsp_flash_ps_load.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_flash_ps_load_args(result, value_data)
+class gecko_rsp_flash_ps_erase_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_flash_ps_erase = struct.Struct('<H')
+def _decode_gecko_rsp_flash_ps_erase(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_flash_ps_erase.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_flash_ps_erase_args(result)
+class gecko_rsp_test_dtm_tx_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_test_dtm_tx = struct.Struct('<H')
+def _decode_gecko_rsp_test_dtm_tx(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_test_dtm_tx.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_test_dtm_tx_args(result)
+class gecko_rsp_test_dtm_rx_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_test_dtm_rx = struct.Struct('<H')
+def _decode_gecko_rsp_test_dtm_rx(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_test_dtm_rx.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_test_dtm_rx_args(result)
+class gecko_rsp_test_dtm_end_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_test_dtm_end = struct.Struct('<H')
+def _decode_gecko_rsp_test_dtm_end(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_test_dtm_end.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_test_dtm_end_args(result)
+class gecko_rsp_test_debug_command_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'id', 'debugdata')
+    def __init__(self, result, id, debugdata):
+        self.result = result
+        self.id = id
+        self.debugdata = debugdata
+_struct_gecko_rsp_test_debug_command = struct.Struct('<HBB')
+def _decode_gecko_rsp_test_debug_command(rx_buf, rx_start, rx_end):
+    result, id, debugdata_len = _struct_gecko_rsp_test_debug_command.unpack_from(rx_buf, rx_start)
+    debugdata_data = rx_buf[rx_start + 4:rx_end]
+    return gecko_rsp_test_debug_command_args(result, id, debugdata_data)
+class gecko_rsp_test_debug_counter_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'value')
+    def __init__(self, result, value):
+        self.result = result
+        self.value = value
+_struct_gecko_rsp_test_debug_counter = struct.Struct('<HI')
+def _decode_gecko_rsp_test_debug_counter(rx_buf, rx_start, rx_end):
+    result, value = _struct_gecko_rsp_test_debug_counter.unpack_from(rx_buf, rx_start)
+    return gecko_rsp_test_debug_counter_args(result, value)
+class gecko_rsp_sm_set_bondable_mode_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_set_bondable_mode = struct.Struct('<H')
+def _decode_gecko_rsp_sm_set_bondable_mode(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_set_bondable_mode.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_set_bondable_mode_args(result)
+class gecko_rsp_sm_configure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_configure = struct.Struct('<H')
+def _decode_gecko_rsp_sm_configure(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_configure.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_configure_args(result)
+class gecko_rsp_sm_store_bonding_configuration_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_store_bonding_configuration = struct.Struct('<H')
+def _decode_gecko_rsp_sm_store_bonding_configuration(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_store_bonding_configuration.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_store_bonding_configuration_args(result)
+class gecko_rsp_sm_increase_security_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_increase_security = struct.Struct('<H')
+def _decode_gecko_rsp_sm_increase_security(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_increase_security.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_increase_security_args(result)
+class gecko_rsp_sm_delete_bonding_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_delete_bonding = struct.Struct('<H')
+def _decode_gecko_rsp_sm_delete_bonding(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_delete_bonding.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_delete_bonding_args(result)
+class gecko_rsp_sm_delete_bondings_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_delete_bondings = struct.Struct('<H')
+def _decode_gecko_rsp_sm_delete_bondings(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_delete_bondings.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_delete_bondings_args(result)
+class gecko_rsp_sm_enter_passkey_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_enter_passkey = struct.Struct('<H')
+def _decode_gecko_rsp_sm_enter_passkey(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_enter_passkey.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_enter_passkey_args(result)
+class gecko_rsp_sm_passkey_confirm_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_passkey_confirm = struct.Struct('<H')
+def _decode_gecko_rsp_sm_passkey_confirm(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_passkey_confirm.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_passkey_confirm_args(result)
+class gecko_rsp_sm_set_oob_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_set_oob_data = struct.Struct('<H')
+def _decode_gecko_rsp_sm_set_oob_data(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_set_oob_data.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_set_oob_data_args(result)
+class gecko_rsp_sm_list_all_bondings_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_list_all_bondings = struct.Struct('<H')
+def _decode_gecko_rsp_sm_list_all_bondings(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_list_all_bondings.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_list_all_bondings_args(result)
+class gecko_rsp_sm_bonding_confirm_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_bonding_confirm = struct.Struct('<H')
+def _decode_gecko_rsp_sm_bonding_confirm(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_bonding_confirm.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_bonding_confirm_args(result)
+class gecko_rsp_sm_set_debug_mode_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_set_debug_mode = struct.Struct('<H')
+def _decode_gecko_rsp_sm_set_debug_mode(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_set_debug_mode.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_set_debug_mode_args(result)
+class gecko_rsp_sm_set_passkey_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_set_passkey = struct.Struct('<H')
+def _decode_gecko_rsp_sm_set_passkey(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_set_passkey.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_set_passkey_args(result)
+class gecko_rsp_sm_use_sc_oob_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'oob_data')
+    def __init__(self, result, oob_data):
+        self.result = result
+        self.oob_data = oob_data
+_struct_gecko_rsp_sm_use_sc_oob = struct.Struct('<HB')
+def _decode_gecko_rsp_sm_use_sc_oob(rx_buf, rx_start, rx_end):
+    result, oob_data_len = _struct_gecko_rsp_sm_use_sc_oob.unpack_from(rx_buf, rx_start)
+    oob_data_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_sm_use_sc_oob_args(result, oob_data_data)
+class gecko_rsp_sm_set_sc_remote_oob_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_set_sc_remote_oob_data = struct.Struct('<H')
+def _decode_gecko_rsp_sm_set_sc_remote_oob_data(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_set_sc_remote_oob_data.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_set_sc_remote_oob_data_args(result)
+class gecko_rsp_sm_add_to_whitelist_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_add_to_whitelist = struct.Struct('<H')
+def _decode_gecko_rsp_sm_add_to_whitelist(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_add_to_whitelist.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_add_to_whitelist_args(result)
+class gecko_rsp_sm_set_minimum_key_size_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_sm_set_minimum_key_size = struct.Struct('<H')
+def _decode_gecko_rsp_sm_set_minimum_key_size(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_sm_set_minimum_key_size.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_sm_set_minimum_key_size_args(result)
+class gecko_rsp_homekit_configure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_configure = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_configure(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_configure.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_configure_args(result)
+class gecko_rsp_homekit_advertise_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_advertise = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_advertise(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_advertise.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_advertise_args(result)
+class gecko_rsp_homekit_delete_pairings_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_delete_pairings = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_delete_pairings(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_delete_pairings.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_delete_pairings_args(result)
+class gecko_rsp_homekit_check_authcp_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_check_authcp = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_check_authcp(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_check_authcp.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_check_authcp_args(result)
+class gecko_rsp_homekit_get_pairing_id_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'pairing_id')
+    def __init__(self, result, pairing_id):
+        self.result = result
+        self.pairing_id = pairing_id
+_struct_gecko_rsp_homekit_get_pairing_id = struct.Struct('<HB')
+def _decode_gecko_rsp_homekit_get_pairing_id(rx_buf, rx_start, rx_end):
+    result, pairing_id_len = _struct_gecko_rsp_homekit_get_pairing_id.unpack_from(rx_buf, rx_start)
+    pairing_id_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_homekit_get_pairing_id_args(result, pairing_id_data)
+class gecko_rsp_homekit_send_write_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_send_write_response = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_send_write_response(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_send_write_response.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_send_write_response_args(result)
+class gecko_rsp_homekit_send_read_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_send_read_response = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_send_read_response(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_send_read_response.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_send_read_response_args(result)
+class gecko_rsp_homekit_gsn_action_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_gsn_action = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_gsn_action(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_gsn_action.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_gsn_action_args(result)
+class gecko_rsp_homekit_event_notification_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_event_notification = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_event_notification(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_event_notification.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_event_notification_args(result)
+class gecko_rsp_homekit_broadcast_action_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_broadcast_action = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_broadcast_action(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_broadcast_action.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_broadcast_action_args(result)
+class gecko_rsp_homekit_configure_product_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_homekit_configure_product_data = struct.Struct('<H')
+def _decode_gecko_rsp_homekit_configure_product_data(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_homekit_configure_product_data.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_homekit_configure_product_data_args(result)
+class gecko_rsp_coex_set_options_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_coex_set_options = struct.Struct('<H')
+def _decode_gecko_rsp_coex_set_options(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_coex_set_options.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_coex_set_options_args(result)
+class gecko_rsp_coex_get_counters_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'counters')
+    def __init__(self, result, counters):
+        self.result = result
+        self.counters = counters
+_struct_gecko_rsp_coex_get_counters = struct.Struct('<HB')
+def _decode_gecko_rsp_coex_get_counters(rx_buf, rx_start, rx_end):
+    result, counters_len = _struct_gecko_rsp_coex_get_counters.unpack_from(rx_buf, rx_start)
+    counters_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_coex_get_counters_args(result, counters_data)
+class gecko_rsp_coex_set_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_coex_set_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_coex_set_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_coex_set_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_coex_set_parameters_args(result)
+class gecko_rsp_coex_set_directional_priority_pulse_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_coex_set_directional_priority_pulse = struct.Struct('<H')
+def _decode_gecko_rsp_coex_set_directional_priority_pulse(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_coex_set_directional_priority_pulse.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_coex_set_directional_priority_pulse_args(result)
+class gecko_rsp_l2cap_coc_send_connection_request_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_l2cap_coc_send_connection_request = struct.Struct('<H')
+def _decode_gecko_rsp_l2cap_coc_send_connection_request(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_l2cap_coc_send_connection_request.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_l2cap_coc_send_connection_request_args(result)
+class gecko_rsp_l2cap_coc_send_connection_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_l2cap_coc_send_connection_response = struct.Struct('<H')
+def _decode_gecko_rsp_l2cap_coc_send_connection_response(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_l2cap_coc_send_connection_response.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_l2cap_coc_send_connection_response_args(result)
+class gecko_rsp_l2cap_coc_send_le_flow_control_credit_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_l2cap_coc_send_le_flow_control_credit = struct.Struct('<H')
+def _decode_gecko_rsp_l2cap_coc_send_le_flow_control_credit(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_l2cap_coc_send_le_flow_control_credit.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_l2cap_coc_send_le_flow_control_credit_args(result)
+class gecko_rsp_l2cap_coc_send_disconnection_request_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_l2cap_coc_send_disconnection_request = struct.Struct('<H')
+def _decode_gecko_rsp_l2cap_coc_send_disconnection_request(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_l2cap_coc_send_disconnection_request.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_l2cap_coc_send_disconnection_request_args(result)
+class gecko_rsp_l2cap_coc_send_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_l2cap_coc_send_data = struct.Struct('<H')
+def _decode_gecko_rsp_l2cap_coc_send_data(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_l2cap_coc_send_data.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_l2cap_coc_send_data_args(result)
+class gecko_rsp_cte_transmitter_enable_cte_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_transmitter_enable_cte_response = struct.Struct('<H')
+def _decode_gecko_rsp_cte_transmitter_enable_cte_response(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_transmitter_enable_cte_response.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_transmitter_enable_cte_response_args(result)
+class gecko_rsp_cte_transmitter_disable_cte_response_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_transmitter_disable_cte_response = struct.Struct('<H')
+def _decode_gecko_rsp_cte_transmitter_disable_cte_response(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_transmitter_disable_cte_response.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_transmitter_disable_cte_response_args(result)
+class gecko_rsp_cte_transmitter_start_connectionless_cte_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_transmitter_start_connectionless_cte = struct.Struct('<H')
+def _decode_gecko_rsp_cte_transmitter_start_connectionless_cte(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_transmitter_start_connectionless_cte.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_transmitter_start_connectionless_cte_args(result)
+class gecko_rsp_cte_transmitter_stop_connectionless_cte_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_transmitter_stop_connectionless_cte = struct.Struct('<H')
+def _decode_gecko_rsp_cte_transmitter_stop_connectionless_cte(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_transmitter_stop_connectionless_cte.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_transmitter_stop_connectionless_cte_args(result)
+class gecko_rsp_cte_transmitter_set_dtm_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_transmitter_set_dtm_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_cte_transmitter_set_dtm_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_transmitter_set_dtm_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_transmitter_set_dtm_parameters_args(result)
+class gecko_rsp_cte_transmitter_clear_dtm_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_transmitter_clear_dtm_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_cte_transmitter_clear_dtm_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_transmitter_clear_dtm_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_transmitter_clear_dtm_parameters_args(result)
+class gecko_rsp_cte_receiver_configure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_receiver_configure = struct.Struct('<H')
+def _decode_gecko_rsp_cte_receiver_configure(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_receiver_configure.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_receiver_configure_args(result)
+class gecko_rsp_cte_receiver_start_iq_sampling_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_receiver_start_iq_sampling = struct.Struct('<H')
+def _decode_gecko_rsp_cte_receiver_start_iq_sampling(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_receiver_start_iq_sampling.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_receiver_start_iq_sampling_args(result)
+class gecko_rsp_cte_receiver_stop_iq_sampling_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_receiver_stop_iq_sampling = struct.Struct('<H')
+def _decode_gecko_rsp_cte_receiver_stop_iq_sampling(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_receiver_stop_iq_sampling.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_receiver_stop_iq_sampling_args(result)
+class gecko_rsp_cte_receiver_start_connectionless_iq_sampling_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_receiver_start_connectionless_iq_sampling = struct.Struct('<H')
+def _decode_gecko_rsp_cte_receiver_start_connectionless_iq_sampling(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_receiver_start_connectionless_iq_sampling.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_receiver_start_connectionless_iq_sampling_args(result)
+class gecko_rsp_cte_receiver_stop_connectionless_iq_sampling_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_receiver_stop_connectionless_iq_sampling = struct.Struct('<H')
+def _decode_gecko_rsp_cte_receiver_stop_connectionless_iq_sampling(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_receiver_stop_connectionless_iq_sampling.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_receiver_stop_connectionless_iq_sampling_args(result)
+class gecko_rsp_cte_receiver_set_dtm_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_receiver_set_dtm_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_cte_receiver_set_dtm_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_receiver_set_dtm_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_receiver_set_dtm_parameters_args(result)
+class gecko_rsp_cte_receiver_clear_dtm_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_cte_receiver_clear_dtm_parameters = struct.Struct('<H')
+def _decode_gecko_rsp_cte_receiver_clear_dtm_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_cte_receiver_clear_dtm_parameters.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_cte_receiver_clear_dtm_parameters_args(result)
+class gecko_rsp_qualtester_configure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_gecko_rsp_qualtester_configure = struct.Struct('<H')
+def _decode_gecko_rsp_qualtester_configure(rx_buf, rx_start, rx_end):
+    result = _struct_gecko_rsp_qualtester_configure.unpack_from(rx_buf, rx_start)[0]
+    return gecko_rsp_qualtester_configure_args(result)
+class gecko_rsp_user_message_to_target_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'data')
+    def __init__(self, result, data):
+        self.result = result
+        self.data = data
+_struct_gecko_rsp_user_message_to_target = struct.Struct('<HB')
+def _decode_gecko_rsp_user_message_to_target(rx_buf, rx_start, rx_end):
+    result, data_len = _struct_gecko_rsp_user_message_to_target.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_rsp_user_message_to_target_args(result, data_data)
+class gecko_evt_dfu_boot_args(BGAPIArgs):
+    __slots__ = _fields = ('version',)
+    def __init__(self, version):
+        self.version = version
+_struct_gecko_evt_dfu_boot = struct.Struct('<I')
+def _decode_gecko_evt_dfu_boot(rx_buf, rx_start, rx_end):
+    version = _struct_gecko_evt_dfu_boot.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_dfu_boot_args(version)
+class gecko_evt_dfu_boot_failure_args(BGAPIArgs):
+    __slots__ = _fields = ('reason',)
+    def __init__(self, reason):
+        self.reason = reason
+_struct_gecko_evt_dfu_boot_failure = struct.Struct('<H')
+def _decode_gecko_evt_dfu_boot_failure(rx_buf, rx_start, rx_end):
+    reason = _struct_gecko_evt_dfu_boot_failure.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_dfu_boot_failure_args(reason)
+class gecko_evt_system_boot_args(BGAPIArgs):
+    __slots__ = _fields = ('major', 'minor', 'patch', 'build', 'bootloader', 'hw', 'hash')
+    def __init__(self, major, minor, patch, build, bootloader, hw, hash):
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        self.build = build
+        self.bootloader = bootloader
+        self.hw = hw
+        self.hash = hash
+_struct_gecko_evt_system_boot = struct.Struct('<HHHHIHI')
+def _decode_gecko_evt_system_boot(rx_buf, rx_start, rx_end):
+    major, minor, patch, build, bootloader, hw, hash = _struct_gecko_evt_system_boot.unpack_from(rx_buf, rx_start)
+    return gecko_evt_system_boot_args(major, minor, patch, build, bootloader, hw, hash)
+class gecko_evt_system_external_signal_args(BGAPIArgs):
+    __slots__ = _fields = ('extsignals',)
+    def __init__(self, extsignals):
+        self.extsignals = extsignals
+_struct_gecko_evt_system_external_signal = struct.Struct('<I')
+def _decode_gecko_evt_system_external_signal(rx_buf, rx_start, rx_end):
+    extsignals = _struct_gecko_evt_system_external_signal.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_system_external_signal_args(extsignals)
+class gecko_evt_system_awake_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_gecko_evt_system_awake(rx_buf, rx_start, rx_end):
+    return gecko_evt_system_awake_args()
+class gecko_evt_system_hardware_error_args(BGAPIArgs):
+    __slots__ = _fields = ('status',)
+    def __init__(self, status):
+        self.status = status
+_struct_gecko_evt_system_hardware_error = struct.Struct('<H')
+def _decode_gecko_evt_system_hardware_error(rx_buf, rx_start, rx_end):
+    status = _struct_gecko_evt_system_hardware_error.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_system_hardware_error_args(status)
+class gecko_evt_system_error_args(BGAPIArgs):
+    __slots__ = _fields = ('reason', 'data')
+    def __init__(self, reason, data):
+        self.reason = reason
+        self.data = data
+_struct_gecko_evt_system_error = struct.Struct('<HB')
+def _decode_gecko_evt_system_error(rx_buf, rx_start, rx_end):
+    reason, data_len = _struct_gecko_evt_system_error.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 3:rx_end]
+    return gecko_evt_system_error_args(reason, data_data)
+class gecko_evt_le_gap_scan_response_args(BGAPIArgs):
+    __slots__ = _fields = ('rssi', 'packet_type', 'address', 'address_type', 'bonding', 'data')
+    def __init__(self, rssi, packet_type, address, address_type, bonding, data):
+        self.rssi = rssi
+        self.packet_type = packet_type
+        self.address = address
+        self.address_type = address_type
+        self.bonding = bonding
+        self.data = data
+_struct_gecko_evt_le_gap_scan_response = struct.Struct('<bB6sBBB')
+def _decode_gecko_evt_le_gap_scan_response(rx_buf, rx_start, rx_end):
+    rssi, packet_type, address, address_type, bonding, data_len = _struct_gecko_evt_le_gap_scan_response.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 11:rx_end]
+    return gecko_evt_le_gap_scan_response_args(rssi, packet_type, address, address_type, bonding, data_data)
+class gecko_evt_le_gap_adv_timeout_args(BGAPIArgs):
+    __slots__ = _fields = ('handle',)
+    def __init__(self, handle):
+        self.handle = handle
+_struct_gecko_evt_le_gap_adv_timeout = struct.Struct('<B')
+def _decode_gecko_evt_le_gap_adv_timeout(rx_buf, rx_start, rx_end):
+    handle = _struct_gecko_evt_le_gap_adv_timeout.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_le_gap_adv_timeout_args(handle)
+class gecko_evt_le_gap_scan_request_args(BGAPIArgs):
+    __slots__ = _fields = ('handle', 'address', 'address_type', 'bonding')
+    def __init__(self, handle, address, address_type, bonding):
+        self.handle = handle
+        self.address = address
+        self.address_type = address_type
+        self.bonding = bonding
+_struct_gecko_evt_le_gap_scan_request = struct.Struct('<B6sBB')
+def _decode_gecko_evt_le_gap_scan_request(rx_buf, rx_start, rx_end):
+    handle, address, address_type, bonding = _struct_gecko_evt_le_gap_scan_request.unpack_from(rx_buf, rx_start)
+    return gecko_evt_le_gap_scan_request_args(handle, address, address_type, bonding)
+class gecko_evt_le_gap_extended_scan_response_args(BGAPIArgs):
+    __slots__ = _fields = ('packet_type', 'address', 'address_type', 'bonding', 'primary_phy', 'secondary_phy', 'adv_sid', 'tx_power', 'rssi', 'channel', 'periodic_interval', 'data')
+    def __init__(self, packet_type, address, address_type, bonding, primary_phy, secondary_phy, adv_sid, tx_power, rssi, channel, periodic_interval, data):
+        self.packet_type = packet_type
+        self.address = address
+        self.address_type = address_type
+        self.bonding = bonding
+        self.primary_phy = primary_phy
+        self.secondary_phy = secondary_phy
+        self.adv_sid = adv_sid
+        self.tx_power = tx_power
+        self.rssi = rssi
+        self.channel = channel
+        self.periodic_interval = periodic_interval
+        self.data = data
+_struct_gecko_evt_le_gap_extended_scan_response = struct.Struct('<B6sBBBBBbbBHB')
+def _decode_gecko_evt_le_gap_extended_scan_response(rx_buf, rx_start, rx_end):
+    packet_type, address, address_type, bonding, primary_phy, secondary_phy, adv_sid, tx_power, rssi, channel, periodic_interval, data_len = _struct_gecko_evt_le_gap_extended_scan_response.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 18:rx_end]
+    return gecko_evt_le_gap_extended_scan_response_args(packet_type, address, address_type, bonding, primary_phy, secondary_phy, adv_sid, tx_power, rssi, channel, periodic_interval, data_data)
+class gecko_evt_le_gap_periodic_advertising_status_args(BGAPIArgs):
+    __slots__ = _fields = ('sid', 'status')
+    def __init__(self, sid, status):
+        self.sid = sid
+        self.status = status
+_struct_gecko_evt_le_gap_periodic_advertising_status = struct.Struct('<BI')
+def _decode_gecko_evt_le_gap_periodic_advertising_status(rx_buf, rx_start, rx_end):
+    sid, status = _struct_gecko_evt_le_gap_periodic_advertising_status.unpack_from(rx_buf, rx_start)
+    return gecko_evt_le_gap_periodic_advertising_status_args(sid, status)
+class gecko_evt_sync_opened_args(BGAPIArgs):
+    __slots__ = _fields = ('sync', 'adv_sid', 'address', 'address_type', 'adv_phy', 'adv_interval', 'clock_accuracy')
+    def __init__(self, sync, adv_sid, address, address_type, adv_phy, adv_interval, clock_accuracy):
+        self.sync = sync
+        self.adv_sid = adv_sid
+        self.address = address
+        self.address_type = address_type
+        self.adv_phy = adv_phy
+        self.adv_interval = adv_interval
+        self.clock_accuracy = clock_accuracy
+_struct_gecko_evt_sync_opened = struct.Struct('<BB6sBBHH')
+def _decode_gecko_evt_sync_opened(rx_buf, rx_start, rx_end):
+    sync, adv_sid, address, address_type, adv_phy, adv_interval, clock_accuracy = _struct_gecko_evt_sync_opened.unpack_from(rx_buf, rx_start)
+    return gecko_evt_sync_opened_args(sync, adv_sid, address, address_type, adv_phy, adv_interval, clock_accuracy)
+class gecko_evt_sync_closed_args(BGAPIArgs):
+    __slots__ = _fields = ('reason', 'sync')
+    def __init__(self, reason, sync):
+        self.reason = reason
+        self.sync = sync
+_struct_gecko_evt_sync_closed = struct.Struct('<HB')
+def _decode_gecko_evt_sync_closed(rx_buf, rx_start, rx_end):
+    reason, sync = _struct_gecko_evt_sync_closed.unpack_from(rx_buf, rx_start)
+    return gecko_evt_sync_closed_args(reason, sync)
+class gecko_evt_sync_data_args(BGAPIArgs):
+    __slots__ = _fields = ('sync', 'tx_power', 'rssi', 'data_status', 'data')
+    def __init__(self, sync, tx_power, rssi, data_status, data):
+        self.sync = sync
+        self.tx_power = tx_power
+        self.rssi = rssi
+        self.data_status = data_status
+        self.data = data
+_struct_gecko_evt_sync_data = struct.Struct('<BbbBB')
+def _decode_gecko_evt_sync_data(rx_buf, rx_start, rx_end):
+    sync, tx_power, rssi, data_status, data_len = _struct_gecko_evt_sync_data.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 5:rx_end]
+    return gecko_evt_sync_data_args(sync, tx_power, rssi, data_status, data_data)
+class gecko_evt_le_connection_opened_args(BGAPIArgs):
+    __slots__ = _fields = ('address', 'address_type', 'master', 'connection', 'bonding', 'advertiser')
+    def __init__(self, address, address_type, master, connection, bonding, advertiser):
+        self.address = address
+        self.address_type = address_type
+        self.master = master
+        self.connection = connection
+        self.bonding = bonding
+        self.advertiser = advertiser
+_struct_gecko_evt_le_connection_opened = struct.Struct('<6sBBBBB')
+def _decode_gecko_evt_le_connection_opened(rx_buf, rx_start, rx_end):
+    address, address_type, master, connection, bonding, advertiser = _struct_gecko_evt_le_connection_opened.unpack_from(rx_buf, rx_start)
+    return gecko_evt_le_connection_opened_args(address, address_type, master, connection, bonding, advertiser)
+class gecko_evt_le_connection_closed_args(BGAPIArgs):
+    __slots__ = _fields = ('reason', 'connection')
+    def __init__(self, reason, connection):
+        self.reason = reason
+        self.connection = connection
+_struct_gecko_evt_le_connection_closed = struct.Struct('<HB')
+def _decode_gecko_evt_le_connection_closed(rx_buf, rx_start, rx_end):
+    reason, connection = _struct_gecko_evt_le_connection_closed.unpack_from(rx_buf, rx_start)
+    return gecko_evt_le_connection_closed_args(reason, connection)
+class gecko_evt_le_connection_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'interval', 'latency', 'timeout', 'security_mode', 'txsize')
+    def __init__(self, connection, interval, latency, timeout, security_mode, txsize):
+        self.connection = connection
+        self.interval = interval
+        self.latency = latency
+        self.timeout = timeout
+        self.security_mode = security_mode
+        self.txsize = txsize
+_struct_gecko_evt_le_connection_parameters = struct.Struct('<BHHHBH')
+def _decode_gecko_evt_le_connection_parameters(rx_buf, rx_start, rx_end):
+    connection, interval, latency, timeout, security_mode, txsize = _struct_gecko_evt_le_connection_parameters.unpack_from(rx_buf, rx_start)
+    return gecko_evt_le_connection_parameters_args(connection, interval, latency, timeout, security_mode, txsize)
+class gecko_evt_le_connection_rssi_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'status', 'rssi')
+    def __init__(self, connection, status, rssi):
+        self.connection = connection
+        self.status = status
+        self.rssi = rssi
+_struct_gecko_evt_le_connection_rssi = struct.Struct('<BBb')
+def _decode_gecko_evt_le_connection_rssi(rx_buf, rx_start, rx_end):
+    connection, status, rssi = _struct_gecko_evt_le_connection_rssi.unpack_from(rx_buf, rx_start)
+    return gecko_evt_le_connection_rssi_args(connection, status, rssi)
+class gecko_evt_le_connection_phy_status_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'phy')
+    def __init__(self, connection, phy):
+        self.connection = connection
+        self.phy = phy
+_struct_gecko_evt_le_connection_phy_status = struct.Struct('<BB')
+def _decode_gecko_evt_le_connection_phy_status(rx_buf, rx_start, rx_end):
+    connection, phy = _struct_gecko_evt_le_connection_phy_status.unpack_from(rx_buf, rx_start)
+    return gecko_evt_le_connection_phy_status_args(connection, phy)
+class gecko_evt_gatt_mtu_exchanged_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'mtu')
+    def __init__(self, connection, mtu):
+        self.connection = connection
+        self.mtu = mtu
+_struct_gecko_evt_gatt_mtu_exchanged = struct.Struct('<BH')
+def _decode_gecko_evt_gatt_mtu_exchanged(rx_buf, rx_start, rx_end):
+    connection, mtu = _struct_gecko_evt_gatt_mtu_exchanged.unpack_from(rx_buf, rx_start)
+    return gecko_evt_gatt_mtu_exchanged_args(connection, mtu)
+class gecko_evt_gatt_service_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'service', 'uuid')
+    def __init__(self, connection, service, uuid):
+        self.connection = connection
+        self.service = service
+        self.uuid = uuid
+_struct_gecko_evt_gatt_service = struct.Struct('<BIB')
+def _decode_gecko_evt_gatt_service(rx_buf, rx_start, rx_end):
+    connection, service, uuid_len = _struct_gecko_evt_gatt_service.unpack_from(rx_buf, rx_start)
+    uuid_data = rx_buf[rx_start + 6:rx_end]
+    return gecko_evt_gatt_service_args(connection, service, uuid_data)
+class gecko_evt_gatt_characteristic_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'characteristic', 'properties', 'uuid')
+    def __init__(self, connection, characteristic, properties, uuid):
+        self.connection = connection
+        self.characteristic = characteristic
+        self.properties = properties
+        self.uuid = uuid
+_struct_gecko_evt_gatt_characteristic = struct.Struct('<BHBB')
+def _decode_gecko_evt_gatt_characteristic(rx_buf, rx_start, rx_end):
+    connection, characteristic, properties, uuid_len = _struct_gecko_evt_gatt_characteristic.unpack_from(rx_buf, rx_start)
+    uuid_data = rx_buf[rx_start + 5:rx_end]
+    return gecko_evt_gatt_characteristic_args(connection, characteristic, properties, uuid_data)
+class gecko_evt_gatt_descriptor_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'descriptor', 'uuid')
+    def __init__(self, connection, descriptor, uuid):
+        self.connection = connection
+        self.descriptor = descriptor
+        self.uuid = uuid
+_struct_gecko_evt_gatt_descriptor = struct.Struct('<BHB')
+def _decode_gecko_evt_gatt_descriptor(rx_buf, rx_start, rx_end):
+    connection, descriptor, uuid_len = _struct_gecko_evt_gatt_descriptor.unpack_from(rx_buf, rx_start)
+    uuid_data = rx_buf[rx_start + 4:rx_end]
+    return gecko_evt_gatt_descriptor_args(connection, descriptor, uuid_data)
+class gecko_evt_gatt_characteristic_value_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'characteristic', 'att_opcode', 'offset', 'value')
+    def __init__(self, connection, characteristic, att_opcode, offset, value):
+        self.connection = connection
+        self.characteristic = characteristic
+        self.att_opcode = att_opcode
+        self.offset = offset
+        self.value = value
+_struct_gecko_evt_gatt_characteristic_value = struct.Struct('<BHBHB')
+def _decode_gecko_evt_gatt_characteristic_value(rx_buf, rx_start, rx_end):
+    connection, characteristic, att_opcode, offset, value_len = _struct_gecko_evt_gatt_characteristic_value.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 7:rx_end]
+    return gecko_evt_gatt_characteristic_value_args(connection, characteristic, att_opcode, offset, value_data)
+class gecko_evt_gatt_descriptor_value_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'descriptor', 'offset', 'value')
+    def __init__(self, connection, descriptor, offset, value):
+        self.connection = connection
+        self.descriptor = descriptor
+        self.offset = offset
+        self.value = value
+_struct_gecko_evt_gatt_descriptor_value = struct.Struct('<BHHB')
+def _decode_gecko_evt_gatt_descriptor_value(rx_buf, rx_start, rx_end):
+    connection, descriptor, offset, value_len = _struct_gecko_evt_gatt_descriptor_value.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 6:rx_end]
+    return gecko_evt_gatt_descriptor_value_args(connection, descriptor, offset, value_data)
+class gecko_evt_gatt_procedure_completed_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_gecko_evt_gatt_procedure_completed = struct.Struct('<BH')
+def _decode_gecko_evt_gatt_procedure_completed(rx_buf, rx_start, rx_end):
+    connection, result = _struct_gecko_evt_gatt_procedure_completed.unpack_from(rx_buf, rx_start)
+    return gecko_evt_gatt_procedure_completed_args(connection, result)
+class gecko_evt_gatt_server_attribute_value_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'attribute', 'att_opcode', 'offset', 'value')
+    def __init__(self, connection, attribute, att_opcode, offset, value):
+        self.connection = connection
+        self.attribute = attribute
+        self.att_opcode = att_opcode
+        self.offset = offset
+        self.value = value
+_struct_gecko_evt_gatt_server_attribute_value = struct.Struct('<BHBHB')
+def _decode_gecko_evt_gatt_server_attribute_value(rx_buf, rx_start, rx_end):
+    connection, attribute, att_opcode, offset, value_len = _struct_gecko_evt_gatt_server_attribute_value.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 7:rx_end]
+    return gecko_evt_gatt_server_attribute_value_args(connection, attribute, att_opcode, offset, value_data)
+class gecko_evt_gatt_server_user_read_request_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'characteristic', 'att_opcode', 'offset')
+    def __init__(self, connection, characteristic, att_opcode, offset):
+        self.connection = connection
+        self.characteristic = characteristic
+        self.att_opcode = att_opcode
+        self.offset = offset
+_struct_gecko_evt_gatt_server_user_read_request = struct.Struct('<BHBH')
+def _decode_gecko_evt_gatt_server_user_read_request(rx_buf, rx_start, rx_end):
+    connection, characteristic, att_opcode, offset = _struct_gecko_evt_gatt_server_user_read_request.unpack_from(rx_buf, rx_start)
+    return gecko_evt_gatt_server_user_read_request_args(connection, characteristic, att_opcode, offset)
+class gecko_evt_gatt_server_user_write_request_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'characteristic', 'att_opcode', 'offset', 'value')
+    def __init__(self, connection, characteristic, att_opcode, offset, value):
+        self.connection = connection
+        self.characteristic = characteristic
+        self.att_opcode = att_opcode
+        self.offset = offset
+        self.value = value
+_struct_gecko_evt_gatt_server_user_write_request = struct.Struct('<BHBHB')
+def _decode_gecko_evt_gatt_server_user_write_request(rx_buf, rx_start, rx_end):
+    connection, characteristic, att_opcode, offset, value_len = _struct_gecko_evt_gatt_server_user_write_request.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 7:rx_end]
+    return gecko_evt_gatt_server_user_write_request_args(connection, characteristic, att_opcode, offset, value_data)
+class gecko_evt_gatt_server_characteristic_status_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'characteristic', 'status_flags', 'client_config_flags')
+    def __init__(self, connection, characteristic, status_flags, client_config_flags):
+        self.connection = connection
+        self.characteristic = characteristic
+        self.status_flags = status_flags
+        self.client_config_flags = client_config_flags
+_struct_gecko_evt_gatt_server_characteristic_status = struct.Struct('<BHBH')
+def _decode_gecko_evt_gatt_server_characteristic_status(rx_buf, rx_start, rx_end):
+    connection, characteristic, status_flags, client_config_flags = _struct_gecko_evt_gatt_server_characteristic_status.unpack_from(rx_buf, rx_start)
+    return gecko_evt_gatt_server_characteristic_status_args(connection, characteristic, status_flags, client_config_flags)
+class gecko_evt_gatt_server_execute_write_completed_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_gecko_evt_gatt_server_execute_write_completed = struct.Struct('<BH')
+def _decode_gecko_evt_gatt_server_execute_write_completed(rx_buf, rx_start, rx_end):
+    connection, result = _struct_gecko_evt_gatt_server_execute_write_completed.unpack_from(rx_buf, rx_start)
+    return gecko_evt_gatt_server_execute_write_completed_args(connection, result)
+class gecko_evt_hardware_soft_timer_args(BGAPIArgs):
+    __slots__ = _fields = ('handle',)
+    def __init__(self, handle):
+        self.handle = handle
+_struct_gecko_evt_hardware_soft_timer = struct.Struct('<B')
+def _decode_gecko_evt_hardware_soft_timer(rx_buf, rx_start, rx_end):
+    handle = _struct_gecko_evt_hardware_soft_timer.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_hardware_soft_timer_args(handle)
+class gecko_evt_test_dtm_completed_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'number_of_packets')
+    def __init__(self, result, number_of_packets):
+        self.result = result
+        self.number_of_packets = number_of_packets
+_struct_gecko_evt_test_dtm_completed = struct.Struct('<HH')
+def _decode_gecko_evt_test_dtm_completed(rx_buf, rx_start, rx_end):
+    result, number_of_packets = _struct_gecko_evt_test_dtm_completed.unpack_from(rx_buf, rx_start)
+    return gecko_evt_test_dtm_completed_args(result, number_of_packets)
+class gecko_evt_sm_passkey_display_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'passkey')
+    def __init__(self, connection, passkey):
+        self.connection = connection
+        self.passkey = passkey
+_struct_gecko_evt_sm_passkey_display = struct.Struct('<BI')
+def _decode_gecko_evt_sm_passkey_display(rx_buf, rx_start, rx_end):
+    connection, passkey = _struct_gecko_evt_sm_passkey_display.unpack_from(rx_buf, rx_start)
+    return gecko_evt_sm_passkey_display_args(connection, passkey)
+class gecko_evt_sm_passkey_request_args(BGAPIArgs):
+    __slots__ = _fields = ('connection',)
+    def __init__(self, connection):
+        self.connection = connection
+_struct_gecko_evt_sm_passkey_request = struct.Struct('<B')
+def _decode_gecko_evt_sm_passkey_request(rx_buf, rx_start, rx_end):
+    connection = _struct_gecko_evt_sm_passkey_request.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_sm_passkey_request_args(connection)
+class gecko_evt_sm_confirm_passkey_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'passkey')
+    def __init__(self, connection, passkey):
+        self.connection = connection
+        self.passkey = passkey
+_struct_gecko_evt_sm_confirm_passkey = struct.Struct('<BI')
+def _decode_gecko_evt_sm_confirm_passkey(rx_buf, rx_start, rx_end):
+    connection, passkey = _struct_gecko_evt_sm_confirm_passkey.unpack_from(rx_buf, rx_start)
+    return gecko_evt_sm_confirm_passkey_args(connection, passkey)
+class gecko_evt_sm_bonded_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'bonding')
+    def __init__(self, connection, bonding):
+        self.connection = connection
+        self.bonding = bonding
+_struct_gecko_evt_sm_bonded = struct.Struct('<BB')
+def _decode_gecko_evt_sm_bonded(rx_buf, rx_start, rx_end):
+    connection, bonding = _struct_gecko_evt_sm_bonded.unpack_from(rx_buf, rx_start)
+    return gecko_evt_sm_bonded_args(connection, bonding)
+class gecko_evt_sm_bonding_failed_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'reason')
+    def __init__(self, connection, reason):
+        self.connection = connection
+        self.reason = reason
+_struct_gecko_evt_sm_bonding_failed = struct.Struct('<BH')
+def _decode_gecko_evt_sm_bonding_failed(rx_buf, rx_start, rx_end):
+    connection, reason = _struct_gecko_evt_sm_bonding_failed.unpack_from(rx_buf, rx_start)
+    return gecko_evt_sm_bonding_failed_args(connection, reason)
+class gecko_evt_sm_list_bonding_entry_args(BGAPIArgs):
+    __slots__ = _fields = ('bonding', 'address', 'address_type')
+    def __init__(self, bonding, address, address_type):
+        self.bonding = bonding
+        self.address = address
+        self.address_type = address_type
+_struct_gecko_evt_sm_list_bonding_entry = struct.Struct('<B6sB')
+def _decode_gecko_evt_sm_list_bonding_entry(rx_buf, rx_start, rx_end):
+    bonding, address, address_type = _struct_gecko_evt_sm_list_bonding_entry.unpack_from(rx_buf, rx_start)
+    return gecko_evt_sm_list_bonding_entry_args(bonding, address, address_type)
+class gecko_evt_sm_list_all_bondings_complete_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_gecko_evt_sm_list_all_bondings_complete(rx_buf, rx_start, rx_end):
+    return gecko_evt_sm_list_all_bondings_complete_args()
+class gecko_evt_sm_confirm_bonding_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'bonding_handle')
+    def __init__(self, connection, bonding_handle):
+        self.connection = connection
+        self.bonding_handle = bonding_handle
+_struct_gecko_evt_sm_confirm_bonding = struct.Struct('<Bb')
+def _decode_gecko_evt_sm_confirm_bonding(rx_buf, rx_start, rx_end):
+    connection, bonding_handle = _struct_gecko_evt_sm_confirm_bonding.unpack_from(rx_buf, rx_start)
+    return gecko_evt_sm_confirm_bonding_args(connection, bonding_handle)
+class gecko_evt_homekit_setupcode_display_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'setupcode')
+    def __init__(self, connection, setupcode):
+        self.connection = connection
+        self.setupcode = setupcode
+_struct_gecko_evt_homekit_setupcode_display = struct.Struct('<BB')
+def _decode_gecko_evt_homekit_setupcode_display(rx_buf, rx_start, rx_end):
+    connection, setupcode_len = _struct_gecko_evt_homekit_setupcode_display.unpack_from(rx_buf, rx_start)
+    setupcode_data = rx_buf[rx_start + 2:rx_end]
+    return gecko_evt_homekit_setupcode_display_args(connection, setupcode_data)
+class gecko_evt_homekit_paired_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'reason')
+    def __init__(self, connection, reason):
+        self.connection = connection
+        self.reason = reason
+_struct_gecko_evt_homekit_paired = struct.Struct('<BH')
+def _decode_gecko_evt_homekit_paired(rx_buf, rx_start, rx_end):
+    connection, reason = _struct_gecko_evt_homekit_paired.unpack_from(rx_buf, rx_start)
+    return gecko_evt_homekit_paired_args(connection, reason)
+class gecko_evt_homekit_pair_verified_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'reason')
+    def __init__(self, connection, reason):
+        self.connection = connection
+        self.reason = reason
+_struct_gecko_evt_homekit_pair_verified = struct.Struct('<BH')
+def _decode_gecko_evt_homekit_pair_verified(rx_buf, rx_start, rx_end):
+    connection, reason = _struct_gecko_evt_homekit_pair_verified.unpack_from(rx_buf, rx_start)
+    return gecko_evt_homekit_pair_verified_args(connection, reason)
+class gecko_evt_homekit_connection_opened_args(BGAPIArgs):
+    __slots__ = _fields = ('connection',)
+    def __init__(self, connection):
+        self.connection = connection
+_struct_gecko_evt_homekit_connection_opened = struct.Struct('<B')
+def _decode_gecko_evt_homekit_connection_opened(rx_buf, rx_start, rx_end):
+    connection = _struct_gecko_evt_homekit_connection_opened.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_homekit_connection_opened_args(connection)
+class gecko_evt_homekit_connection_closed_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'reason')
+    def __init__(self, connection, reason):
+        self.connection = connection
+        self.reason = reason
+_struct_gecko_evt_homekit_connection_closed = struct.Struct('<BH')
+def _decode_gecko_evt_homekit_connection_closed(rx_buf, rx_start, rx_end):
+    connection, reason = _struct_gecko_evt_homekit_connection_closed.unpack_from(rx_buf, rx_start)
+    return gecko_evt_homekit_connection_closed_args(connection, reason)
+class gecko_evt_homekit_identify_args(BGAPIArgs):
+    __slots__ = _fields = ('connection',)
+    def __init__(self, connection):
+        self.connection = connection
+_struct_gecko_evt_homekit_identify = struct.Struct('<B')
+def _decode_gecko_evt_homekit_identify(rx_buf, rx_start, rx_end):
+    connection = _struct_gecko_evt_homekit_identify.unpack_from(rx_buf, rx_start)[0]
+    return gecko_evt_homekit_identify_args(connection)
+class gecko_evt_homekit_write_request_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'characteristic', 'chr_value_size', 'authorization_size', 'value_offset', 'value')
+    def __init__(self, connection, characteristic, chr_value_size, authorization_size, value_offset, value):
+        self.connection = connection
+        self.characteristic = characteristic
+        self.chr_value_size = chr_value_size
+        self.authorization_size = authorization_size
+        self.value_offset = value_offset
+        self.value = value
+_struct_gecko_evt_homekit_write_request = struct.Struct('<BHHHHB')
+def _decode_gecko_evt_homekit_write_request(rx_buf, rx_start, rx_end):
+    connection, characteristic, chr_value_size, authorization_size, value_offset, value_len = _struct_gecko_evt_homekit_write_request.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 10:rx_end]
+    return gecko_evt_homekit_write_request_args(connection, characteristic, chr_value_size, authorization_size, value_offset, value_data)
+class gecko_evt_homekit_read_request_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'characteristic', 'offset')
+    def __init__(self, connection, characteristic, offset):
+        self.connection = connection
+        self.characteristic = characteristic
+        self.offset = offset
+_struct_gecko_evt_homekit_read_request = struct.Struct('<BHH')
+def _decode_gecko_evt_homekit_read_request(rx_buf, rx_start, rx_end):
+    connection, characteristic, offset = _struct_gecko_evt_homekit_read_request.unpack_from(rx_buf, rx_start)
+    return gecko_evt_homekit_read_request_args(connection, characteristic, offset)
+class gecko_evt_homekit_disconnection_required_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'reason')
+    def __init__(self, connection, reason):
+        self.connection = connection
+        self.reason = reason
+_struct_gecko_evt_homekit_disconnection_required = struct.Struct('<BH')
+def _decode_gecko_evt_homekit_disconnection_required(rx_buf, rx_start, rx_end):
+    connection, reason = _struct_gecko_evt_homekit_disconnection_required.unpack_from(rx_buf, rx_start)
+    return gecko_evt_homekit_disconnection_required_args(connection, reason)
+class gecko_evt_homekit_pairing_removed_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'remaining_pairings', 'pairing_id')
+    def __init__(self, connection, remaining_pairings, pairing_id):
+        self.connection = connection
+        self.remaining_pairings = remaining_pairings
+        self.pairing_id = pairing_id
+_struct_gecko_evt_homekit_pairing_removed = struct.Struct('<BHB')
+def _decode_gecko_evt_homekit_pairing_removed(rx_buf, rx_start, rx_end):
+    connection, remaining_pairings, pairing_id_len = _struct_gecko_evt_homekit_pairing_removed.unpack_from(rx_buf, rx_start)
+    pairing_id_data = rx_buf[rx_start + 4:rx_end]
+    return gecko_evt_homekit_pairing_removed_args(connection, remaining_pairings, pairing_id_data)
+class gecko_evt_homekit_setuppayload_display_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'setuppayload')
+    def __init__(self, connection, setuppayload):
+        self.connection = connection
+        self.setuppayload = setuppayload
+_struct_gecko_evt_homekit_setuppayload_display = struct.Struct('<BB')
+def _decode_gecko_evt_homekit_setuppayload_display(rx_buf, rx_start, rx_end):
+    connection, setuppayload_len = _struct_gecko_evt_homekit_setuppayload_display.unpack_from(rx_buf, rx_start)
+    setuppayload_data = rx_buf[rx_start + 2:rx_end]
+    return gecko_evt_homekit_setuppayload_display_args(connection, setuppayload_data)
+class gecko_evt_l2cap_coc_connection_request_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'le_psm', 'source_cid', 'mtu', 'mps', 'initial_credit', 'flags', 'encryption_key_size')
+    def __init__(self, connection, le_psm, source_cid, mtu, mps, initial_credit, flags, encryption_key_size):
+        self.connection = connection
+        self.le_psm = le_psm
+        self.source_cid = source_cid
+        self.mtu = mtu
+        self.mps = mps
+        self.initial_credit = initial_credit
+        self.flags = flags
+        self.encryption_key_size = encryption_key_size
+_struct_gecko_evt_l2cap_coc_connection_request = struct.Struct('<BHHHHHBB')
+def _decode_gecko_evt_l2cap_coc_connection_request(rx_buf, rx_start, rx_end):
+    connection, le_psm, source_cid, mtu, mps, initial_credit, flags, encryption_key_size = _struct_gecko_evt_l2cap_coc_connection_request.unpack_from(rx_buf, rx_start)
+    return gecko_evt_l2cap_coc_connection_request_args(connection, le_psm, source_cid, mtu, mps, initial_credit, flags, encryption_key_size)
+class gecko_evt_l2cap_coc_connection_response_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'destination_cid', 'mtu', 'mps', 'initial_credit', 'result')
+    def __init__(self, connection, destination_cid, mtu, mps, initial_credit, result):
+        self.connection = connection
+        self.destination_cid = destination_cid
+        self.mtu = mtu
+        self.mps = mps
+        self.initial_credit = initial_credit
+        self.result = result
+_struct_gecko_evt_l2cap_coc_connection_response = struct.Struct('<BHHHHH')
+def _decode_gecko_evt_l2cap_coc_connection_response(rx_buf, rx_start, rx_end):
+    connection, destination_cid, mtu, mps, initial_credit, result = _struct_gecko_evt_l2cap_coc_connection_response.unpack_from(rx_buf, rx_start)
+    return gecko_evt_l2cap_coc_connection_response_args(connection, destination_cid, mtu, mps, initial_credit, result)
+class gecko_evt_l2cap_coc_le_flow_control_credit_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'cid', 'credits')
+    def __init__(self, connection, cid, credits):
+        self.connection = connection
+        self.cid = cid
+        self.credits = credits
+_struct_gecko_evt_l2cap_coc_le_flow_control_credit = struct.Struct('<BHH')
+def _decode_gecko_evt_l2cap_coc_le_flow_control_credit(rx_buf, rx_start, rx_end):
+    connection, cid, credits = _struct_gecko_evt_l2cap_coc_le_flow_control_credit.unpack_from(rx_buf, rx_start)
+    return gecko_evt_l2cap_coc_le_flow_control_credit_args(connection, cid, credits)
+class gecko_evt_l2cap_coc_channel_disconnected_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'cid', 'reason')
+    def __init__(self, connection, cid, reason):
+        self.connection = connection
+        self.cid = cid
+        self.reason = reason
+_struct_gecko_evt_l2cap_coc_channel_disconnected = struct.Struct('<BHH')
+def _decode_gecko_evt_l2cap_coc_channel_disconnected(rx_buf, rx_start, rx_end):
+    connection, cid, reason = _struct_gecko_evt_l2cap_coc_channel_disconnected.unpack_from(rx_buf, rx_start)
+    return gecko_evt_l2cap_coc_channel_disconnected_args(connection, cid, reason)
+class gecko_evt_l2cap_coc_data_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'cid', 'data')
+    def __init__(self, connection, cid, data):
+        self.connection = connection
+        self.cid = cid
+        self.data = data
+_struct_gecko_evt_l2cap_coc_data = struct.Struct('<BHB')
+def _decode_gecko_evt_l2cap_coc_data(rx_buf, rx_start, rx_end):
+    connection, cid, data_len = _struct_gecko_evt_l2cap_coc_data.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 4:rx_end]
+    return gecko_evt_l2cap_coc_data_args(connection, cid, data_data)
+class gecko_evt_l2cap_command_rejected_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'code', 'reason')
+    def __init__(self, connection, code, reason):
+        self.connection = connection
+        self.code = code
+        self.reason = reason
+_struct_gecko_evt_l2cap_command_rejected = struct.Struct('<BBH')
+def _decode_gecko_evt_l2cap_command_rejected(rx_buf, rx_start, rx_end):
+    connection, code, reason = _struct_gecko_evt_l2cap_command_rejected.unpack_from(rx_buf, rx_start)
+    return gecko_evt_l2cap_command_rejected_args(connection, code, reason)
+class gecko_evt_cte_receiver_iq_report_args(BGAPIArgs):
+    __slots__ = _fields = ('status', 'packet_type', 'handle', 'phy', 'channel', 'rssi', 'rssi_antenna_id', 'cte_type', 'slot_durations', 'event_counter', 'completeness', 'samples')
+    def __init__(self, status, packet_type, handle, phy, channel, rssi, rssi_antenna_id, cte_type, slot_durations, event_counter, completeness, samples):
+        self.status = status
+        self.packet_type = packet_type
+        self.handle = handle
+        self.phy = phy
+        self.channel = channel
+        self.rssi = rssi
+        self.rssi_antenna_id = rssi_antenna_id
+        self.cte_type = cte_type
+        self.slot_durations = slot_durations
+        self.event_counter = event_counter
+        self.completeness = completeness
+        self.samples = samples
+_struct_gecko_evt_cte_receiver_iq_report = struct.Struct('<HBBBBbBBBHBB')
+def _decode_gecko_evt_cte_receiver_iq_report(rx_buf, rx_start, rx_end):
+    status, packet_type, handle, phy, channel, rssi, rssi_antenna_id, cte_type, slot_durations, event_counter, completeness, samples_len = _struct_gecko_evt_cte_receiver_iq_report.unpack_from(rx_buf, rx_start)
+    samples_data = rx_buf[rx_start + 14:rx_end]
+    return gecko_evt_cte_receiver_iq_report_args(status, packet_type, handle, phy, channel, rssi, rssi_antenna_id, cte_type, slot_durations, event_counter, completeness, samples_data)
+class gecko_evt_qualtester_state_changed_args(BGAPIArgs):
+    __slots__ = _fields = ('group', 'id', 'value', 'data')
+    def __init__(self, group, id, value, data):
+        self.group = group
+        self.id = id
+        self.value = value
+        self.data = data
+_struct_gecko_evt_qualtester_state_changed = struct.Struct('<IIIB')
+def _decode_gecko_evt_qualtester_state_changed(rx_buf, rx_start, rx_end):
+    group, id, value, data_len = _struct_gecko_evt_qualtester_state_changed.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 13:rx_end]
+    return gecko_evt_qualtester_state_changed_args(group, id, value, data_data)
+class gecko_evt_user_message_to_host_args(BGAPIArgs):
+    __slots__ = _fields = ('data',)
+    def __init__(self, data):
+        self.data = data
+_struct_gecko_evt_user_message_to_host = struct.Struct('<B')
+def _decode_gecko_evt_user_message_to_host(rx_buf, rx_start, rx_end):
+    data_len = _struct_gecko_evt_user_message_to_host.unpack_from(rx_buf, rx_start)[0]
+    data_data = rx_buf[rx_start + 1:rx_end]
+    return gecko_evt_user_message_to_host_args(data_data)
+
+
 class BGLib(object):
 
     def gecko_cmd_dfu_reset(self, dfu):
@@ -679,11 +2790,77 @@ class BGLib(object):
     on_timeout = BGAPIEvent()
     on_before_tx_command = BGAPIEvent()
     on_tx_command_complete = BGAPIEvent()
+    on_raw_frame = BGAPIEvent()
 
     bgapi_rx_buffer = b""
     bgapi_rx_expected_length = 0
+    bgapi_rx_recycled = b""
+    bgapi_rx_partial_time = 0
     busy = False
+    zero_copy = False
+    buffered_read = False
+    resync = False
+    resync_timeout = 0.05
+    rx_discarded_bytes = 0
+    rx_partial_timeouts = 0
+    event_queue = None
+    rx_dropped_events = 0
+    rx_handler_errors = 0
+    raw_frame_filter = None
+    capture = None
+    raw_frame_only = False
     debug = False
+    _reader = None
+    _rx_chunk = None
+    _rx_pos = 0
+    _rx_depth = 0
+    _attribute_event = None
+
+    def __new__(cls, *args, **kwargs):
+        # per-instance state is set up here rather than in __init__(), so a
+        # subclass whose __init__() does not call BGLib.__init__() still parses
+        self = super().__new__(cls)
+        self.__eventhandler__ = {}
+        self.__eventhandlers__ = {}
+        self._any_handlers = {}
+        self._raw_frame_handler = self.on_raw_frame
+        self._response_waiters = {}
+        self._command_queue = deque()
+        self._command_pending = None
+        self._command_lock = threading.Lock()
+        return self
+
+    def __init__(self, zero_copy=False):
+
+        """Create a BGLib parser.
+
+        With zero_copy set, uint8array fields such as 'data', 'value' and
+        'handles' are passed to handlers as read-only memoryviews rather than
+        as new bytes objects, whichever way the data is parsed. From
+        parse_bytes() they view a receive buffer that is recycled by the next
+        call, so a view is only valid until the handler returns; call
+        .tobytes() on it to keep the contents.
+
+        on_raw_frame handlers get a BGAPIRawFrame with the undecoded 4-byte
+        header and payload of every received packet, or only of those matching
+        raw_frame_filter, a set of class IDs and/or (class ID, command ID)
+        pairs. With raw_frame_only set, those packets are not decoded and
+        their own events do not fire; busy/idle tracking is unaffected, and a
+        response that a submit() or call() is waiting for is still decoded to
+        complete it.
+
+        With resync set, parse_bytes() only accepts a header whose message
+        type, class and command are in bgapi_rx_dispatch and whose length fits
+        bgapi_rx_lengths, otherwise it steps one byte and searches on through
+        the received data for the next plausible header. A partial frame still
+        incomplete after resync_timeout seconds is given up the same way;
+        check_activity() shortens its reads and the start_reader() thread
+        waits at most that long for more data, so that this happens even on
+        a port opened without a read timeout. rx_discarded_bytes and rx_partial_timeouts count the bytes
+        skipped and the partial frames given up.
+        """
+
+        self.zero_copy = zero_copy
 
     def send_command(self, ser, packet):
         if self.debug: print('=>[ ' + ' '.join(['%02X' % b for b in packet]) + ' ]')
@@ -691,26 +2868,458 @@ class BGLib(object):
         self.busy = True
         self.on_busy()
         ser.write(packet)
+        if self.capture is not None: self.capture.write(BGAPICapture.TX, packet)
         self.on_tx_command_complete()
 
+    def send_many(self, ser, packets):
+
+        """Send several command packets, in order, with a single ser.write().
+
+        For streams of commands whose responses are not waited for one by one,
+        e.g. gecko_cmd_gatt_write_characteristic_value_without_response. on_before_tx_command, on_busy and
+        on_tx_command_complete fire once for the whole batch, and the
+        responses are parsed as usual when they arrive. To keep commands in
+        order with submit() and call(), raises RuntimeError while a submitted
+        command is still waiting for its response, and commands submitted
+        while the batch is written are sent after it. Returns the number of
+        packets sent.
+        """
+
+        packets = list(packets)
+        if len(packets) == 0:
+            return 0
+        batch = concurrent.futures.Future()
+        with self._command_lock:
+            if self._command_pending is not None:
+                raise RuntimeError('a submitted command is still waiting for its response')
+            # submit() queues behind the batch until it has been written
+            self._command_pending = batch
+        try:
+            if self.debug:
+                for packet in packets: print('=>[ ' + ' '.join(['%02X' % b for b in packet]) + ' ]')
+            self.on_before_tx_command()
+            self.busy = True
+            self.on_busy()
+            data = b"".join(packets)
+            ser.write(data)
+            if self.capture is not None: self.capture.write(BGAPICapture.TX, data)
+            self.on_tx_command_complete()
+        finally:
+            self._command_done(batch)
+        return len(packets)
+
     def check_activity(self, ser, timeout=0):
+
+        """Read and parse pending serial data.
+
+        With buffered_read set, each read takes everything the port has waiting
+        (blocking for the first byte only when a timeout is given) and hands
+        the whole chunk to parse_bytes() instead of reading one byte per call.
+        Called from a handler, it first parses the rest of the data that
+        handler's packet arrived with, and returns at once if that completes
+        the command being waited for.
+        """
+
+        if self._rx_chunk is not None:
+            busy = self.busy
+            self.parse_bytes(b"")
+            if busy and not self.busy:
+                return self.busy
         if timeout > 0:
-            ser.timeout = timeout
+            ser.timeout = read_timeout = timeout
             while 1:
-                x = ser.read()
+                if self.resync:
+                    # wait no longer than the partial frame time limit
+                    if len(self.bgapi_rx_buffer) > 0 and self.resync_timeout < timeout:
+                        if read_timeout != self.resync_timeout:
+                            ser.timeout = read_timeout = self.resync_timeout
+                    elif read_timeout != timeout:
+                        ser.timeout = read_timeout = timeout
+                if self.buffered_read or self.resync:
+                    x = ser.read(ser.inWaiting() or 1)
+                else:
+                    x = ser.read()
                 if len(x) > 0:
-                    self.parse(x)
+                    if self.buffered_read or self.resync:
+                        self.parse_bytes(x)
+                    else:
+                        self.parse(x)
+                elif self.resync and len(self.bgapi_rx_buffer) > 0:
+                    # partial frame timed out, resync after its first byte
+                    self._parse_bytes_resync(b"", True)
                 else: # timeout
                     self.busy = False
                     self.on_idle()
                     self.on_timeout()
+                    self._timeout_command()
                 if not self.busy: # finished
                     break
+        elif self.buffered_read or self.resync:
+            while ser.inWaiting(): self.parse_bytes(ser.read(ser.inWaiting()))
         else:
             while ser.inWaiting(): self.parse(ser.read())
         return self.busy
 
+    def start_reader(self, ser, queue_size=0):
+
+        """Read and parse ser on a background daemon thread until stop() is called.
+
+        The thread blocks on the port and hands whatever each read returns to
+        parse_bytes(), so packets are handled as soon as they arrive instead of
+        at the next check_activity() poll. By default, handlers run in place on
+        the reader thread. With queue_size > 0, decoded responses and events
+        are put on event_queue, a queue.Queue of (event, args) pairs bounded to
+        queue_size entries, and their handlers run when process_events() is
+        called; the reader waits while the queue is full. on_idle, on_timeout
+        and on_raw_frame always fire on the reader thread. Do not call
+        check_activity() or parse() on ser while the reader is running.
+
+        An exception raised by a handler on the reader thread is printed and
+        counted in rx_handler_errors, and reading goes on. If reading the port
+        fails, the thread exits and commands waiting for a response fail with
+        that error.
+        """
+
+        if self._reader is not None:
+            raise RuntimeError('reader thread already running')
+        if queue_size > 0 and self.zero_copy:
+            # zero_copy views would be overwritten before the handlers run
+            raise ValueError('queue_size cannot be used with zero_copy')
+        self.event_queue = queue.Queue(queue_size) if queue_size > 0 else None
+        self._reader_port = ser
+        self._reader_stop = threading.Event()
+        self._reader = threading.Thread(target=self._run_reader, args=(ser, self._reader_stop), name='BGLib reader')
+        self._reader.daemon = True
+        self._reader.start()
+        return self._reader
+
+    def stop(self, timeout=None):
+
+        """Stop the reader thread started by start_reader() and wait for it to exit.
+
+        A blocked read is interrupted with ser.cancel_read() where the port
+        supports it, otherwise the thread exits after its current read returns
+        (after at most ser.timeout). Events still on event_queue are kept for
+        process_events(). Returns True once the thread has exited.
+        """
+
+        reader = self._reader
+        if reader is None:
+            return True
+        self._reader_stop.set()
+        if hasattr(self._reader_port, 'cancel_read'):
+            self._reader_port.cancel_read()
+        reader.join(timeout)
+        if reader.is_alive():
+            return False
+        self._reader = None
+        self._reader_port = None
+        return True
+
+    def process_events(self, timeout=None):
+
+        """Run the handlers of events queued by the reader thread, on the calling thread.
+
+        Waits up to timeout seconds (forever if None, not at all if 0) for the
+        first event, then handles everything already queued without waiting
+        again. Returns the number of events handled.
+        """
+
+        if self.event_queue is None:
+            return 0
+        try:
+            event, args = self.event_queue.get(timeout != 0, timeout)
+        except queue.Empty:
+            return 0
+        count = 0
+        while 1:
+            self._run_handlers(event, args)
+            count += 1
+            try:
+                event, args = self.event_queue.get_nowait()
+            except queue.Empty:
+                return count
+
+    def submit(self, ser, packet):
+
+        """Queue a command packet and return a concurrent.futures.Future for its response.
+
+        Submitted commands are written one at a time: the next one goes out as
+        soon as the response to the previous one, matched by class and command
+        ID, has been parsed, whether by check_activity(), the reader thread or
+        parse_bytes(). The future's result() is the args of the response, so a
+        sequence of commands takes as long as the device needs to answer them
+        rather than a check_activity() timeout each. If check_activity() times
+        out first, the pending command fails with TimeoutError and the next
+        one is sent. Commands sent directly with send_command() bypass the
+        queue.
+        """
+
+        future = concurrent.futures.Future()
+        self._queue_command(ser, packet, future)
+        return future
+
+    def call(self, ser, packet, timeout=1):
+
+        """Send a command and block until its response arrives; return the response args.
+
+        For example, ble.call(ser, ble.gecko_cmd_system_get_bt_address()).address. The command
+        is queued as with submit(). Unless the reader thread is running, the
+        port is read and parsed here (so events arriving meanwhile are handled
+        too), waiting on the port's file descriptor where it has one. So is it
+        when call() is made from a handler running on the reader thread, which
+        is blocked until the handler returns. The port timeout and other
+        settings are left as they are. Raises TimeoutError
+        if no response arrives within timeout seconds; the command is then
+        dropped and on_timeout fires.
+        """
+
+        future = self.submit(ser, packet)
+        deadline = time.monotonic() + timeout
+        if self._reader is None or threading.current_thread() is self._reader:
+            if self._rx_chunk is not None:
+                # called from a handler, the rest of its chunk comes first
+                self.parse_bytes(b"")
+            while not future.done():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if ser.inWaiting():
+                    self.parse_bytes(ser.read(ser.inWaiting()))
+                else:
+                    self._wait_readable(ser, remaining)
+        try:
+            return future.result(max(0, deadline - time.monotonic()))
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            if self._command_pending is None:
+                self.busy = False
+                self.on_idle()
+            self.on_timeout()
+            raise TimeoutError('no response to command within %s s' % timeout)
+
+    def _wait_readable(self, ser, timeout):
+
+        """(internal use) Wait up to timeout seconds for ser to have data to read."""
+
+        try:
+            fd = ser.fileno()
+        except (AttributeError, OSError, ValueError):
+            # no file descriptor to wait on (e.g. Windows), poll instead
+            time.sleep(min(timeout, 0.001))
+            return
+        select.select([fd], [], [], timeout)
+
+    def cancel_commands(self, exc=None):
+
+        """Drop all submitted commands that have not completed yet.
+
+        Their futures are failed with exc, or cancelled if exc is None.
+        """
+
+        with self._command_lock:
+            futures = [future for ser, packet, future in self._command_queue]
+            self._command_queue.clear()
+            for waiters in self._response_waiters.values():
+                futures.extend(future for future in waiters if future is not None)
+        for future in futures:
+            if exc is None:
+                future.cancel()
+            else:
+                try:
+                    future.set_exception(exc)
+                except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+                    pass
+
+    def _run_reader(self, ser, stop):
+
+        """(internal use) Reader thread body, see start_reader()."""
+
+        try:
+            while not stop.is_set():
+                if self._rx_chunk is not None:
+                    # a handler failed partway through a chunk, parse the rest
+                    x = b""
+                else:
+                    waiting = ser.inWaiting()
+                    partial = self.resync and len(self.bgapi_rx_buffer) > 0
+                    if waiting == 0 and (partial or getattr(ser, 'timeout', None) == 0):
+                        # wait here rather than spin on a non-blocking read(),
+                        # or block on a partial frame past resync_timeout
+                        self._wait_readable(ser, self.resync_timeout)
+                        waiting = ser.inWaiting()
+                    if waiting == 0 and partial:
+                        x = b""
+                    else:
+                        x = ser.read(waiting or 1)
+                try:
+                    if len(x) > 0 or self._rx_chunk is not None:
+                        self.parse_bytes(x)
+                    elif self.resync and len(self.bgapi_rx_buffer) > 0 and not stop.is_set():
+                        # nothing arrived to complete a partial frame
+                        self.parse_bytes(b"")
+                except Exception:
+                    self.rx_handler_errors += 1
+                    traceback.print_exc()
+        except Exception as exc:
+            # the port failed, no response can arrive any more
+            self.cancel_commands(exc)
+            raise
+        finally:
+            if self._reader is threading.current_thread():
+                self._reader = None
+
+    def _fire_event(self, event, args):
+
+        """(internal use) Run the handlers of a decoded packet, or queue them for
+        process_events(), waiting while event_queue is full."""
+
+        if self.event_queue is None:
+            self._run_handlers(event, args)
+            return
+        while 1:
+            try:
+                self.event_queue.put((event, args), True, 0.1)
+                return
+            except queue.Full:
+                if self._reader is not None and self._reader_stop.is_set():
+                    # stopping, nobody may be draining the queue
+                    self.rx_dropped_events += 1
+                    return
+
+    def on_batch(self, name, func, max_items=512, max_delay=0.05, columnar=False):
+
+        """Subscribe func(sender, batch) to batches of the event called name.
+
+        One call covers up to max_items packets, collected for at most
+        max_delay seconds (None waits for max_items), as a list of args
+        records or, with columnar, as a dict of one list per field:
+
+            ble.on_batch('gecko_evt_le_gap_scan_response', store, columnar=True)
+
+        Returns the BGAPIBatchHandler; remove it with -= on the event and
+        call its flush() to deliver what is left.
+        """
+
+        handler = BGAPIBatchHandler(func, max_items, max_delay, columnar)
+        getattr(self, name).add(handler)
+        return handler
+
+    def _run_handlers(self, event, args):
+
+        """(internal use) Call the handlers of event, then the matching on_any() handlers."""
+
+        for func in self.__eventhandler__.get(event, ()):
+            func(self, args)
+        if self._any_handlers:
+            for func in self._any_handlers.get(getattr(event, 'kind', None), ()):
+                func(self, event.name, args)
+
+    def on_any(self, func, kinds=('response', 'event')):
+
+        """Call func(sender, name, args) for every message of the given kinds.
+
+        kinds may include 'response' and 'event' for decoded messages, where
+        name is the event attribute name, and 'raw_frame' for every frame
+        on_raw_frame would see, with name 'on_raw_frame' and args a
+        BGAPIRawFrame. Decoded handlers run wherever the message's own
+        handlers run (see start_reader()). With no on_any() handlers the
+        receive path only checks one empty dict.
+        """
+
+        for kind in kinds:
+            if kind not in ('response', 'event', 'raw_frame'):
+                raise ValueError('unknown message kind %r' % (kind,))
+        for kind in kinds:
+            self._any_handlers[kind] = self._any_handlers.get(kind, ()) + (func,)
+
+    def off_any(self, func):
+
+        """Remove func from every kind it was added to with on_any()."""
+
+        for kind, functions in list(self._any_handlers.items()):
+            functions = tuple(f for f in functions if f != func)
+            if functions:
+                self._any_handlers[kind] = functions
+            else:
+                del self._any_handlers[kind]
+
+    def subscribe_attribute(self, connection, handle, func):
+
+        """Call func(sender, args) for each gecko_evt_gatt_characteristic_value of one
+        connection and characteristic only.
+
+        Packets are routed on the connection and handle bytes before they
+        are decoded, so the cost per notification does not grow with the
+        number of subscriptions, and one that nobody subscribed to is not
+        decoded at all. Handlers added to gecko_evt_gatt_characteristic_value itself
+        still see every notification.
+        """
+
+        key = (BGLib.gecko_evt_gatt_characteristic_value, connection, handle)
+        self.__eventhandler__[key] = self.__eventhandler__.get(key, ()) + (func,)
+        self._attribute_event = BGLib.gecko_evt_gatt_characteristic_value
+
+    def unsubscribe_attribute(self, connection, handle, func):
+
+        """Remove a func added with subscribe_attribute() for this connection and handle."""
+
+        key = (BGLib.gecko_evt_gatt_characteristic_value, connection, handle)
+        functions = list(self.__eventhandler__.get(key, ()))
+        functions.remove(func)
+        if functions:
+            self.__eventhandler__[key] = tuple(functions)
+        else:
+            del self.__eventhandler__[key]
+
+    def _route_attribute(self, decoder, event, buf, start, end):
+
+        """(internal use) Fire the subscribe_attribute() handlers of one
+        notification, keyed on its connection and handle bytes."""
+
+        key = (event, buf[start + 4], buf[start + 5] | buf[start + 6] << 8)
+        routed = self.__eventhandler__.get(key)
+        if routed or self.__eventhandler__.get(event) or self._any_handlers:
+            args = decoder(buf, start + 4, end)
+            if routed:
+                self._fire_event(key, args)
+            if self.__eventhandler__.get(event) or self._any_handlers:
+                self._fire_event(event, args)
+
+    def start_capture(self, file):
+
+        """Record every chunk parsed and command sent from now on to file, a
+        path or binary file object (see BGAPICapture); returns the capture.
+
+        Bytes given to parse() one at a time are recorded together, once a
+        packet is complete.
+        """
+
+        self.stop_capture()
+        self._capture_rx = bytearray()
+        self.capture = BGAPICapture(file)
+        return self.capture
+
+    def stop_capture(self):
+        if self.capture is not None:
+            self._write_capture_rx()
+            capture, self.capture = self.capture, None
+            capture.close()
+
+    def _write_capture_rx(self):
+
+        """(internal use) Record the bytes parse() has collected for the capture."""
+
+        if len(self._capture_rx) > 0:
+            self.capture.write(BGAPICapture.RX, self._capture_rx)
+            self._capture_rx = bytearray()
+
     def parse(self, barray):
+        if self._rx_chunk is not None:
+            # called from a handler while parse_bytes() is working through a
+            # chunk; the rest of that chunk comes first
+            return self.parse_bytes(barray[:1])
+        if self.capture is not None: self._capture_rx += barray[:1]
         b=barray[0]
         if len(self.bgapi_rx_buffer) == 0 and (b == 0xa0 or b == 0x20):
             self.bgapi_rx_buffer+=bytes([b])
@@ -734,754 +3343,2265 @@ class BGLib(object):
 
         #print'%02X: %d, %d' % (b, len(self.bgapi_rx_buffer), self.bgapi_rx_expected_length)
         if self.bgapi_rx_expected_length > 0 and len(self.bgapi_rx_buffer) == self.bgapi_rx_expected_length:
-            if self.debug: print('<=[ ' + ' '.join(['%02X' % b for b in self.bgapi_rx_buffer ]) + ' ]')
-            packet_type, payload_length, packet_class, packet_command = self.bgapi_rx_buffer[:4]
-            self.bgapi_rx_payload = self.bgapi_rx_buffer[4:]
+            packet = self.bgapi_rx_buffer
             self.bgapi_rx_buffer = b""
-            if packet_type & 0xa0 == 0x20:
-                # 0x20 = Blue Gecko response packet
-                if packet_class == 0:
-                    if packet_command == 0: # gecko_rsp_dfu_reset
-                        self.gecko_rsp_dfu_reset({  })
-                        self.busy = False
-                        self.on_idle()
-                    elif packet_command == 1: # gecko_rsp_dfu_flash_set_address
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_dfu_flash_set_address({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_dfu_flash_upload
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_dfu_flash_upload({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_dfu_flash_upload_finish
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_dfu_flash_upload_finish({ 'result': result })
-                elif packet_class == 1:
-                    if packet_command == 0: # gecko_rsp_system_hello
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_hello({ 'result': result })
-                    elif packet_command == 1: # gecko_rsp_system_reset
-                        self.gecko_rsp_system_reset({  })
-                    elif packet_command == 3: # gecko_rsp_system_get_bt_address
-                        address = struct.unpack('<6s', self.bgapi_rx_payload[:6])[0]
-                        address = address
-                        self.gecko_rsp_system_get_bt_address({ 'address': address })
-                    elif packet_command == 4: # gecko_rsp_system_set_bt_address
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_set_bt_address({ 'result': result })
-                    elif packet_command == 10: # gecko_rsp_system_set_tx_power
-                        set_power = struct.unpack('<h', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_set_tx_power({ 'set_power': set_power })
-                    elif packet_command == 11: # gecko_rsp_system_get_random_data
-                        result, data_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        data_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_system_get_random_data({ 'result': result, 'data': data_data })
-                    elif packet_command == 12: # gecko_rsp_system_halt
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_halt({ 'result': result })
-                    elif packet_command == 13: # gecko_rsp_system_set_device_name
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_set_device_name({ 'result': result })
-                    elif packet_command == 14: # gecko_rsp_system_linklayer_configure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_linklayer_configure({ 'result': result })
-                    elif packet_command == 15: # gecko_rsp_system_get_counters
-                        result, tx_packets, rx_packets, crc_errors, failures = struct.unpack('<HHHHH', self.bgapi_rx_payload[:10])
-                        self.gecko_rsp_system_get_counters({ 'result': result, 'tx_packets': tx_packets, 'rx_packets': rx_packets, 'crc_errors': crc_errors, 'failures': failures })
-                    elif packet_command == 18: # gecko_rsp_system_data_buffer_write
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_data_buffer_write({ 'result': result })
-                    elif packet_command == 19: # gecko_rsp_system_set_identity_address
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_set_identity_address({ 'result': result })
-                    elif packet_command == 20: # gecko_rsp_system_data_buffer_clear
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_system_data_buffer_clear({ 'result': result })
-                elif packet_class == 3:
-                    if packet_command == 0: # gecko_rsp_le_gap_open
-                        result, connection = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.gecko_rsp_le_gap_open({ 'result': result, 'connection': connection })
-                    elif packet_command == 1: # gecko_rsp_le_gap_set_mode
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_mode({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_le_gap_discover
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_discover({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_le_gap_end_procedure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_end_procedure({ 'result': result })
-                    elif packet_command == 4: # gecko_rsp_le_gap_set_adv_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_adv_parameters({ 'result': result })
-                    elif packet_command == 5: # gecko_rsp_le_gap_set_conn_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_conn_parameters({ 'result': result })
-                    elif packet_command == 6: # gecko_rsp_le_gap_set_scan_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_scan_parameters({ 'result': result })
-                    elif packet_command == 7: # gecko_rsp_le_gap_set_adv_data
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_adv_data({ 'result': result })
-                    elif packet_command == 8: # gecko_rsp_le_gap_set_adv_timeout
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_adv_timeout({ 'result': result })
-                    elif packet_command == 9: # gecko_rsp_le_gap_set_conn_phy
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_conn_phy({ 'result': result })
-                    elif packet_command == 10: # gecko_rsp_le_gap_bt5_set_mode
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_bt5_set_mode({ 'result': result })
-                    elif packet_command == 11: # gecko_rsp_le_gap_bt5_set_adv_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_bt5_set_adv_parameters({ 'result': result })
-                    elif packet_command == 12: # gecko_rsp_le_gap_bt5_set_adv_data
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_bt5_set_adv_data({ 'result': result })
-                    elif packet_command == 13: # gecko_rsp_le_gap_set_privacy_mode
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_privacy_mode({ 'result': result })
-                    elif packet_command == 14: # gecko_rsp_le_gap_set_advertise_timing
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_advertise_timing({ 'result': result })
-                    elif packet_command == 15: # gecko_rsp_le_gap_set_advertise_channel_map
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_advertise_channel_map({ 'result': result })
-                    elif packet_command == 16: # gecko_rsp_le_gap_set_advertise_report_scan_request
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_advertise_report_scan_request({ 'result': result })
-                    elif packet_command == 17: # gecko_rsp_le_gap_set_advertise_phy
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_advertise_phy({ 'result': result })
-                    elif packet_command == 18: # gecko_rsp_le_gap_set_advertise_configuration
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_advertise_configuration({ 'result': result })
-                    elif packet_command == 19: # gecko_rsp_le_gap_clear_advertise_configuration
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_clear_advertise_configuration({ 'result': result })
-                    elif packet_command == 20: # gecko_rsp_le_gap_start_advertising
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_start_advertising({ 'result': result })
-                    elif packet_command == 21: # gecko_rsp_le_gap_stop_advertising
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_stop_advertising({ 'result': result })
-                    elif packet_command == 22: # gecko_rsp_le_gap_set_discovery_timing
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_discovery_timing({ 'result': result })
-                    elif packet_command == 23: # gecko_rsp_le_gap_set_discovery_type
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_discovery_type({ 'result': result })
-                    elif packet_command == 24: # gecko_rsp_le_gap_start_discovery
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_start_discovery({ 'result': result })
-                    elif packet_command == 25: # gecko_rsp_le_gap_set_data_channel_classification
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_data_channel_classification({ 'result': result })
-                    elif packet_command == 26: # gecko_rsp_le_gap_connect
-                        result, connection = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.gecko_rsp_le_gap_connect({ 'result': result, 'connection': connection })
-                    elif packet_command == 27: # gecko_rsp_le_gap_set_advertise_tx_power
-                        result, set_power = struct.unpack('<Hh', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_le_gap_set_advertise_tx_power({ 'result': result, 'set_power': set_power })
-                    elif packet_command == 28: # gecko_rsp_le_gap_set_discovery_extended_scan_response
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_discovery_extended_scan_response({ 'result': result })
-                    elif packet_command == 29: # gecko_rsp_le_gap_start_periodic_advertising
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_start_periodic_advertising({ 'result': result })
-                    elif packet_command == 31: # gecko_rsp_le_gap_stop_periodic_advertising
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_stop_periodic_advertising({ 'result': result })
-                    elif packet_command == 32: # gecko_rsp_le_gap_set_long_advertising_data
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_long_advertising_data({ 'result': result })
-                    elif packet_command == 33: # gecko_rsp_le_gap_enable_whitelisting
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_enable_whitelisting({ 'result': result })
-                    elif packet_command == 34: # gecko_rsp_le_gap_set_conn_timing_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_set_conn_timing_parameters({ 'result': result })
-                    elif packet_command == 37: # gecko_rsp_le_gap_set_advertise_random_address
-                        result, address_out = struct.unpack('<H6s', self.bgapi_rx_payload[:8])
-                        address_out = address_out
-                        self.gecko_rsp_le_gap_set_advertise_random_address({ 'result': result, 'address_out': address_out })
-                    elif packet_command == 38: # gecko_rsp_le_gap_clear_advertise_random_address
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_gap_clear_advertise_random_address({ 'result': result })
-                elif packet_class == 66:
-                    if packet_command == 0: # gecko_rsp_sync_open
-                        result, sync = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.gecko_rsp_sync_open({ 'result': result, 'sync': sync })
-                    elif packet_command == 1: # gecko_rsp_sync_close
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sync_close({ 'result': result })
-                elif packet_class == 8:
-                    if packet_command == 0: # gecko_rsp_le_connection_set_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_connection_set_parameters({ 'result': result })
-                    elif packet_command == 1: # gecko_rsp_le_connection_get_rssi
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_connection_get_rssi({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_le_connection_disable_slave_latency
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_connection_disable_slave_latency({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_le_connection_set_phy
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_connection_set_phy({ 'result': result })
-                    elif packet_command == 4: # gecko_rsp_le_connection_close
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_connection_close({ 'result': result })
-                    elif packet_command == 5: # gecko_rsp_le_connection_set_timing_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_connection_set_timing_parameters({ 'result': result })
-                    elif packet_command == 6: # gecko_rsp_le_connection_read_channel_map
-                        result, channel_map_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        channel_map_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_le_connection_read_channel_map({ 'result': result, 'channel_map': channel_map_data })
-                    elif packet_command == 7: # gecko_rsp_le_connection_set_preferred_phy
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_le_connection_set_preferred_phy({ 'result': result })
-                elif packet_class == 9:
-                    if packet_command == 0: # gecko_rsp_gatt_set_max_mtu
-                        result, max_mtu = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_set_max_mtu({ 'result': result, 'max_mtu': max_mtu })
-                    elif packet_command == 1: # gecko_rsp_gatt_discover_primary_services
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_discover_primary_services({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_gatt_discover_primary_services_by_uuid
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_discover_primary_services_by_uuid({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_gatt_discover_characteristics
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_discover_characteristics({ 'result': result })
-                    elif packet_command == 4: # gecko_rsp_gatt_discover_characteristics_by_uuid
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_discover_characteristics_by_uuid({ 'result': result })
-                    elif packet_command == 5: # gecko_rsp_gatt_set_characteristic_notification
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_set_characteristic_notification({ 'result': result })
-                    elif packet_command == 6: # gecko_rsp_gatt_discover_descriptors
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_discover_descriptors({ 'result': result })
-                    elif packet_command == 7: # gecko_rsp_gatt_read_characteristic_value
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_read_characteristic_value({ 'result': result })
-                    elif packet_command == 8: # gecko_rsp_gatt_read_characteristic_value_by_uuid
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_read_characteristic_value_by_uuid({ 'result': result })
-                    elif packet_command == 9: # gecko_rsp_gatt_write_characteristic_value
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_write_characteristic_value({ 'result': result })
-                    elif packet_command == 10: # gecko_rsp_gatt_write_characteristic_value_without_response
-                        result, sent_len = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_write_characteristic_value_without_response({ 'result': result, 'sent_len': sent_len })
-                    elif packet_command == 11: # gecko_rsp_gatt_prepare_characteristic_value_write
-                        result, sent_len = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_prepare_characteristic_value_write({ 'result': result, 'sent_len': sent_len })
-                    elif packet_command == 12: # gecko_rsp_gatt_execute_characteristic_value_write
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_execute_characteristic_value_write({ 'result': result })
-                    elif packet_command == 13: # gecko_rsp_gatt_send_characteristic_confirmation
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_send_characteristic_confirmation({ 'result': result })
-                    elif packet_command == 14: # gecko_rsp_gatt_read_descriptor_value
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_read_descriptor_value({ 'result': result })
-                    elif packet_command == 15: # gecko_rsp_gatt_write_descriptor_value
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_write_descriptor_value({ 'result': result })
-                    elif packet_command == 16: # gecko_rsp_gatt_find_included_services
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_find_included_services({ 'result': result })
-                    elif packet_command == 17: # gecko_rsp_gatt_read_multiple_characteristic_values
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_read_multiple_characteristic_values({ 'result': result })
-                    elif packet_command == 18: # gecko_rsp_gatt_read_characteristic_value_from_offset
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_read_characteristic_value_from_offset({ 'result': result })
-                    elif packet_command == 19: # gecko_rsp_gatt_prepare_characteristic_value_reliable_write
-                        result, sent_len = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_prepare_characteristic_value_reliable_write({ 'result': result, 'sent_len': sent_len })
-                elif packet_class == 10:
-                    if packet_command == 0: # gecko_rsp_gatt_server_read_attribute_value
-                        result, value_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        value_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_gatt_server_read_attribute_value({ 'result': result, 'value': value_data })
-                    elif packet_command == 1: # gecko_rsp_gatt_server_read_attribute_type
-                        result, type_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        type_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_gatt_server_read_attribute_type({ 'result': result, 'type': type_data })
-                    elif packet_command == 2: # gecko_rsp_gatt_server_write_attribute_value
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_server_write_attribute_value({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_gatt_server_send_user_read_response
-                        result, sent_len = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_server_send_user_read_response({ 'result': result, 'sent_len': sent_len })
-                    elif packet_command == 4: # gecko_rsp_gatt_server_send_user_write_response
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_server_send_user_write_response({ 'result': result })
-                    elif packet_command == 5: # gecko_rsp_gatt_server_send_characteristic_notification
-                        result, sent_len = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_server_send_characteristic_notification({ 'result': result, 'sent_len': sent_len })
-                    elif packet_command == 6: # gecko_rsp_gatt_server_find_attribute
-                        result, attribute = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_server_find_attribute({ 'result': result, 'attribute': attribute })
-                    elif packet_command == 8: # gecko_rsp_gatt_server_set_capabilities
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_server_set_capabilities({ 'result': result })
-                    elif packet_command == 9: # gecko_rsp_gatt_server_find_primary_service
-                        result, start, end = struct.unpack('<HHH', self.bgapi_rx_payload[:6])
-                        self.gecko_rsp_gatt_server_find_primary_service({ 'result': result, 'start': start, 'end': end })
-                    elif packet_command == 10: # gecko_rsp_gatt_server_set_max_mtu
-                        result, max_mtu = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_server_set_max_mtu({ 'result': result, 'max_mtu': max_mtu })
-                    elif packet_command == 11: # gecko_rsp_gatt_server_get_mtu
-                        result, mtu = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_rsp_gatt_server_get_mtu({ 'result': result, 'mtu': mtu })
-                    elif packet_command == 12: # gecko_rsp_gatt_server_enable_capabilities
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_server_enable_capabilities({ 'result': result })
-                    elif packet_command == 13: # gecko_rsp_gatt_server_disable_capabilities
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_gatt_server_disable_capabilities({ 'result': result })
-                    elif packet_command == 14: # gecko_rsp_gatt_server_get_enabled_capabilities
-                        result, caps = struct.unpack('<HI', self.bgapi_rx_payload[:6])
-                        self.gecko_rsp_gatt_server_get_enabled_capabilities({ 'result': result, 'caps': caps })
-                elif packet_class == 12:
-                    if packet_command == 0: # gecko_rsp_hardware_set_soft_timer
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_hardware_set_soft_timer({ 'result': result })
-                    elif packet_command == 11: # gecko_rsp_hardware_get_time
-                        seconds, ticks = struct.unpack('<IH', self.bgapi_rx_payload[:6])
-                        self.gecko_rsp_hardware_get_time({ 'seconds': seconds, 'ticks': ticks })
-                    elif packet_command == 12: # gecko_rsp_hardware_set_lazy_soft_timer
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_hardware_set_lazy_soft_timer({ 'result': result })
-                elif packet_class == 13:
-                    if packet_command == 1: # gecko_rsp_flash_ps_erase_all
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_flash_ps_erase_all({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_flash_ps_save
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_flash_ps_save({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_flash_ps_load
-                        result, value_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        value_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_flash_ps_load({ 'result': result, 'value': value_data })
-                    elif packet_command == 4: # gecko_rsp_flash_ps_erase
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_flash_ps_erase({ 'result': result })
-                elif packet_class == 14:
-                    if packet_command == 0: # gecko_rsp_test_dtm_tx
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_test_dtm_tx({ 'result': result })
-                    elif packet_command == 1: # gecko_rsp_test_dtm_rx
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_test_dtm_rx({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_test_dtm_end
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_test_dtm_end({ 'result': result })
-                    elif packet_command == 7: # gecko_rsp_test_debug_command
-                        result, id, debugdata_len = struct.unpack('<HBB', self.bgapi_rx_payload[:4])
-                        debugdata_data = self.bgapi_rx_payload[4:]
-                        self.gecko_rsp_test_debug_command({ 'result': result, 'id': id, 'debugdata': debugdata_data })
-                    elif packet_command == 12: # gecko_rsp_test_debug_counter
-                        result, value = struct.unpack('<HI', self.bgapi_rx_payload[:6])
-                        self.gecko_rsp_test_debug_counter({ 'result': result, 'value': value })
-                elif packet_class == 15:
-                    if packet_command == 0: # gecko_rsp_sm_set_bondable_mode
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_set_bondable_mode({ 'result': result })
-                    elif packet_command == 1: # gecko_rsp_sm_configure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_configure({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_sm_store_bonding_configuration
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_store_bonding_configuration({ 'result': result })
-                    elif packet_command == 4: # gecko_rsp_sm_increase_security
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_increase_security({ 'result': result })
-                    elif packet_command == 6: # gecko_rsp_sm_delete_bonding
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_delete_bonding({ 'result': result })
-                    elif packet_command == 7: # gecko_rsp_sm_delete_bondings
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_delete_bondings({ 'result': result })
-                    elif packet_command == 8: # gecko_rsp_sm_enter_passkey
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_enter_passkey({ 'result': result })
-                    elif packet_command == 9: # gecko_rsp_sm_passkey_confirm
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_passkey_confirm({ 'result': result })
-                    elif packet_command == 10: # gecko_rsp_sm_set_oob_data
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_set_oob_data({ 'result': result })
-                    elif packet_command == 11: # gecko_rsp_sm_list_all_bondings
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_list_all_bondings({ 'result': result })
-                    elif packet_command == 14: # gecko_rsp_sm_bonding_confirm
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_bonding_confirm({ 'result': result })
-                    elif packet_command == 15: # gecko_rsp_sm_set_debug_mode
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_set_debug_mode({ 'result': result })
-                    elif packet_command == 16: # gecko_rsp_sm_set_passkey
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_set_passkey({ 'result': result })
-                    elif packet_command == 17: # gecko_rsp_sm_use_sc_oob
-                        result, oob_data_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        oob_data_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_sm_use_sc_oob({ 'result': result, 'oob_data': oob_data_data })
-                    elif packet_command == 18: # gecko_rsp_sm_set_sc_remote_oob_data
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_set_sc_remote_oob_data({ 'result': result })
-                    elif packet_command == 19: # gecko_rsp_sm_add_to_whitelist
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_add_to_whitelist({ 'result': result })
-                    elif packet_command == 20: # gecko_rsp_sm_set_minimum_key_size
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_sm_set_minimum_key_size({ 'result': result })
-                elif packet_class == 19:
-                    if packet_command == 0: # gecko_rsp_homekit_configure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_configure({ 'result': result })
-                    elif packet_command == 1: # gecko_rsp_homekit_advertise
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_advertise({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_homekit_delete_pairings
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_delete_pairings({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_homekit_check_authcp
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_check_authcp({ 'result': result })
-                    elif packet_command == 4: # gecko_rsp_homekit_get_pairing_id
-                        result, pairing_id_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        pairing_id_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_homekit_get_pairing_id({ 'result': result, 'pairing_id': pairing_id_data })
-                    elif packet_command == 5: # gecko_rsp_homekit_send_write_response
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_send_write_response({ 'result': result })
-                    elif packet_command == 6: # gecko_rsp_homekit_send_read_response
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_send_read_response({ 'result': result })
-                    elif packet_command == 7: # gecko_rsp_homekit_gsn_action
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_gsn_action({ 'result': result })
-                    elif packet_command == 8: # gecko_rsp_homekit_event_notification
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_event_notification({ 'result': result })
-                    elif packet_command == 9: # gecko_rsp_homekit_broadcast_action
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_broadcast_action({ 'result': result })
-                    elif packet_command == 10: # gecko_rsp_homekit_configure_product_data
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_homekit_configure_product_data({ 'result': result })
-                elif packet_class == 32:
-                    if packet_command == 0: # gecko_rsp_coex_set_options
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_coex_set_options({ 'result': result })
-                    elif packet_command == 1: # gecko_rsp_coex_get_counters
-                        result, counters_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        counters_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_coex_get_counters({ 'result': result, 'counters': counters_data })
-                    elif packet_command == 2: # gecko_rsp_coex_set_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_coex_set_parameters({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_coex_set_directional_priority_pulse
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_coex_set_directional_priority_pulse({ 'result': result })
-                elif packet_class == 67:
-                    if packet_command == 1: # gecko_rsp_l2cap_coc_send_connection_request
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_l2cap_coc_send_connection_request({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_l2cap_coc_send_connection_response
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_l2cap_coc_send_connection_response({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_l2cap_coc_send_le_flow_control_credit
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_l2cap_coc_send_le_flow_control_credit({ 'result': result })
-                    elif packet_command == 4: # gecko_rsp_l2cap_coc_send_disconnection_request
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_l2cap_coc_send_disconnection_request({ 'result': result })
-                    elif packet_command == 5: # gecko_rsp_l2cap_coc_send_data
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_l2cap_coc_send_data({ 'result': result })
-                elif packet_class == 68:
-                    if packet_command == 0: # gecko_rsp_cte_transmitter_enable_cte_response
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_transmitter_enable_cte_response({ 'result': result })
-                    elif packet_command == 1: # gecko_rsp_cte_transmitter_disable_cte_response
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_transmitter_disable_cte_response({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_cte_transmitter_start_connectionless_cte
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_transmitter_start_connectionless_cte({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_cte_transmitter_stop_connectionless_cte
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_transmitter_stop_connectionless_cte({ 'result': result })
-                    elif packet_command == 4: # gecko_rsp_cte_transmitter_set_dtm_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_transmitter_set_dtm_parameters({ 'result': result })
-                    elif packet_command == 5: # gecko_rsp_cte_transmitter_clear_dtm_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_transmitter_clear_dtm_parameters({ 'result': result })
-                elif packet_class == 69:
-                    if packet_command == 0: # gecko_rsp_cte_receiver_configure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_receiver_configure({ 'result': result })
-                    elif packet_command == 1: # gecko_rsp_cte_receiver_start_iq_sampling
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_receiver_start_iq_sampling({ 'result': result })
-                    elif packet_command == 2: # gecko_rsp_cte_receiver_stop_iq_sampling
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_receiver_stop_iq_sampling({ 'result': result })
-                    elif packet_command == 3: # gecko_rsp_cte_receiver_start_connectionless_iq_sampling
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_receiver_start_connectionless_iq_sampling({ 'result': result })
-                    elif packet_command == 4: # gecko_rsp_cte_receiver_stop_connectionless_iq_sampling
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_receiver_stop_connectionless_iq_sampling({ 'result': result })
-                    elif packet_command == 5: # gecko_rsp_cte_receiver_set_dtm_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_receiver_set_dtm_parameters({ 'result': result })
-                    elif packet_command == 6: # gecko_rsp_cte_receiver_clear_dtm_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_cte_receiver_clear_dtm_parameters({ 'result': result })
-                elif packet_class == 254:
-                    if packet_command == 0: # gecko_rsp_qualtester_configure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_rsp_qualtester_configure({ 'result': result })
-                elif packet_class == 255:
-                    if packet_command == 0: # gecko_rsp_user_message_to_target
-                        result, data_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        data_data = self.bgapi_rx_payload[3:]
-                        self.gecko_rsp_user_message_to_target({ 'result': result, 'data': data_data })
-                self.busy = False
-                self.on_idle()
-            elif packet_type & 0xa0 == 0xa0:
-                # 0xa0 = Blue Gecko event packet
-                if packet_class == 0:
-                    if packet_command == 0: # gecko_evt_dfu_boot
-                        version = struct.unpack('<I', self.bgapi_rx_payload[:4])[0]
-                        self.gecko_evt_dfu_boot({ 'version': version })
-                        self.busy = False
-                        self.on_idle()
-                    elif packet_command == 1: # gecko_evt_dfu_boot_failure
-                        reason = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_evt_dfu_boot_failure({ 'reason': reason })
-                elif packet_class == 1:
-                    if packet_command == 0: # gecko_evt_system_boot
-                        major, minor, patch, build, bootloader, hw, hash = struct.unpack('<HHHHIHI', self.bgapi_rx_payload[:18])
-                        self.gecko_evt_system_boot({ 'major': major, 'minor': minor, 'patch': patch, 'build': build, 'bootloader': bootloader, 'hw': hw, 'hash': hash })
-                    elif packet_command == 3: # gecko_evt_system_external_signal
-                        extsignals = struct.unpack('<I', self.bgapi_rx_payload[:4])[0]
-                        self.gecko_evt_system_external_signal({ 'extsignals': extsignals })
-                    elif packet_command == 4: # gecko_evt_system_awake
-                        self.gecko_evt_system_awake({  })
-                    elif packet_command == 5: # gecko_evt_system_hardware_error
-                        status = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.gecko_evt_system_hardware_error({ 'status': status })
-                    elif packet_command == 6: # gecko_evt_system_error
-                        reason, data_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        data_data = self.bgapi_rx_payload[3:]
-                        self.gecko_evt_system_error({ 'reason': reason, 'data': data_data })
-                elif packet_class == 3:
-                    if packet_command == 0: # gecko_evt_le_gap_scan_response
-                        rssi, packet_type, address, address_type, bonding, data_len = struct.unpack('<bB6sBBB', self.bgapi_rx_payload[:11])
-                        address = address
-                        data_data = self.bgapi_rx_payload[11:]
-                        self.gecko_evt_le_gap_scan_response({ 'rssi': rssi, 'packet_type': packet_type, 'address': address, 'address_type': address_type, 'bonding': bonding, 'data': data_data })
-                    elif packet_command == 1: # gecko_evt_le_gap_adv_timeout
-                        handle = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.gecko_evt_le_gap_adv_timeout({ 'handle': handle })
-                    elif packet_command == 2: # gecko_evt_le_gap_scan_request
-                        handle, address, address_type, bonding = struct.unpack('<B6sBB', self.bgapi_rx_payload[:9])
-                        address = address
-                        self.gecko_evt_le_gap_scan_request({ 'handle': handle, 'address': address, 'address_type': address_type, 'bonding': bonding })
-                    elif packet_command == 4: # gecko_evt_le_gap_extended_scan_response
-                        packet_type, address, address_type, bonding, primary_phy, secondary_phy, adv_sid, tx_power, rssi, channel, periodic_interval, data_len = struct.unpack('<B6sBBBBBbbBHB', self.bgapi_rx_payload[:18])
-                        address = address
-                        data_data = self.bgapi_rx_payload[18:]
-                        self.gecko_evt_le_gap_extended_scan_response({ 'packet_type': packet_type, 'address': address, 'address_type': address_type, 'bonding': bonding, 'primary_phy': primary_phy, 'secondary_phy': secondary_phy, 'adv_sid': adv_sid, 'tx_power': tx_power, 'rssi': rssi, 'channel': channel, 'periodic_interval': periodic_interval, 'data': data_data })
-                    elif packet_command == 5: # gecko_evt_le_gap_periodic_advertising_status
-                        sid, status = struct.unpack('<BI', self.bgapi_rx_payload[:5])
-                        self.gecko_evt_le_gap_periodic_advertising_status({ 'sid': sid, 'status': status })
-                elif packet_class == 66:
-                    if packet_command == 0: # gecko_evt_sync_opened
-                        sync, adv_sid, address, address_type, adv_phy, adv_interval, clock_accuracy = struct.unpack('<BB6sBBHH', self.bgapi_rx_payload[:14])
-                        address = address
-                        self.gecko_evt_sync_opened({ 'sync': sync, 'adv_sid': adv_sid, 'address': address, 'address_type': address_type, 'adv_phy': adv_phy, 'adv_interval': adv_interval, 'clock_accuracy': clock_accuracy })
-                    elif packet_command == 1: # gecko_evt_sync_closed
-                        reason, sync = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_sync_closed({ 'reason': reason, 'sync': sync })
-                    elif packet_command == 2: # gecko_evt_sync_data
-                        sync, tx_power, rssi, data_status, data_len = struct.unpack('<BbbBB', self.bgapi_rx_payload[:5])
-                        data_data = self.bgapi_rx_payload[5:]
-                        self.gecko_evt_sync_data({ 'sync': sync, 'tx_power': tx_power, 'rssi': rssi, 'data_status': data_status, 'data': data_data })
-                elif packet_class == 8:
-                    if packet_command == 0: # gecko_evt_le_connection_opened
-                        address, address_type, master, connection, bonding, advertiser = struct.unpack('<6sBBBBB', self.bgapi_rx_payload[:11])
-                        address = address
-                        self.gecko_evt_le_connection_opened({ 'address': address, 'address_type': address_type, 'master': master, 'connection': connection, 'bonding': bonding, 'advertiser': advertiser })
-                    elif packet_command == 1: # gecko_evt_le_connection_closed
-                        reason, connection = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_le_connection_closed({ 'reason': reason, 'connection': connection })
-                    elif packet_command == 2: # gecko_evt_le_connection_parameters
-                        connection, interval, latency, timeout, security_mode, txsize = struct.unpack('<BHHHBH', self.bgapi_rx_payload[:10])
-                        self.gecko_evt_le_connection_parameters({ 'connection': connection, 'interval': interval, 'latency': latency, 'timeout': timeout, 'security_mode': security_mode, 'txsize': txsize })
-                    elif packet_command == 3: # gecko_evt_le_connection_rssi
-                        connection, status, rssi = struct.unpack('<BBb', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_le_connection_rssi({ 'connection': connection, 'status': status, 'rssi': rssi })
-                    elif packet_command == 4: # gecko_evt_le_connection_phy_status
-                        connection, phy = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        self.gecko_evt_le_connection_phy_status({ 'connection': connection, 'phy': phy })
-                elif packet_class == 9:
-                    if packet_command == 0: # gecko_evt_gatt_mtu_exchanged
-                        connection, mtu = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_gatt_mtu_exchanged({ 'connection': connection, 'mtu': mtu })
-                    elif packet_command == 1: # gecko_evt_gatt_service
-                        connection, service, uuid_len = struct.unpack('<BIB', self.bgapi_rx_payload[:6])
-                        uuid_data = self.bgapi_rx_payload[6:]
-                        self.gecko_evt_gatt_service({ 'connection': connection, 'service': service, 'uuid': uuid_data })
-                    elif packet_command == 2: # gecko_evt_gatt_characteristic
-                        connection, characteristic, properties, uuid_len = struct.unpack('<BHBB', self.bgapi_rx_payload[:5])
-                        uuid_data = self.bgapi_rx_payload[5:]
-                        self.gecko_evt_gatt_characteristic({ 'connection': connection, 'characteristic': characteristic, 'properties': properties, 'uuid': uuid_data })
-                    elif packet_command == 3: # gecko_evt_gatt_descriptor
-                        connection, descriptor, uuid_len = struct.unpack('<BHB', self.bgapi_rx_payload[:4])
-                        uuid_data = self.bgapi_rx_payload[4:]
-                        self.gecko_evt_gatt_descriptor({ 'connection': connection, 'descriptor': descriptor, 'uuid': uuid_data })
-                    elif packet_command == 4: # gecko_evt_gatt_characteristic_value
-                        connection, characteristic, att_opcode, offset, value_len = struct.unpack('<BHBHB', self.bgapi_rx_payload[:7])
-                        value_data = self.bgapi_rx_payload[7:]
-                        self.gecko_evt_gatt_characteristic_value({ 'connection': connection, 'characteristic': characteristic, 'att_opcode': att_opcode, 'offset': offset, 'value': value_data })
-                    elif packet_command == 5: # gecko_evt_gatt_descriptor_value
-                        connection, descriptor, offset, value_len = struct.unpack('<BHHB', self.bgapi_rx_payload[:6])
-                        value_data = self.bgapi_rx_payload[6:]
-                        self.gecko_evt_gatt_descriptor_value({ 'connection': connection, 'descriptor': descriptor, 'offset': offset, 'value': value_data })
-                    elif packet_command == 6: # gecko_evt_gatt_procedure_completed
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_gatt_procedure_completed({ 'connection': connection, 'result': result })
-                elif packet_class == 10:
-                    if packet_command == 0: # gecko_evt_gatt_server_attribute_value
-                        connection, attribute, att_opcode, offset, value_len = struct.unpack('<BHBHB', self.bgapi_rx_payload[:7])
-                        value_data = self.bgapi_rx_payload[7:]
-                        self.gecko_evt_gatt_server_attribute_value({ 'connection': connection, 'attribute': attribute, 'att_opcode': att_opcode, 'offset': offset, 'value': value_data })
-                    elif packet_command == 1: # gecko_evt_gatt_server_user_read_request
-                        connection, characteristic, att_opcode, offset = struct.unpack('<BHBH', self.bgapi_rx_payload[:6])
-                        self.gecko_evt_gatt_server_user_read_request({ 'connection': connection, 'characteristic': characteristic, 'att_opcode': att_opcode, 'offset': offset })
-                    elif packet_command == 2: # gecko_evt_gatt_server_user_write_request
-                        connection, characteristic, att_opcode, offset, value_len = struct.unpack('<BHBHB', self.bgapi_rx_payload[:7])
-                        value_data = self.bgapi_rx_payload[7:]
-                        self.gecko_evt_gatt_server_user_write_request({ 'connection': connection, 'characteristic': characteristic, 'att_opcode': att_opcode, 'offset': offset, 'value': value_data })
-                    elif packet_command == 3: # gecko_evt_gatt_server_characteristic_status
-                        connection, characteristic, status_flags, client_config_flags = struct.unpack('<BHBH', self.bgapi_rx_payload[:6])
-                        self.gecko_evt_gatt_server_characteristic_status({ 'connection': connection, 'characteristic': characteristic, 'status_flags': status_flags, 'client_config_flags': client_config_flags })
-                    elif packet_command == 4: # gecko_evt_gatt_server_execute_write_completed
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_gatt_server_execute_write_completed({ 'connection': connection, 'result': result })
-                elif packet_class == 12:
-                    if packet_command == 0: # gecko_evt_hardware_soft_timer
-                        handle = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.gecko_evt_hardware_soft_timer({ 'handle': handle })
-                elif packet_class == 14:
-                    if packet_command == 0: # gecko_evt_test_dtm_completed
-                        result, number_of_packets = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.gecko_evt_test_dtm_completed({ 'result': result, 'number_of_packets': number_of_packets })
-                elif packet_class == 15:
-                    if packet_command == 0: # gecko_evt_sm_passkey_display
-                        connection, passkey = struct.unpack('<BI', self.bgapi_rx_payload[:5])
-                        self.gecko_evt_sm_passkey_display({ 'connection': connection, 'passkey': passkey })
-                    elif packet_command == 1: # gecko_evt_sm_passkey_request
-                        connection = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.gecko_evt_sm_passkey_request({ 'connection': connection })
-                    elif packet_command == 2: # gecko_evt_sm_confirm_passkey
-                        connection, passkey = struct.unpack('<BI', self.bgapi_rx_payload[:5])
-                        self.gecko_evt_sm_confirm_passkey({ 'connection': connection, 'passkey': passkey })
-                    elif packet_command == 3: # gecko_evt_sm_bonded
-                        connection, bonding = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        self.gecko_evt_sm_bonded({ 'connection': connection, 'bonding': bonding })
-                    elif packet_command == 4: # gecko_evt_sm_bonding_failed
-                        connection, reason = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_sm_bonding_failed({ 'connection': connection, 'reason': reason })
-                    elif packet_command == 5: # gecko_evt_sm_list_bonding_entry
-                        bonding, address, address_type = struct.unpack('<B6sB', self.bgapi_rx_payload[:8])
-                        address = address
-                        self.gecko_evt_sm_list_bonding_entry({ 'bonding': bonding, 'address': address, 'address_type': address_type })
-                    elif packet_command == 6: # gecko_evt_sm_list_all_bondings_complete
-                        self.gecko_evt_sm_list_all_bondings_complete({  })
-                    elif packet_command == 9: # gecko_evt_sm_confirm_bonding
-                        connection, bonding_handle = struct.unpack('<Bb', self.bgapi_rx_payload[:2])
-                        self.gecko_evt_sm_confirm_bonding({ 'connection': connection, 'bonding_handle': bonding_handle })
-                elif packet_class == 19:
-                    if packet_command == 0: # gecko_evt_homekit_setupcode_display
-                        connection, setupcode_len = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        setupcode_data = self.bgapi_rx_payload[2:]
-                        self.gecko_evt_homekit_setupcode_display({ 'connection': connection, 'setupcode': setupcode_data })
-                    elif packet_command == 1: # gecko_evt_homekit_paired
-                        connection, reason = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_homekit_paired({ 'connection': connection, 'reason': reason })
-                    elif packet_command == 2: # gecko_evt_homekit_pair_verified
-                        connection, reason = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_homekit_pair_verified({ 'connection': connection, 'reason': reason })
-                    elif packet_command == 3: # gecko_evt_homekit_connection_opened
-                        connection = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.gecko_evt_homekit_connection_opened({ 'connection': connection })
-                    elif packet_command == 4: # gecko_evt_homekit_connection_closed
-                        connection, reason = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_homekit_connection_closed({ 'connection': connection, 'reason': reason })
-                    elif packet_command == 5: # gecko_evt_homekit_identify
-                        connection = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.gecko_evt_homekit_identify({ 'connection': connection })
-                    elif packet_command == 6: # gecko_evt_homekit_write_request
-                        connection, characteristic, chr_value_size, authorization_size, value_offset, value_len = struct.unpack('<BHHHHB', self.bgapi_rx_payload[:10])
-                        value_data = self.bgapi_rx_payload[10:]
-                        self.gecko_evt_homekit_write_request({ 'connection': connection, 'characteristic': characteristic, 'chr_value_size': chr_value_size, 'authorization_size': authorization_size, 'value_offset': value_offset, 'value': value_data })
-                    elif packet_command == 7: # gecko_evt_homekit_read_request
-                        connection, characteristic, offset = struct.unpack('<BHH', self.bgapi_rx_payload[:5])
-                        self.gecko_evt_homekit_read_request({ 'connection': connection, 'characteristic': characteristic, 'offset': offset })
-                    elif packet_command == 8: # gecko_evt_homekit_disconnection_required
-                        connection, reason = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.gecko_evt_homekit_disconnection_required({ 'connection': connection, 'reason': reason })
-                    elif packet_command == 9: # gecko_evt_homekit_pairing_removed
-                        connection, remaining_pairings, pairing_id_len = struct.unpack('<BHB', self.bgapi_rx_payload[:4])
-                        pairing_id_data = self.bgapi_rx_payload[4:]
-                        self.gecko_evt_homekit_pairing_removed({ 'connection': connection, 'remaining_pairings': remaining_pairings, 'pairing_id': pairing_id_data })
-                    elif packet_command == 10: # gecko_evt_homekit_setuppayload_display
-                        connection, setuppayload_len = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        setuppayload_data = self.bgapi_rx_payload[2:]
-                        self.gecko_evt_homekit_setuppayload_display({ 'connection': connection, 'setuppayload': setuppayload_data })
-                elif packet_class == 67:
-                    if packet_command == 1: # gecko_evt_l2cap_coc_connection_request
-                        connection, le_psm, source_cid, mtu, mps, initial_credit, flags, encryption_key_size = struct.unpack('<BHHHHHBB', self.bgapi_rx_payload[:13])
-                        self.gecko_evt_l2cap_coc_connection_request({ 'connection': connection, 'le_psm': le_psm, 'source_cid': source_cid, 'mtu': mtu, 'mps': mps, 'initial_credit': initial_credit, 'flags': flags, 'encryption_key_size': encryption_key_size })
-                    elif packet_command == 2: # gecko_evt_l2cap_coc_connection_response
-                        connection, destination_cid, mtu, mps, initial_credit, result = struct.unpack('<BHHHHH', self.bgapi_rx_payload[:11])
-                        self.gecko_evt_l2cap_coc_connection_response({ 'connection': connection, 'destination_cid': destination_cid, 'mtu': mtu, 'mps': mps, 'initial_credit': initial_credit, 'result': result })
-                    elif packet_command == 3: # gecko_evt_l2cap_coc_le_flow_control_credit
-                        connection, cid, credits = struct.unpack('<BHH', self.bgapi_rx_payload[:5])
-                        self.gecko_evt_l2cap_coc_le_flow_control_credit({ 'connection': connection, 'cid': cid, 'credits': credits })
-                    elif packet_command == 4: # gecko_evt_l2cap_coc_channel_disconnected
-                        connection, cid, reason = struct.unpack('<BHH', self.bgapi_rx_payload[:5])
-                        self.gecko_evt_l2cap_coc_channel_disconnected({ 'connection': connection, 'cid': cid, 'reason': reason })
-                    elif packet_command == 5: # gecko_evt_l2cap_coc_data
-                        connection, cid, data_len = struct.unpack('<BHB', self.bgapi_rx_payload[:4])
-                        data_data = self.bgapi_rx_payload[4:]
-                        self.gecko_evt_l2cap_coc_data({ 'connection': connection, 'cid': cid, 'data': data_data })
-                    elif packet_command == 6: # gecko_evt_l2cap_command_rejected
-                        connection, code, reason = struct.unpack('<BBH', self.bgapi_rx_payload[:4])
-                        self.gecko_evt_l2cap_command_rejected({ 'connection': connection, 'code': code, 'reason': reason })
-                elif packet_class == 69:
-                    if packet_command == 0: # gecko_evt_cte_receiver_iq_report
-                        status, packet_type, handle, phy, channel, rssi, rssi_antenna_id, cte_type, slot_durations, event_counter, completeness, samples_len = struct.unpack('<HBBBBbBBBHBB', self.bgapi_rx_payload[:14])
-                        samples_data = self.bgapi_rx_payload[14:]
-                        self.gecko_evt_cte_receiver_iq_report({ 'status': status, 'packet_type': packet_type, 'handle': handle, 'phy': phy, 'channel': channel, 'rssi': rssi, 'rssi_antenna_id': rssi_antenna_id, 'cte_type': cte_type, 'slot_durations': slot_durations, 'event_counter': event_counter, 'completeness': completeness, 'samples': samples_data })
-                elif packet_class == 254:
-                    if packet_command == 0: # gecko_evt_qualtester_state_changed
-                        group, id, value, data_len = struct.unpack('<IIIB', self.bgapi_rx_payload[:13])
-                        data_data = self.bgapi_rx_payload[13:]
-                        self.gecko_evt_qualtester_state_changed({ 'group': group, 'id': id, 'value': value, 'data': data_data })
-                elif packet_class == 255:
-                    if packet_command == 0: # gecko_evt_user_message_to_host
-                        data_len = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        data_data = self.bgapi_rx_payload[1:]
-                        self.gecko_evt_user_message_to_host({ 'data': data_data })
+            if self.capture is not None: self._write_capture_rx()
+            if self.zero_copy:
+                packet = memoryview(packet)
+            self._parse_packet(packet, 0, len(packet))
+
+    def parse_bytes(self, buf):
+
+        """Parse a whole chunk of received bytes, e.g. everything one ser.read() returned.
+
+        Packet boundaries are found from the length in each 4-byte header and
+        every complete packet in the chunk is decoded in one pass. A trailing
+        partial packet is kept in bgapi_rx_buffer and completed by the next
+        call (or by parse(), which shares the same buffer). Handlers may parse
+        again, e.g. through check_activity() or call(): the nested call
+        continues with the rest of this chunk, and this one returns once the
+        handler does.
+        """
+
+        if self.capture is not None:
+            self._write_capture_rx()
+            self.capture.write(BGAPICapture.RX, buf)
+        if self.resync:
+            return self._parse_bytes_resync(buf)
+        buf = self._take_rx_buffer(buf)
+        pos = 0
+        end = len(buf)
+        self._rx_chunk = buf
+        self._rx_depth += 1
+        try:
+            while pos < end:
+                b = buf[pos]
+                if not (b == 0xa0 or b == 0x20):
+                    pos += 1
+                    continue
+                if end - pos < 2:
+                    break
+                length = 4 + (b & 0x07) + buf[pos + 1]
+                if end - pos < length:
+                    break
+                self._rx_pos = pos + length
+                self._parse_packet(buf, pos, pos + length)
+                if self._rx_chunk is not buf:
+                    # a handler parsed again, which took over the rest of buf
+                    return
+                pos += length
+        finally:
+            self._rx_depth -= 1
+        self._rx_chunk = None
+        self._keep_rx_partial(buf, pos)
+
+    def _parse_bytes_resync(self, buf, expire=False):
+
+        """(internal use) parse_bytes() with the resync checks described in __init__().
+
+        With expire set, the partial frame at the front of the buffer is given
+        up regardless of its age.
+        """
+
+        now = time.monotonic()
+        partial = self._rx_chunk is None and len(self.bgapi_rx_buffer) > 0
+        if partial and not expire:
+            expire = now - self.bgapi_rx_partial_time >= self.resync_timeout
+        buf = self._take_rx_buffer(buf)
+        pos = 0
+        if partial and expire:
+            self.rx_partial_timeouts += 1
+            self.rx_discarded_bytes += 1
+            pos = 1
+        end = len(buf)
+        lengths = self.bgapi_rx_lengths
+        self._rx_chunk = buf
+        self._rx_depth += 1
+        try:
+            while pos < end:
+                b = buf[pos]
+                if b == 0xa0 or b == 0x20:
+                    if end - pos < 4:
+                        break
+                    length = 4 + (b & 0x07) + buf[pos + 1]
+                    limits = lengths.get((b & 0xf8, buf[pos + 2], buf[pos + 3]))
+                    if limits is not None and limits[0] <= length - 4 <= limits[1]:
+                        if end - pos < length:
+                            break
+                        self._rx_pos = pos + length
+                        self._parse_packet(buf, pos, pos + length)
+                        if self._rx_chunk is not buf:
+                            # a handler parsed again, which took over the rest of buf
+                            return
+                        pos += length
+                        continue
+                pos += 1
+                self.rx_discarded_bytes += 1
+        finally:
+            self._rx_depth -= 1
+        self._rx_chunk = None
+        if pos > 0 or not partial:
+            # a new partial frame (if any) starts now
+            self.bgapi_rx_partial_time = now
+        self._keep_rx_partial(buf, pos)
+
+    def _take_rx_buffer(self, buf):
+
+        """(internal use) Take over the received bytes not parsed yet and return
+        them followed by buf.
+
+        Those are a partial packet carried over in bgapi_rx_buffer or, when a
+        handler parses again while parse_bytes() is working through a chunk,
+        the rest of that chunk after the packet being handled. That call then
+        stops once the handler returns and leaves the rest to this one.
+        """
+
+        nested = self._rx_depth > 0
+        if self._rx_chunk is not None:
+            carry = self._rx_chunk[self._rx_pos:]
+            self._rx_chunk = None
+            nested = True
+        else:
+            carry = self.bgapi_rx_buffer
+        self.bgapi_rx_buffer = b""
+        self.bgapi_rx_expected_length = 0
+        if self.zero_copy:
+            return self._recycle_rx_buffer(carry, buf, nested)
+        if len(carry) > 0:
+            return bytes(carry) + buf
+        if type(buf) is not bytes:
+            return bytes(buf)
+        return buf
+
+    def _keep_rx_partial(self, buf, pos):
+
+        """(internal use) Carry the partial packet at buf[pos:] over to the next call."""
+
+        self.bgapi_rx_buffer = bytes(buf[pos:])
+        if len(buf) - pos > 1:
+            self.bgapi_rx_expected_length = 4 + (buf[pos] & 0x07) + buf[pos + 1]
+        else:
+            self.bgapi_rx_expected_length = 0
+
+    def iter_frames(self, source):
+
+        """Lazily yield each complete BGAPI packet in source as a bytes object.
+
+        source may be a serial port (read until the caller stops iterating), a
+        file opened in binary mode (read to the end), a bytes-like object or
+        any iterable of bytes-like chunks. Bytes that cannot start a packet are
+        skipped as in parse(), and a trailing partial packet is dropped. This
+        does not touch the receive buffer, busy flag or event handlers.
+        """
+
+        buf = b""
+        for chunk in self._iter_chunks(source):
+            buf = buf + chunk if len(buf) > 0 else bytes(chunk)
+            pos = 0
+            end = len(buf)
+            while pos < end:
+                b = buf[pos]
+                if not (b == 0xa0 or b == 0x20):
+                    pos += 1
+                    continue
+                if end - pos < 2:
+                    break
+                length = 4 + (b & 0x07) + buf[pos + 1]
+                if end - pos < length:
+                    break
+                yield buf[pos:pos + length]
+                pos += length
+            buf = buf[pos:]
+
+    def iter_packets(self, source):
+
+        """Lazily yield a (name, args) pair for each packet in source.
+
+        name is the event attribute name, e.g. 'ble_evt_gap_scan_response', and
+        args is the record its handlers would be given. Sources are as for
+        iter_frames(); packets without a decoder are skipped and no events fire.
+        """
+
+        for frame in self.iter_frames(source):
+            handler = self.bgapi_rx_dispatch.get((frame[0] & 0xf8, frame[2], frame[3]))
+            if handler is not None:
+                decoder, event = handler
+                yield event.name, decoder(frame, 4, len(frame))
+
+    def _iter_chunks(self, source):
+
+        """(internal use) Yield received byte chunks from a port, file or iterable."""
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            yield source
+        elif hasattr(source, 'inWaiting'):
+            while 1:
+                yield source.read(source.inWaiting() or 1)
+        elif hasattr(source, 'read'):
+            while 1:
+                chunk = source.read(4096)
+                if len(chunk) == 0:
+                    break
+                yield chunk
+        else:
+            for chunk in source:
+                yield bytes((chunk,)) if isinstance(chunk, int) else chunk
+
+    def _recycle_rx_buffer(self, carry, buf, nested=False):
+
+        """(internal use) Copy carry and buf into the recycled receive buffer,
+        and return a read-only view of the used part.
+
+        The buffer is overwritten in place rather than resized, so views that
+        handlers kept past their lifetime see new data instead of raising. A
+        nested parse gets a buffer of its own instead, as the handler that
+        started it, or a parse_bytes() call further up the stack, may still be
+        reading the recycled one.
+        """
+
+        length = len(carry) + len(buf)
+        if nested:
+            recycled = bytearray(length)
+        else:
+            if length > len(self.bgapi_rx_recycled):
+                self.bgapi_rx_recycled = bytearray(max(length, 4096))
+            recycled = self.bgapi_rx_recycled
+        recycled[:len(carry)] = carry
+        recycled[len(carry):length] = buf
+        return memoryview(recycled).toreadonly()[:length]
+
+    def _parse_packet(self, buf, start, end):
+
+        """(internal use) Decode the packet in buf[start:end] without copying it out."""
+
+        if self.debug: print('<=[ ' + ' '.join(['%02X' % b for b in buf[start:end] ]) + ' ]')
+        waited = False
+        packet_type = buf[start]
+        packet_class = buf[start + 2]
+        packet_command = buf[start + 3]
+        handler = self.bgapi_rx_dispatch.get((packet_type & 0xf8, packet_class, packet_command))
+        if self._raw_frame_handler.functions or (self._any_handlers and 'raw_frame' in self._any_handlers):
+            raw_frame_filter = self.raw_frame_filter
+            if raw_frame_filter is None or packet_class in raw_frame_filter or (packet_class, packet_command) in raw_frame_filter:
+                frame = BGAPIRawFrame(buf[start:start + 4], buf[start + 4:end])
+                self.on_raw_frame(frame)
+                for func in self._any_handlers.get('raw_frame', ()):
+                    func(self, 'on_raw_frame', frame)
+                if self.raw_frame_only:
+                    if handler is not None and packet_type & 0x80 == 0x00 and self._response_waiters:
+                        # its event does not fire, but a submitted command
+                        # waiting for this response still gets its args
+                        args = self._decode_response(handler[0], buf, start, end)
+                        waited = True
+                    handler = None
+        if handler is not None:
+            decoder, event = handler
+            if packet_type & 0x80 == 0x00 and self._response_waiters:
+                args = self._decode_response(decoder, buf, start, end)
+                waited = True
+                if self.__eventhandler__.get(event) or self._any_handlers:
+                    self._fire_event(event, args)
+            elif event is self._attribute_event:
+                self._route_attribute(decoder, event, buf, start, end)
+            # only decode when something is subscribed (add() and remove()
+            # keep these tuples current), but always do the busy bookkeeping
+            elif self.__eventhandler__.get(event) or (self._any_handlers and event.kind in self._any_handlers):
+                self._fire_event(event, decoder(buf, start + 4, end))
+        if packet_type & 0x80 == 0x00:
+            # response packet, the command has completed
+            self.busy = False
+            self.on_idle()
+            if waited:
+                # may send the next queued command
+                self._complete_command(packet_class, packet_command, args)
+        elif packet_class == 0 and packet_command == 0:
+            # boot event
+            self.busy = False
+            self.on_idle()
+
+    def _decode_response(self, decoder, buf, start, end):
+
+        """(internal use) Decode a response a command may be waiting for; its
+        args must outlive the receive buffer."""
+
+        if self.zero_copy:
+            return decoder(memoryview(bytes(buf[start:end])), 4, end - start)
+        return decoder(buf, start + 4, end)
+
+    def _complete_command(self, packet_class, packet_command, args):
+
+        """(internal use) Resolve the oldest future waiting for this response."""
+
+        with self._command_lock:
+            waiters = self._response_waiters.get((packet_class, packet_command))
+            if not waiters:
+                return
+            future = waiters.popleft()
+            if not waiters:
+                del self._response_waiters[(packet_class, packet_command)]
+        if future is None:
+            # the late answer to a command that timed out or was cancelled
+            return
+        try:
+            future.set_result(args)
+        except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+            # cancelled meanwhile, e.g. by call() giving up on another thread,
+            # or an AsyncBGLib future cancelled before its callback ran
+            pass
+
+    def _queue_command(self, ser, packet, future):
+
+        """(internal use) Send packet now if no submitted command is pending, else queue it."""
+
+        with self._command_lock:
+            if self._command_pending is not None:
+                self._command_queue.append((ser, packet, future))
+                return
+            self._command_pending = future
+        self._send_queued_command(ser, packet, future)
+
+    def _send_queued_command(self, ser, packet, future):
+
+        """(internal use) Send a command that is now the pending one."""
+
+        with self._command_lock:
+            self._response_waiters.setdefault((packet[2], packet[3]), deque()).append(future)
+        future.add_done_callback(self._command_done)
+        self.send_command(ser, packet)
+
+    def _command_done(self, future):
+
+        """(internal use) Release the next queued command once the pending one is done,
+        whether by its response, a timeout, cancellation or cancel_commands()."""
+
+        with self._command_lock:
+            if future is not self._command_pending:
+                return
+            self._command_pending = None
+            for waiters in self._response_waiters.values():
+                # not completed by a response; keep its place, so that a late
+                # one is dropped instead of answering the next such command
+                if future in waiters:
+                    waiters[waiters.index(future)] = None
+            while self._command_queue:
+                ser, packet, future = self._command_queue.popleft()
+                if not future.cancelled():
+                    self._command_pending = future
+                    break
+            else:
+                return
+        self._send_queued_command(ser, packet, future)
+
+    def _timeout_command(self):
+
+        """(internal use) Fail the pending submitted command after check_activity() timed out."""
+
+        future = self._command_pending
+        if future is not None:
+            try:
+                future.set_exception(TimeoutError('no response to command'))
+            except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+                pass
+
+    # (message type and technology type, class ID, command ID) => (decoder, event)
+    bgapi_rx_dispatch = {
+        (0x20, 0, 0): (_decode_gecko_rsp_dfu_reset, gecko_rsp_dfu_reset),
+        (0x20, 0, 1): (_decode_gecko_rsp_dfu_flash_set_address, gecko_rsp_dfu_flash_set_address),
+        (0x20, 0, 2): (_decode_gecko_rsp_dfu_flash_upload, gecko_rsp_dfu_flash_upload),
+        (0x20, 0, 3): (_decode_gecko_rsp_dfu_flash_upload_finish, gecko_rsp_dfu_flash_upload_finish),
+        (0x20, 1, 0): (_decode_gecko_rsp_system_hello, gecko_rsp_system_hello),
+        (0x20, 1, 1): (_decode_gecko_rsp_system_reset, gecko_rsp_system_reset),
+        (0x20, 1, 3): (_decode_gecko_rsp_system_get_bt_address, gecko_rsp_system_get_bt_address),
+        (0x20, 1, 4): (_decode_gecko_rsp_system_set_bt_address, gecko_rsp_system_set_bt_address),
+        (0x20, 1, 10): (_decode_gecko_rsp_system_set_tx_power, gecko_rsp_system_set_tx_power),
+        (0x20, 1, 11): (_decode_gecko_rsp_system_get_random_data, gecko_rsp_system_get_random_data),
+        (0x20, 1, 12): (_decode_gecko_rsp_system_halt, gecko_rsp_system_halt),
+        (0x20, 1, 13): (_decode_gecko_rsp_system_set_device_name, gecko_rsp_system_set_device_name),
+        (0x20, 1, 14): (_decode_gecko_rsp_system_linklayer_configure, gecko_rsp_system_linklayer_configure),
+        (0x20, 1, 15): (_decode_gecko_rsp_system_get_counters, gecko_rsp_system_get_counters),
+        (0x20, 1, 18): (_decode_gecko_rsp_system_data_buffer_write, gecko_rsp_system_data_buffer_write),
+        (0x20, 1, 19): (_decode_gecko_rsp_system_set_identity_address, gecko_rsp_system_set_identity_address),
+        (0x20, 1, 20): (_decode_gecko_rsp_system_data_buffer_clear, gecko_rsp_system_data_buffer_clear),
+        (0x20, 3, 0): (_decode_gecko_rsp_le_gap_open, gecko_rsp_le_gap_open),
+        (0x20, 3, 1): (_decode_gecko_rsp_le_gap_set_mode, gecko_rsp_le_gap_set_mode),
+        (0x20, 3, 2): (_decode_gecko_rsp_le_gap_discover, gecko_rsp_le_gap_discover),
+        (0x20, 3, 3): (_decode_gecko_rsp_le_gap_end_procedure, gecko_rsp_le_gap_end_procedure),
+        (0x20, 3, 4): (_decode_gecko_rsp_le_gap_set_adv_parameters, gecko_rsp_le_gap_set_adv_parameters),
+        (0x20, 3, 5): (_decode_gecko_rsp_le_gap_set_conn_parameters, gecko_rsp_le_gap_set_conn_parameters),
+        (0x20, 3, 6): (_decode_gecko_rsp_le_gap_set_scan_parameters, gecko_rsp_le_gap_set_scan_parameters),
+        (0x20, 3, 7): (_decode_gecko_rsp_le_gap_set_adv_data, gecko_rsp_le_gap_set_adv_data),
+        (0x20, 3, 8): (_decode_gecko_rsp_le_gap_set_adv_timeout, gecko_rsp_le_gap_set_adv_timeout),
+        (0x20, 3, 9): (_decode_gecko_rsp_le_gap_set_conn_phy, gecko_rsp_le_gap_set_conn_phy),
+        (0x20, 3, 10): (_decode_gecko_rsp_le_gap_bt5_set_mode, gecko_rsp_le_gap_bt5_set_mode),
+        (0x20, 3, 11): (_decode_gecko_rsp_le_gap_bt5_set_adv_parameters, gecko_rsp_le_gap_bt5_set_adv_parameters),
+        (0x20, 3, 12): (_decode_gecko_rsp_le_gap_bt5_set_adv_data, gecko_rsp_le_gap_bt5_set_adv_data),
+        (0x20, 3, 13): (_decode_gecko_rsp_le_gap_set_privacy_mode, gecko_rsp_le_gap_set_privacy_mode),
+        (0x20, 3, 14): (_decode_gecko_rsp_le_gap_set_advertise_timing, gecko_rsp_le_gap_set_advertise_timing),
+        (0x20, 3, 15): (_decode_gecko_rsp_le_gap_set_advertise_channel_map, gecko_rsp_le_gap_set_advertise_channel_map),
+        (0x20, 3, 16): (_decode_gecko_rsp_le_gap_set_advertise_report_scan_request, gecko_rsp_le_gap_set_advertise_report_scan_request),
+        (0x20, 3, 17): (_decode_gecko_rsp_le_gap_set_advertise_phy, gecko_rsp_le_gap_set_advertise_phy),
+        (0x20, 3, 18): (_decode_gecko_rsp_le_gap_set_advertise_configuration, gecko_rsp_le_gap_set_advertise_configuration),
+        (0x20, 3, 19): (_decode_gecko_rsp_le_gap_clear_advertise_configuration, gecko_rsp_le_gap_clear_advertise_configuration),
+        (0x20, 3, 20): (_decode_gecko_rsp_le_gap_start_advertising, gecko_rsp_le_gap_start_advertising),
+        (0x20, 3, 21): (_decode_gecko_rsp_le_gap_stop_advertising, gecko_rsp_le_gap_stop_advertising),
+        (0x20, 3, 22): (_decode_gecko_rsp_le_gap_set_discovery_timing, gecko_rsp_le_gap_set_discovery_timing),
+        (0x20, 3, 23): (_decode_gecko_rsp_le_gap_set_discovery_type, gecko_rsp_le_gap_set_discovery_type),
+        (0x20, 3, 24): (_decode_gecko_rsp_le_gap_start_discovery, gecko_rsp_le_gap_start_discovery),
+        (0x20, 3, 25): (_decode_gecko_rsp_le_gap_set_data_channel_classification, gecko_rsp_le_gap_set_data_channel_classification),
+        (0x20, 3, 26): (_decode_gecko_rsp_le_gap_connect, gecko_rsp_le_gap_connect),
+        (0x20, 3, 27): (_decode_gecko_rsp_le_gap_set_advertise_tx_power, gecko_rsp_le_gap_set_advertise_tx_power),
+        (0x20, 3, 28): (_decode_gecko_rsp_le_gap_set_discovery_extended_scan_response, gecko_rsp_le_gap_set_discovery_extended_scan_response),
+        (0x20, 3, 29): (_decode_gecko_rsp_le_gap_start_periodic_advertising, gecko_rsp_le_gap_start_periodic_advertising),
+        (0x20, 3, 31): (_decode_gecko_rsp_le_gap_stop_periodic_advertising, gecko_rsp_le_gap_stop_periodic_advertising),
+        (0x20, 3, 32): (_decode_gecko_rsp_le_gap_set_long_advertising_data, gecko_rsp_le_gap_set_long_advertising_data),
+        (0x20, 3, 33): (_decode_gecko_rsp_le_gap_enable_whitelisting, gecko_rsp_le_gap_enable_whitelisting),
+        (0x20, 3, 34): (_decode_gecko_rsp_le_gap_set_conn_timing_parameters, gecko_rsp_le_gap_set_conn_timing_parameters),
+        (0x20, 3, 37): (_decode_gecko_rsp_le_gap_set_advertise_random_address, gecko_rsp_le_gap_set_advertise_random_address),
+        (0x20, 3, 38): (_decode_gecko_rsp_le_gap_clear_advertise_random_address, gecko_rsp_le_gap_clear_advertise_random_address),
+        (0x20, 66, 0): (_decode_gecko_rsp_sync_open, gecko_rsp_sync_open),
+        (0x20, 66, 1): (_decode_gecko_rsp_sync_close, gecko_rsp_sync_close),
+        (0x20, 8, 0): (_decode_gecko_rsp_le_connection_set_parameters, gecko_rsp_le_connection_set_parameters),
+        (0x20, 8, 1): (_decode_gecko_rsp_le_connection_get_rssi, gecko_rsp_le_connection_get_rssi),
+        (0x20, 8, 2): (_decode_gecko_rsp_le_connection_disable_slave_latency, gecko_rsp_le_connection_disable_slave_latency),
+        (0x20, 8, 3): (_decode_gecko_rsp_le_connection_set_phy, gecko_rsp_le_connection_set_phy),
+        (0x20, 8, 4): (_decode_gecko_rsp_le_connection_close, gecko_rsp_le_connection_close),
+        (0x20, 8, 5): (_decode_gecko_rsp_le_connection_set_timing_parameters, gecko_rsp_le_connection_set_timing_parameters),
+        (0x20, 8, 6): (_decode_gecko_rsp_le_connection_read_channel_map, gecko_rsp_le_connection_read_channel_map),
+        (0x20, 8, 7): (_decode_gecko_rsp_le_connection_set_preferred_phy, gecko_rsp_le_connection_set_preferred_phy),
+        (0x20, 9, 0): (_decode_gecko_rsp_gatt_set_max_mtu, gecko_rsp_gatt_set_max_mtu),
+        (0x20, 9, 1): (_decode_gecko_rsp_gatt_discover_primary_services, gecko_rsp_gatt_discover_primary_services),
+        (0x20, 9, 2): (_decode_gecko_rsp_gatt_discover_primary_services_by_uuid, gecko_rsp_gatt_discover_primary_services_by_uuid),
+        (0x20, 9, 3): (_decode_gecko_rsp_gatt_discover_characteristics, gecko_rsp_gatt_discover_characteristics),
+        (0x20, 9, 4): (_decode_gecko_rsp_gatt_discover_characteristics_by_uuid, gecko_rsp_gatt_discover_characteristics_by_uuid),
+        (0x20, 9, 5): (_decode_gecko_rsp_gatt_set_characteristic_notification, gecko_rsp_gatt_set_characteristic_notification),
+        (0x20, 9, 6): (_decode_gecko_rsp_gatt_discover_descriptors, gecko_rsp_gatt_discover_descriptors),
+        (0x20, 9, 7): (_decode_gecko_rsp_gatt_read_characteristic_value, gecko_rsp_gatt_read_characteristic_value),
+        (0x20, 9, 8): (_decode_gecko_rsp_gatt_read_characteristic_value_by_uuid, gecko_rsp_gatt_read_characteristic_value_by_uuid),
+        (0x20, 9, 9): (_decode_gecko_rsp_gatt_write_characteristic_value, gecko_rsp_gatt_write_characteristic_value),
+        (0x20, 9, 10): (_decode_gecko_rsp_gatt_write_characteristic_value_without_response, gecko_rsp_gatt_write_characteristic_value_without_response),
+        (0x20, 9, 11): (_decode_gecko_rsp_gatt_prepare_characteristic_value_write, gecko_rsp_gatt_prepare_characteristic_value_write),
+        (0x20, 9, 12): (_decode_gecko_rsp_gatt_execute_characteristic_value_write, gecko_rsp_gatt_execute_characteristic_value_write),
+        (0x20, 9, 13): (_decode_gecko_rsp_gatt_send_characteristic_confirmation, gecko_rsp_gatt_send_characteristic_confirmation),
+        (0x20, 9, 14): (_decode_gecko_rsp_gatt_read_descriptor_value, gecko_rsp_gatt_read_descriptor_value),
+        (0x20, 9, 15): (_decode_gecko_rsp_gatt_write_descriptor_value, gecko_rsp_gatt_write_descriptor_value),
+        (0x20, 9, 16): (_decode_gecko_rsp_gatt_find_included_services, gecko_rsp_gatt_find_included_services),
+        (0x20, 9, 17): (_decode_gecko_rsp_gatt_read_multiple_characteristic_values, gecko_rsp_gatt_read_multiple_characteristic_values),
+        (0x20, 9, 18): (_decode_gecko_rsp_gatt_read_characteristic_value_from_offset, gecko_rsp_gatt_read_characteristic_value_from_offset),
+        (0x20, 9, 19): (_decode_gecko_rsp_gatt_prepare_characteristic_value_reliable_write, gecko_rsp_gatt_prepare_characteristic_value_reliable_write),
+        (0x20, 10, 0): (_decode_gecko_rsp_gatt_server_read_attribute_value, gecko_rsp_gatt_server_read_attribute_value),
+        (0x20, 10, 1): (_decode_gecko_rsp_gatt_server_read_attribute_type, gecko_rsp_gatt_server_read_attribute_type),
+        (0x20, 10, 2): (_decode_gecko_rsp_gatt_server_write_attribute_value, gecko_rsp_gatt_server_write_attribute_value),
+        (0x20, 10, 3): (_decode_gecko_rsp_gatt_server_send_user_read_response, gecko_rsp_gatt_server_send_user_read_response),
+        (0x20, 10, 4): (_decode_gecko_rsp_gatt_server_send_user_write_response, gecko_rsp_gatt_server_send_user_write_response),
+        (0x20, 10, 5): (_decode_gecko_rsp_gatt_server_send_characteristic_notification, gecko_rsp_gatt_server_send_characteristic_notification),
+        (0x20, 10, 6): (_decode_gecko_rsp_gatt_server_find_attribute, gecko_rsp_gatt_server_find_attribute),
+        (0x20, 10, 8): (_decode_gecko_rsp_gatt_server_set_capabilities, gecko_rsp_gatt_server_set_capabilities),
+        (0x20, 10, 9): (_decode_gecko_rsp_gatt_server_find_primary_service, gecko_rsp_gatt_server_find_primary_service),
+        (0x20, 10, 10): (_decode_gecko_rsp_gatt_server_set_max_mtu, gecko_rsp_gatt_server_set_max_mtu),
+        (0x20, 10, 11): (_decode_gecko_rsp_gatt_server_get_mtu, gecko_rsp_gatt_server_get_mtu),
+        (0x20, 10, 12): (_decode_gecko_rsp_gatt_server_enable_capabilities, gecko_rsp_gatt_server_enable_capabilities),
+        (0x20, 10, 13): (_decode_gecko_rsp_gatt_server_disable_capabilities, gecko_rsp_gatt_server_disable_capabilities),
+        (0x20, 10, 14): (_decode_gecko_rsp_gatt_server_get_enabled_capabilities, gecko_rsp_gatt_server_get_enabled_capabilities),
+        (0x20, 12, 0): (_decode_gecko_rsp_hardware_set_soft_timer, gecko_rsp_hardware_set_soft_timer),
+        (0x20, 12, 11): (_decode_gecko_rsp_hardware_get_time, gecko_rsp_hardware_get_time),
+        (0x20, 12, 12): (_decode_gecko_rsp_hardware_set_lazy_soft_timer, gecko_rsp_hardware_set_lazy_soft_timer),
+        (0x20, 13, 1): (_decode_gecko_rsp_flash_ps_erase_all, gecko_rsp_flash_ps_erase_all),
+        (0x20, 13, 2): (_decode_gecko_rsp_flash_ps_save, gecko_rsp_flash_ps_save),
+        (0x20, 13, 3): (_decode_gecko_rsp_flash_ps_load, gecko_rsp_flash_ps_load),
+        (0x20, 13, 4): (_decode_gecko_rsp_flash_ps_erase, gecko_rsp_flash_ps_erase),
+        (0x20, 14, 0): (_decode_gecko_rsp_test_dtm_tx, gecko_rsp_test_dtm_tx),
+        (0x20, 14, 1): (_decode_gecko_rsp_test_dtm_rx, gecko_rsp_test_dtm_rx),
+        (0x20, 14, 2): (_decode_gecko_rsp_test_dtm_end, gecko_rsp_test_dtm_end),
+        (0x20, 14, 7): (_decode_gecko_rsp_test_debug_command, gecko_rsp_test_debug_command),
+        (0x20, 14, 12): (_decode_gecko_rsp_test_debug_counter, gecko_rsp_test_debug_counter),
+        (0x20, 15, 0): (_decode_gecko_rsp_sm_set_bondable_mode, gecko_rsp_sm_set_bondable_mode),
+        (0x20, 15, 1): (_decode_gecko_rsp_sm_configure, gecko_rsp_sm_configure),
+        (0x20, 15, 2): (_decode_gecko_rsp_sm_store_bonding_configuration, gecko_rsp_sm_store_bonding_configuration),
+        (0x20, 15, 4): (_decode_gecko_rsp_sm_increase_security, gecko_rsp_sm_increase_security),
+        (0x20, 15, 6): (_decode_gecko_rsp_sm_delete_bonding, gecko_rsp_sm_delete_bonding),
+        (0x20, 15, 7): (_decode_gecko_rsp_sm_delete_bondings, gecko_rsp_sm_delete_bondings),
+        (0x20, 15, 8): (_decode_gecko_rsp_sm_enter_passkey, gecko_rsp_sm_enter_passkey),
+        (0x20, 15, 9): (_decode_gecko_rsp_sm_passkey_confirm, gecko_rsp_sm_passkey_confirm),
+        (0x20, 15, 10): (_decode_gecko_rsp_sm_set_oob_data, gecko_rsp_sm_set_oob_data),
+        (0x20, 15, 11): (_decode_gecko_rsp_sm_list_all_bondings, gecko_rsp_sm_list_all_bondings),
+        (0x20, 15, 14): (_decode_gecko_rsp_sm_bonding_confirm, gecko_rsp_sm_bonding_confirm),
+        (0x20, 15, 15): (_decode_gecko_rsp_sm_set_debug_mode, gecko_rsp_sm_set_debug_mode),
+        (0x20, 15, 16): (_decode_gecko_rsp_sm_set_passkey, gecko_rsp_sm_set_passkey),
+        (0x20, 15, 17): (_decode_gecko_rsp_sm_use_sc_oob, gecko_rsp_sm_use_sc_oob),
+        (0x20, 15, 18): (_decode_gecko_rsp_sm_set_sc_remote_oob_data, gecko_rsp_sm_set_sc_remote_oob_data),
+        (0x20, 15, 19): (_decode_gecko_rsp_sm_add_to_whitelist, gecko_rsp_sm_add_to_whitelist),
+        (0x20, 15, 20): (_decode_gecko_rsp_sm_set_minimum_key_size, gecko_rsp_sm_set_minimum_key_size),
+        (0x20, 19, 0): (_decode_gecko_rsp_homekit_configure, gecko_rsp_homekit_configure),
+        (0x20, 19, 1): (_decode_gecko_rsp_homekit_advertise, gecko_rsp_homekit_advertise),
+        (0x20, 19, 2): (_decode_gecko_rsp_homekit_delete_pairings, gecko_rsp_homekit_delete_pairings),
+        (0x20, 19, 3): (_decode_gecko_rsp_homekit_check_authcp, gecko_rsp_homekit_check_authcp),
+        (0x20, 19, 4): (_decode_gecko_rsp_homekit_get_pairing_id, gecko_rsp_homekit_get_pairing_id),
+        (0x20, 19, 5): (_decode_gecko_rsp_homekit_send_write_response, gecko_rsp_homekit_send_write_response),
+        (0x20, 19, 6): (_decode_gecko_rsp_homekit_send_read_response, gecko_rsp_homekit_send_read_response),
+        (0x20, 19, 7): (_decode_gecko_rsp_homekit_gsn_action, gecko_rsp_homekit_gsn_action),
+        (0x20, 19, 8): (_decode_gecko_rsp_homekit_event_notification, gecko_rsp_homekit_event_notification),
+        (0x20, 19, 9): (_decode_gecko_rsp_homekit_broadcast_action, gecko_rsp_homekit_broadcast_action),
+        (0x20, 19, 10): (_decode_gecko_rsp_homekit_configure_product_data, gecko_rsp_homekit_configure_product_data),
+        (0x20, 32, 0): (_decode_gecko_rsp_coex_set_options, gecko_rsp_coex_set_options),
+        (0x20, 32, 1): (_decode_gecko_rsp_coex_get_counters, gecko_rsp_coex_get_counters),
+        (0x20, 32, 2): (_decode_gecko_rsp_coex_set_parameters, gecko_rsp_coex_set_parameters),
+        (0x20, 32, 3): (_decode_gecko_rsp_coex_set_directional_priority_pulse, gecko_rsp_coex_set_directional_priority_pulse),
+        (0x20, 67, 1): (_decode_gecko_rsp_l2cap_coc_send_connection_request, gecko_rsp_l2cap_coc_send_connection_request),
+        (0x20, 67, 2): (_decode_gecko_rsp_l2cap_coc_send_connection_response, gecko_rsp_l2cap_coc_send_connection_response),
+        (0x20, 67, 3): (_decode_gecko_rsp_l2cap_coc_send_le_flow_control_credit, gecko_rsp_l2cap_coc_send_le_flow_control_credit),
+        (0x20, 67, 4): (_decode_gecko_rsp_l2cap_coc_send_disconnection_request, gecko_rsp_l2cap_coc_send_disconnection_request),
+        (0x20, 67, 5): (_decode_gecko_rsp_l2cap_coc_send_data, gecko_rsp_l2cap_coc_send_data),
+        (0x20, 68, 0): (_decode_gecko_rsp_cte_transmitter_enable_cte_response, gecko_rsp_cte_transmitter_enable_cte_response),
+        (0x20, 68, 1): (_decode_gecko_rsp_cte_transmitter_disable_cte_response, gecko_rsp_cte_transmitter_disable_cte_response),
+        (0x20, 68, 2): (_decode_gecko_rsp_cte_transmitter_start_connectionless_cte, gecko_rsp_cte_transmitter_start_connectionless_cte),
+        (0x20, 68, 3): (_decode_gecko_rsp_cte_transmitter_stop_connectionless_cte, gecko_rsp_cte_transmitter_stop_connectionless_cte),
+        (0x20, 68, 4): (_decode_gecko_rsp_cte_transmitter_set_dtm_parameters, gecko_rsp_cte_transmitter_set_dtm_parameters),
+        (0x20, 68, 5): (_decode_gecko_rsp_cte_transmitter_clear_dtm_parameters, gecko_rsp_cte_transmitter_clear_dtm_parameters),
+        (0x20, 69, 0): (_decode_gecko_rsp_cte_receiver_configure, gecko_rsp_cte_receiver_configure),
+        (0x20, 69, 1): (_decode_gecko_rsp_cte_receiver_start_iq_sampling, gecko_rsp_cte_receiver_start_iq_sampling),
+        (0x20, 69, 2): (_decode_gecko_rsp_cte_receiver_stop_iq_sampling, gecko_rsp_cte_receiver_stop_iq_sampling),
+        (0x20, 69, 3): (_decode_gecko_rsp_cte_receiver_start_connectionless_iq_sampling, gecko_rsp_cte_receiver_start_connectionless_iq_sampling),
+        (0x20, 69, 4): (_decode_gecko_rsp_cte_receiver_stop_connectionless_iq_sampling, gecko_rsp_cte_receiver_stop_connectionless_iq_sampling),
+        (0x20, 69, 5): (_decode_gecko_rsp_cte_receiver_set_dtm_parameters, gecko_rsp_cte_receiver_set_dtm_parameters),
+        (0x20, 69, 6): (_decode_gecko_rsp_cte_receiver_clear_dtm_parameters, gecko_rsp_cte_receiver_clear_dtm_parameters),
+        (0x20, 254, 0): (_decode_gecko_rsp_qualtester_configure, gecko_rsp_qualtester_configure),
+        (0x20, 255, 0): (_decode_gecko_rsp_user_message_to_target, gecko_rsp_user_message_to_target),
+        (0xa0, 0, 0): (_decode_gecko_evt_dfu_boot, gecko_evt_dfu_boot),
+        (0xa0, 0, 1): (_decode_gecko_evt_dfu_boot_failure, gecko_evt_dfu_boot_failure),
+        (0xa0, 1, 0): (_decode_gecko_evt_system_boot, gecko_evt_system_boot),
+        (0xa0, 1, 3): (_decode_gecko_evt_system_external_signal, gecko_evt_system_external_signal),
+        (0xa0, 1, 4): (_decode_gecko_evt_system_awake, gecko_evt_system_awake),
+        (0xa0, 1, 5): (_decode_gecko_evt_system_hardware_error, gecko_evt_system_hardware_error),
+        (0xa0, 1, 6): (_decode_gecko_evt_system_error, gecko_evt_system_error),
+        (0xa0, 3, 0): (_decode_gecko_evt_le_gap_scan_response, gecko_evt_le_gap_scan_response),
+        (0xa0, 3, 1): (_decode_gecko_evt_le_gap_adv_timeout, gecko_evt_le_gap_adv_timeout),
+        (0xa0, 3, 2): (_decode_gecko_evt_le_gap_scan_request, gecko_evt_le_gap_scan_request),
+        (0xa0, 3, 4): (_decode_gecko_evt_le_gap_extended_scan_response, gecko_evt_le_gap_extended_scan_response),
+        (0xa0, 3, 5): (_decode_gecko_evt_le_gap_periodic_advertising_status, gecko_evt_le_gap_periodic_advertising_status),
+        (0xa0, 66, 0): (_decode_gecko_evt_sync_opened, gecko_evt_sync_opened),
+        (0xa0, 66, 1): (_decode_gecko_evt_sync_closed, gecko_evt_sync_closed),
+        (0xa0, 66, 2): (_decode_gecko_evt_sync_data, gecko_evt_sync_data),
+        (0xa0, 8, 0): (_decode_gecko_evt_le_connection_opened, gecko_evt_le_connection_opened),
+        (0xa0, 8, 1): (_decode_gecko_evt_le_connection_closed, gecko_evt_le_connection_closed),
+        (0xa0, 8, 2): (_decode_gecko_evt_le_connection_parameters, gecko_evt_le_connection_parameters),
+        (0xa0, 8, 3): (_decode_gecko_evt_le_connection_rssi, gecko_evt_le_connection_rssi),
+        (0xa0, 8, 4): (_decode_gecko_evt_le_connection_phy_status, gecko_evt_le_connection_phy_status),
+        (0xa0, 9, 0): (_decode_gecko_evt_gatt_mtu_exchanged, gecko_evt_gatt_mtu_exchanged),
+        (0xa0, 9, 1): (_decode_gecko_evt_gatt_service, gecko_evt_gatt_service),
+        (0xa0, 9, 2): (_decode_gecko_evt_gatt_characteristic, gecko_evt_gatt_characteristic),
+        (0xa0, 9, 3): (_decode_gecko_evt_gatt_descriptor, gecko_evt_gatt_descriptor),
+        (0xa0, 9, 4): (_decode_gecko_evt_gatt_characteristic_value, gecko_evt_gatt_characteristic_value),
+        (0xa0, 9, 5): (_decode_gecko_evt_gatt_descriptor_value, gecko_evt_gatt_descriptor_value),
+        (0xa0, 9, 6): (_decode_gecko_evt_gatt_procedure_completed, gecko_evt_gatt_procedure_completed),
+        (0xa0, 10, 0): (_decode_gecko_evt_gatt_server_attribute_value, gecko_evt_gatt_server_attribute_value),
+        (0xa0, 10, 1): (_decode_gecko_evt_gatt_server_user_read_request, gecko_evt_gatt_server_user_read_request),
+        (0xa0, 10, 2): (_decode_gecko_evt_gatt_server_user_write_request, gecko_evt_gatt_server_user_write_request),
+        (0xa0, 10, 3): (_decode_gecko_evt_gatt_server_characteristic_status, gecko_evt_gatt_server_characteristic_status),
+        (0xa0, 10, 4): (_decode_gecko_evt_gatt_server_execute_write_completed, gecko_evt_gatt_server_execute_write_completed),
+        (0xa0, 12, 0): (_decode_gecko_evt_hardware_soft_timer, gecko_evt_hardware_soft_timer),
+        (0xa0, 14, 0): (_decode_gecko_evt_test_dtm_completed, gecko_evt_test_dtm_completed),
+        (0xa0, 15, 0): (_decode_gecko_evt_sm_passkey_display, gecko_evt_sm_passkey_display),
+        (0xa0, 15, 1): (_decode_gecko_evt_sm_passkey_request, gecko_evt_sm_passkey_request),
+        (0xa0, 15, 2): (_decode_gecko_evt_sm_confirm_passkey, gecko_evt_sm_confirm_passkey),
+        (0xa0, 15, 3): (_decode_gecko_evt_sm_bonded, gecko_evt_sm_bonded),
+        (0xa0, 15, 4): (_decode_gecko_evt_sm_bonding_failed, gecko_evt_sm_bonding_failed),
+        (0xa0, 15, 5): (_decode_gecko_evt_sm_list_bonding_entry, gecko_evt_sm_list_bonding_entry),
+        (0xa0, 15, 6): (_decode_gecko_evt_sm_list_all_bondings_complete, gecko_evt_sm_list_all_bondings_complete),
+        (0xa0, 15, 9): (_decode_gecko_evt_sm_confirm_bonding, gecko_evt_sm_confirm_bonding),
+        (0xa0, 19, 0): (_decode_gecko_evt_homekit_setupcode_display, gecko_evt_homekit_setupcode_display),
+        (0xa0, 19, 1): (_decode_gecko_evt_homekit_paired, gecko_evt_homekit_paired),
+        (0xa0, 19, 2): (_decode_gecko_evt_homekit_pair_verified, gecko_evt_homekit_pair_verified),
+        (0xa0, 19, 3): (_decode_gecko_evt_homekit_connection_opened, gecko_evt_homekit_connection_opened),
+        (0xa0, 19, 4): (_decode_gecko_evt_homekit_connection_closed, gecko_evt_homekit_connection_closed),
+        (0xa0, 19, 5): (_decode_gecko_evt_homekit_identify, gecko_evt_homekit_identify),
+        (0xa0, 19, 6): (_decode_gecko_evt_homekit_write_request, gecko_evt_homekit_write_request),
+        (0xa0, 19, 7): (_decode_gecko_evt_homekit_read_request, gecko_evt_homekit_read_request),
+        (0xa0, 19, 8): (_decode_gecko_evt_homekit_disconnection_required, gecko_evt_homekit_disconnection_required),
+        (0xa0, 19, 9): (_decode_gecko_evt_homekit_pairing_removed, gecko_evt_homekit_pairing_removed),
+        (0xa0, 19, 10): (_decode_gecko_evt_homekit_setuppayload_display, gecko_evt_homekit_setuppayload_display),
+        (0xa0, 67, 1): (_decode_gecko_evt_l2cap_coc_connection_request, gecko_evt_l2cap_coc_connection_request),
+        (0xa0, 67, 2): (_decode_gecko_evt_l2cap_coc_connection_response, gecko_evt_l2cap_coc_connection_response),
+        (0xa0, 67, 3): (_decode_gecko_evt_l2cap_coc_le_flow_control_credit, gecko_evt_l2cap_coc_le_flow_control_credit),
+        (0xa0, 67, 4): (_decode_gecko_evt_l2cap_coc_channel_disconnected, gecko_evt_l2cap_coc_channel_disconnected),
+        (0xa0, 67, 5): (_decode_gecko_evt_l2cap_coc_data, gecko_evt_l2cap_coc_data),
+        (0xa0, 67, 6): (_decode_gecko_evt_l2cap_command_rejected, gecko_evt_l2cap_command_rejected),
+        (0xa0, 69, 0): (_decode_gecko_evt_cte_receiver_iq_report, gecko_evt_cte_receiver_iq_report),
+        (0xa0, 254, 0): (_decode_gecko_evt_qualtester_state_changed, gecko_evt_qualtester_state_changed),
+        (0xa0, 255, 0): (_decode_gecko_evt_user_message_to_host, gecko_evt_user_message_to_host),
+    }
+
+    # (message type and technology type, class ID, command ID) => (min payload length, max payload length)
+    bgapi_rx_lengths = {
+        (0x20, 0, 0): (0, 0),
+        (0x20, 0, 1): (2, 2),
+        (0x20, 0, 2): (2, 2),
+        (0x20, 0, 3): (2, 2),
+        (0x20, 1, 0): (2, 2),
+        (0x20, 1, 1): (0, 0),
+        (0x20, 1, 3): (6, 6),
+        (0x20, 1, 4): (2, 2),
+        (0x20, 1, 10): (2, 2),
+        (0x20, 1, 11): (3, 258),
+        (0x20, 1, 12): (2, 2),
+        (0x20, 1, 13): (2, 2),
+        (0x20, 1, 14): (2, 2),
+        (0x20, 1, 15): (10, 10),
+        (0x20, 1, 18): (2, 2),
+        (0x20, 1, 19): (2, 2),
+        (0x20, 1, 20): (2, 2),
+        (0x20, 3, 0): (3, 3),
+        (0x20, 3, 1): (2, 2),
+        (0x20, 3, 2): (2, 2),
+        (0x20, 3, 3): (2, 2),
+        (0x20, 3, 4): (2, 2),
+        (0x20, 3, 5): (2, 2),
+        (0x20, 3, 6): (2, 2),
+        (0x20, 3, 7): (2, 2),
+        (0x20, 3, 8): (2, 2),
+        (0x20, 3, 9): (2, 2),
+        (0x20, 3, 10): (2, 2),
+        (0x20, 3, 11): (2, 2),
+        (0x20, 3, 12): (2, 2),
+        (0x20, 3, 13): (2, 2),
+        (0x20, 3, 14): (2, 2),
+        (0x20, 3, 15): (2, 2),
+        (0x20, 3, 16): (2, 2),
+        (0x20, 3, 17): (2, 2),
+        (0x20, 3, 18): (2, 2),
+        (0x20, 3, 19): (2, 2),
+        (0x20, 3, 20): (2, 2),
+        (0x20, 3, 21): (2, 2),
+        (0x20, 3, 22): (2, 2),
+        (0x20, 3, 23): (2, 2),
+        (0x20, 3, 24): (2, 2),
+        (0x20, 3, 25): (2, 2),
+        (0x20, 3, 26): (3, 3),
+        (0x20, 3, 27): (4, 4),
+        (0x20, 3, 28): (2, 2),
+        (0x20, 3, 29): (2, 2),
+        (0x20, 3, 31): (2, 2),
+        (0x20, 3, 32): (2, 2),
+        (0x20, 3, 33): (2, 2),
+        (0x20, 3, 34): (2, 2),
+        (0x20, 3, 37): (8, 8),
+        (0x20, 3, 38): (2, 2),
+        (0x20, 66, 0): (3, 3),
+        (0x20, 66, 1): (2, 2),
+        (0x20, 8, 0): (2, 2),
+        (0x20, 8, 1): (2, 2),
+        (0x20, 8, 2): (2, 2),
+        (0x20, 8, 3): (2, 2),
+        (0x20, 8, 4): (2, 2),
+        (0x20, 8, 5): (2, 2),
+        (0x20, 8, 6): (3, 258),
+        (0x20, 8, 7): (2, 2),
+        (0x20, 9, 0): (4, 4),
+        (0x20, 9, 1): (2, 2),
+        (0x20, 9, 2): (2, 2),
+        (0x20, 9, 3): (2, 2),
+        (0x20, 9, 4): (2, 2),
+        (0x20, 9, 5): (2, 2),
+        (0x20, 9, 6): (2, 2),
+        (0x20, 9, 7): (2, 2),
+        (0x20, 9, 8): (2, 2),
+        (0x20, 9, 9): (2, 2),
+        (0x20, 9, 10): (4, 4),
+        (0x20, 9, 11): (4, 4),
+        (0x20, 9, 12): (2, 2),
+        (0x20, 9, 13): (2, 2),
+        (0x20, 9, 14): (2, 2),
+        (0x20, 9, 15): (2, 2),
+        (0x20, 9, 16): (2, 2),
+        (0x20, 9, 17): (2, 2),
+        (0x20, 9, 18): (2, 2),
+        (0x20, 9, 19): (4, 4),
+        (0x20, 10, 0): (3, 258),
+        (0x20, 10, 1): (3, 258),
+        (0x20, 10, 2): (2, 2),
+        (0x20, 10, 3): (4, 4),
+        (0x20, 10, 4): (2, 2),
+        (0x20, 10, 5): (4, 4),
+        (0x20, 10, 6): (4, 4),
+        (0x20, 10, 8): (2, 2),
+        (0x20, 10, 9): (6, 6),
+        (0x20, 10, 10): (4, 4),
+        (0x20, 10, 11): (4, 4),
+        (0x20, 10, 12): (2, 2),
+        (0x20, 10, 13): (2, 2),
+        (0x20, 10, 14): (6, 6),
+        (0x20, 12, 0): (2, 2),
+        (0x20, 12, 11): (6, 6),
+        (0x20, 12, 12): (2, 2),
+        (0x20, 13, 1): (2, 2),
+        (0x20, 13, 2): (2, 2),
+        (0x20, 13, 3): (3, 258),
+        (0x20, 13, 4): (2, 2),
+        (0x20, 14, 0): (2, 2),
+        (0x20, 14, 1): (2, 2),
+        (0x20, 14, 2): (2, 2),
+        (0x20, 14, 7): (4, 259),
+        (0x20, 14, 12): (6, 6),
+        (0x20, 15, 0): (2, 2),
+        (0x20, 15, 1): (2, 2),
+        (0x20, 15, 2): (2, 2),
+        (0x20, 15, 4): (2, 2),
+        (0x20, 15, 6): (2, 2),
+        (0x20, 15, 7): (2, 2),
+        (0x20, 15, 8): (2, 2),
+        (0x20, 15, 9): (2, 2),
+        (0x20, 15, 10): (2, 2),
+        (0x20, 15, 11): (2, 2),
+        (0x20, 15, 14): (2, 2),
+        (0x20, 15, 15): (2, 2),
+        (0x20, 15, 16): (2, 2),
+        (0x20, 15, 17): (3, 258),
+        (0x20, 15, 18): (2, 2),
+        (0x20, 15, 19): (2, 2),
+        (0x20, 15, 20): (2, 2),
+        (0x20, 19, 0): (2, 2),
+        (0x20, 19, 1): (2, 2),
+        (0x20, 19, 2): (2, 2),
+        (0x20, 19, 3): (2, 2),
+        (0x20, 19, 4): (3, 258),
+        (0x20, 19, 5): (2, 2),
+        (0x20, 19, 6): (2, 2),
+        (0x20, 19, 7): (2, 2),
+        (0x20, 19, 8): (2, 2),
+        (0x20, 19, 9): (2, 2),
+        (0x20, 19, 10): (2, 2),
+        (0x20, 32, 0): (2, 2),
+        (0x20, 32, 1): (3, 258),
+        (0x20, 32, 2): (2, 2),
+        (0x20, 32, 3): (2, 2),
+        (0x20, 67, 1): (2, 2),
+        (0x20, 67, 2): (2, 2),
+        (0x20, 67, 3): (2, 2),
+        (0x20, 67, 4): (2, 2),
+        (0x20, 67, 5): (2, 2),
+        (0x20, 68, 0): (2, 2),
+        (0x20, 68, 1): (2, 2),
+        (0x20, 68, 2): (2, 2),
+        (0x20, 68, 3): (2, 2),
+        (0x20, 68, 4): (2, 2),
+        (0x20, 68, 5): (2, 2),
+        (0x20, 69, 0): (2, 2),
+        (0x20, 69, 1): (2, 2),
+        (0x20, 69, 2): (2, 2),
+        (0x20, 69, 3): (2, 2),
+        (0x20, 69, 4): (2, 2),
+        (0x20, 69, 5): (2, 2),
+        (0x20, 69, 6): (2, 2),
+        (0x20, 254, 0): (2, 2),
+        (0x20, 255, 0): (3, 258),
+        (0xa0, 0, 0): (4, 4),
+        (0xa0, 0, 1): (2, 2),
+        (0xa0, 1, 0): (18, 18),
+        (0xa0, 1, 3): (4, 4),
+        (0xa0, 1, 4): (0, 0),
+        (0xa0, 1, 5): (2, 2),
+        (0xa0, 1, 6): (3, 258),
+        (0xa0, 3, 0): (11, 266),
+        (0xa0, 3, 1): (1, 1),
+        (0xa0, 3, 2): (9, 9),
+        (0xa0, 3, 4): (18, 273),
+        (0xa0, 3, 5): (5, 5),
+        (0xa0, 66, 0): (14, 14),
+        (0xa0, 66, 1): (3, 3),
+        (0xa0, 66, 2): (5, 260),
+        (0xa0, 8, 0): (11, 11),
+        (0xa0, 8, 1): (3, 3),
+        (0xa0, 8, 2): (10, 10),
+        (0xa0, 8, 3): (3, 3),
+        (0xa0, 8, 4): (2, 2),
+        (0xa0, 9, 0): (3, 3),
+        (0xa0, 9, 1): (6, 261),
+        (0xa0, 9, 2): (5, 260),
+        (0xa0, 9, 3): (4, 259),
+        (0xa0, 9, 4): (7, 262),
+        (0xa0, 9, 5): (6, 261),
+        (0xa0, 9, 6): (3, 3),
+        (0xa0, 10, 0): (7, 262),
+        (0xa0, 10, 1): (6, 6),
+        (0xa0, 10, 2): (7, 262),
+        (0xa0, 10, 3): (6, 6),
+        (0xa0, 10, 4): (3, 3),
+        (0xa0, 12, 0): (1, 1),
+        (0xa0, 14, 0): (4, 4),
+        (0xa0, 15, 0): (5, 5),
+        (0xa0, 15, 1): (1, 1),
+        (0xa0, 15, 2): (5, 5),
+        (0xa0, 15, 3): (2, 2),
+        (0xa0, 15, 4): (3, 3),
+        (0xa0, 15, 5): (8, 8),
+        (0xa0, 15, 6): (0, 0),
+        (0xa0, 15, 9): (2, 2),
+        (0xa0, 19, 0): (2, 257),
+        (0xa0, 19, 1): (3, 3),
+        (0xa0, 19, 2): (3, 3),
+        (0xa0, 19, 3): (1, 1),
+        (0xa0, 19, 4): (3, 3),
+        (0xa0, 19, 5): (1, 1),
+        (0xa0, 19, 6): (10, 265),
+        (0xa0, 19, 7): (5, 5),
+        (0xa0, 19, 8): (3, 3),
+        (0xa0, 19, 9): (4, 259),
+        (0xa0, 19, 10): (2, 257),
+        (0xa0, 67, 1): (13, 13),
+        (0xa0, 67, 2): (11, 11),
+        (0xa0, 67, 3): (5, 5),
+        (0xa0, 67, 4): (5, 5),
+        (0xa0, 67, 5): (4, 259),
+        (0xa0, 67, 6): (4, 4),
+        (0xa0, 69, 0): (14, 269),
+        (0xa0, 254, 0): (13, 268),
+        (0xa0, 255, 0): (1, 256),
+    }
+
+
+class AsyncBGLib(BGLib, asyncio.Protocol):
+
+    """BGLib driven by an asyncio transport, e.g. from serial_asyncio's
+    create_serial_connection(), loop.create_connection() or
+    loop.create_unix_connection().
+
+    Received data goes straight to parse_bytes(), so handlers added with
+    '+=' still work. Command methods queue the command for the transport as
+    submit() does and return a future that resolves to the args of its
+    response, so that
+
+        address = (await ble.gecko_cmd_system_get_bt_address()).address
+
+    works; wrap it in asyncio.wait_for() for a time limit, which also
+    releases the next queued command. events() gives an async iterator over
+    decoded events.
+    """
+
+    def __init__(self, zero_copy=False):
+        BGLib.__init__(self, zero_copy)
+        self.transport = None
+        self._loop = None
+        self._event_streams = set()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self._loop = asyncio.get_running_loop()
+
+    def data_received(self, data):
+        self.parse_bytes(data)
+
+    def connection_lost(self, exc):
+        self.transport = None
+        if exc is None:
+            exc = ConnectionError('connection lost')
+        self.cancel_commands(exc)
+        for stream in list(self._event_streams):
+            stream.close()
+
+    def send(self, packet):
+
+        """Queue a command packet as submit() does and return an asyncio future
+        for its response args."""
+
+        if self.transport is None:
+            raise ConnectionError('not connected')
+        future = self._loop.create_future()
+        self._queue_command(self.transport, packet, future)
+        return future
+
+    def events(self, *names, maxsize=0):
+
+        """Return an async iterator over (name, args) for the named events.
+
+        For example:
+
+            async for name, args in ble.events('gecko_evt_le_gap_scan_response'):
+                ...
+
+        Events are collected from the moment events() is called. Once maxsize
+        (if > 0) events are waiting, further ones are counted in
+        rx_dropped_events and dropped. The iterator ends after close() or when
+        the connection is lost.
+        """
+
+        if self.zero_copy:
+            # zero_copy views would be overwritten before they are consumed
+            raise ValueError('events() cannot be used with zero_copy')
+        return BGAPIEventStream(self, names, maxsize)
+
+
+def _async_command(build):
+    def command(self, *args):
+        return self.send(build(self, *args))
+    command.__name__ = build.__name__
+    command.__doc__ = build.__doc__
+    return command
+
+for _name, _build in list(BGLib.__dict__.items()):
+    if _name.startswith('gecko_cmd_'):
+        setattr(AsyncBGLib, _name, _async_command(_build))
+del _name, _build
+
+
+class BGAPIEventStream(object):
+
+    """Async iterator over (name, args) of events, see AsyncBGLib.events()."""
+
+    def __init__(self, lib, names, maxsize=0):
+        self.lib = lib
+        self.queue = asyncio.Queue(maxsize)
+        self.closed = False
+        self.handlers = [(name, self._handler(name)) for name in names]
+        for name, handler in self.handlers:
+            getattr(lib, name).add(handler)
+        lib._event_streams.add(self)
+
+    def _handler(self, name):
+        def handler(sender, args):
+            try:
+                self.queue.put_nowait((name, args))
+            except asyncio.QueueFull:
+                self.lib.rx_dropped_events += 1
+        return handler
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed and self.queue.empty():
+            raise StopAsyncIteration
+        item = await self.queue.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+    def close(self):
+
+        """Unsubscribe; the iterator ends once the events already queued are consumed."""
+
+        if self.closed:
+            return
+        self.closed = True
+        for name, handler in self.handlers:
+            getattr(self.lib, name).remove(handler)
+        self.lib._event_streams.discard(self)
+        try:
+            # wake a pending __anext__()
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+class BGLibPool(object):
+
+    """Several adapters working as one, each with its own BGLib parser.
+
+    ports are open serial ports, one per adapter; libs[i] parses ports[i].
+    start() gives every adapter a reader thread (see BGLib.start_reader()).
+    Events named with subscribe() are time-stamped as they are parsed and
+    merged into a single stream of (timestamp, adapter index, name, args)
+    tuples, read in timestamp order with get() or by iterating over the pool.
+    An event is held back for reorder_delay seconds so that one parsed a
+    little later on another adapter's thread can still be put before it.
+    """
+
+    def __init__(self, ports, reorder_delay=0.005, queue_size=0):
+        self.ports = list(ports)
+        self.libs = [BGLib() for port in self.ports]
+        self.reorder_delay = reorder_delay
+        self._queue = queue.Queue(queue_size)
+        self._pending = []
+        self._sequence = itertools.count()
+
+    def subscribe(self, *names):
+
+        """Add the named responses or events of every adapter to the merged stream."""
+
+        for index, lib in enumerate(self.libs):
+            for name in names:
+                getattr(lib, name).add(self._handler(index, name))
+
+    def _handler(self, index, name):
+        put = self._queue.put
+        def handler(sender, args):
+            put((time.monotonic(), index, name, args))
+        return handler
+
+    def start(self):
+
+        """Start the reader thread of every adapter that is not running yet."""
+
+        for lib, port in zip(self.libs, self.ports):
+            if lib._reader is None:
+                lib.start_reader(port)
+
+    def stop(self, timeout=None):
+
+        """Stop all reader threads; returns True once all have exited."""
+
+        stopped = True
+        for lib in self.libs:
+            stopped = lib.stop(timeout) and stopped
+        return stopped
+
+    def get(self, timeout=None):
+
+        """Return the next (timestamp, adapter index, name, args) in timestamp order.
+
+        timestamp is time.monotonic() when the event was parsed. Raises
+        queue.Empty if nothing is ready within timeout seconds (None waits
+        forever).
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while 1:
+            now = time.monotonic()
+            if self._pending:
+                ready = self._pending[0][0] + self.reorder_delay
+                if ready <= now:
+                    return heapq.heappop(self._pending)[2]
+                wait = ready - now
+                if deadline is not None:
+                    wait = min(wait, deadline - now)
+            elif deadline is not None:
+                wait = deadline - now
+            else:
+                wait = None
+            if wait is not None and wait <= 0:
+                raise queue.Empty
+            try:
+                item = self._queue.get(True, wait)
+            except queue.Empty:
+                continue
+            while 1:
+                heapq.heappush(self._pending, (item[0], next(self._sequence), item))
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+    def __iter__(self):
+        while 1:
+            yield self.get()
+
+    def start_scan(self, scan_interval=0x10, active=0, mode=2, phy=1, timeout=1):
+
+        """Start discovery on every adapter with staggered scan windows.
+
+        Each of the N adapters scans for 1/N of every scan_interval (in units
+        of 0.625 ms, at least 4 units), and adapter i starts i/N of an
+        interval after the first, so that together the windows cover the
+        interval once instead of all adapters listening at the same time.
+        (BGAPI has no command to choose the advertising channels a scanner
+        listens on, so the duty is split in time.) mode is the
+        le_gap_start_discovery mode (2 = observation) and phy the scanning
+        PHY. Starts the reader threads if needed; returns the
+        le_gap_start_discovery response args of every adapter.
+        """
+
+        self.start()
+        count = len(self.libs)
+        window = max(4, scan_interval // count)
+        for lib, port in zip(self.libs, self.ports):
+            lib.call(port, lib.gecko_cmd_le_gap_set_discovery_timing(phy, scan_interval, window), timeout)
+            lib.call(port, lib.gecko_cmd_le_gap_set_discovery_type(phy, active), timeout)
+        start = time.monotonic()
+        futures = []
+        for index, (lib, port) in enumerate(zip(self.libs, self.ports)):
+            delay = start + index * scan_interval * 0.000625 / count - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(lib.submit(port, lib.gecko_cmd_le_gap_start_discovery(phy, mode)))
+        return [future.result(timeout) for future in futures]
+
+    def end_scan(self, timeout=1):
+
+        """Stop discovery on every adapter; returns their response args."""
+
+        return [lib.call(port, lib.gecko_cmd_le_gap_end_procedure(), timeout) for lib, port in zip(self.libs, self.ports)]
+
+class BGAPIRing(object):
+
+    """Fixed-size record ring buffer in multiprocessing shared memory.
+
+    One process writes records with put() and one other process reads them
+    with drain(). The write and read positions live in the shared block
+    itself, so no lock or pipe is involved. Each record is a tuple of the
+    fields named in BGAPIRing.fields:
+
+        timestamp     time.monotonic() when the packet was decoded
+        adapter       adapter index given to put()
+        kind          SCAN_RESPONSE, ATTRIBUTE_VALUE, CONNECTION_STATUS or DISCONNECTED
+        connection    connection handle, 0xff for scan responses
+        address_type  remote address type
+        rssi          scan response RSSI
+        flags         packet type, ATT opcode or master flag
+        handle        characteristic handle or disconnect reason
+        address       6-byte remote address
+        length        full length of data
+        data          the first data_size bytes of data, zero padded
+
+    When the ring is full, put() drops the record and counts it in dropped.
+    """
+
+    SCAN_RESPONSE = 1
+    ATTRIBUTE_VALUE = 2
+    CONNECTION_STATUS = 3
+    DISCONNECTED = 4
+
+    fields = ('timestamp', 'adapter', 'kind', 'connection', 'address_type', 'rssi', 'flags', 'handle', 'address', 'length', 'data')
+
+    # write position, dropped count | read position (in its own cache line)
+    _header = 128
+
+    def __init__(self, slots=4096, data_size=64, name=None):
+        self.slots = slots
+        self.data_size = data_size
+        self.record = struct.Struct('<dBBBBbBH6sH%ds' % data_size)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=self._header + slots * self.record.size)
+            self.shm.buf[:self._header] = bytes(self._header)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.owner = name is None
+        self._position = struct.Struct('<Q')
+
+    @property
+    def dropped(self):
+        return self._position.unpack_from(self.shm.buf, 8)[0]
+
+    def put(self, adapter, kind, connection, address_type, rssi, flags, handle, address, data):
+
+        """Append a record; returns False if the ring was full and it was dropped."""
+
+        buf = self.shm.buf
+        position = self._position
+        write = position.unpack_from(buf, 0)[0]
+        if write - position.unpack_from(buf, 64)[0] >= self.slots:
+            position.pack_into(buf, 8, position.unpack_from(buf, 8)[0] + 1)
+            return False
+        self.record.pack_into(buf, self._header + (write % self.slots) * self.record.size, time.monotonic(), adapter, kind, connection, address_type, rssi, flags, handle, address, len(data), data)
+        # publish the record only after it has been written
+        position.pack_into(buf, 0, write + 1)
+        return True
+
+    def drain(self, max_items=None):
+
+        """Remove and return up to max_items (all if None) records, oldest first."""
+
+        buf = self.shm.buf
+        position = self._position
+        read = position.unpack_from(buf, 64)[0]
+        count = position.unpack_from(buf, 0)[0] - read
+        if max_items is not None:
+            count = min(count, max_items)
+        if count <= 0:
+            return []
+        size = self.record.size
+        first = read % self.slots
+        # at most two contiguous runs, before and after the wrap
+        head = min(count, self.slots - first)
+        records = list(self.record.iter_unpack(buf[self._header + first * size:self._header + (first + head) * size]))
+        if head < count:
+            records.extend(self.record.iter_unpack(buf[self._header:self._header + (count - head) * size]))
+        position.pack_into(buf, 64, read + count)
+        return records
+
+    def close(self):
+
+        """Detach from the shared memory, and free it if this object created it."""
+
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _open_serial_port(port):
+    import serial
+    return serial.Serial(port, 115200, timeout=0.1)
+
+
+def _run_ring_reader(ring_name, slots, data_size, adapter, port, opener, commands, stop, errors):
+
+    """(internal use) Body of a BGLibProcessPool adapter process."""
+
+    ring = BGAPIRing(slots, data_size, ring_name)
+    ser = None
+    try:
+        ser = opener(port)
+        lib = BGLib()
+        _ring_subscribe(lib, ring, adapter)
+        for packet in commands:
+            lib.call(ser, packet)
+        while not stop.is_set():
+            x = ser.read(ser.inWaiting() or 1)
+            if len(x) > 0:
+                lib.parse_bytes(x)
+    except Exception:
+        # tell the parent why this adapter stopped; drain() raises it there
+        errors.put((adapter, traceback.format_exc()))
+        raise
+    finally:
+        if ser is not None:
+            ser.close()
+        ring.shm.close()
+
+
+class BGLibProcessPool(object):
+
+    """Several adapters, each read and decoded in a process of its own.
+
+    For when one process (and its GIL) cannot keep up with the adapters.
+    Each adapter process opens its port with opener(port) (by default a
+    pyserial Serial at 115200 baud), sends the given command packets, e.g.
+    scan parameters and gap_discover, and from then on writes scan
+    responses, attribute values and connection status changes to its own
+    BGAPIRing as fixed-size records. drain() collects them in the main
+    process in batches. opener must be picklable, e.g. a module-level
+    function or functools.partial(serial.Serial, baudrate=...).
+
+    If an adapter process fails, for instance because its port cannot be
+    opened or a setup command times out, the next drain() raises a
+    RuntimeError carrying the traceback from that process.
+    """
+
+    def __init__(self, ports, opener=None, commands=(), slots=4096, data_size=64):
+        self.ports = list(ports)
+        self.rings = [BGAPIRing(slots, data_size) for port in self.ports]
+        self._stop = multiprocessing.Event()
+        self._errors = multiprocessing.Queue()
+        self.processes = [multiprocessing.Process(
+            target=_run_ring_reader,
+            args=(ring.name, slots, data_size, index, port, opener or _open_serial_port, list(commands), self._stop, self._errors),
+            name='BGLib adapter %d' % index,
+            daemon=True) for index, (ring, port) in enumerate(zip(self.rings, self.ports))]
+
+    def start(self):
+        for process in self.processes:
+            process.start()
+
+    def drain(self, max_items=None, sort=False):
+
+        """Return the records waiting in all rings (see BGAPIRing) as one list.
+
+        max_items limits the records taken from each ring. With sort set the
+        list is put in timestamp order; otherwise it holds each adapter's
+        records in order, one adapter after another.
+        """
+
+        try:
+            adapter, error = self._errors.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            raise RuntimeError('BGLib adapter %d (%s) failed:\n%s' % (adapter, self.ports[adapter], error))
+        records = []
+        for ring in self.rings:
+            records.extend(ring.drain(max_items))
+        if sort:
+            records.sort(key=lambda record: record[0])
+        return records
+
+    def stop(self, timeout=None):
+
+        """Stop the adapter processes; returns True once all have exited."""
+
+        self._stop.set()
+        for process in self.processes:
+            process.join(timeout)
+        return not any(process.is_alive() for process in self.processes)
+
+    def close(self):
+
+        """Stop the adapter processes and free the rings."""
+
+        if not self.stop(1):
+            for process in self.processes:
+                process.terminate()
+        for ring in self.rings:
+            ring.close()
+
+
+def _ring_subscribe(lib, ring, adapter):
+
+    """(internal use) Write the events kept by BGLibProcessPool to ring."""
+
+    def scan_response(sender, args):
+        ring.put(adapter, BGAPIRing.SCAN_RESPONSE, 0xff, args.address_type, args.rssi, args.packet_type, 0, args.address, args.data)
+    def characteristic_value(sender, args):
+        ring.put(adapter, BGAPIRing.ATTRIBUTE_VALUE, args.connection, 0, 0, args.att_opcode, args.characteristic, b'', args.value)
+    def connection_opened(sender, args):
+        # bonding and advertiser go in data
+        ring.put(adapter, BGAPIRing.CONNECTION_STATUS, args.connection, args.address_type, 0, args.master, 0, args.address, struct.pack('<BB', args.bonding, args.advertiser))
+    def connection_closed(sender, args):
+        ring.put(adapter, BGAPIRing.DISCONNECTED, args.connection, 0, 0, 0, args.reason, b'', b'')
+    lib.gecko_evt_le_gap_scan_response += scan_response
+    lib.gecko_evt_gatt_characteristic_value += characteristic_value
+    lib.gecko_evt_le_connection_opened += connection_opened
+    lib.gecko_evt_le_connection_closed += connection_closed
+
+class BGAPIBridge(object):
+
+    """Share one adapter among several clients over TCP or a Unix socket.
+
+    The bridge owns the port: it runs a BGLib reader thread on it and speaks
+    plain BGAPI to its clients, so a client is an ordinary BGLib used with
+    a BGAPISocketPort, or an AsyncBGLib connected with
+    loop.create_connection(). Commands from all clients go through
+    BGLib.submit()'s queue, so they reach the adapter one at a time, and
+    each response is sent only to the client whose command it answers.
+    Events are passed on undecoded to every client, or only to those that
+    subscribed to their class or (class, command) pair with a
+    subscribe_frame(). A client whose send buffer is over max_buffer bytes
+    misses events until it catches up. Commands still unanswered
+    command_timeout seconds after they arrived are dropped, and so is a
+    response that arrives for one of them later.
+    """
+
+    # first header byte of bridge control frames (message type 0, technology type 1111)
+    CONTROL = 0x78
+
+    def __init__(self, ser, command_timeout=1, max_buffer=1 << 20):
+        self.ser = ser
+        self.lib = BGLib()
+        self.command_timeout = command_timeout
+        self.max_buffer = max_buffer
+        self.clients = set()
+        self._command_clients = {}
+        self._loop = None
+        self.lib.on_raw_frame += self._raw_frame
+
+    @staticmethod
+    def subscribe_frame(*filters):
+
+        """Return the control frame that limits a client to the given events.
+
+        filters are class IDs and (class ID, command ID) pairs; with none, the
+        client gets all events again (as it does before subscribing).
+        """
+
+        payload = []
+        for item in filters:
+            if isinstance(item, tuple):
+                payload.extend(item)
+            else:
+                payload.extend((item, 0xff))
+        return bytes([BGAPIBridge.CONTROL, len(payload), 0, 0] + payload)
+
+    async def start(self, address):
+
+        """Start the reader thread and listen on address, a (host, port) pair
+        for TCP or a path for a Unix socket; returns the asyncio server."""
+
+        self._loop = asyncio.get_running_loop()
+        if self.lib._reader is None:
+            self.lib.start_reader(self.ser)
+        if isinstance(address, str):
+            return await self._loop.create_unix_server(lambda: _BridgeClient(self), address)
+        return await self._loop.create_server(lambda: _BridgeClient(self), address[0], address[1])
+
+    def serve_forever(self, address):
+
+        """Run the bridge on address (see start()) until interrupted."""
+
+        async def serve():
+            server = await self.start(address)
+            async with server:
+                await server.serve_forever()
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.lib.stop(1)
+
+    def _command(self, client, packet):
+
+        """(internal use) Queue a command packet from a client."""
+
+        future = concurrent.futures.Future()
+        self._command_clients[future] = (client, packet[2], packet[3])
+        self._loop.call_later(self.command_timeout, self._expire_command, future)
+        self.lib._queue_command(self.ser, packet, future)
+
+    def _expire_command(self, future):
+        self._command_clients.pop(future, None)
+        future.cancel()
+
+    def _raw_frame(self, sender, frame):
+
+        """(internal use) Pass a received packet on, from the reader thread."""
+
+        header = frame.header
+        data = bytes(header) + bytes(frame.payload)
+        if header[0] & 0x80:
+            self._loop.call_soon_threadsafe(self._fan_out, header[2], header[3], data)
+            return
+        # a response, to the oldest command waiting for it (resolved right
+        # after this); None in its place marks one that has been dropped
+        waiters = self.lib._response_waiters.get((header[2], header[3]))
+        command = self._command_clients.pop(waiters[0], None) if waiters else None
+        if command is not None and command[1:] == (header[2], header[3]):
+            self._loop.call_soon_threadsafe(command[0].send, data)
+
+    def _fan_out(self, packet_class, packet_command, data):
+        for client in self.clients:
+            filters = client.filters
+            if filters is None or packet_class in filters or (packet_class, packet_command) in filters:
+                if client.transport.get_write_buffer_size() > self.max_buffer:
+                    client.dropped += 1
+                else:
+                    client.send(data)
+
+
+class _BridgeClient(asyncio.Protocol):
+
+    """(internal use) One client connection of a BGAPIBridge."""
+
+    def __init__(self, bridge):
+        self.bridge = bridge
+        self.transport = None
+        self.filters = None
+        self.dropped = 0
+        self.buffer = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.bridge.clients.add(self)
+
+    def connection_lost(self, exc):
+        self.bridge.clients.discard(self)
+        for future, command in list(self.bridge._command_clients.items()):
+            if command[0] is self:
+                self.bridge._expire_command(future)
+
+    def send(self, data):
+        if not self.transport.is_closing():
+            self.transport.write(data)
+
+    def data_received(self, data):
+        buf = self.buffer + data
+        pos = 0
+        end = len(buf)
+        while end - pos >= 4:
+            length = 4 + (buf[pos] & 0x07) + buf[pos + 1]
+            if end - pos < length:
+                break
+            if buf[pos] == BGAPIBridge.CONTROL:
+                self._control(buf[pos + 2], buf[pos + 3], buf[pos + 4:pos + length])
+            else:
+                self.bridge._command(self, buf[pos:pos + length])
+            pos += length
+        self.buffer = buf[pos:]
+
+    def _control(self, control_class, control_command, payload):
+        if control_class == 0 and control_command == 0:
+            # subscribe
+            if len(payload) == 0:
+                self.filters = None
+                return
+            self.filters = set()
+            for i in range(0, len(payload) - 1, 2):
+                if payload[i + 1] == 0xff:
+                    self.filters.add(payload[i])
+                else:
+                    self.filters.add((payload[i], payload[i + 1]))
+
+
+class BGAPISocketPort(object):
+
+    """A socket connection to a BGAPIBridge that looks like a pyserial port.
+
+    It provides read(), write(), inWaiting(), fileno(), timeout, cancel_read()
+    and close(), so the blocking BGLib API (check_activity(), call(),
+    start_reader()) works over it unchanged:
+
+        port = BGAPISocketPort.connect(('localhost', 9000))
+        port.subscribe(3)   # only le_gap events
+        ble.call(port, ble.gecko_cmd_le_gap_start_discovery(1, 2))
+    """
+
+    def __init__(self, sock, timeout=None):
+        self.sock = sock
+        self.timeout = timeout
+        self._buffer = b""
+        self._wakeup_read, self._wakeup_write = socket.socketpair()
+
+    @classmethod
+    def connect(cls, address, timeout=None):
+
+        """Connect to a bridge at a (host, port) pair or a Unix socket path."""
+
+        if isinstance(address, str):
+            sock = socket.socket(socket.AF_UNIX)
+            sock.connect(address)
+        else:
+            sock = socket.create_connection(address)
+        return cls(sock, timeout)
+
+    def subscribe(self, *filters):
+
+        """Receive only the given events, see BGAPIBridge.subscribe_frame()."""
+
+        self.sock.sendall(BGAPIBridge.subscribe_frame(*filters))
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def inWaiting(self):
+        if len(self._buffer) == 0:
+            self._fill(0)
+        return len(self._buffer)
+
+    def read(self, size=1):
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while len(self._buffer) < size:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            if not self._fill(remaining):
+                break
+        data = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return data
+
+    def _fill(self, timeout):
+
+        """(internal use) Wait up to timeout seconds for data; False if cancelled or timed out."""
+
+        readable = select.select([self.sock, self._wakeup_read], [], [], timeout)[0]
+        if self._wakeup_read in readable:
+            self._wakeup_read.recv(64)
+            return False
+        if not readable:
+            return False
+        data = self.sock.recv(65536)
+        if len(data) == 0:
+            raise ConnectionError('bridge closed the connection')
+        self._buffer += data
+        return True
+
+    def write(self, data):
+        self.sock.sendall(data)
+        return len(data)
+
+    def cancel_read(self):
+        self._wakeup_write.send(b"\x00")
+
+    def close(self):
+        self.sock.close()
+        self._wakeup_read.close()
+        self._wakeup_write.close()
+
+class BGAPISimulator(object):
+
+    """A simulated Blue Gecko (BGAPI device) that answers every command and can stream events.
+
+    Generated from the same API definitions as BGLib. Every command frame
+    received is answered with a well-formed response: all fields zero (so
+    'result' is success) and arrays empty, unless responses[(class ID,
+    command ID)] holds the payload to send instead, or a function of the
+    command payload that returns it. push() sends one event and stream()
+    sends events from a background thread at a given rate, for example
+
+        sim, path = BGAPISimulator.open_pty()
+        sim.stream('gecko_evt_le_gap_scan_response', rate=20000)
+
+    then open path as the serial port. Event payloads default to random
+    field values, with arrays of up to array_size random bytes.
+    """
+
+    def __init__(self, read, write, seed=None):
+        self._read = read
+        self._write = write
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._close = None
+        self.responses = {}
+        self.array_size = 31
+        self.random = random.Random(seed)
+        self.names = dict((event.name, key) for key, (decoder, event) in BGLib.bgapi_rx_dispatch.items())
+        self.threads = [threading.Thread(target=self._run_commands, name='BGAPI simulator', daemon=True)]
+        self.threads[0].start()
+
+    @classmethod
+    def open_pty(cls, seed=None):
+
+        """Start a simulator on a new pseudo-terminal (POSIX only).
+
+        Returns the simulator and the path of the terminal to open as the
+        serial port.
+        """
+
+        import pty
+        import tty
+        master, slave = pty.openpty()
+        tty.setraw(master)
+        tty.setraw(slave)
+        def read(timeout):
+            if select.select([master], [], [], timeout)[0]:
+                return os.read(master, 65536)
+            return None
+        def write(data):
+            view = memoryview(data)
+            while len(view) > 0:
+                view = view[os.write(master, view):]
+        sim = cls(read, write, seed)
+        sim._close = lambda: (os.close(master), os.close(slave))
+        return sim, os.ttyname(slave)
+
+    @classmethod
+    def socket_pair(cls, seed=None):
+
+        """Start a simulator on one end of a socket pair; returns the simulator
+        and the other end, e.g. for BGAPISocketPort(sock) or AsyncBGLib."""
+
+        device, host = socket.socketpair()
+        def read(timeout):
+            if select.select([device], [], [], timeout)[0]:
+                return device.recv(65536)
+            return None
+        sim = cls(read, device.sendall, seed)
+        sim._close = device.close
+        return sim, host
+
+    def payload(self, key, randomize=True):
+
+        """Return a payload for the message with dispatch key key, with random
+        field values if randomize is set, otherwise all zero."""
+
+        layout, has_array = self.layouts[key]
+        size = struct.calcsize(layout)
+        if not randomize:
+            return bytes(size)
+        data = self.random.getrandbits(8 * size).to_bytes(size, 'little') if size > 0 else b""
+        if has_array:
+            length = self.random.randint(0, self.array_size)
+            data = data[:-1] + bytes([length]) + self.random.getrandbits(8 * length).to_bytes(length, 'little')
+        return data
+
+    def frame(self, name, payload=None):
+
+        """Return the packet for the named event or response, with the given
+        or a random payload."""
+
+        key = self.names[name]
+        if payload is None:
+            payload = self.payload(key)
+        return bytes([key[0] | (len(payload) >> 8) & 0x07, len(payload) & 0xFF, key[1], key[2]]) + payload
+
+    def send(self, data):
+
+        """Write raw bytes to the host, between whole packets of other writers."""
+
+        with self._write_lock:
+            self._write(data)
+
+    def push(self, name, payload=None):
+
+        """Send one event (or response), e.g. push('gecko_evt_le_gap_scan_response')."""
+
+        self.send(self.frame(name, payload))
+
+    def stream(self, events, rate=None, count=None):
+
+        """Send events from a background thread; returns the thread.
+
+        events is either a name, sent repeatedly with random payloads, or an
+        iterable of (name, payload) pairs (payload None for random) that is
+        played once. rate is in events per second, None for as fast as
+        possible; count limits the number of events. Events due at the same
+        time go out in one write. Runs until done or close().
+        """
+
+        if isinstance(events, str):
+            events = itertools.repeat((events, None))
+        if count is not None:
+            events = itertools.islice(events, count)
+        thread = threading.Thread(target=self._run_stream, args=(iter(events), rate), name='BGAPI simulator stream', daemon=True)
+        self.threads.append(thread)
+        thread.start()
+        return thread
+
+    def close(self):
+
+        """Stop all threads and close the simulator's end of the connection."""
+
+        self._stop.set()
+        for thread in self.threads:
+            if thread is not threading.current_thread():
+                thread.join(1)
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def _run_stream(self, events, rate):
+        start = time.monotonic()
+        sent = 0
+        while not self._stop.is_set():
+            if rate is None:
+                wanted = 64
+            else:
+                # event n is due n / rate seconds after the start
+                wanted = int((time.monotonic() - start) * rate) + 1 - sent
+            if wanted > 0:
+                batch = [self.frame(name, payload) for name, payload in itertools.islice(events, wanted)]
+                if len(batch) > 0:
+                    self.send(b"".join(batch))
+                    sent += len(batch)
+                if len(batch) < wanted:
+                    # out of events
+                    return
+            if rate is not None:
+                time.sleep(min(0.001, max(0, sent / rate - (time.monotonic() - start))))
+
+    def _run_commands(self):
+        buf = b""
+        while not self._stop.is_set():
+            try:
+                data = self._read(0.1)
+            except OSError:
+                return
+            if data is None:
+                continue
+            if len(data) == 0:
+                return
+            buf += data
+            pos = 0
+            while len(buf) - pos >= 4:
+                length = 4 + (buf[pos] & 0x07) + buf[pos + 1]
+                if len(buf) - pos < length:
+                    break
+                self._answer(buf[pos:pos + length])
+                pos += length
+            buf = buf[pos:]
+
+    def _answer(self, command):
+        key = (command[0] & 0xf8, command[2], command[3])
+        if key not in self.layouts:
+            return
+        response = self.responses.get(key[1:])
+        if response is None:
+            payload = self.payload(key, False)
+        elif callable(response):
+            payload = response(command[4:])
+        else:
+            payload = response
+        self.send(bytes([key[0] | (len(payload) >> 8) & 0x07, len(payload) & 0xFF, key[1], key[2]]) + payload)
+
+    # (message type and technology type, class ID, command ID) => (struct format of the payload, whether it ends in a uint8array)
+    layouts = {
+        (0x20, 0, 0): ('<', False),
+        (0x20, 0, 1): ('<H', False),
+        (0x20, 0, 2): ('<H', False),
+        (0x20, 0, 3): ('<H', False),
+        (0x20, 1, 0): ('<H', False),
+        (0x20, 1, 1): ('<', False),
+        (0x20, 1, 3): ('<6s', False),
+        (0x20, 1, 4): ('<H', False),
+        (0x20, 1, 10): ('<h', False),
+        (0x20, 1, 11): ('<HB', True),
+        (0x20, 1, 12): ('<H', False),
+        (0x20, 1, 13): ('<H', False),
+        (0x20, 1, 14): ('<H', False),
+        (0x20, 1, 15): ('<HHHHH', False),
+        (0x20, 1, 18): ('<H', False),
+        (0x20, 1, 19): ('<H', False),
+        (0x20, 1, 20): ('<H', False),
+        (0x20, 3, 0): ('<HB', False),
+        (0x20, 3, 1): ('<H', False),
+        (0x20, 3, 2): ('<H', False),
+        (0x20, 3, 3): ('<H', False),
+        (0x20, 3, 4): ('<H', False),
+        (0x20, 3, 5): ('<H', False),
+        (0x20, 3, 6): ('<H', False),
+        (0x20, 3, 7): ('<H', False),
+        (0x20, 3, 8): ('<H', False),
+        (0x20, 3, 9): ('<H', False),
+        (0x20, 3, 10): ('<H', False),
+        (0x20, 3, 11): ('<H', False),
+        (0x20, 3, 12): ('<H', False),
+        (0x20, 3, 13): ('<H', False),
+        (0x20, 3, 14): ('<H', False),
+        (0x20, 3, 15): ('<H', False),
+        (0x20, 3, 16): ('<H', False),
+        (0x20, 3, 17): ('<H', False),
+        (0x20, 3, 18): ('<H', False),
+        (0x20, 3, 19): ('<H', False),
+        (0x20, 3, 20): ('<H', False),
+        (0x20, 3, 21): ('<H', False),
+        (0x20, 3, 22): ('<H', False),
+        (0x20, 3, 23): ('<H', False),
+        (0x20, 3, 24): ('<H', False),
+        (0x20, 3, 25): ('<H', False),
+        (0x20, 3, 26): ('<HB', False),
+        (0x20, 3, 27): ('<Hh', False),
+        (0x20, 3, 28): ('<H', False),
+        (0x20, 3, 29): ('<H', False),
+        (0x20, 3, 31): ('<H', False),
+        (0x20, 3, 32): ('<H', False),
+        (0x20, 3, 33): ('<H', False),
+        (0x20, 3, 34): ('<H', False),
+        (0x20, 3, 37): ('<H6s', False),
+        (0x20, 3, 38): ('<H', False),
+        (0x20, 66, 0): ('<HB', False),
+        (0x20, 66, 1): ('<H', False),
+        (0x20, 8, 0): ('<H', False),
+        (0x20, 8, 1): ('<H', False),
+        (0x20, 8, 2): ('<H', False),
+        (0x20, 8, 3): ('<H', False),
+        (0x20, 8, 4): ('<H', False),
+        (0x20, 8, 5): ('<H', False),
+        (0x20, 8, 6): ('<HB', True),
+        (0x20, 8, 7): ('<H', False),
+        (0x20, 9, 0): ('<HH', False),
+        (0x20, 9, 1): ('<H', False),
+        (0x20, 9, 2): ('<H', False),
+        (0x20, 9, 3): ('<H', False),
+        (0x20, 9, 4): ('<H', False),
+        (0x20, 9, 5): ('<H', False),
+        (0x20, 9, 6): ('<H', False),
+        (0x20, 9, 7): ('<H', False),
+        (0x20, 9, 8): ('<H', False),
+        (0x20, 9, 9): ('<H', False),
+        (0x20, 9, 10): ('<HH', False),
+        (0x20, 9, 11): ('<HH', False),
+        (0x20, 9, 12): ('<H', False),
+        (0x20, 9, 13): ('<H', False),
+        (0x20, 9, 14): ('<H', False),
+        (0x20, 9, 15): ('<H', False),
+        (0x20, 9, 16): ('<H', False),
+        (0x20, 9, 17): ('<H', False),
+        (0x20, 9, 18): ('<H', False),
+        (0x20, 9, 19): ('<HH', False),
+        (0x20, 10, 0): ('<HB', True),
+        (0x20, 10, 1): ('<HB', True),
+        (0x20, 10, 2): ('<H', False),
+        (0x20, 10, 3): ('<HH', False),
+        (0x20, 10, 4): ('<H', False),
+        (0x20, 10, 5): ('<HH', False),
+        (0x20, 10, 6): ('<HH', False),
+        (0x20, 10, 8): ('<H', False),
+        (0x20, 10, 9): ('<HHH', False),
+        (0x20, 10, 10): ('<HH', False),
+        (0x20, 10, 11): ('<HH', False),
+        (0x20, 10, 12): ('<H', False),
+        (0x20, 10, 13): ('<H', False),
+        (0x20, 10, 14): ('<HI', False),
+        (0x20, 12, 0): ('<H', False),
+        (0x20, 12, 11): ('<IH', False),
+        (0x20, 12, 12): ('<H', False),
+        (0x20, 13, 1): ('<H', False),
+        (0x20, 13, 2): ('<H', False),
+        (0x20, 13, 3): ('<HB', True),
+        (0x20, 13, 4): ('<H', False),
+        (0x20, 14, 0): ('<H', False),
+        (0x20, 14, 1): ('<H', False),
+        (0x20, 14, 2): ('<H', False),
+        (0x20, 14, 7): ('<HBB', True),
+        (0x20, 14, 12): ('<HI', False),
+        (0x20, 15, 0): ('<H', False),
+        (0x20, 15, 1): ('<H', False),
+        (0x20, 15, 2): ('<H', False),
+        (0x20, 15, 4): ('<H', False),
+        (0x20, 15, 6): ('<H', False),
+        (0x20, 15, 7): ('<H', False),
+        (0x20, 15, 8): ('<H', False),
+        (0x20, 15, 9): ('<H', False),
+        (0x20, 15, 10): ('<H', False),
+        (0x20, 15, 11): ('<H', False),
+        (0x20, 15, 14): ('<H', False),
+        (0x20, 15, 15): ('<H', False),
+        (0x20, 15, 16): ('<H', False),
+        (0x20, 15, 17): ('<HB', True),
+        (0x20, 15, 18): ('<H', False),
+        (0x20, 15, 19): ('<H', False),
+        (0x20, 15, 20): ('<H', False),
+        (0x20, 19, 0): ('<H', False),
+        (0x20, 19, 1): ('<H', False),
+        (0x20, 19, 2): ('<H', False),
+        (0x20, 19, 3): ('<H', False),
+        (0x20, 19, 4): ('<HB', True),
+        (0x20, 19, 5): ('<H', False),
+        (0x20, 19, 6): ('<H', False),
+        (0x20, 19, 7): ('<H', False),
+        (0x20, 19, 8): ('<H', False),
+        (0x20, 19, 9): ('<H', False),
+        (0x20, 19, 10): ('<H', False),
+        (0x20, 32, 0): ('<H', False),
+        (0x20, 32, 1): ('<HB', True),
+        (0x20, 32, 2): ('<H', False),
+        (0x20, 32, 3): ('<H', False),
+        (0x20, 67, 1): ('<H', False),
+        (0x20, 67, 2): ('<H', False),
+        (0x20, 67, 3): ('<H', False),
+        (0x20, 67, 4): ('<H', False),
+        (0x20, 67, 5): ('<H', False),
+        (0x20, 68, 0): ('<H', False),
+        (0x20, 68, 1): ('<H', False),
+        (0x20, 68, 2): ('<H', False),
+        (0x20, 68, 3): ('<H', False),
+        (0x20, 68, 4): ('<H', False),
+        (0x20, 68, 5): ('<H', False),
+        (0x20, 69, 0): ('<H', False),
+        (0x20, 69, 1): ('<H', False),
+        (0x20, 69, 2): ('<H', False),
+        (0x20, 69, 3): ('<H', False),
+        (0x20, 69, 4): ('<H', False),
+        (0x20, 69, 5): ('<H', False),
+        (0x20, 69, 6): ('<H', False),
+        (0x20, 254, 0): ('<H', False),
+        (0x20, 255, 0): ('<HB', True),
+        (0xa0, 0, 0): ('<I', False),
+        (0xa0, 0, 1): ('<H', False),
+        (0xa0, 1, 0): ('<HHHHIHI', False),
+        (0xa0, 1, 3): ('<I', False),
+        (0xa0, 1, 4): ('<', False),
+        (0xa0, 1, 5): ('<H', False),
+        (0xa0, 1, 6): ('<HB', True),
+        (0xa0, 3, 0): ('<bB6sBBB', True),
+        (0xa0, 3, 1): ('<B', False),
+        (0xa0, 3, 2): ('<B6sBB', False),
+        (0xa0, 3, 4): ('<B6sBBBBBbbBHB', True),
+        (0xa0, 3, 5): ('<BI', False),
+        (0xa0, 66, 0): ('<BB6sBBHH', False),
+        (0xa0, 66, 1): ('<HB', False),
+        (0xa0, 66, 2): ('<BbbBB', True),
+        (0xa0, 8, 0): ('<6sBBBBB', False),
+        (0xa0, 8, 1): ('<HB', False),
+        (0xa0, 8, 2): ('<BHHHBH', False),
+        (0xa0, 8, 3): ('<BBb', False),
+        (0xa0, 8, 4): ('<BB', False),
+        (0xa0, 9, 0): ('<BH', False),
+        (0xa0, 9, 1): ('<BIB', True),
+        (0xa0, 9, 2): ('<BHBB', True),
+        (0xa0, 9, 3): ('<BHB', True),
+        (0xa0, 9, 4): ('<BHBHB', True),
+        (0xa0, 9, 5): ('<BHHB', True),
+        (0xa0, 9, 6): ('<BH', False),
+        (0xa0, 10, 0): ('<BHBHB', True),
+        (0xa0, 10, 1): ('<BHBH', False),
+        (0xa0, 10, 2): ('<BHBHB', True),
+        (0xa0, 10, 3): ('<BHBH', False),
+        (0xa0, 10, 4): ('<BH', False),
+        (0xa0, 12, 0): ('<B', False),
+        (0xa0, 14, 0): ('<HH', False),
+        (0xa0, 15, 0): ('<BI', False),
+        (0xa0, 15, 1): ('<B', False),
+        (0xa0, 15, 2): ('<BI', False),
+        (0xa0, 15, 3): ('<BB', False),
+        (0xa0, 15, 4): ('<BH', False),
+        (0xa0, 15, 5): ('<B6sB', False),
+        (0xa0, 15, 6): ('<', False),
+        (0xa0, 15, 9): ('<Bb', False),
+        (0xa0, 19, 0): ('<BB', True),
+        (0xa0, 19, 1): ('<BH', False),
+        (0xa0, 19, 2): ('<BH', False),
+        (0xa0, 19, 3): ('<B', False),
+        (0xa0, 19, 4): ('<BH', False),
+        (0xa0, 19, 5): ('<B', False),
+        (0xa0, 19, 6): ('<BHHHHB', True),
+        (0xa0, 19, 7): ('<BHH', False),
+        (0xa0, 19, 8): ('<BH', False),
+        (0xa0, 19, 9): ('<BHB', True),
+        (0xa0, 19, 10): ('<BB', True),
+        (0xa0, 67, 1): ('<BHHHHHBB', False),
+        (0xa0, 67, 2): ('<BHHHHH', False),
+        (0xa0, 67, 3): ('<BHH', False),
+        (0xa0, 67, 4): ('<BHH', False),
+        (0xa0, 67, 5): ('<BHB', True),
+        (0xa0, 67, 6): ('<BBH', False),
+        (0xa0, 69, 0): ('<HBBBBbBBBHBB', True),
+        (0xa0, 254, 0): ('<IIIB', True),
+        (0xa0, 255, 0): ('<B', True),
+    }
+
+class BGAPICapture(object):
+
+    """Timestamped capture of the raw bytes a BGLib receives and sends.
+
+    Used through BGLib.start_capture(). The file starts with MAGIC and then
+    holds one record per chunk: a '<dBI' header (time.monotonic(), RX or
+    TX, length) followed by the bytes. Read it back with BGAPIReplay.
+    """
+
+    MAGIC = b"BGAPIcap"
+    RX = 0
+    TX = 1
+
+    _record = struct.Struct('<dBI')
+
+    def __init__(self, file):
+        if isinstance(file, (str, bytes, os.PathLike)):
+            self.file = open(file, 'wb')
+            self._owned = True
+        else:
+            self.file = file
+            self._owned = False
+        self._lock = threading.Lock()
+        self.file.write(self.MAGIC)
+
+    def write(self, direction, data):
+        if len(data) == 0:
+            return
+        with self._lock:
+            self.file.write(self._record.pack(time.monotonic(), direction, len(data)))
+            self.file.write(data)
+
+    def close(self):
+        with self._lock:
+            if self._owned:
+                self.file.close()
+            else:
+                self.file.flush()
+
+
+class BGAPIReplay(object):
+
+    """Play back a BGAPICapture file.
+
+    records() gives every (timestamp, direction, data) record. chunks()
+    gives the received chunks at their original pace, speed times faster,
+    or as fast as possible with speed None, and is a valid source for
+    BGLib.iter_frames() and iter_packets(). feed() passes them to a BGLib's
+    parse_bytes(), so its handlers run as they did when the capture was
+    made:
+
+        BGAPIReplay('scan.cap').feed(ble, speed=10)
+    """
+
+    def __init__(self, file):
+        self.file = file
+
+    def records(self):
+        record = BGAPICapture._record
+        if isinstance(self.file, (str, bytes, os.PathLike)):
+            f = open(self.file, 'rb')
+        else:
+            f = self.file
+        try:
+            if f.read(len(BGAPICapture.MAGIC)) != BGAPICapture.MAGIC:
+                raise ValueError('not a BGAPI capture file')
+            while 1:
+                header = f.read(record.size)
+                if len(header) < record.size:
+                    return
+                timestamp, direction, length = record.unpack(header)
+                yield timestamp, direction, f.read(length)
+        finally:
+            if f is not self.file:
+                f.close()
+
+    def chunks(self, speed=1, direction=BGAPICapture.RX):
+        start = None
+        for timestamp, chunk_direction, data in self.records():
+            if chunk_direction != direction:
+                continue
+            if speed:
+                if start is None:
+                    start = (timestamp, time.monotonic())
+                delay = (timestamp - start[0]) / speed - (time.monotonic() - start[1])
+                if delay > 0:
+                    time.sleep(delay)
+            yield data
+
+    def feed(self, lib, speed=1):
+
+        """Parse the received chunks with lib; returns the number of bytes fed."""
+
+        count = 0
+        for data in self.chunks(speed):
+            lib.parse_bytes(data)
+            count += len(data)
+        return count
+
+def _detach_args(args):
+
+    """(internal use) Copy of args with zero_copy views replaced by bytes."""
+
+    return type(args)(*[bytes(value) if isinstance(value, memoryview) else value
+                        for value in [getattr(args, name) for name in args.__slots__]])
+
+
+class BGAPIExecutorHandler(object):
+
+    """Event handler that runs func on an executor instead of the parser thread.
+
+        pool = concurrent.futures.ThreadPoolExecutor(8)
+        ble.gecko_evt_gatt_characteristic_value += BGAPIExecutorHandler(store_value, pool, key='connection')
+
+    Calls with the same key run one at a time, in the order they arrived,
+    and calls with different keys run in parallel. key is an argument name
+    such as 'connection' or 'sender', a function of the args record, or
+    None to run every call in order. func(sender, args) is called as usual,
+    except that on a ProcessPoolExecutor sender is None, because a BGLib
+    cannot be pickled; args records pickle as they are. With zero_copy, the
+    uint8array fields are copied before they are queued.
+
+    Exceptions raised by func are counted in errors, and the last one is
+    kept in last_error. wait() blocks until everything submitted so far has
+    run.
+    """
+
+    def __init__(self, func, executor, key=None):
+        self.func = func
+        self.executor = executor
+        self.key = key
+        self.errors = 0
+        self.last_error = None
+        self._pass_sender = not isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+        self._pending = {}
+        self._condition = threading.Condition()
+
+    def __call__(self, sender, args):
+        if getattr(sender, 'zero_copy', False):
+            args = _detach_args(args)
+        if self.key is None:
+            key = None
+        elif callable(self.key):
+            key = self.key(args)
+        else:
+            key = args[self.key]
+        with self._condition:
+            waiting = self._pending.get(key)
+            if waiting is not None:
+                # an earlier call with this key is still running
+                waiting.append((sender, args))
+                return
+            self._pending[key] = deque()
+        self._submit(key, sender, args)
+
+    def _submit(self, key, sender, args):
+
+        """(internal use) Run one call; the next one with this key follows when it is done."""
+
+        try:
+            future = self.executor.submit(self.func, sender if self._pass_sender else None, args)
+        except BaseException:
+            # the executor refused the call, e.g. after shutdown(); release the
+            # key and the calls queued behind it so wait() does not block
+            with self._condition:
+                del self._pending[key]
+                self._condition.notify_all()
+            raise
+        future.add_done_callback(lambda future: self._done(key, future))
+
+    def _done(self, key, future):
+
+        """(internal use) Record the outcome of a call and submit the next one with its key."""
+
+        if not future.cancelled() and future.exception() is not None:
+            self.errors += 1
+            self.last_error = future.exception()
+        with self._condition:
+            waiting = self._pending[key]
+            if not waiting:
+                del self._pending[key]
+                self._condition.notify_all()
+                return
+            sender, args = waiting.popleft()
+        self._submit(key, sender, args)
+
+    def wait(self, timeout=None):
+
+        """Wait until no call is running or queued; returns False on timeout."""
+
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending, timeout)
+
+
+class _BatchFlusher(object):
+
+    """(internal use) The one thread that delivers batches whose max_delay has passed."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        # heap of (deadline, sequence number, handler)
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._thread = None
+
+    def schedule(self, handler, deadline):
+        with self._condition:
+            heapq.heappush(self._deadlines, (deadline, next(self._sequence), handler))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='BGLib batch flusher', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._deadlines:
+                        self._condition.wait()
+                        continue
+                    remaining = self._deadlines[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                deadline, sequence, handler = heapq.heappop(self._deadlines)
+            handler._flush(deadline)
+
+
+_batch_flusher = _BatchFlusher()
+
+
+class BGAPIBatchHandler(object):
+
+    """Event handler that collects decoded args and delivers them in batches.
+
+    Created by BGLib.on_batch(). func(sender, batch) gets a list of args
+    records or, with columnar set, a dict of one list per field. A batch is
+    delivered once it holds max_items records, or max_delay seconds after
+    its first record arrived (from a thread shared by all batch handlers),
+    whichever comes first.
+    flush() delivers whatever is collected now. Deliveries never overlap
+    and keep arrival order.
+    """
+
+    def __init__(self, func, max_items=512, max_delay=0.05, columnar=False):
+        self.func = func
+        self.max_items = max_items
+        self.max_delay = max_delay
+        self.columnar = columnar
+        self._items = []
+        self._sender = None
+        self._deadline = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def __call__(self, sender, args):
+        if sender.zero_copy:
+            args = _detach_args(args)
+        with self._lock:
+            self._items.append(args)
+            self._sender = sender
+            count = len(self._items)
+            if count == 1 and self.max_delay is not None:
+                self._deadline = time.monotonic() + self.max_delay
+                _batch_flusher.schedule(self, self._deadline)
+        if count >= self.max_items:
+            self.flush()
+
+    def flush(self):
+        self._flush(None)
+
+    def _flush(self, deadline):
+
+        """(internal use) Deliver the batch; with a deadline, only if it is
+        still the batch that deadline was set for."""
+
+        with self._flush_lock:
+            with self._lock:
+                if deadline is not None and deadline != self._deadline:
+                    return
+                items, self._items = self._items, []
+                self._deadline = None
+            if not items:
+                return
+            if self.columnar:
+                self.func(self._sender, {name: [args[name] for args in items] for name in items[0]._fields})
+            else:
+                self.func(self._sender, items)
 
 # ================================================================
@@ -4,6 +4,41 @@
 # ----------------------------------------------------------------
 #
 # CHANGELOG:
+#   2026-10-18 - Added parse_bytes() for parsing whole read chunks in one pass
+#              - Added buffered_read mode to check_activity()
+#              - Replaced the if/elif parser chain with table-driven dispatch
+#              - Decoders use precompiled struct.Struct objects and unpack_from()
+#              - Added zero_copy mode passing memoryviews for uint8array fields
+#              - Packets are not decoded for events without handlers
+#              - Slotted per-message argument records (BGAPIArgs) replace event dicts
+#              - Add iter_frames() and iter_packets() pull-style iterators
+#              - Add on_raw_frame hook with raw_frame_filter and raw_frame_only
+#              - Add resync mode with plausibility checks and partial-frame timeouts
+#              - Add start_reader()/stop() background reader thread with optional event queue
+#              - Add AsyncBGLib asyncio protocol with awaitable commands and event streams
+#              - Add submit() response-correlated command queue
+#              - Add blocking call() returning the matched response args
+#              - Add BGLibPool for staggered scanning across several adapters
+#              - Add BGLibProcessPool with per-adapter processes and BGAPIRing shared-memory records
+#              - Add BGAPIBridge socket server and BGAPISocketPort client port
+#              - Add send_many() for coalesced command writes
+#              - Add BGAPISimulator device simulator generated from the API definitions
+#              - Add start_capture() and BGAPIReplay for timestamped capture and replay
+#              - Cache event handlers per object and fire them from a tuple, so dispatch no longer allocates per packet
+#              - Add subscribe_attribute() to route notifications by connection and handle before decoding
+#              - Add on_any() and off_any() for wildcard handlers on decoded messages or raw frames
+#              - Add BGAPIExecutorHandler to run handlers on an executor, in order per key
+#              - Add on_batch() to deliver an event in lists or columnar blocks
+#              - parse_bytes() can be re-entered from handlers (e.g. send_command() followed by check_activity() or call())
+#              - check_activity() called from a handler parses the rest of that handler's chunk first
+#              - call() from a handler on the reader thread reads the port itself instead of waiting on the blocked reader
+#              - The reader thread survives handler exceptions, clears itself when it exits and no longer spins on non-blocking ports
+#              - zero_copy passes memoryviews on every parse path
+#              - Resolving a command future no longer fails when it was cancelled on another thread
+#              - Faster key lookup and membership tests on argument records
+#              - send_many() keeps command order with submit() and call()
+#              - raw_frame_only no longer stops submit() and call() from getting their responses
+#              - Captures made through parse() store one record per packet instead of one per byte
 #   2017-06-26 - Moved to python3
 #   2013-05-04 - Fixed single-item struct.unpack returns (@zwasson on Github)
 #   2013-04-28 - Fixed numerous uint8array/bd_addr command arg errors
@@ -35,23 +70,39 @@ ble_classes = dom.getElementsByTagName('class')
 #for ble_datatype in ble_datatypes:
 #    print(ble_datatype.toxml())
 
+# event argument record fields that would shadow a BGAPIArgs (Mapping) method
+# are stored under an attribute with a trailing underscore
+args_reserved_names = ('keys', 'items', 'values', 'get')
+
+# payload layout of each message for the device simulator: the struct format
+# of its fields, where a uint8array (always the last field) is its length byte
+sim_type_formats = { 'uint8': 'B', 'uint16': 'H', 'uint32': 'I', 'int8': 'b', 'int16': 'h', 'int32': 'i', 'bd_addr': '6s', 'hw_addr': '6s', 'ipv4': '4s', 'uint8array': 'B' }
+def sim_layout(params):
+    layout = '<'
+    has_array = False
+    for param in params:
+        if param.attributes['type'].value in sim_type_formats:
+            layout += sim_type_formats[param.attributes['type'].value]
+            has_array = param.attributes['type'].value == 'uint8array'
+    return "('" + layout + "', " + str(has_array) + ")"
+
 ble_command_method_definitions = []
 ble_response_callback_definitions = []
-ble_response_callback_parser_conditions = []
+ble_response_decoder_definitions = []
+ble_response_dispatch_entries = []
+ble_response_length_entries = []
+ble_response_sim_entries = []
 ble_event_callback_definitions = []
-ble_event_callback_parser_conditions = []
+ble_event_decoder_definitions = []
+ble_event_dispatch_entries = []
+ble_event_length_entries = []
+ble_event_sim_entries = []
 ble_constant_macros = []
 
 for ble_class in ble_classes:
     class_name = ble_class.attributes['name'].value
     print("Gathering command, event, and enum data from main class '" + class_name + "'...")
 
-    if len(ble_response_callback_parser_conditions) > 0:
-        ble_response_callback_parser_conditions.append('elif packet_class == ' + ble_class.attributes['index'].value + ':')
-    else:
-        ble_response_callback_parser_conditions.append('if packet_class == ' + ble_class.attributes['index'].value + ':')
-
-    num_responses = 0
     for ble_command in ble_class.getElementsByTagName('command'):
         #print(class_name + '_' + ble_command.attributes['name'].value)
         ble_command_name = class_name + '_' + ble_command.attributes['name'].value
@@ -111,6 +162,7 @@ for ble_class in ble_classes:
                 returns.append(ble_return.attributes['type'].value + ' ' + ble_return.attributes['name'].value)
 
         ble_response_args = []
+        obj_names = []
         obj_args = []
         unpack_pattern = '<'
         unpack_args = []
@@ -121,84 +173,96 @@ for ble_class in ble_classes:
                 if (ble_return.attributes['type'].value == 'uint8'):
                     unpack_pattern += 'B'
                     unpack_args.append(ble_return.attributes['name'].value)
-                    obj_args.append("'" + ble_return.attributes['name'].value + "': " + ble_return.attributes['name'].value)
+                    obj_names.append(ble_return.attributes['name'].value)
+                    obj_args.append(ble_return.attributes['name'].value)
                     payload_length += 1
                 elif (ble_return.attributes['type'].value == 'uint16'):
                     unpack_pattern += 'H'
                     unpack_args.append(ble_return.attributes['name'].value)
-                    obj_args.append("'" + ble_return.attributes['name'].value + "': " + ble_return.attributes['name'].value)
+                    obj_names.append(ble_return.attributes['name'].value)
+                    obj_args.append(ble_return.attributes['name'].value)
                     payload_length += 2
                 elif (ble_return.attributes['type'].value == 'uint32'):
                     unpack_pattern += 'I'
                     unpack_args.append(ble_return.attributes['name'].value)
-                    obj_args.append("'" + ble_return.attributes['name'].value + "': " + ble_return.attributes['name'].value)
+                    obj_names.append(ble_return.attributes['name'].value)
+                    obj_args.append(ble_return.attributes['name'].value)
                     payload_length += 4
                 elif (ble_return.attributes['type'].value == 'int8'):
                     unpack_pattern += 'b'
                     unpack_args.append(ble_return.attributes['name'].value)
-                    obj_args.append("'" + ble_return.attributes['name'].value + "': " + ble_return.attributes['name'].value)
+                    obj_names.append(ble_return.attributes['name'].value)
+                    obj_args.append(ble_return.attributes['name'].value)
                     payload_length += 1
                 elif (ble_return.attributes['type'].value == 'int16'):
                     unpack_pattern += 'h'
                     unpack_args.append(ble_return.attributes['name'].value)
-                    obj_args.append("'" + ble_return.attributes['name'].value + "': " + ble_return.attributes['name'].value)
+                    obj_names.append(ble_return.attributes['name'].value)
+                    obj_args.append(ble_return.attributes['name'].value)
                     payload_length += 2
                 elif (ble_return.attributes['type'].value == 'int32'):
                     unpack_pattern += 'i'
                     unpack_args.append(ble_return.attributes['name'].value)
-                    obj_args.append("'" + ble_return.attributes['name'].value + "': " + ble_return.attributes['name'].value)
+                    obj_names.append(ble_return.attributes['name'].value)
+                    obj_args.append(ble_return.attributes['name'].value)
                     payload_length += 4
                 elif (ble_return.attributes['type'].value == 'bd_addr'):
                     unpack_pattern += '6s'
                     unpack_args.append(ble_return.attributes['name'].value)
-                    obj_args.append("'" + ble_return.attributes['name'].value + "': " + ble_return.attributes['name'].value)
+                    obj_names.append(ble_return.attributes['name'].value)
+                    obj_args.append(ble_return.attributes['name'].value)
                     payload_length += 6
-                    additional_code.append(ble_return.attributes['name'].value + ' = ' + ble_return.attributes['name'].value)
                 elif (ble_return.attributes['type'].value == 'uint8array'):
                     unpack_pattern += 'B'
                     unpack_args.append(ble_return.attributes['name'].value + '_len')
-                    obj_args.append("'" + ble_return.attributes['name'].value + "': " + ble_return.attributes['name'].value + '_data')
+                    obj_names.append(ble_return.attributes['name'].value)
+                    obj_args.append(ble_return.attributes['name'].value + '_data')
                     payload_length += 1
-                    additional_code.append(ble_return.attributes['name'].value + '_data = self.bgapi_rx_payload[' + str(payload_length) + ':]')
-
-        if num_responses > 0:
-            ble_response_callback_parser_conditions.append('    elif packet_command == %s: # ble_rsp_%s' % (ble_command.attributes['index'].value, ble_command_name))
-        else:
-            ble_response_callback_parser_conditions.append('    if packet_command == %s: # ble_rsp_%s' % (ble_command.attributes['index'].value, ble_command_name))
+                    additional_code.append(ble_return.attributes['name'].value + '_data = rx_buf[rx_start + ' + str(payload_length) + ':rx_end]')
 
         ble_response_code = []
         if payload_length > 0:
             if len(unpack_args) > 1:
-                ble_response_code.append(', '.join(unpack_args) + ' = struct.unpack(\'' + unpack_pattern + '\', self.bgapi_rx_payload[:' + str(payload_length) + '])')
+                ble_response_code.append(', '.join(unpack_args) + ' = _struct_ble_rsp_' + ble_command_name + '.unpack_from(rx_buf, rx_start)')
             else:
                 # "struct.unpack" returns a tuple no matter what
                 # (thanks @zwasson: https://github.com/jrowberg/bglib/issues/5)
-                ble_response_code.append(', '.join(unpack_args) + ' = struct.unpack(\'' + unpack_pattern + '\', self.bgapi_rx_payload[:' + str(payload_length) + '])[0]')
+                ble_response_code.append(', '.join(unpack_args) + ' = _struct_ble_rsp_' + ble_command_name + '.unpack_from(rx_buf, rx_start)[0]')
         [ble_response_code.append(x) for x in additional_code]
-        ble_response_code.append('self.ble_rsp_' + ble_command_name + '({ ' + ', '.join(obj_args) + ' })')
-        ble_response_callback_parser_conditions.append('        ' + '\n                        '.join(ble_response_code))
-        if ble_class.attributes['index'].value == '0' and ble_command.attributes['index'].value == '0':
-            ble_response_callback_parser_conditions.append('        self.busy = False')
-            ble_response_callback_parser_conditions.append('        self.on_idle()')
+        ble_response_code.append('return ble_rsp_' + ble_command_name + '_args(' + ', '.join(obj_args) + ')')
+        obj_attrs = [x + '_' if x in args_reserved_names else x for x in obj_names]
+        ble_response_decoder_definitions.append('class ble_rsp_' + ble_command_name + '_args(BGAPIArgs):')
+        if obj_attrs == obj_names:
+            ble_response_decoder_definitions.append('    __slots__ = _fields = ' + str(tuple(obj_names)))
+        else:
+            ble_response_decoder_definitions.append('    __slots__ = ' + str(tuple(obj_attrs)))
+            ble_response_decoder_definitions.append('    _fields = ' + str(tuple(obj_names)))
+        if len(obj_names) > 0:
+            ble_response_decoder_definitions.append('    def __init__(self, ' + ', '.join(obj_names) + '):')
+            ble_response_decoder_definitions.append('        ' + '\n        '.join('self.' + a + ' = ' + x for a, x in zip(obj_attrs, obj_names)))
+        if payload_length > 0:
+            ble_response_decoder_definitions.append('_struct_ble_rsp_' + ble_command_name + ' = struct.Struct(\'' + unpack_pattern + '\')')
+        ble_response_decoder_definitions.append('def _decode_ble_rsp_' + ble_command_name + '(rx_buf, rx_start, rx_end):')
+        ble_response_decoder_definitions.append('    ' + '\n    '.join(ble_response_code))
+        ble_response_dispatch_entries.append('(0x00, %s, %s): (_decode_ble_rsp_%s, ble_rsp_%s),' % (ble_class.attributes['index'].value, ble_command.attributes['index'].value, ble_command_name, ble_command_name))
+        max_payload_length = payload_length
+        if len(obj_names) < len(returns):
+            # some parameter types are not decoded, so only the minimum length is known
+            max_payload_length = 2047
+        elif len(additional_code) > 0:
+            max_payload_length += 255
+        ble_response_length_entries.append('(0x00, %s, %s): (%d, %d),' % (ble_class.attributes['index'].value, ble_command.attributes['index'].value, payload_length, max_payload_length))
+        ble_response_sim_entries.append('(0x00, %s, %s): %s,' % (ble_class.attributes['index'].value, ble_command.attributes['index'].value, sim_layout(ble_returns[0].getElementsByTagName('param') if len(ble_returns) > 0 else [])))
 
         ble_response_callback_definitions.append('ble_rsp_' + ble_command_name + ' = BGAPIEvent()')
-        num_responses += 1
-
-    if num_responses == 0:
-        ble_response_callback_parser_conditions.pop()
 
-    if len(ble_event_callback_parser_conditions) > 0:
-        ble_event_callback_parser_conditions.append('elif packet_class == ' + ble_class.attributes['index'].value + ':')
-    else:
-        ble_event_callback_parser_conditions.append('if packet_class == ' + ble_class.attributes['index'].value + ':')
-
-    num_events = 0
     for ble_event in ble_class.getElementsByTagName('event'):
         #print(class_name + '_' + ble_event.attributes['name'].value)
         ble_event_name = class_name + '_' + ble_event.attributes['name'].value
 
         # gather parameter info, if present
         ble_params = ble_event.getElementsByTagName('params');
+        obj_names = []
         obj_args = []
         unpack_pattern = '<'
         unpack_args = []
@@ -209,71 +273,88 @@ for ble_class in ble_classes:
                 if (ble_param.attributes['type'].value == 'uint8'):
                     unpack_pattern += 'B'
                     unpack_args.append(ble_param.attributes['name'].value)
-                    obj_args.append("'" + ble_param.attributes['name'].value + "': " + ble_param.attributes['name'].value)
+                    obj_names.append(ble_param.attributes['name'].value)
+                    obj_args.append(ble_param.attributes['name'].value)
                     payload_length += 1
                 elif (ble_param.attributes['type'].value == 'uint16'):
                     unpack_pattern += 'H'
                     unpack_args.append(ble_param.attributes['name'].value)
-                    obj_args.append("'" + ble_param.attributes['name'].value + "': " + ble_param.attributes['name'].value)
+                    obj_names.append(ble_param.attributes['name'].value)
+                    obj_args.append(ble_param.attributes['name'].value)
                     payload_length += 2
                 elif (ble_param.attributes['type'].value == 'uint32'):
                     unpack_pattern += 'I'
                     unpack_args.append(ble_param.attributes['name'].value)
-                    obj_args.append("'" + ble_param.attributes['name'].value + "': " + ble_param.attributes['name'].value)
+                    obj_names.append(ble_param.attributes['name'].value)
+                    obj_args.append(ble_param.attributes['name'].value)
                     payload_length += 4
                 elif (ble_param.attributes['type'].value == 'int8'):
                     unpack_pattern += 'b'
                     unpack_args.append(ble_param.attributes['name'].value)
-                    obj_args.append("'" + ble_param.attributes['name'].value + "': " + ble_param.attributes['name'].value)
+                    obj_names.append(ble_param.attributes['name'].value)
+                    obj_args.append(ble_param.attributes['name'].value)
                     payload_length += 1
                 elif (ble_param.attributes['type'].value == 'int16'):
                     unpack_pattern += 'h'
                     unpack_args.append(ble_param.attributes['name'].value)
-                    obj_args.append("'" + ble_param.attributes['name'].value + "': " + ble_param.attributes['name'].value)
+                    obj_names.append(ble_param.attributes['name'].value)
+                    obj_args.append(ble_param.attributes['name'].value)
                     payload_length += 2
                 elif (ble_param.attributes['type'].value == 'int32'):
                     unpack_pattern += 'i'
                     unpack_args.append(ble_param.attributes['name'].value)
-                    obj_args.append("'" + ble_param.attributes['name'].value + "': " + ble_param.attributes['name'].value)
+                    obj_names.append(ble_param.attributes['name'].value)
+                    obj_args.append(ble_param.attributes['name'].value)
                     payload_length += 4
                 elif (ble_param.attributes['type'].value == 'bd_addr'):
                     unpack_pattern += '6s'
                     unpack_args.append(ble_param.attributes['name'].value)
-                    obj_args.append("'" + ble_param.attributes['name'].value + "': " + ble_param.attributes['name'].value)
+                    obj_names.append(ble_param.attributes['name'].value)
+                    obj_args.append(ble_param.attributes['name'].value)
                     payload_length += 6
-                    additional_code.append(ble_param.attributes['name'].value + ' = ' + ble_param.attributes['name'].value)
                 elif (ble_param.attributes['type'].value == 'uint8array'):
                     unpack_pattern += 'B'
                     unpack_args.append(ble_param.attributes['name'].value + '_len')
-                    obj_args.append("'" + ble_param.attributes['name'].value + "': " + ble_param.attributes['name'].value + '_data')
+                    obj_names.append(ble_param.attributes['name'].value)
+                    obj_args.append(ble_param.attributes['name'].value + '_data')
                     payload_length += 1
-                    additional_code.append(ble_param.attributes['name'].value + '_data = self.bgapi_rx_payload[' + str(payload_length) + ':]')
-
-        if num_events > 0:
-            ble_event_callback_parser_conditions.append('    elif packet_command == %s: # ble_evt_%s' % (ble_event.attributes['index'].value, ble_event_name))
-        else:
-            ble_event_callback_parser_conditions.append('    if packet_command == %s: # ble_evt_%s' % (ble_event.attributes['index'].value, ble_event_name))
+                    additional_code.append(ble_param.attributes['name'].value + '_data = rx_buf[rx_start + ' + str(payload_length) + ':rx_end]')
 
         ble_event_code = []
         if payload_length > 0:
             if len(unpack_args) > 1:
-                ble_event_code.append(', '.join(unpack_args) + ' = struct.unpack(\'' + unpack_pattern + '\', self.bgapi_rx_payload[:' + str(payload_length) + '])')
+                ble_event_code.append(', '.join(unpack_args) + ' = _struct_ble_evt_' + ble_event_name + '.unpack_from(rx_buf, rx_start)')
             else:
                 # "struct.unpack" returns a tuple no matter what
                 # (thanks @zwasson: https://github.com/jrowberg/bglib/issues/5)
-                ble_event_code.append(', '.join(unpack_args) + ' = struct.unpack(\'' + unpack_pattern + '\', self.bgapi_rx_payload[:' + str(payload_length) + '])[0]')
+                ble_event_code.append(', '.join(unpack_args) + ' = _struct_ble_evt_' + ble_event_name + '.unpack_from(rx_buf, rx_start)[0]')
         [ble_event_code.append(x) for x in additional_code]
-        ble_event_code.append('self.ble_evt_' + ble_event_name + '({ ' + ', '.join(obj_args) + ' })')
-        ble_event_callback_parser_conditions.append('        ' + '\n                        '.join(ble_event_code))
-        if ble_class.attributes['index'].value == '0' and ble_event.attributes['index'].value == '0':
-            ble_event_callback_parser_conditions.append('        self.busy = False')
-            ble_event_callback_parser_conditions.append('        self.on_idle()')
+        ble_event_code.append('return ble_evt_' + ble_event_name + '_args(' + ', '.join(obj_args) + ')')
+        obj_attrs = [x + '_' if x in args_reserved_names else x for x in obj_names]
+        ble_event_decoder_definitions.append('class ble_evt_' + ble_event_name + '_args(BGAPIArgs):')
+        if obj_attrs == obj_names:
+            ble_event_decoder_definitions.append('    __slots__ = _fields = ' + str(tuple(obj_names)))
+        else:
+            ble_event_decoder_definitions.append('    __slots__ = ' + str(tuple(obj_attrs)))
+            ble_event_decoder_definitions.append('    _fields = ' + str(tuple(obj_names)))
+        if len(obj_names) > 0:
+            ble_event_decoder_definitions.append('    def __init__(self, ' + ', '.join(obj_names) + '):')
+            ble_event_decoder_definitions.append('        ' + '\n        '.join('self.' + a + ' = ' + x for a, x in zip(obj_attrs, obj_names)))
+        if payload_length > 0:
+            ble_event_decoder_definitions.append('_struct_ble_evt_' + ble_event_name + ' = struct.Struct(\'' + unpack_pattern + '\')')
+        ble_event_decoder_definitions.append('def _decode_ble_evt_' + ble_event_name + '(rx_buf, rx_start, rx_end):')
+        ble_event_decoder_definitions.append('    ' + '\n    '.join(ble_event_code))
+        ble_event_dispatch_entries.append('(0x80, %s, %s): (_decode_ble_evt_%s, ble_evt_%s),' % (ble_class.attributes['index'].value, ble_event.attributes['index'].value, ble_event_name, ble_event_name))
+        max_payload_length = payload_length
+        if len(obj_names) < (len(ble_params[0].getElementsByTagName('param')) if len(ble_params) > 0 else 0):
+            # some parameter types are not decoded, so only the minimum length is known
+            max_payload_length = 2047
+        elif len(additional_code) > 0:
+            max_payload_length += 255
+        ble_event_length_entries.append('(0x80, %s, %s): (%d, %d),' % (ble_class.attributes['index'].value, ble_event.attributes['index'].value, payload_length, max_payload_length))
+        ble_event_sim_entries.append('(0x80, %s, %s): %s,' % (ble_class.attributes['index'].value, ble_event.attributes['index'].value, sim_layout(ble_params[0].getElementsByTagName('param') if len(ble_params) > 0 else [])))
 
         ble_event_callback_definitions.append('ble_evt_' + ble_event_name + ' = BGAPIEvent()')
-        num_events += 1
-
-    if num_events == 0:
-        ble_event_callback_parser_conditions.pop()
 
     for ble_enum in ble_class.getElementsByTagName('enum'):
         #print(class_name + '_' + ble_enum.attributes['name'].value)
@@ -302,21 +383,21 @@ wifi_classes = dom.getElementsByTagName('class')
 
 wifi_command_method_definitions = []
 wifi_response_callback_definitions = []
-wifi_response_callback_parser_conditions = []
+wifi_response_decoder_definitions = []
+wifi_response_dispatch_entries = []
+wifi_response_length_entries = []
+wifi_response_sim_entries = []
 wifi_event_callback_definitions = []
-wifi_event_callback_parser_conditions = []
+wifi_event_decoder_definitions = []
+wifi_event_dispatch_entries = []
+wifi_event_length_entries = []
+wifi_event_sim_entries = []
 wifi_constant_macros = []
 
 for wifi_class in wifi_classes:
     class_name = wifi_class.attributes['name'].value
     print("Gathering command, event, and enum data from main class '" + class_name + "'...")
 
-    if len(wifi_response_callback_parser_conditions) > 0:
-        wifi_response_callback_parser_conditions.append('elif packet_class == ' + wifi_class.attributes['index'].value + ':')
-    else:
-        wifi_response_callback_parser_conditions.append('if packet_class == ' + wifi_class.attributes['index'].value + ':')
-
-    num_responses = 0
     for wifi_command in wifi_class.getElementsByTagName('command'):
         #print(class_name + '_' + wifi_command.attributes['name'].value)
         wifi_command_name = class_name + '_' + wifi_command.attributes['name'].value
@@ -376,6 +457,7 @@ for wifi_class in wifi_classes:
                 returns.append(wifi_return.attributes['type'].value + ' ' + wifi_return.attributes['name'].value)
 
         wifi_responseargs = []
+        obj_names = []
         obj_args = []
         unpack_pattern = '<'
         unpack_args = []
@@ -386,84 +468,96 @@ for wifi_class in wifi_classes:
                 if (wifi_return.attributes['type'].value == 'uint8'):
                     unpack_pattern += 'B'
                     unpack_args.append(wifi_return.attributes['name'].value)
-                    obj_args.append("'" + wifi_return.attributes['name'].value + "': " + wifi_return.attributes['name'].value)
+                    obj_names.append(wifi_return.attributes['name'].value)
+                    obj_args.append(wifi_return.attributes['name'].value)
                     payload_length += 1
                 elif (wifi_return.attributes['type'].value == 'uint16'):
                     unpack_pattern += 'H'
                     unpack_args.append(wifi_return.attributes['name'].value)
-                    obj_args.append("'" + wifi_return.attributes['name'].value + "': " + wifi_return.attributes['name'].value)
+                    obj_names.append(wifi_return.attributes['name'].value)
+                    obj_args.append(wifi_return.attributes['name'].value)
                     payload_length += 2
                 elif (wifi_return.attributes['type'].value == 'uint32'):
                     unpack_pattern += 'I'
                     unpack_args.append(wifi_return.attributes['name'].value)
-                    obj_args.append("'" + wifi_return.attributes['name'].value + "': " + wifi_return.attributes['name'].value)
+                    obj_names.append(wifi_return.attributes['name'].value)
+                    obj_args.append(wifi_return.attributes['name'].value)
                     payload_length += 4
                 elif (wifi_return.attributes['type'].value == 'int8'):
                     unpack_pattern += 'b'
                     unpack_args.append(wifi_return.attributes['name'].value)
-                    obj_args.append("'" + wifi_return.attributes['name'].value + "': " + wifi_return.attributes['name'].value)
+                    obj_names.append(wifi_return.attributes['name'].value)
+                    obj_args.append(wifi_return.attributes['name'].value)
                     payload_length += 1
                 elif (wifi_return.attributes['type'].value == 'int16'):
                     unpack_pattern += 'h'
                     unpack_args.append(wifi_return.attributes['name'].value)
-                    obj_args.append("'" + wifi_return.attributes['name'].value + "': " + wifi_return.attributes['name'].value)
+                    obj_names.append(wifi_return.attributes['name'].value)
+                    obj_args.append(wifi_return.attributes['name'].value)
                     payload_length += 2
                 elif (wifi_return.attributes['type'].value == 'int32'):
                     unpack_pattern += 'i'
                     unpack_args.append(wifi_return.attributes['name'].value)
-                    obj_args.append("'" + wifi_return.attributes['name'].value + "': " + wifi_return.attributes['name'].value)
+                    obj_names.append(wifi_return.attributes['name'].value)
+                    obj_args.append(wifi_return.attributes['name'].value)
                     payload_length += 4
                 elif (wifi_return.attributes['type'].value == 'bd_addr'):
                     unpack_pattern += '6s'
                     unpack_args.append(wifi_return.attributes['name'].value)
-                    obj_args.append("'" + wifi_return.attributes['name'].value + "': " + wifi_return.attributes['name'].value)
+                    obj_names.append(wifi_return.attributes['name'].value)
+                    obj_args.append(wifi_return.attributes['name'].value)
                     payload_length += 6
-                    additional_code.append(wifi_return.attributes['name'].value + ' = ' + wifi_return.attributes['name'].value)
                 elif (wifi_return.attributes['type'].value == 'uint8array'):
                     unpack_pattern += 'B'
                     unpack_args.append(wifi_return.attributes['name'].value + '_len')
-                    obj_args.append("'" + wifi_return.attributes['name'].value + "': " + wifi_return.attributes['name'].value + '_data')
+                    obj_names.append(wifi_return.attributes['name'].value)
+                    obj_args.append(wifi_return.attributes['name'].value + '_data')
                     payload_length += 1
-                    additional_code.append(wifi_return.attributes['name'].value + '_data = self.bgapi_rx_payload[' + str(payload_length) + ':]')
-
-        if num_responses > 0:
-            wifi_response_callback_parser_conditions.append('    elif packet_command == %s: # wifi_rsp_%s' % (wifi_command.attributes['index'].value, wifi_command_name))
-        else:
-            wifi_response_callback_parser_conditions.append('    if packet_command == %s: # wifi_rsp_%s' % (wifi_command.attributes['index'].value, wifi_command_name))
+                    additional_code.append(wifi_return.attributes['name'].value + '_data = rx_buf[rx_start + ' + str(payload_length) + ':rx_end]')
 
         wifi_response_code = []
         if payload_length > 0:
             if len(unpack_args) > 1:
-                wifi_response_code.append(', '.join(unpack_args) + ' = struct.unpack(\'' + unpack_pattern + '\', self.bgapi_rx_payload[:' + str(payload_length) + '])')
+                wifi_response_code.append(', '.join(unpack_args) + ' = _struct_wifi_rsp_' + wifi_command_name + '.unpack_from(rx_buf, rx_start)')
             else:
                 # "struct.unpack" returns a tuple no matter what
                 # (thanks @zwasson: https://github.com/jrowberg/bglib/issues/5)
-                wifi_response_code.append(', '.join(unpack_args) + ' = struct.unpack(\'' + unpack_pattern + '\', self.bgapi_rx_payload[:' + str(payload_length) + '])[0]')
+                wifi_response_code.append(', '.join(unpack_args) + ' = _struct_wifi_rsp_' + wifi_command_name + '.unpack_from(rx_buf, rx_start)[0]')
         [wifi_response_code.append(x) for x in additional_code]
-        wifi_response_code.append('self.wifi_rsp_' + wifi_command_name + '({ ' + ', '.join(obj_args) + ' })')
-        wifi_response_callback_parser_conditions.append('        ' + '\n                        '.join(wifi_response_code))
-        if wifi_class.attributes['index'].value == '0' and wifi_command.attributes['index'].value == '0':
-            wifi_response_callback_parser_conditions.append('        self.busy = False')
-            wifi_response_callback_parser_conditions.append('        self.on_idle()')
+        wifi_response_code.append('return wifi_rsp_' + wifi_command_name + '_args(' + ', '.join(obj_args) + ')')
+        obj_attrs = [x + '_' if x in args_reserved_names else x for x in obj_names]
+        wifi_response_decoder_definitions.append('class wifi_rsp_' + wifi_command_name + '_args(BGAPIArgs):')
+        if obj_attrs == obj_names:
+            wifi_response_decoder_definitions.append('    __slots__ = _fields = ' + str(tuple(obj_names)))
+        else:
+            wifi_response_decoder_definitions.append('    __slots__ = ' + str(tuple(obj_attrs)))
+            wifi_response_decoder_definitions.append('    _fields = ' + str(tuple(obj_names)))
+        if len(obj_names) > 0:
+            wifi_response_decoder_definitions.append('    def __init__(self, ' + ', '.join(obj_names) + '):')
+            wifi_response_decoder_definitions.append('        ' + '\n        '.join('self.' + a + ' = ' + x for a, x in zip(obj_attrs, obj_names)))
+        if payload_length > 0:
+            wifi_response_decoder_definitions.append('_struct_wifi_rsp_' + wifi_command_name + ' = struct.Struct(\'' + unpack_pattern + '\')')
+        wifi_response_decoder_definitions.append('def _decode_wifi_rsp_' + wifi_command_name + '(rx_buf, rx_start, rx_end):')
+        wifi_response_decoder_definitions.append('    ' + '\n    '.join(wifi_response_code))
+        wifi_response_dispatch_entries.append('(0x08, %s, %s): (_decode_wifi_rsp_%s, wifi_rsp_%s),' % (wifi_class.attributes['index'].value, wifi_command.attributes['index'].value, wifi_command_name, wifi_command_name))
+        max_payload_length = payload_length
+        if len(obj_names) < len(returns):
+            # some parameter types are not decoded, so only the minimum length is known
+            max_payload_length = 2047
+        elif len(additional_code) > 0:
+            max_payload_length += 255
+        wifi_response_length_entries.append('(0x08, %s, %s): (%d, %d),' % (wifi_class.attributes['index'].value, wifi_command.attributes['index'].value, payload_length, max_payload_length))
+        wifi_response_sim_entries.append('(0x08, %s, %s): %s,' % (wifi_class.attributes['index'].value, wifi_command.attributes['index'].value, sim_layout(wifi_returns[0].getElementsByTagName('param') if len(wifi_returns) > 0 else [])))
 
         wifi_response_callback_definitions.append('wifi_rsp_' + wifi_command_name + ' = BGAPIEvent()')
-        num_responses += 1
-
-    if num_responses == 0:
-        wifi_response_callback_parser_conditions.pop()
 
-    if len(wifi_event_callback_parser_conditions) > 0:
-        wifi_event_callback_parser_conditions.append('elif packet_class == ' + wifi_class.attributes['index'].value + ':')
-    else:
-        wifi_event_callback_parser_conditions.append('if packet_class == ' + wifi_class.attributes['index'].value + ':')
-
-    num_events = 0
     for wifi_event in wifi_class.getElementsByTagName('event'):
         #print(class_name + '_' + wifi_event.attributes['name'].value)
         wifi_event_name = class_name + '_' + wifi_event.attributes['name'].value
 
         # gather parameter info, if present
         wifi_params = wifi_event.getElementsByTagName('params');
+        obj_names = []
         obj_args = []
         unpack_pattern = '<'
         unpack_args = []
@@ -474,71 +568,88 @@ for wifi_class in wifi_classes:
                 if (wifi_param.attributes['type'].value == 'uint8'):
                     unpack_pattern += 'B'
                     unpack_args.append(wifi_param.attributes['name'].value)
-                    obj_args.append("'" + wifi_param.attributes['name'].value + "': " + wifi_param.attributes['name'].value)
+                    obj_names.append(wifi_param.attributes['name'].value)
+                    obj_args.append(wifi_param.attributes['name'].value)
                     payload_length += 1
                 elif (wifi_param.attributes['type'].value == 'uint16'):
                     unpack_pattern += 'H'
                     unpack_args.append(wifi_param.attributes['name'].value)
-                    obj_args.append("'" + wifi_param.attributes['name'].value + "': " + wifi_param.attributes['name'].value)
+                    obj_names.append(wifi_param.attributes['name'].value)
+                    obj_args.append(wifi_param.attributes['name'].value)
                     payload_length += 2
                 elif (wifi_param.attributes['type'].value == 'uint32'):
                     unpack_pattern += 'I'
                     unpack_args.append(wifi_param.attributes['name'].value)
-                    obj_args.append("'" + wifi_param.attributes['name'].value + "': " + wifi_param.attributes['name'].value)
+                    obj_names.append(wifi_param.attributes['name'].value)
+                    obj_args.append(wifi_param.attributes['name'].value)
                     payload_length += 4
                 elif (wifi_param.attributes['type'].value == 'int8'):
                     unpack_pattern += 'b'
                     unpack_args.append(wifi_param.attributes['name'].value)
-                    obj_args.append("'" + wifi_param.attributes['name'].value + "': " + wifi_param.attributes['name'].value)
+                    obj_names.append(wifi_param.attributes['name'].value)
+                    obj_args.append(wifi_param.attributes['name'].value)
                     payload_length += 1
                 elif (wifi_param.attributes['type'].value == 'int16'):
                     unpack_pattern += 'h'
                     unpack_args.append(wifi_param.attributes['name'].value)
-                    obj_args.append("'" + wifi_param.attributes['name'].value + "': " + wifi_param.attributes['name'].value)
+                    obj_names.append(wifi_param.attributes['name'].value)
+                    obj_args.append(wifi_param.attributes['name'].value)
                     payload_length += 2
                 elif (wifi_param.attributes['type'].value == 'int32'):
                     unpack_pattern += 'i'
                     unpack_args.append(wifi_param.attributes['name'].value)
-                    obj_args.append("'" + wifi_param.attributes['name'].value + "': " + wifi_param.attributes['name'].value)
+                    obj_names.append(wifi_param.attributes['name'].value)
+                    obj_args.append(wifi_param.attributes['name'].value)
                     payload_length += 4
                 elif (wifi_param.attributes['type'].value == 'bd_addr'):
                     unpack_pattern += '6s'
                     unpack_args.append(wifi_param.attributes['name'].value)
-                    obj_args.append("'" + wifi_param.attributes['name'].value + "': " + wifi_param.attributes['name'].value)
+                    obj_names.append(wifi_param.attributes['name'].value)
+                    obj_args.append(wifi_param.attributes['name'].value)
                     payload_length += 6
-                    additional_code.append(wifi_param.attributes['name'].value + ' = ' + wifi_param.attributes['name'].value)
                 elif (wifi_param.attributes['type'].value == 'uint8array'):
                     unpack_pattern += 'B'
                     unpack_args.append(wifi_param.attributes['name'].value + '_len')
-                    obj_args.append("'" + wifi_param.attributes['name'].value + "': " + wifi_param.attributes['name'].value + '_data')
+                    obj_names.append(wifi_param.attributes['name'].value)
+                    obj_args.append(wifi_param.attributes['name'].value + '_data')
                     payload_length += 1
-                    additional_code.append(wifi_param.attributes['name'].value + '_data = self.bgapi_rx_payload[' + str(payload_length) + ':]')
-
-        if num_events > 0:
-            wifi_event_callback_parser_conditions.append('    elif packet_command == %s: # wifi_evt_%s' % (wifi_event.attributes['index'].value, wifi_event_name))
-        else:
-            wifi_event_callback_parser_conditions.append('    if packet_command == %s: # wifi_evt_%s' % (wifi_event.attributes['index'].value, wifi_event_name))
+                    additional_code.append(wifi_param.attributes['name'].value + '_data = rx_buf[rx_start + ' + str(payload_length) + ':rx_end]')
 
         wifi_event_code = []
         if payload_length > 0:
             if len(unpack_args) > 1:
-                wifi_event_code.append(', '.join(unpack_args) + ' = struct.unpack(\'' + unpack_pattern + '\', self.bgapi_rx_payload[:' + str(payload_length) + '])')
+                wifi_event_code.append(', '.join(unpack_args) + ' = _struct_wifi_evt_' + wifi_event_name + '.unpack_from(rx_buf, rx_start)')
             else:
                 # "struct.unpack" returns a tuple no matter what
                 # (thanks @zwasson: https://github.com/jrowberg/bglib/issues/5)
-                wifi_event_code.append(', '.join(unpack_args) + ' = struct.unpack(\'' + unpack_pattern + '\', self.bgapi_rx_payload[:' + str(payload_length) + '])[0]')
+                wifi_event_code.append(', '.join(unpack_args) + ' = _struct_wifi_evt_' + wifi_event_name + '.unpack_from(rx_buf, rx_start)[0]')
         [wifi_event_code.append(x) for x in additional_code]
-        wifi_event_code.append('self.wifi_evt_' + wifi_event_name + '({ ' + ', '.join(obj_args) + ' })')
-        wifi_event_callback_parser_conditions.append('        ' + '\n                        '.join(wifi_event_code))
-        if wifi_class.attributes['index'].value == '0' and wifi_event.attributes['index'].value == '0':
-            wifi_event_callback_parser_conditions.append('        self.busy = False')
-            wifi_event_callback_parser_conditions.append('        self.on_idle()')
+        wifi_event_code.append('return wifi_evt_' + wifi_event_name + '_args(' + ', '.join(obj_args) + ')')
+        obj_attrs = [x + '_' if x in args_reserved_names else x for x in obj_names]
+        wifi_event_decoder_definitions.append('class wifi_evt_' + wifi_event_name + '_args(BGAPIArgs):')
+        if obj_attrs == obj_names:
+            wifi_event_decoder_definitions.append('    __slots__ = _fields = ' + str(tuple(obj_names)))
+        else:
+            wifi_event_decoder_definitions.append('    __slots__ = ' + str(tuple(obj_attrs)))
+            wifi_event_decoder_definitions.append('    _fields = ' + str(tuple(obj_names)))
+        if len(obj_names) > 0:
+            wifi_event_decoder_definitions.append('    def __init__(self, ' + ', '.join(obj_names) + '):')
+            wifi_event_decoder_definitions.append('        ' + '\n        '.join('self.' + a + ' = ' + x for a, x in zip(obj_attrs, obj_names)))
+        if payload_length > 0:
+            wifi_event_decoder_definitions.append('_struct_wifi_evt_' + wifi_event_name + ' = struct.Struct(\'' + unpack_pattern + '\')')
+        wifi_event_decoder_definitions.append('def _decode_wifi_evt_' + wifi_event_name + '(rx_buf, rx_start, rx_end):')
+        wifi_event_decoder_definitions.append('    ' + '\n    '.join(wifi_event_code))
+        wifi_event_dispatch_entries.append('(0x88, %s, %s): (_decode_wifi_evt_%s, wifi_evt_%s),' % (wifi_class.attributes['index'].value, wifi_event.attributes['index'].value, wifi_event_name, wifi_event_name))
+        max_payload_length = payload_length
+        if len(obj_names) < (len(wifi_params[0].getElementsByTagName('param')) if len(wifi_params) > 0 else 0):
+            # some parameter types are not decoded, so only the minimum length is known
+            max_payload_length = 2047
+        elif len(additional_code) > 0:
+            max_payload_length += 255
+        wifi_event_length_entries.append('(0x88, %s, %s): (%d, %d),' % (wifi_class.attributes['index'].value, wifi_event.attributes['index'].value, payload_length, max_payload_length))
+        wifi_event_sim_entries.append('(0x88, %s, %s): %s,' % (wifi_class.attributes['index'].value, wifi_event.attributes['index'].value, sim_layout(wifi_params[0].getElementsByTagName('param') if len(wifi_params) > 0 else [])))
 
         wifi_event_callback_definitions.append('wifi_evt_' + wifi_event_name + ' = BGAPIEvent()')
-        num_events += 1
-
-    if num_events == 0:
-        wifi_event_callback_parser_conditions.pop()
 
     for wifi_enum in wifi_class.getElementsByTagName('enum'):
         #print(class_name + '_' + wifi_enum.attributes['name'].value)
@@ -556,6 +667,41 @@ source.write('#!/usr/bin/env python\n\
 """ Bluegiga BGAPI/BGLib implementation\n\
 \n\
 Changelog:\n\
+    2026-10-18 - Added parse_bytes() for parsing whole read chunks in one pass\n\
+               - Added buffered_read mode to check_activity()\n\
+               - Replaced the if/elif parser chain with table-driven dispatch\n\
+               - Decoders use precompiled struct.Struct objects and unpack_from()\n\
+               - Added zero_copy mode passing memoryviews for uint8array fields\n\
+               - Packets are not decoded for events without handlers\n\
+               - Slotted per-message argument records (BGAPIArgs) replace event dicts\n\
+               - Add iter_frames() and iter_packets() pull-style iterators\n\
+               - Add on_raw_frame hook with raw_frame_filter and raw_frame_only\n\
+               - Add resync mode with plausibility checks and partial-frame timeouts\n\
+               - Add start_reader()/stop() background reader thread with optional event queue\n\
+               - Add AsyncBGLib asyncio protocol with awaitable commands and event streams\n\
+               - Add submit() response-correlated command queue\n\
+               - Add blocking call() returning the matched response args\n\
+               - Add BGLibPool for staggered scanning across several adapters\n\
+               - Add BGLibProcessPool with per-adapter processes and BGAPIRing shared-memory records\n\
+               - Add BGAPIBridge socket server and BGAPISocketPort client port\n\
+               - Add send_many() for coalesced command writes\n\
+               - Add BGAPISimulator device simulator generated from the API definitions\n\
+               - Add start_capture() and BGAPIReplay for timestamped capture and replay\n\
+               - Cache event handlers per object and fire them from a tuple, so dispatch no longer allocates per packet\n\
+               - Add subscribe_attribute() to route notifications by connection and handle before decoding\n\
+               - Add on_any() and off_any() for wildcard handlers on decoded messages or raw frames\n\
+               - Add BGAPIExecutorHandler to run handlers on an executor, in order per key\n\
+               - Add on_batch() to deliver an event in lists or columnar blocks\n\
+               - parse_bytes() can be re-entered from handlers (e.g. send_command() followed by check_activity() or call())\n\
+               - check_activity() called from a handler parses the rest of that handler\'s chunk first\n\
+               - call() from a handler on the reader thread reads the port itself instead of waiting on the blocked reader\n\
+               - The reader thread survives handler exceptions, clears itself when it exits and no longer spins on non-blocking ports\n\
+               - zero_copy passes memoryviews on every parse path\n\
+               - Resolving a command future no longer fails when it was cancelled on another thread\n\
+               - Faster key lookup and membership tests on argument records\n\
+               - send_many() keeps command order with submit() and call()\n\
+               - raw_frame_only no longer stops submit() and call() from getting their responses\n\
+               - Captures made through parse() store one record per packet instead of one per byte\n\
     2013-05-04 - Fixed single-item struct.unpack returns (@zwasson on Github)\n\
     2013-04-28 - Fixed numerous uint8array/bd_addr command arg errors\n\
                - Added \'debug\' support\n\
@@ -599,42 +745,93 @@ __license__ = "MIT"\n\
 __version__ = "2013-05-04"\n\
 __email__ = "jeff@rowberg.net"\n\
 \n\
+import asyncio\n\
+import concurrent.futures\n\
+import heapq\n\
+import itertools\n\
+import multiprocessing\n\
+import operator\n\
+import os\n\
+import queue\n\
+import random\n\
+import select\n\
+import socket\n\
 import struct\n\
+import threading\n\
+import time\n\
+import traceback\n\
+from collections import deque\n\
+from collections.abc import Mapping\n\
+from multiprocessing import shared_memory\n\
 \n\
 \n\
 # thanks to Masaaki Shibata for Python event handler code\n\
 # http://www.emptypage.jp/notes/pyevent.en.html\n\
 \n\
 class BGAPIEvent(object):\n\
+\n\
+    name = None\n\
+    kind = None\n\
 \n\
     def __init__(self, doc=None):\n\
         self.__doc__ = doc\n\
+\n\
+    def __set_name__(self, owner, name):\n\
+        self.name = name\n\
+        self.kind = \'response\' if \'_rsp_\' in name else \'event\'\n\
 \n\
     def __get__(self, obj, objtype=None):\n\
         if obj is None:\n\
             return self\n\
-        return BGAPIEventHandler(self, obj)\n\
+        try:\n\
+            return obj.__eventhandlers__[self]\n\
+        except AttributeError:\n\
+            obj.__eventhandlers__ = {}\n\
+        except KeyError:\n\
+            pass\n\
+        handler = obj.__eventhandlers__[self] = BGAPIEventHandler(self, obj)\n\
+        return handler\n\
 \n\
     def __set__(self, obj, value):\n\
         pass\n\
 \n\
 \n\
 class BGAPIEventHandler(object):\n\
+\n\
+    """The handlers of one event on one object.\n\
+\n\
+    There is one of these per object and event, created on first access.\n\
+    The handler functions are kept as a tuple that add() and remove()\n\
+    replace, so fire() is a plain loop over it. The same tuple is stored\n\
+    in obj.__eventhandler__, where the receive path looks it up to decide\n\
+    whether a packet needs decoding at all.\n\
+    """\n\
 \n\
     def __init__(self, event, obj):\n\
 \n\
         self.event = event\n\
         self.obj = obj\n\
+        try:\n\
+            eventhandler = obj.__eventhandler__\n\
+        except AttributeError:\n\
+            eventhandler = obj.__eventhandler__ = {}\n\
+        self.functions = eventhandler.get(event, ())\n\
 \n\
     def _getfunctionlist(self):\n\
 \n\
         """(internal use) """\n\
 \n\
-        try:\n\
-            eventhandler = self.obj.__eventhandler__\n\
-        except AttributeError:\n\
-            eventhandler = self.obj.__eventhandler__ = {}\n\
-        return eventhandler.setdefault(self.event, [])\n\
+        return self.functions\n\
+\n\
+    def _setfunctionlist(self, functions):\n\
+\n\
+        """(internal use) """\n\
+\n\
+        self.functions = functions\n\
+        if functions:\n\
+            self.obj.__eventhandler__[self.event] = functions\n\
+        else:\n\
+            self.obj.__eventhandler__.pop(self.event, None)\n\
 \n\
     def add(self, func):\n\
 \n\
@@ -644,7 +841,7 @@ class BGAPIEventHandler(object):\n\
         You can add handler also by using \'+=\' operator.\n\
         """\n\
 \n\
-        self._getfunctionlist().append(func)\n\
+        self._setfunctionlist(self.functions + (func,))\n\
         return self\n\
 \n\
     def remove(self, func):\n\
@@ -654,7 +851,9 @@ class BGAPIEventHandler(object):\n\
         You can remove handler also by using \'-=\' operator.\n\
         """\n\
 \n\
-        self._getfunctionlist().remove(func)\n\
+        functions = list(self.functions)\n\
+        functions.remove(func)\n\
+        self._setfunctionlist(tuple(functions))\n\
         return self\n\
 \n\
     def fire(self, earg=None):\n\
@@ -665,7 +864,7 @@ class BGAPIEventHandler(object):\n\
         e.fire(earg).\n\
         """\n\
 \n\
-        for func in self._getfunctionlist():\n\
+        for func in self.functions:\n\
             func(self.obj, earg)\n\
 \n\
     __iadd__ = add\n\
@@ -673,6 +872,59 @@ class BGAPIEventHandler(object):\n\
     __call__ = fire\n\
 \n\
 \n\
+class BGAPIArgs(Mapping):\n\
+\n\
+    """Base class for the argument records passed to event handlers.\n\
+\n\
+    Each response and event has its own slotted subclass, so a record\n\
+    costs no per-instance dict. Arguments can be read as attributes\n\
+    (args.rssi) or, as before, by key (args[\'rssi\']); a record compares\n\
+    equal to a dict with the same items and dict(args) makes a copy.\n\
+    Fields that would shadow a Mapping method (e.g. \'keys\') are only\n\
+    stored under a trailing underscore (args.keys_), but keep their\n\
+    original key.\n\
+    """\n\
+\n\
+    __slots__ = ()\n\
+    _fields = ()\n\
+    _getters = {}\n\
+\n\
+    def __init_subclass__(cls, **kwargs):\n\
+        super().__init_subclass__(**kwargs)\n\
+        # key => attribute getter, so that args[key] is one dict lookup (an\n\
+        # unknown key raises KeyError from it), and \'key in args\' is the\n\
+        # dict\'s own __contains__, which is called without self\n\
+        cls._getters = {key: operator.attrgetter(key if key in cls.__slots__ else key + \'_\') for key in cls._fields}\n\
+        cls.__contains__ = cls._getters.__contains__\n\
+\n\
+    def __getitem__(self, key):\n\
+        return self._getters[key](self)\n\
+\n\
+    def __iter__(self):\n\
+        return iter(self._fields)\n\
+\n\
+    def __len__(self):\n\
+        return len(self._fields)\n\
+\n\
+    def __repr__(self):\n\
+        return type(self).__name__ + \'(\' + \', \'.join([\'%s=%r\' % (key, self[key]) for key in self._fields]) + \')\'\n\
+\n\
+\n\
+class BGAPIRawFrame(BGAPIArgs):\n\
+\n\
+    """Undecoded packet passed to on_raw_frame handlers."""\n\
+\n\
+    __slots__ = _fields = (\'header\', \'payload\')\n\
+\n\
+    def __init__(self, header, payload):\n\
+        self.header = header\n\
+        self.payload = payload\n\
+\n\
+\n\
+# packet payload decoders and argument records, one per response and event\n\
+' + ('\n'.join(ble_response_decoder_definitions + ble_event_decoder_definitions + wifi_response_decoder_definitions + wifi_event_decoder_definitions)) + '\n\
+\n\
+\n\
 class BGLib(object):\n\
 \n\
     ' + ('\n    '.join(ble_command_method_definitions)) + '\n\n\
@@ -688,12 +940,78 @@ class BGLib(object):\n\
     on_timeout = BGAPIEvent()\n\
     on_before_tx_command = BGAPIEvent()\n\
     on_tx_command_complete = BGAPIEvent()\n\
+    on_raw_frame = BGAPIEvent()\n\
 \n\
     bgapi_rx_buffer = b""\n\
     bgapi_rx_expected_length = 0\n\
+    bgapi_rx_recycled = b""\n\
+    bgapi_rx_partial_time = 0\n\
     busy = False\n\
+    zero_copy = False\n\
+    buffered_read = False\n\
     packet_mode = False\n\
+    resync = False\n\
+    resync_timeout = 0.05\n\
+    rx_discarded_bytes = 0\n\
+    rx_partial_timeouts = 0\n\
+    event_queue = None\n\
+    rx_dropped_events = 0\n\
+    rx_handler_errors = 0\n\
+    raw_frame_filter = None\n\
+    capture = None\n\
+    raw_frame_only = False\n\
     debug = False\n\
+    _reader = None\n\
+    _rx_chunk = None\n\
+    _rx_pos = 0\n\
+    _rx_depth = 0\n\
+    _attribute_event = None\n\
+\n\
+    def __new__(cls, *args, **kwargs):\n\
+        # per-instance state is set up here rather than in __init__(), so a\n\
+        # subclass whose __init__() does not call BGLib.__init__() still parses\n\
+        self = super().__new__(cls)\n\
+        self.__eventhandler__ = {}\n\
+        self.__eventhandlers__ = {}\n\
+        self._any_handlers = {}\n\
+        self._raw_frame_handler = self.on_raw_frame\n\
+        self._response_waiters = {}\n\
+        self._command_queue = deque()\n\
+        self._command_pending = None\n\
+        self._command_lock = threading.Lock()\n\
+        return self\n\
+\n\
+    def __init__(self, zero_copy=False):\n\
+\n\
+        """Create a BGLib parser.\n\
+\n\
+        With zero_copy set, uint8array fields such as \'data\', \'value\' and\n\
+        \'handles\' are passed to handlers as read-only memoryviews rather than\n\
+        as new bytes objects, whichever way the data is parsed. From\n\
+        parse_bytes() they view a receive buffer that is recycled by the next\n\
+        call, so a view is only valid until the handler returns; call\n\
+        .tobytes() on it to keep the contents.\n\
+\n\
+        on_raw_frame handlers get a BGAPIRawFrame with the undecoded 4-byte\n\
+        header and payload of every received packet, or only of those matching\n\
+        raw_frame_filter, a set of class IDs and/or (class ID, command ID)\n\
+        pairs. With raw_frame_only set, those packets are not decoded and\n\
+        their own events do not fire; busy/idle tracking is unaffected, and a\n\
+        response that a submit() or call() is waiting for is still decoded to\n\
+        complete it.\n\
+\n\
+        With resync set, parse_bytes() only accepts a header whose message\n\
+        type, class and command are in bgapi_rx_dispatch and whose length fits\n\
+        bgapi_rx_lengths, otherwise it steps one byte and searches on through\n\
+        the received data for the next plausible header. A partial frame still\n\
+        incomplete after resync_timeout seconds is given up the same way;\n\
+        check_activity() shortens its reads and the start_reader() thread\n\
+        waits at most that long for more data, so that this happens even on\n\
+        a port opened without a read timeout. rx_discarded_bytes and rx_partial_timeouts count the bytes\n\
+        skipped and the partial frames given up.\n\
+        """\n\
+\n\
+        self.zero_copy = zero_copy\n\
 \n\
     def send_command(self, ser, packet):\n\
         if self.packet_mode: packet = chr(len(packet) & 0xFF) + packet\n\
@@ -702,26 +1020,461 @@ class BGLib(object):\n\
         self.busy = True\n\
         self.on_busy()\n\
         ser.write(packet)\n\
+        if self.capture is not None: self.capture.write(BGAPICapture.TX, packet)\n\
         self.on_tx_command_complete()\n\
+\n\
+    def send_many(self, ser, packets):\n\
+\n\
+        """Send several command packets, in order, with a single ser.write().\n\
+\n\
+        For streams of commands whose responses are not waited for one by one,\n\
+        e.g. ble_cmd_attclient_write_command. on_before_tx_command, on_busy and\n\
+        on_tx_command_complete fire once for the whole batch, and the\n\
+        responses are parsed as usual when they arrive. To keep commands in\n\
+        order with submit() and call(), raises RuntimeError while a submitted\n\
+        command is still waiting for its response, and commands submitted\n\
+        while the batch is written are sent after it. Returns the number of\n\
+        packets sent.\n\
+        """\n\
+\n\
+        if self.packet_mode:\n\
+            packets = [bytes([len(packet) & 0xFF]) + packet for packet in packets]\n\
+        else:\n\
+            packets = list(packets)\n\
+        if len(packets) == 0:\n\
+            return 0\n\
+        batch = concurrent.futures.Future()\n\
+        with self._command_lock:\n\
+            if self._command_pending is not None:\n\
+                raise RuntimeError(\'a submitted command is still waiting for its response\')\n\
+            # submit() queues behind the batch until it has been written\n\
+            self._command_pending = batch\n\
+        try:\n\
+            if self.debug:\n\
+                for packet in packets: print(\'=>[ \' + \' \'.join([\'%02X\' % b for b in packet]) + \' ]\')\n\
+            self.on_before_tx_command()\n\
+            self.busy = True\n\
+            self.on_busy()\n\
+            data = b"".join(packets)\n\
+            ser.write(data)\n\
+            if self.capture is not None: self.capture.write(BGAPICapture.TX, data)\n\
+            self.on_tx_command_complete()\n\
+        finally:\n\
+            self._command_done(batch)\n\
+        return len(packets)\n\
 \n\
     def check_activity(self, ser, timeout=0):\n\
+\n\
+        """Read and parse pending serial data.\n\
+\n\
+        With buffered_read set, each read takes everything the port has waiting\n\
+        (blocking for the first byte only when a timeout is given) and hands\n\
+        the whole chunk to parse_bytes() instead of reading one byte per call.\n\
+        Called from a handler, it first parses the rest of the data that\n\
+        handler\'s packet arrived with, and returns at once if that completes\n\
+        the command being waited for.\n\
+        """\n\
+\n\
+        if self._rx_chunk is not None:\n\
+            busy = self.busy\n\
+            self.parse_bytes(b"")\n\
+            if busy and not self.busy:\n\
+                return self.busy\n\
         if timeout > 0:\n\
-            ser.timeout = timeout\n\
+            ser.timeout = read_timeout = timeout\n\
             while 1:\n\
-                x = ser.read()\n\
+                if self.resync:\n\
+                    # wait no longer than the partial frame time limit\n\
+                    if len(self.bgapi_rx_buffer) > 0 and self.resync_timeout < timeout:\n\
+                        if read_timeout != self.resync_timeout:\n\
+                            ser.timeout = read_timeout = self.resync_timeout\n\
+                    elif read_timeout != timeout:\n\
+                        ser.timeout = read_timeout = timeout\n\
+                if self.buffered_read or self.resync:\n\
+                    x = ser.read(ser.inWaiting() or 1)\n\
+                else:\n\
+                    x = ser.read()\n\
                 if len(x) > 0:\n\
-                    self.parse(x)\n\
+                    if self.buffered_read or self.resync:\n\
+                        self.parse_bytes(x)\n\
+                    else:\n\
+                        self.parse(x)\n\
+                elif self.resync and len(self.bgapi_rx_buffer) > 0:\n\
+                    # partial frame timed out, resync after its first byte\n\
+                    self._parse_bytes_resync(b"", True)\n\
                 else: # timeout\n\
                     self.busy = False\n\
                     self.on_idle()\n\
                     self.on_timeout()\n\
+                    self._timeout_command()\n\
                 if not self.busy: # finished\n\
                     break\n\
+        elif self.buffered_read or self.resync:\n\
+            while ser.inWaiting(): self.parse_bytes(ser.read(ser.inWaiting()))\n\
         else:\n\
             while ser.inWaiting(): self.parse(ser.read())\n\
         return self.busy\n\
+\n\
+    def start_reader(self, ser, queue_size=0):\n\
+\n\
+        """Read and parse ser on a background daemon thread until stop() is called.\n\
+\n\
+        The thread blocks on the port and hands whatever each read returns to\n\
+        parse_bytes(), so packets are handled as soon as they arrive instead of\n\
+        at the next check_activity() poll. By default, handlers run in place on\n\
+        the reader thread. With queue_size > 0, decoded responses and events\n\
+        are put on event_queue, a queue.Queue of (event, args) pairs bounded to\n\
+        queue_size entries, and their handlers run when process_events() is\n\
+        called; the reader waits while the queue is full. on_idle, on_timeout\n\
+        and on_raw_frame always fire on the reader thread. Do not call\n\
+        check_activity() or parse() on ser while the reader is running.\n\
+\n\
+        An exception raised by a handler on the reader thread is printed and\n\
+        counted in rx_handler_errors, and reading goes on. If reading the port\n\
+        fails, the thread exits and commands waiting for a response fail with\n\
+        that error.\n\
+        """\n\
+\n\
+        if self._reader is not None:\n\
+            raise RuntimeError(\'reader thread already running\')\n\
+        if queue_size > 0 and self.zero_copy:\n\
+            # zero_copy views would be overwritten before the handlers run\n\
+            raise ValueError(\'queue_size cannot be used with zero_copy\')\n\
+        self.event_queue = queue.Queue(queue_size) if queue_size > 0 else None\n\
+        self._reader_port = ser\n\
+        self._reader_stop = threading.Event()\n\
+        self._reader = threading.Thread(target=self._run_reader, args=(ser, self._reader_stop), name=\'BGLib reader\')\n\
+        self._reader.daemon = True\n\
+        self._reader.start()\n\
+        return self._reader\n\
+\n\
+    def stop(self, timeout=None):\n\
+\n\
+        """Stop the reader thread started by start_reader() and wait for it to exit.\n\
+\n\
+        A blocked read is interrupted with ser.cancel_read() where the port\n\
+        supports it, otherwise the thread exits after its current read returns\n\
+        (after at most ser.timeout). Events still on event_queue are kept for\n\
+        process_events(). Returns True once the thread has exited.\n\
+        """\n\
+\n\
+        reader = self._reader\n\
+        if reader is None:\n\
+            return True\n\
+        self._reader_stop.set()\n\
+        if hasattr(self._reader_port, \'cancel_read\'):\n\
+            self._reader_port.cancel_read()\n\
+        reader.join(timeout)\n\
+        if reader.is_alive():\n\
+            return False\n\
+        self._reader = None\n\
+        self._reader_port = None\n\
+        return True\n\
+\n\
+    def process_events(self, timeout=None):\n\
+\n\
+        """Run the handlers of events queued by the reader thread, on the calling thread.\n\
+\n\
+        Waits up to timeout seconds (forever if None, not at all if 0) for the\n\
+        first event, then handles everything already queued without waiting\n\
+        again. Returns the number of events handled.\n\
+        """\n\
+\n\
+        if self.event_queue is None:\n\
+            return 0\n\
+        try:\n\
+            event, args = self.event_queue.get(timeout != 0, timeout)\n\
+        except queue.Empty:\n\
+            return 0\n\
+        count = 0\n\
+        while 1:\n\
+            self._run_handlers(event, args)\n\
+            count += 1\n\
+            try:\n\
+                event, args = self.event_queue.get_nowait()\n\
+            except queue.Empty:\n\
+                return count\n\
+\n\
+    def submit(self, ser, packet):\n\
+\n\
+        """Queue a command packet and return a concurrent.futures.Future for its response.\n\
+\n\
+        Submitted commands are written one at a time: the next one goes out as\n\
+        soon as the response to the previous one, matched by class and command\n\
+        ID, has been parsed, whether by check_activity(), the reader thread or\n\
+        parse_bytes(). The future\'s result() is the args of the response, so a\n\
+        sequence of commands takes as long as the device needs to answer them\n\
+        rather than a check_activity() timeout each. If check_activity() times\n\
+        out first, the pending command fails with TimeoutError and the next\n\
+        one is sent. Commands sent directly with send_command() bypass the\n\
+        queue.\n\
+        """\n\
+\n\
+        future = concurrent.futures.Future()\n\
+        self._queue_command(ser, packet, future)\n\
+        return future\n\
+\n\
+    def call(self, ser, packet, timeout=1):\n\
+\n\
+        """Send a command and block until its response arrives; return the response args.\n\
+\n\
+        For example, ble.call(ser, ble.ble_cmd_system_address_get()).address. The command\n\
+        is queued as with submit(). Unless the reader thread is running, the\n\
+        port is read and parsed here (so events arriving meanwhile are handled\n\
+        too), waiting on the port\'s file descriptor where it has one. So is it\n\
+        when call() is made from a handler running on the reader thread, which\n\
+        is blocked until the handler returns. The port timeout and other\n\
+        settings are left as they are. Raises TimeoutError\n\
+        if no response arrives within timeout seconds; the command is then\n\
+        dropped and on_timeout fires.\n\
+        """\n\
+\n\
+        future = self.submit(ser, packet)\n\
+        deadline = time.monotonic() + timeout\n\
+        if self._reader is None or threading.current_thread() is self._reader:\n\
+            if self._rx_chunk is not None:\n\
+                # called from a handler, the rest of its chunk comes first\n\
+                self.parse_bytes(b"")\n\
+            while not future.done():\n\
+                remaining = deadline - time.monotonic()\n\
+                if remaining <= 0:\n\
+                    break\n\
+                if ser.inWaiting():\n\
+                    self.parse_bytes(ser.read(ser.inWaiting()))\n\
+                else:\n\
+                    self._wait_readable(ser, remaining)\n\
+        try:\n\
+            return future.result(max(0, deadline - time.monotonic()))\n\
+        except concurrent.futures.TimeoutError:\n\
+            future.cancel()\n\
+            if self._command_pending is None:\n\
+                self.busy = False\n\
+                self.on_idle()\n\
+            self.on_timeout()\n\
+            raise TimeoutError(\'no response to command within %s s\' % timeout)\n\
+\n\
+    def _wait_readable(self, ser, timeout):\n\
+\n\
+        """(internal use) Wait up to timeout seconds for ser to have data to read."""\n\
+\n\
+        try:\n\
+            fd = ser.fileno()\n\
+        except (AttributeError, OSError, ValueError):\n\
+            # no file descriptor to wait on (e.g. Windows), poll instead\n\
+            time.sleep(min(timeout, 0.001))\n\
+            return\n\
+        select.select([fd], [], [], timeout)\n\
+\n\
+    def cancel_commands(self, exc=None):\n\
+\n\
+        """Drop all submitted commands that have not completed yet.\n\
+\n\
+        Their futures are failed with exc, or cancelled if exc is None.\n\
+        """\n\
+\n\
+        with self._command_lock:\n\
+            futures = [future for ser, packet, future in self._command_queue]\n\
+            self._command_queue.clear()\n\
+            for waiters in self._response_waiters.values():\n\
+                futures.extend(future for future in waiters if future is not None)\n\
+        for future in futures:\n\
+            if exc is None:\n\
+                future.cancel()\n\
+            else:\n\
+                try:\n\
+                    future.set_exception(exc)\n\
+                except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):\n\
+                    pass\n\
+\n\
+    def _run_reader(self, ser, stop):\n\
+\n\
+        """(internal use) Reader thread body, see start_reader()."""\n\
+\n\
+        try:\n\
+            while not stop.is_set():\n\
+                if self._rx_chunk is not None:\n\
+                    # a handler failed partway through a chunk, parse the rest\n\
+                    x = b""\n\
+                else:\n\
+                    waiting = ser.inWaiting()\n\
+                    partial = self.resync and len(self.bgapi_rx_buffer) > 0\n\
+                    if waiting == 0 and (partial or getattr(ser, \'timeout\', None) == 0):\n\
+                        # wait here rather than spin on a non-blocking read(),\n\
+                        # or block on a partial frame past resync_timeout\n\
+                        self._wait_readable(ser, self.resync_timeout)\n\
+                        waiting = ser.inWaiting()\n\
+                    if waiting == 0 and partial:\n\
+                        x = b""\n\
+                    else:\n\
+                        x = ser.read(waiting or 1)\n\
+                try:\n\
+                    if len(x) > 0 or self._rx_chunk is not None:\n\
+                        self.parse_bytes(x)\n\
+                    elif self.resync and len(self.bgapi_rx_buffer) > 0 and not stop.is_set():\n\
+                        # nothing arrived to complete a partial frame\n\
+                        self.parse_bytes(b"")\n\
+                except Exception:\n\
+                    self.rx_handler_errors += 1\n\
+                    traceback.print_exc()\n\
+        except Exception as exc:\n\
+            # the port failed, no response can arrive any more\n\
+            self.cancel_commands(exc)\n\
+            raise\n\
+        finally:\n\
+            if self._reader is threading.current_thread():\n\
+                self._reader = None\n\
+\n\
+    def _fire_event(self, event, args):\n\
+\n\
+        """(internal use) Run the handlers of a decoded packet, or queue them for\n\
+        process_events(), waiting while event_queue is full."""\n\
+\n\
+        if self.event_queue is None:\n\
+            self._run_handlers(event, args)\n\
+            return\n\
+        while 1:\n\
+            try:\n\
+                self.event_queue.put((event, args), True, 0.1)\n\
+                return\n\
+            except queue.Full:\n\
+                if self._reader is not None and self._reader_stop.is_set():\n\
+                    # stopping, nobody may be draining the queue\n\
+                    self.rx_dropped_events += 1\n\
+                    return\n\
+\n\
+    def on_batch(self, name, func, max_items=512, max_delay=0.05, columnar=False):\n\
+\n\
+        """Subscribe func(sender, batch) to batches of the event called name.\n\
+\n\
+        One call covers up to max_items packets, collected for at most\n\
+        max_delay seconds (None waits for max_items), as a list of args\n\
+        records or, with columnar, as a dict of one list per field:\n\
+\n\
+            ble.on_batch(\'ble_evt_gap_scan_response\', store, columnar=True)\n\
+\n\
+        Returns the BGAPIBatchHandler; remove it with -= on the event and\n\
+        call its flush() to deliver what is left.\n\
+        """\n\
+\n\
+        handler = BGAPIBatchHandler(func, max_items, max_delay, columnar)\n\
+        getattr(self, name).add(handler)\n\
+        return handler\n\
+\n\
+    def _run_handlers(self, event, args):\n\
+\n\
+        """(internal use) Call the handlers of event, then the matching on_any() handlers."""\n\
+\n\
+        for func in self.__eventhandler__.get(event, ()):\n\
+            func(self, args)\n\
+        if self._any_handlers:\n\
+            for func in self._any_handlers.get(getattr(event, \'kind\', None), ()):\n\
+                func(self, event.name, args)\n\
+\n\
+    def on_any(self, func, kinds=(\'response\', \'event\')):\n\
+\n\
+        """Call func(sender, name, args) for every message of the given kinds.\n\
+\n\
+        kinds may include \'response\' and \'event\' for decoded messages, where\n\
+        name is the event attribute name, and \'raw_frame\' for every frame\n\
+        on_raw_frame would see, with name \'on_raw_frame\' and args a\n\
+        BGAPIRawFrame. Decoded handlers run wherever the message\'s own\n\
+        handlers run (see start_reader()). With no on_any() handlers the\n\
+        receive path only checks one empty dict.\n\
+        """\n\
+\n\
+        for kind in kinds:\n\
+            if kind not in (\'response\', \'event\', \'raw_frame\'):\n\
+                raise ValueError(\'unknown message kind %r\' % (kind,))\n\
+        for kind in kinds:\n\
+            self._any_handlers[kind] = self._any_handlers.get(kind, ()) + (func,)\n\
+\n\
+    def off_any(self, func):\n\
+\n\
+        """Remove func from every kind it was added to with on_any()."""\n\
+\n\
+        for kind, functions in list(self._any_handlers.items()):\n\
+            functions = tuple(f for f in functions if f != func)\n\
+            if functions:\n\
+                self._any_handlers[kind] = functions\n\
+            else:\n\
+                del self._any_handlers[kind]\n\
+\n\
+    def subscribe_attribute(self, connection, handle, func):\n\
+\n\
+        """Call func(sender, args) for each ble_evt_attclient_attribute_value of one\n\
+        connection and atthandle only.\n\
+\n\
+        Packets are routed on the connection and handle bytes before they\n\
+        are decoded, so the cost per notification does not grow with the\n\
+        number of subscriptions, and one that nobody subscribed to is not\n\
+        decoded at all. Handlers added to ble_evt_attclient_attribute_value itself\n\
+        still see every notification.\n\
+        """\n\
+\n\
+        key = (BGLib.ble_evt_attclient_attribute_value, connection, handle)\n\
+        self.__eventhandler__[key] = self.__eventhandler__.get(key, ()) + (func,)\n\
+        self._attribute_event = BGLib.ble_evt_attclient_attribute_value\n\
+\n\
+    def unsubscribe_attribute(self, connection, handle, func):\n\
+\n\
+        """Remove a func added with subscribe_attribute() for this connection and handle."""\n\
+\n\
+        key = (BGLib.ble_evt_attclient_attribute_value, connection, handle)\n\
+        functions = list(self.__eventhandler__.get(key, ()))\n\
+        functions.remove(func)\n\
+        if functions:\n\
+            self.__eventhandler__[key] = tuple(functions)\n\
+        else:\n\
+            del self.__eventhandler__[key]\n\
+\n\
+    def _route_attribute(self, decoder, event, buf, start, end):\n\
+\n\
+        """(internal use) Fire the subscribe_attribute() handlers of one\n\
+        notification, keyed on its connection and handle bytes."""\n\
+\n\
+        key = (event, buf[start + 4], buf[start + 5] | buf[start + 6] << 8)\n\
+        routed = self.__eventhandler__.get(key)\n\
+        if routed or self.__eventhandler__.get(event) or self._any_handlers:\n\
+            args = decoder(buf, start + 4, end)\n\
+            if routed:\n\
+                self._fire_event(key, args)\n\
+            if self.__eventhandler__.get(event) or self._any_handlers:\n\
+                self._fire_event(event, args)\n\
+\n\
+    def start_capture(self, file):\n\
+\n\
+        """Record every chunk parsed and command sent from now on to file, a\n\
+        path or binary file object (see BGAPICapture); returns the capture.\n\
+\n\
+        Bytes given to parse() one at a time are recorded together, once a\n\
+        packet is complete.\n\
+        """\n\
+\n\
+        self.stop_capture()\n\
+        self._capture_rx = bytearray()\n\
+        self.capture = BGAPICapture(file)\n\
+        return self.capture\n\
+\n\
+    def stop_capture(self):\n\
+        if self.capture is not None:\n\
+            self._write_capture_rx()\n\
+            capture, self.capture = self.capture, None\n\
+            capture.close()\n\
+\n\
+    def _write_capture_rx(self):\n\
+\n\
+        """(internal use) Record the bytes parse() has collected for the capture."""\n\
+\n\
+        if len(self._capture_rx) > 0:\n\
+            self.capture.write(BGAPICapture.RX, self._capture_rx)\n\
+            self._capture_rx = bytearray()\n\
 \n\
     def parse(self, barray):\n\
+        if self._rx_chunk is not None:\n\
+            # called from a handler while parse_bytes() is working through a\n\
+            # chunk; the rest of that chunk comes first\n\
+            return self.parse_bytes(barray[:1])\n\
+        if self.capture is not None: self._capture_rx += barray[:1]\n\
         b=barray[0]\n\
         if len(self.bgapi_rx_buffer) == 0 and (b == 0x00 or b == 0x80 or b == 0x08 or b == 0x88):\n\
             self.bgapi_rx_buffer+=bytes([b])\n\
@@ -745,26 +1498,1597 @@ class BGLib(object):\n\
 \n\
         #print\'%02X: %d, %d\' % (b, len(self.bgapi_rx_buffer), self.bgapi_rx_expected_length)\n\
         if self.bgapi_rx_expected_length > 0 and len(self.bgapi_rx_buffer) == self.bgapi_rx_expected_length:\n\
-            if self.debug: print(\'<=[ \' + \' \'.join([\'%02X\' % b for b in self.bgapi_rx_buffer ]) + \' ]\')\n\
-            packet_type, payload_length, packet_class, packet_command = self.bgapi_rx_buffer[:4]\n\
-            self.bgapi_rx_payload = self.bgapi_rx_buffer[4:]\n\
+            packet = self.bgapi_rx_buffer\n\
             self.bgapi_rx_buffer = b""\n\
-            if packet_type & 0x88 == 0x00:\n\
-                # 0x00 = BLE response packet\n\
-                ' + ('\n                '.join(ble_response_callback_parser_conditions)) + '\n\
-                self.busy = False\n\
-                self.on_idle()\n\
-            elif packet_type & 0x88 == 0x80:\n\
-                # 0x80 = BLE event packet\n\
-                ' + ('\n                '.join(ble_event_callback_parser_conditions)) + '\n\
-            elif packet_type & 0x88 == 0x08:\n\
-                # 0x08 = wifi response packet\n\
-                ' + ('\n                '.join(wifi_response_callback_parser_conditions)) + '\n\
-                self.busy = False\n\
-                self.on_idle()\n\
+            if self.capture is not None: self._write_capture_rx()\n\
+            if self.zero_copy:\n\
+                packet = memoryview(packet)\n\
+            self._parse_packet(packet, 0, len(packet))\n\
+\n\
+    def parse_bytes(self, buf):\n\
+\n\
+        """Parse a whole chunk of received bytes, e.g. everything one ser.read() returned.\n\
+\n\
+        Packet boundaries are found from the length in each 4-byte header and\n\
+        every complete packet in the chunk is decoded in one pass. A trailing\n\
+        partial packet is kept in bgapi_rx_buffer and completed by the next\n\
+        call (or by parse(), which shares the same buffer). Handlers may parse\n\
+        again, e.g. through check_activity() or call(): the nested call\n\
+        continues with the rest of this chunk, and this one returns once the\n\
+        handler does.\n\
+        """\n\
+\n\
+        if self.capture is not None:\n\
+            self._write_capture_rx()\n\
+            self.capture.write(BGAPICapture.RX, buf)\n\
+        if self.resync:\n\
+            return self._parse_bytes_resync(buf)\n\
+        buf = self._take_rx_buffer(buf)\n\
+        pos = 0\n\
+        end = len(buf)\n\
+        self._rx_chunk = buf\n\
+        self._rx_depth += 1\n\
+        try:\n\
+            while pos < end:\n\
+                b = buf[pos]\n\
+                if not (b == 0x00 or b == 0x80 or b == 0x08 or b == 0x88):\n\
+                    pos += 1\n\
+                    continue\n\
+                if end - pos < 2:\n\
+                    break\n\
+                length = 4 + (b & 0x07) + buf[pos + 1]\n\
+                if end - pos < length:\n\
+                    break\n\
+                self._rx_pos = pos + length\n\
+                self._parse_packet(buf, pos, pos + length)\n\
+                if self._rx_chunk is not buf:\n\
+                    # a handler parsed again, which took over the rest of buf\n\
+                    return\n\
+                pos += length\n\
+        finally:\n\
+            self._rx_depth -= 1\n\
+        self._rx_chunk = None\n\
+        self._keep_rx_partial(buf, pos)\n\
+\n\
+    def _parse_bytes_resync(self, buf, expire=False):\n\
+\n\
+        """(internal use) parse_bytes() with the resync checks described in __init__().\n\
+\n\
+        With expire set, the partial frame at the front of the buffer is given\n\
+        up regardless of its age.\n\
+        """\n\
+\n\
+        now = time.monotonic()\n\
+        partial = self._rx_chunk is None and len(self.bgapi_rx_buffer) > 0\n\
+        if partial and not expire:\n\
+            expire = now - self.bgapi_rx_partial_time >= self.resync_timeout\n\
+        buf = self._take_rx_buffer(buf)\n\
+        pos = 0\n\
+        if partial and expire:\n\
+            self.rx_partial_timeouts += 1\n\
+            self.rx_discarded_bytes += 1\n\
+            pos = 1\n\
+        end = len(buf)\n\
+        lengths = self.bgapi_rx_lengths\n\
+        self._rx_chunk = buf\n\
+        self._rx_depth += 1\n\
+        try:\n\
+            while pos < end:\n\
+                b = buf[pos]\n\
+                if b == 0x00 or b == 0x80 or b == 0x08 or b == 0x88:\n\
+                    if end - pos < 4:\n\
+                        break\n\
+                    length = 4 + (b & 0x07) + buf[pos + 1]\n\
+                    limits = lengths.get((b & 0xf8, buf[pos + 2], buf[pos + 3]))\n\
+                    if limits is not None and limits[0] <= length - 4 <= limits[1]:\n\
+                        if end - pos < length:\n\
+                            break\n\
+                        self._rx_pos = pos + length\n\
+                        self._parse_packet(buf, pos, pos + length)\n\
+                        if self._rx_chunk is not buf:\n\
+                            # a handler parsed again, which took over the rest of buf\n\
+                            return\n\
+                        pos += length\n\
+                        continue\n\
+                pos += 1\n\
+                self.rx_discarded_bytes += 1\n\
+        finally:\n\
+            self._rx_depth -= 1\n\
+        self._rx_chunk = None\n\
+        if pos > 0 or not partial:\n\
+            # a new partial frame (if any) starts now\n\
+            self.bgapi_rx_partial_time = now\n\
+        self._keep_rx_partial(buf, pos)\n\
+\n\
+    def _take_rx_buffer(self, buf):\n\
+\n\
+        """(internal use) Take over the received bytes not parsed yet and return\n\
+        them followed by buf.\n\
+\n\
+        Those are a partial packet carried over in bgapi_rx_buffer or, when a\n\
+        handler parses again while parse_bytes() is working through a chunk,\n\
+        the rest of that chunk after the packet being handled. That call then\n\
+        stops once the handler returns and leaves the rest to this one.\n\
+        """\n\
+\n\
+        nested = self._rx_depth > 0\n\
+        if self._rx_chunk is not None:\n\
+            carry = self._rx_chunk[self._rx_pos:]\n\
+            self._rx_chunk = None\n\
+            nested = True\n\
+        else:\n\
+            carry = self.bgapi_rx_buffer\n\
+        self.bgapi_rx_buffer = b""\n\
+        self.bgapi_rx_expected_length = 0\n\
+        if self.zero_copy:\n\
+            return self._recycle_rx_buffer(carry, buf, nested)\n\
+        if len(carry) > 0:\n\
+            return bytes(carry) + buf\n\
+        if type(buf) is not bytes:\n\
+            return bytes(buf)\n\
+        return buf\n\
+\n\
+    def _keep_rx_partial(self, buf, pos):\n\
+\n\
+        """(internal use) Carry the partial packet at buf[pos:] over to the next call."""\n\
+\n\
+        self.bgapi_rx_buffer = bytes(buf[pos:])\n\
+        if len(buf) - pos > 1:\n\
+            self.bgapi_rx_expected_length = 4 + (buf[pos] & 0x07) + buf[pos + 1]\n\
+        else:\n\
+            self.bgapi_rx_expected_length = 0\n\
+\n\
+    def iter_frames(self, source):\n\
+\n\
+        """Lazily yield each complete BGAPI packet in source as a bytes object.\n\
+\n\
+        source may be a serial port (read until the caller stops iterating), a\n\
+        file opened in binary mode (read to the end), a bytes-like object or\n\
+        any iterable of bytes-like chunks. Bytes that cannot start a packet are\n\
+        skipped as in parse(), and a trailing partial packet is dropped. This\n\
+        does not touch the receive buffer, busy flag or event handlers.\n\
+        """\n\
+\n\
+        buf = b""\n\
+        for chunk in self._iter_chunks(source):\n\
+            buf = buf + chunk if len(buf) > 0 else bytes(chunk)\n\
+            pos = 0\n\
+            end = len(buf)\n\
+            while pos < end:\n\
+                b = buf[pos]\n\
+                if not (b == 0x00 or b == 0x80 or b == 0x08 or b == 0x88):\n\
+                    pos += 1\n\
+                    continue\n\
+                if end - pos < 2:\n\
+                    break\n\
+                length = 4 + (b & 0x07) + buf[pos + 1]\n\
+                if end - pos < length:\n\
+                    break\n\
+                yield buf[pos:pos + length]\n\
+                pos += length\n\
+            buf = buf[pos:]\n\
+\n\
+    def iter_packets(self, source):\n\
+\n\
+        """Lazily yield a (name, args) pair for each packet in source.\n\
+\n\
+        name is the event attribute name, e.g. \'ble_evt_gap_scan_response\', and\n\
+        args is the record its handlers would be given. Sources are as for\n\
+        iter_frames(); packets without a decoder are skipped and no events fire.\n\
+        """\n\
+\n\
+        for frame in self.iter_frames(source):\n\
+            handler = self.bgapi_rx_dispatch.get((frame[0] & 0xf8, frame[2], frame[3]))\n\
+            if handler is not None:\n\
+                decoder, event = handler\n\
+                yield event.name, decoder(frame, 4, len(frame))\n\
+\n\
+    def _iter_chunks(self, source):\n\
+\n\
+        """(internal use) Yield received byte chunks from a port, file or iterable."""\n\
+\n\
+        if isinstance(source, (bytes, bytearray, memoryview)):\n\
+            yield source\n\
+        elif hasattr(source, \'inWaiting\'):\n\
+            while 1:\n\
+                yield source.read(source.inWaiting() or 1)\n\
+        elif hasattr(source, \'read\'):\n\
+            while 1:\n\
+                chunk = source.read(4096)\n\
+                if len(chunk) == 0:\n\
+                    break\n\
+                yield chunk\n\
+        else:\n\
+            for chunk in source:\n\
+                yield bytes((chunk,)) if isinstance(chunk, int) else chunk\n\
+\n\
+    def _recycle_rx_buffer(self, carry, buf, nested=False):\n\
+\n\
+        """(internal use) Copy carry and buf into the recycled receive buffer,\n\
+        and return a read-only view of the used part.\n\
+\n\
+        The buffer is overwritten in place rather than resized, so views that\n\
+        handlers kept past their lifetime see new data instead of raising. A\n\
+        nested parse gets a buffer of its own instead, as the handler that\n\
+        started it, or a parse_bytes() call further up the stack, may still be\n\
+        reading the recycled one.\n\
+        """\n\
+\n\
+        length = len(carry) + len(buf)\n\
+        if nested:\n\
+            recycled = bytearray(length)\n\
+        else:\n\
+            if length > len(self.bgapi_rx_recycled):\n\
+                self.bgapi_rx_recycled = bytearray(max(length, 4096))\n\
+            recycled = self.bgapi_rx_recycled\n\
+        recycled[:len(carry)] = carry\n\
+        recycled[len(carry):length] = buf\n\
+        return memoryview(recycled).toreadonly()[:length]\n\
+\n\
+    def _parse_packet(self, buf, start, end):\n\
+\n\
+        """(internal use) Decode the packet in buf[start:end] without copying it out."""\n\
+\n\
+        if self.debug: print(\'<=[ \' + \' \'.join([\'%02X\' % b for b in buf[start:end] ]) + \' ]\')\n\
+        waited = False\n\
+        packet_type = buf[start]\n\
+        packet_class = buf[start + 2]\n\
+        packet_command = buf[start + 3]\n\
+        handler = self.bgapi_rx_dispatch.get((packet_type & 0xf8, packet_class, packet_command))\n\
+        if self._raw_frame_handler.functions or (self._any_handlers and \'raw_frame\' in self._any_handlers):\n\
+            raw_frame_filter = self.raw_frame_filter\n\
+            if raw_frame_filter is None or packet_class in raw_frame_filter or (packet_class, packet_command) in raw_frame_filter:\n\
+                frame = BGAPIRawFrame(buf[start:start + 4], buf[start + 4:end])\n\
+                self.on_raw_frame(frame)\n\
+                for func in self._any_handlers.get(\'raw_frame\', ()):\n\
+                    func(self, \'on_raw_frame\', frame)\n\
+                if self.raw_frame_only:\n\
+                    if handler is not None and packet_type & 0x80 == 0x00 and self._response_waiters:\n\
+                        # its event does not fire, but a submitted command\n\
+                        # waiting for this response still gets its args\n\
+                        args = self._decode_response(handler[0], buf, start, end)\n\
+                        waited = True\n\
+                    handler = None\n\
+        if handler is not None:\n\
+            decoder, event = handler\n\
+            if packet_type & 0x80 == 0x00 and self._response_waiters:\n\
+                args = self._decode_response(decoder, buf, start, end)\n\
+                waited = True\n\
+                if self.__eventhandler__.get(event) or self._any_handlers:\n\
+                    self._fire_event(event, args)\n\
+            elif event is self._attribute_event:\n\
+                self._route_attribute(decoder, event, buf, start, end)\n\
+            # only decode when something is subscribed (add() and remove()\n\
+            # keep these tuples current), but always do the busy bookkeeping\n\
+            elif self.__eventhandler__.get(event) or (self._any_handlers and event.kind in self._any_handlers):\n\
+                self._fire_event(event, decoder(buf, start + 4, end))\n\
+        if packet_type & 0x80 == 0x00:\n\
+            # response packet, the command has completed\n\
+            self.busy = False\n\
+            self.on_idle()\n\
+            if waited:\n\
+                # may send the next queued command\n\
+                self._complete_command(packet_class, packet_command, args)\n\
+        elif packet_class == 0 and packet_command == 0:\n\
+            # boot event\n\
+            self.busy = False\n\
+            self.on_idle()\n\
+\n\
+    def _decode_response(self, decoder, buf, start, end):\n\
+\n\
+        """(internal use) Decode a response a command may be waiting for; its\n\
+        args must outlive the receive buffer."""\n\
+\n\
+        if self.zero_copy:\n\
+            return decoder(memoryview(bytes(buf[start:end])), 4, end - start)\n\
+        return decoder(buf, start + 4, end)\n\
+\n\
+    def _complete_command(self, packet_class, packet_command, args):\n\
+\n\
+        """(internal use) Resolve the oldest future waiting for this response."""\n\
+\n\
+        with self._command_lock:\n\
+            waiters = self._response_waiters.get((packet_class, packet_command))\n\
+            if not waiters:\n\
+                return\n\
+            future = waiters.popleft()\n\
+            if not waiters:\n\
+                del self._response_waiters[(packet_class, packet_command)]\n\
+        if future is None:\n\
+            # the late answer to a command that timed out or was cancelled\n\
+            return\n\
+        try:\n\
+            future.set_result(args)\n\
+        except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):\n\
+            # cancelled meanwhile, e.g. by call() giving up on another thread,\n\
+            # or an AsyncBGLib future cancelled before its callback ran\n\
+            pass\n\
+\n\
+    def _queue_command(self, ser, packet, future):\n\
+\n\
+        """(internal use) Send packet now if no submitted command is pending, else queue it."""\n\
+\n\
+        with self._command_lock:\n\
+            if self._command_pending is not None:\n\
+                self._command_queue.append((ser, packet, future))\n\
+                return\n\
+            self._command_pending = future\n\
+        self._send_queued_command(ser, packet, future)\n\
+\n\
+    def _send_queued_command(self, ser, packet, future):\n\
+\n\
+        """(internal use) Send a command that is now the pending one."""\n\
+\n\
+        with self._command_lock:\n\
+            self._response_waiters.setdefault((packet[2], packet[3]), deque()).append(future)\n\
+        future.add_done_callback(self._command_done)\n\
+        self.send_command(ser, packet)\n\
+\n\
+    def _command_done(self, future):\n\
+\n\
+        """(internal use) Release the next queued command once the pending one is done,\n\
+        whether by its response, a timeout, cancellation or cancel_commands()."""\n\
+\n\
+        with self._command_lock:\n\
+            if future is not self._command_pending:\n\
+                return\n\
+            self._command_pending = None\n\
+            for waiters in self._response_waiters.values():\n\
+                # not completed by a response; keep its place, so that a late\n\
+                # one is dropped instead of answering the next such command\n\
+                if future in waiters:\n\
+                    waiters[waiters.index(future)] = None\n\
+            while self._command_queue:\n\
+                ser, packet, future = self._command_queue.popleft()\n\
+                if not future.cancelled():\n\
+                    self._command_pending = future\n\
+                    break\n\
+            else:\n\
+                return\n\
+        self._send_queued_command(ser, packet, future)\n\
+\n\
+    def _timeout_command(self):\n\
+\n\
+        """(internal use) Fail the pending submitted command after check_activity() timed out."""\n\
+\n\
+        future = self._command_pending\n\
+        if future is not None:\n\
+            try:\n\
+                future.set_exception(TimeoutError(\'no response to command\'))\n\
+            except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):\n\
+                pass\n\
+\n\
+    # (message type and technology type, class ID, command ID) => (decoder, event)\n\
+    bgapi_rx_dispatch = {\n\
+        ' + ('\n        '.join(ble_response_dispatch_entries + ble_event_dispatch_entries + wifi_response_dispatch_entries + wifi_event_dispatch_entries)) + '\n\
+    }\n\
+\n\
+    # (message type and technology type, class ID, command ID) => (min payload length, max payload length)\n\
+    bgapi_rx_lengths = {\n\
+        ' + ('\n        '.join(ble_response_length_entries + ble_event_length_entries + wifi_response_length_entries + wifi_event_length_entries)) + '\n\
+    }\n\
+\n\
+\n\
+class AsyncBGLib(BGLib, asyncio.Protocol):\n\
+\n\
+    """BGLib driven by an asyncio transport, e.g. from serial_asyncio\'s\n\
+    create_serial_connection(), loop.create_connection() or\n\
+    loop.create_unix_connection().\n\
+\n\
+    Received data goes straight to parse_bytes(), so handlers added with\n\
+    \'+=\' still work. Command methods queue the command for the transport as\n\
+    submit() does and return a future that resolves to the args of its\n\
+    response, so that\n\
+\n\
+        address = (await ble.ble_cmd_system_address_get()).address\n\
+\n\
+    works; wrap it in asyncio.wait_for() for a time limit, which also\n\
+    releases the next queued command. events() gives an async iterator over\n\
+    decoded events.\n\
+    """\n\
+\n\
+    def __init__(self, zero_copy=False):\n\
+        BGLib.__init__(self, zero_copy)\n\
+        self.transport = None\n\
+        self._loop = None\n\
+        self._event_streams = set()\n\
+\n\
+    def connection_made(self, transport):\n\
+        self.transport = transport\n\
+        self._loop = asyncio.get_running_loop()\n\
+\n\
+    def data_received(self, data):\n\
+        self.parse_bytes(data)\n\
+\n\
+    def connection_lost(self, exc):\n\
+        self.transport = None\n\
+        if exc is None:\n\
+            exc = ConnectionError(\'connection lost\')\n\
+        self.cancel_commands(exc)\n\
+        for stream in list(self._event_streams):\n\
+            stream.close()\n\
+\n\
+    def send(self, packet):\n\
+\n\
+        """Queue a command packet as submit() does and return an asyncio future\n\
+        for its response args."""\n\
+\n\
+        if self.transport is None:\n\
+            raise ConnectionError(\'not connected\')\n\
+        future = self._loop.create_future()\n\
+        self._queue_command(self.transport, packet, future)\n\
+        return future\n\
+\n\
+    def events(self, *names, maxsize=0):\n\
+\n\
+        """Return an async iterator over (name, args) for the named events.\n\
+\n\
+        For example:\n\
+\n\
+            async for name, args in ble.events(\'ble_evt_gap_scan_response\'):\n\
+                ...\n\
+\n\
+        Events are collected from the moment events() is called. Once maxsize\n\
+        (if > 0) events are waiting, further ones are counted in\n\
+        rx_dropped_events and dropped. The iterator ends after close() or when\n\
+        the connection is lost.\n\
+        """\n\
+\n\
+        if self.zero_copy:\n\
+            # zero_copy views would be overwritten before they are consumed\n\
+            raise ValueError(\'events() cannot be used with zero_copy\')\n\
+        return BGAPIEventStream(self, names, maxsize)\n\
+\n\
+\n\
+def _async_command(build):\n\
+    def command(self, *args):\n\
+        return self.send(build(self, *args))\n\
+    command.__name__ = build.__name__\n\
+    command.__doc__ = build.__doc__\n\
+    return command\n\
+\n\
+for _name, _build in list(BGLib.__dict__.items()):\n\
+    if _name.startswith((\'ble_cmd_\', \'wifi_cmd_\')):\n\
+        setattr(AsyncBGLib, _name, _async_command(_build))\n\
+del _name, _build\n\
+\n\
+\n\
+class BGAPIEventStream(object):\n\
+\n\
+    """Async iterator over (name, args) of events, see AsyncBGLib.events()."""\n\
+\n\
+    def __init__(self, lib, names, maxsize=0):\n\
+        self.lib = lib\n\
+        self.queue = asyncio.Queue(maxsize)\n\
+        self.closed = False\n\
+        self.handlers = [(name, self._handler(name)) for name in names]\n\
+        for name, handler in self.handlers:\n\
+            getattr(lib, name).add(handler)\n\
+        lib._event_streams.add(self)\n\
+\n\
+    def _handler(self, name):\n\
+        def handler(sender, args):\n\
+            try:\n\
+                self.queue.put_nowait((name, args))\n\
+            except asyncio.QueueFull:\n\
+                self.lib.rx_dropped_events += 1\n\
+        return handler\n\
+\n\
+    def __aiter__(self):\n\
+        return self\n\
+\n\
+    async def __anext__(self):\n\
+        if self.closed and self.queue.empty():\n\
+            raise StopAsyncIteration\n\
+        item = await self.queue.get()\n\
+        if item is None:\n\
+            raise StopAsyncIteration\n\
+        return item\n\
+\n\
+    def close(self):\n\
+\n\
+        """Unsubscribe; the iterator ends once the events already queued are consumed."""\n\
+\n\
+        if self.closed:\n\
+            return\n\
+        self.closed = True\n\
+        for name, handler in self.handlers:\n\
+            getattr(self.lib, name).remove(handler)\n\
+        self.lib._event_streams.discard(self)\n\
+        try:\n\
+            # wake a pending __anext__()\n\
+            self.queue.put_nowait(None)\n\
+        except asyncio.QueueFull:\n\
+            pass\n\
+\n\
+class BGLibPool(object):\n\
+\n\
+    """Several adapters working as one, each with its own BGLib parser.\n\
+\n\
+    ports are open serial ports, one per adapter; libs[i] parses ports[i].\n\
+    start() gives every adapter a reader thread (see BGLib.start_reader()).\n\
+    Events named with subscribe() are time-stamped as they are parsed and\n\
+    merged into a single stream of (timestamp, adapter index, name, args)\n\
+    tuples, read in timestamp order with get() or by iterating over the pool.\n\
+    An event is held back for reorder_delay seconds so that one parsed a\n\
+    little later on another adapter\'s thread can still be put before it.\n\
+    """\n\
+\n\
+    def __init__(self, ports, reorder_delay=0.005, queue_size=0):\n\
+        self.ports = list(ports)\n\
+        self.libs = [BGLib() for port in self.ports]\n\
+        self.reorder_delay = reorder_delay\n\
+        self._queue = queue.Queue(queue_size)\n\
+        self._pending = []\n\
+        self._sequence = itertools.count()\n\
+\n\
+    def subscribe(self, *names):\n\
+\n\
+        """Add the named responses or events of every adapter to the merged stream."""\n\
+\n\
+        for index, lib in enumerate(self.libs):\n\
+            for name in names:\n\
+                getattr(lib, name).add(self._handler(index, name))\n\
+\n\
+    def _handler(self, index, name):\n\
+        put = self._queue.put\n\
+        def handler(sender, args):\n\
+            put((time.monotonic(), index, name, args))\n\
+        return handler\n\
+\n\
+    def start(self):\n\
+\n\
+        """Start the reader thread of every adapter that is not running yet."""\n\
+\n\
+        for lib, port in zip(self.libs, self.ports):\n\
+            if lib._reader is None:\n\
+                lib.start_reader(port)\n\
+\n\
+    def stop(self, timeout=None):\n\
+\n\
+        """Stop all reader threads; returns True once all have exited."""\n\
+\n\
+        stopped = True\n\
+        for lib in self.libs:\n\
+            stopped = lib.stop(timeout) and stopped\n\
+        return stopped\n\
+\n\
+    def get(self, timeout=None):\n\
+\n\
+        """Return the next (timestamp, adapter index, name, args) in timestamp order.\n\
+\n\
+        timestamp is time.monotonic() when the event was parsed. Raises\n\
+        queue.Empty if nothing is ready within timeout seconds (None waits\n\
+        forever).\n\
+        """\n\
+\n\
+        deadline = None if timeout is None else time.monotonic() + timeout\n\
+        while 1:\n\
+            now = time.monotonic()\n\
+            if self._pending:\n\
+                ready = self._pending[0][0] + self.reorder_delay\n\
+                if ready <= now:\n\
+                    return heapq.heappop(self._pending)[2]\n\
+                wait = ready - now\n\
+                if deadline is not None:\n\
+                    wait = min(wait, deadline - now)\n\
+            elif deadline is not None:\n\
+                wait = deadline - now\n\
+            else:\n\
+                wait = None\n\
+            if wait is not None and wait <= 0:\n\
+                raise queue.Empty\n\
+            try:\n\
+                item = self._queue.get(True, wait)\n\
+            except queue.Empty:\n\
+                continue\n\
+            while 1:\n\
+                heapq.heappush(self._pending, (item[0], next(self._sequence), item))\n\
+                try:\n\
+                    item = self._queue.get_nowait()\n\
+                except queue.Empty:\n\
+                    break\n\
+\n\
+    def __iter__(self):\n\
+        while 1:\n\
+            yield self.get()\n\
+\n\
+    def start_scan(self, scan_interval=0x4b, active=0, mode=2, timeout=1):\n\
+\n\
+        """Start discovery on every adapter with staggered scan windows.\n\
+\n\
+        Each of the N adapters scans for 1/N of every scan_interval (in units\n\
+        of 0.625 ms, at least 4 units), and adapter i starts i/N of an\n\
+        interval after the first, so that together the windows cover the\n\
+        interval once instead of all adapters listening at the same time.\n\
+        mode is the gap_discover mode (2 = observation). Starts the reader\n\
+        threads if needed; returns the gap_discover response args of every\n\
+        adapter.\n\
+        """\n\
+\n\
+        self.start()\n\
+        count = len(self.libs)\n\
+        window = max(4, scan_interval // count)\n\
+        for lib, port in zip(self.libs, self.ports):\n\
+            lib.call(port, lib.ble_cmd_gap_set_scan_parameters(scan_interval, window, active), timeout)\n\
+        start = time.monotonic()\n\
+        futures = []\n\
+        for index, (lib, port) in enumerate(zip(self.libs, self.ports)):\n\
+            delay = start + index * scan_interval * 0.000625 / count - time.monotonic()\n\
+            if delay > 0:\n\
+                time.sleep(delay)\n\
+            futures.append(lib.submit(port, lib.ble_cmd_gap_discover(mode)))\n\
+        return [future.result(timeout) for future in futures]\n\
+\n\
+    def end_scan(self, timeout=1):\n\
+\n\
+        """Stop discovery on every adapter; returns their response args."""\n\
+\n\
+        return [lib.call(port, lib.ble_cmd_gap_end_procedure(), timeout) for lib, port in zip(self.libs, self.ports)]\n\
+\n\
+class BGAPIRing(object):\n\
+\n\
+    """Fixed-size record ring buffer in multiprocessing shared memory.\n\
+\n\
+    One process writes records with put() and one other process reads them\n\
+    with drain(). The write and read positions live in the shared block\n\
+    itself, so no lock or pipe is involved. Each record is a tuple of the\n\
+    fields named in BGAPIRing.fields:\n\
+\n\
+        timestamp     time.monotonic() when the packet was decoded\n\
+        adapter       adapter index given to put()\n\
+        kind          SCAN_RESPONSE, ATTRIBUTE_VALUE, CONNECTION_STATUS or DISCONNECTED\n\
+        connection    connection handle, 0xff for scan responses\n\
+        address_type  remote address type\n\
+        rssi          scan response RSSI\n\
+        flags         packet type, attribute value type or connection flags\n\
+        handle        attribute handle, connection interval or disconnect reason\n\
+        address       6-byte remote address\n\
+        length        full length of data\n\
+        data          the first data_size bytes of data, zero padded\n\
+\n\
+    When the ring is full, put() drops the record and counts it in dropped.\n\
+    """\n\
+\n\
+    SCAN_RESPONSE = 1\n\
+    ATTRIBUTE_VALUE = 2\n\
+    CONNECTION_STATUS = 3\n\
+    DISCONNECTED = 4\n\
+\n\
+    fields = (\'timestamp\', \'adapter\', \'kind\', \'connection\', \'address_type\', \'rssi\', \'flags\', \'handle\', \'address\', \'length\', \'data\')\n\
+\n\
+    # write position, dropped count | read position (in its own cache line)\n\
+    _header = 128\n\
+\n\
+    def __init__(self, slots=4096, data_size=64, name=None):\n\
+        self.slots = slots\n\
+        self.data_size = data_size\n\
+        self.record = struct.Struct(\'<dBBBBbBH6sH%ds\' % data_size)\n\
+        if name is None:\n\
+            self.shm = shared_memory.SharedMemory(create=True, size=self._header + slots * self.record.size)\n\
+            self.shm.buf[:self._header] = bytes(self._header)\n\
+        else:\n\
+            self.shm = shared_memory.SharedMemory(name=name)\n\
+        self.name = self.shm.name\n\
+        self.owner = name is None\n\
+        self._position = struct.Struct(\'<Q\')\n\
+\n\
+    @property\n\
+    def dropped(self):\n\
+        return self._position.unpack_from(self.shm.buf, 8)[0]\n\
+\n\
+    def put(self, adapter, kind, connection, address_type, rssi, flags, handle, address, data):\n\
+\n\
+        """Append a record; returns False if the ring was full and it was dropped."""\n\
+\n\
+        buf = self.shm.buf\n\
+        position = self._position\n\
+        write = position.unpack_from(buf, 0)[0]\n\
+        if write - position.unpack_from(buf, 64)[0] >= self.slots:\n\
+            position.pack_into(buf, 8, position.unpack_from(buf, 8)[0] + 1)\n\
+            return False\n\
+        self.record.pack_into(buf, self._header + (write % self.slots) * self.record.size, time.monotonic(), adapter, kind, connection, address_type, rssi, flags, handle, address, len(data), data)\n\
+        # publish the record only after it has been written\n\
+        position.pack_into(buf, 0, write + 1)\n\
+        return True\n\
+\n\
+    def drain(self, max_items=None):\n\
+\n\
+        """Remove and return up to max_items (all if None) records, oldest first."""\n\
+\n\
+        buf = self.shm.buf\n\
+        position = self._position\n\
+        read = position.unpack_from(buf, 64)[0]\n\
+        count = position.unpack_from(buf, 0)[0] - read\n\
+        if max_items is not None:\n\
+            count = min(count, max_items)\n\
+        if count <= 0:\n\
+            return []\n\
+        size = self.record.size\n\
+        first = read % self.slots\n\
+        # at most two contiguous runs, before and after the wrap\n\
+        head = min(count, self.slots - first)\n\
+        records = list(self.record.iter_unpack(buf[self._header + first * size:self._header + (first + head) * size]))\n\
+        if head < count:\n\
+            records.extend(self.record.iter_unpack(buf[self._header:self._header + (count - head) * size]))\n\
+        position.pack_into(buf, 64, read + count)\n\
+        return records\n\
+\n\
+    def close(self):\n\
+\n\
+        """Detach from the shared memory, and free it if this object created it."""\n\
+\n\
+        self.shm.close()\n\
+        if self.owner:\n\
+            self.shm.unlink()\n\
+\n\
+\n\
+def _open_serial_port(port):\n\
+    import serial\n\
+    return serial.Serial(port, 115200, timeout=0.1)\n\
+\n\
+\n\
+def _run_ring_reader(ring_name, slots, data_size, adapter, port, opener, commands, stop, errors):\n\
+\n\
+    """(internal use) Body of a BGLibProcessPool adapter process."""\n\
+\n\
+    ring = BGAPIRing(slots, data_size, ring_name)\n\
+    ser = None\n\
+    try:\n\
+        ser = opener(port)\n\
+        lib = BGLib()\n\
+        _ring_subscribe(lib, ring, adapter)\n\
+        for packet in commands:\n\
+            lib.call(ser, packet)\n\
+        while not stop.is_set():\n\
+            x = ser.read(ser.inWaiting() or 1)\n\
+            if len(x) > 0:\n\
+                lib.parse_bytes(x)\n\
+    except Exception:\n\
+        # tell the parent why this adapter stopped; drain() raises it there\n\
+        errors.put((adapter, traceback.format_exc()))\n\
+        raise\n\
+    finally:\n\
+        if ser is not None:\n\
+            ser.close()\n\
+        ring.shm.close()\n\
+\n\
+\n\
+class BGLibProcessPool(object):\n\
+\n\
+    """Several adapters, each read and decoded in a process of its own.\n\
+\n\
+    For when one process (and its GIL) cannot keep up with the adapters.\n\
+    Each adapter process opens its port with opener(port) (by default a\n\
+    pyserial Serial at 115200 baud), sends the given command packets, e.g.\n\
+    scan parameters and gap_discover, and from then on writes scan\n\
+    responses, attribute values and connection status changes to its own\n\
+    BGAPIRing as fixed-size records. drain() collects them in the main\n\
+    process in batches. opener must be picklable, e.g. a module-level\n\
+    function or functools.partial(serial.Serial, baudrate=...).\n\
+\n\
+    If an adapter process fails, for instance because its port cannot be\n\
+    opened or a setup command times out, the next drain() raises a\n\
+    RuntimeError carrying the traceback from that process.\n\
+    """\n\
+\n\
+    def __init__(self, ports, opener=None, commands=(), slots=4096, data_size=64):\n\
+        self.ports = list(ports)\n\
+        self.rings = [BGAPIRing(slots, data_size) for port in self.ports]\n\
+        self._stop = multiprocessing.Event()\n\
+        self._errors = multiprocessing.Queue()\n\
+        self.processes = [multiprocessing.Process(\n\
+            target=_run_ring_reader,\n\
+            args=(ring.name, slots, data_size, index, port, opener or _open_serial_port, list(commands), self._stop, self._errors),\n\
+            name=\'BGLib adapter %d\' % index,\n\
+            daemon=True) for index, (ring, port) in enumerate(zip(self.rings, self.ports))]\n\
+\n\
+    def start(self):\n\
+        for process in self.processes:\n\
+            process.start()\n\
+\n\
+    def drain(self, max_items=None, sort=False):\n\
+\n\
+        """Return the records waiting in all rings (see BGAPIRing) as one list.\n\
+\n\
+        max_items limits the records taken from each ring. With sort set the\n\
+        list is put in timestamp order; otherwise it holds each adapter\'s\n\
+        records in order, one adapter after another.\n\
+        """\n\
+\n\
+        try:\n\
+            adapter, error = self._errors.get_nowait()\n\
+        except queue.Empty:\n\
+            pass\n\
+        else:\n\
+            raise RuntimeError(\'BGLib adapter %d (%s) failed:\\n%s\' % (adapter, self.ports[adapter], error))\n\
+        records = []\n\
+        for ring in self.rings:\n\
+            records.extend(ring.drain(max_items))\n\
+        if sort:\n\
+            records.sort(key=lambda record: record[0])\n\
+        return records\n\
+\n\
+    def stop(self, timeout=None):\n\
+\n\
+        """Stop the adapter processes; returns True once all have exited."""\n\
+\n\
+        self._stop.set()\n\
+        for process in self.processes:\n\
+            process.join(timeout)\n\
+        return not any(process.is_alive() for process in self.processes)\n\
+\n\
+    def close(self):\n\
+\n\
+        """Stop the adapter processes and free the rings."""\n\
+\n\
+        if not self.stop(1):\n\
+            for process in self.processes:\n\
+                process.terminate()\n\
+        for ring in self.rings:\n\
+            ring.close()\n\
+\n\
+\n\
+def _ring_subscribe(lib, ring, adapter):\n\
+\n\
+    """(internal use) Write the events kept by BGLibProcessPool to ring."""\n\
+\n\
+    def scan_response(sender, args):\n\
+        ring.put(adapter, BGAPIRing.SCAN_RESPONSE, 0xff, args.address_type, args.rssi, args.packet_type, 0, args.sender, args.data)\n\
+    def attribute_value(sender, args):\n\
+        ring.put(adapter, BGAPIRing.ATTRIBUTE_VALUE, args.connection, 0, 0, args.type, args.atthandle, b\'\', args.value)\n\
+    def connection_status(sender, args):\n\
+        # timeout, latency and bonding go in data\n\
+        ring.put(adapter, BGAPIRing.CONNECTION_STATUS, args.connection, args.address_type, 0, args.flags, args.conn_interval, args.address, struct.pack(\'<HHB\', args.timeout, args.latency, args.bonding))\n\
+    def disconnected(sender, args):\n\
+        ring.put(adapter, BGAPIRing.DISCONNECTED, args.connection, 0, 0, 0, args.reason, b\'\', b\'\')\n\
+    lib.ble_evt_gap_scan_response += scan_response\n\
+    lib.ble_evt_attclient_attribute_value += attribute_value\n\
+    lib.ble_evt_connection_status += connection_status\n\
+    lib.ble_evt_connection_disconnected += disconnected\n\
+\n\
+class BGAPIBridge(object):\n\
+\n\
+    """Share one adapter among several clients over TCP or a Unix socket.\n\
+\n\
+    The bridge owns the port: it runs a BGLib reader thread on it and speaks\n\
+    plain BGAPI to its clients, so a client is an ordinary BGLib used with\n\
+    a BGAPISocketPort, or an AsyncBGLib connected with\n\
+    loop.create_connection(). Commands from all clients go through\n\
+    BGLib.submit()\'s queue, so they reach the adapter one at a time, and\n\
+    each response is sent only to the client whose command it answers.\n\
+    Events are passed on undecoded to every client, or only to those that\n\
+    subscribed to their class or (class, command) pair with a\n\
+    subscribe_frame(). A client whose send buffer is over max_buffer bytes\n\
+    misses events until it catches up. Commands still unanswered\n\
+    command_timeout seconds after they arrived are dropped, and so is a\n\
+    response that arrives for one of them later.\n\
+    """\n\
+\n\
+    # first header byte of bridge control frames (message type 0, technology type 1111)\n\
+    CONTROL = 0x78\n\
+\n\
+    def __init__(self, ser, command_timeout=1, max_buffer=1 << 20):\n\
+        self.ser = ser\n\
+        self.lib = BGLib()\n\
+        self.command_timeout = command_timeout\n\
+        self.max_buffer = max_buffer\n\
+        self.clients = set()\n\
+        self._command_clients = {}\n\
+        self._loop = None\n\
+        self.lib.on_raw_frame += self._raw_frame\n\
+\n\
+    @staticmethod\n\
+    def subscribe_frame(*filters):\n\
+\n\
+        """Return the control frame that limits a client to the given events.\n\
+\n\
+        filters are class IDs and (class ID, command ID) pairs; with none, the\n\
+        client gets all events again (as it does before subscribing).\n\
+        """\n\
+\n\
+        payload = []\n\
+        for item in filters:\n\
+            if isinstance(item, tuple):\n\
+                payload.extend(item)\n\
+            else:\n\
+                payload.extend((item, 0xff))\n\
+        return bytes([BGAPIBridge.CONTROL, len(payload), 0, 0] + payload)\n\
+\n\
+    async def start(self, address):\n\
+\n\
+        """Start the reader thread and listen on address, a (host, port) pair\n\
+        for TCP or a path for a Unix socket; returns the asyncio server."""\n\
+\n\
+        self._loop = asyncio.get_running_loop()\n\
+        if self.lib._reader is None:\n\
+            self.lib.start_reader(self.ser)\n\
+        if isinstance(address, str):\n\
+            return await self._loop.create_unix_server(lambda: _BridgeClient(self), address)\n\
+        return await self._loop.create_server(lambda: _BridgeClient(self), address[0], address[1])\n\
+\n\
+    def serve_forever(self, address):\n\
+\n\
+        """Run the bridge on address (see start()) until interrupted."""\n\
+\n\
+        async def serve():\n\
+            server = await self.start(address)\n\
+            async with server:\n\
+                await server.serve_forever()\n\
+        try:\n\
+            asyncio.run(serve())\n\
+        except KeyboardInterrupt:\n\
+            pass\n\
+        finally:\n\
+            self.lib.stop(1)\n\
+\n\
+    def _command(self, client, packet):\n\
+\n\
+        """(internal use) Queue a command packet from a client."""\n\
+\n\
+        future = concurrent.futures.Future()\n\
+        self._command_clients[future] = (client, packet[2], packet[3])\n\
+        self._loop.call_later(self.command_timeout, self._expire_command, future)\n\
+        self.lib._queue_command(self.ser, packet, future)\n\
+\n\
+    def _expire_command(self, future):\n\
+        self._command_clients.pop(future, None)\n\
+        future.cancel()\n\
+\n\
+    def _raw_frame(self, sender, frame):\n\
+\n\
+        """(internal use) Pass a received packet on, from the reader thread."""\n\
+\n\
+        header = frame.header\n\
+        data = bytes(header) + bytes(frame.payload)\n\
+        if header[0] & 0x80:\n\
+            self._loop.call_soon_threadsafe(self._fan_out, header[2], header[3], data)\n\
+            return\n\
+        # a response, to the oldest command waiting for it (resolved right\n\
+        # after this); None in its place marks one that has been dropped\n\
+        waiters = self.lib._response_waiters.get((header[2], header[3]))\n\
+        command = self._command_clients.pop(waiters[0], None) if waiters else None\n\
+        if command is not None and command[1:] == (header[2], header[3]):\n\
+            self._loop.call_soon_threadsafe(command[0].send, data)\n\
+\n\
+    def _fan_out(self, packet_class, packet_command, data):\n\
+        for client in self.clients:\n\
+            filters = client.filters\n\
+            if filters is None or packet_class in filters or (packet_class, packet_command) in filters:\n\
+                if client.transport.get_write_buffer_size() > self.max_buffer:\n\
+                    client.dropped += 1\n\
+                else:\n\
+                    client.send(data)\n\
+\n\
+\n\
+class _BridgeClient(asyncio.Protocol):\n\
+\n\
+    """(internal use) One client connection of a BGAPIBridge."""\n\
+\n\
+    def __init__(self, bridge):\n\
+        self.bridge = bridge\n\
+        self.transport = None\n\
+        self.filters = None\n\
+        self.dropped = 0\n\
+        self.buffer = b""\n\
+\n\
+    def connection_made(self, transport):\n\
+        self.transport = transport\n\
+        self.bridge.clients.add(self)\n\
+\n\
+    def connection_lost(self, exc):\n\
+        self.bridge.clients.discard(self)\n\
+        for future, command in list(self.bridge._command_clients.items()):\n\
+            if command[0] is self:\n\
+                self.bridge._expire_command(future)\n\
+\n\
+    def send(self, data):\n\
+        if not self.transport.is_closing():\n\
+            self.transport.write(data)\n\
+\n\
+    def data_received(self, data):\n\
+        buf = self.buffer + data\n\
+        pos = 0\n\
+        end = len(buf)\n\
+        while end - pos >= 4:\n\
+            length = 4 + (buf[pos] & 0x07) + buf[pos + 1]\n\
+            if end - pos < length:\n\
+                break\n\
+            if buf[pos] == BGAPIBridge.CONTROL:\n\
+                self._control(buf[pos + 2], buf[pos + 3], buf[pos + 4:pos + length])\n\
+            else:\n\
+                self.bridge._command(self, buf[pos:pos + length])\n\
+            pos += length\n\
+        self.buffer = buf[pos:]\n\
+\n\
+    def _control(self, control_class, control_command, payload):\n\
+        if control_class == 0 and control_command == 0:\n\
+            # subscribe\n\
+            if len(payload) == 0:\n\
+                self.filters = None\n\
+                return\n\
+            self.filters = set()\n\
+            for i in range(0, len(payload) - 1, 2):\n\
+                if payload[i + 1] == 0xff:\n\
+                    self.filters.add(payload[i])\n\
+                else:\n\
+                    self.filters.add((payload[i], payload[i + 1]))\n\
+\n\
+\n\
+class BGAPISocketPort(object):\n\
+\n\
+    """A socket connection to a BGAPIBridge that looks like a pyserial port.\n\
+\n\
+    It provides read(), write(), inWaiting(), fileno(), timeout, cancel_read()\n\
+    and close(), so the blocking BGLib API (check_activity(), call(),\n\
+    start_reader()) works over it unchanged:\n\
+\n\
+        port = BGAPISocketPort.connect((\'localhost\', 9000))\n\
+        port.subscribe(6)   # only gap events\n\
+        ble.call(port, ble.ble_cmd_gap_discover(1))\n\
+    """\n\
+\n\
+    def __init__(self, sock, timeout=None):\n\
+        self.sock = sock\n\
+        self.timeout = timeout\n\
+        self._buffer = b""\n\
+        self._wakeup_read, self._wakeup_write = socket.socketpair()\n\
+\n\
+    @classmethod\n\
+    def connect(cls, address, timeout=None):\n\
+\n\
+        """Connect to a bridge at a (host, port) pair or a Unix socket path."""\n\
+\n\
+        if isinstance(address, str):\n\
+            sock = socket.socket(socket.AF_UNIX)\n\
+            sock.connect(address)\n\
+        else:\n\
+            sock = socket.create_connection(address)\n\
+        return cls(sock, timeout)\n\
+\n\
+    def subscribe(self, *filters):\n\
+\n\
+        """Receive only the given events, see BGAPIBridge.subscribe_frame()."""\n\
+\n\
+        self.sock.sendall(BGAPIBridge.subscribe_frame(*filters))\n\
+\n\
+    def fileno(self):\n\
+        return self.sock.fileno()\n\
+\n\
+    def inWaiting(self):\n\
+        if len(self._buffer) == 0:\n\
+            self._fill(0)\n\
+        return len(self._buffer)\n\
+\n\
+    def read(self, size=1):\n\
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout\n\
+        while len(self._buffer) < size:\n\
+            remaining = None if deadline is None else deadline - time.monotonic()\n\
+            if remaining is not None and remaining <= 0:\n\
+                break\n\
+            if not self._fill(remaining):\n\
+                break\n\
+        data = self._buffer[:size]\n\
+        self._buffer = self._buffer[size:]\n\
+        return data\n\
+\n\
+    def _fill(self, timeout):\n\
+\n\
+        """(internal use) Wait up to timeout seconds for data; False if cancelled or timed out."""\n\
+\n\
+        readable = select.select([self.sock, self._wakeup_read], [], [], timeout)[0]\n\
+        if self._wakeup_read in readable:\n\
+            self._wakeup_read.recv(64)\n\
+            return False\n\
+        if not readable:\n\
+            return False\n\
+        data = self.sock.recv(65536)\n\
+        if len(data) == 0:\n\
+            raise ConnectionError(\'bridge closed the connection\')\n\
+        self._buffer += data\n\
+        return True\n\
+\n\
+    def write(self, data):\n\
+        self.sock.sendall(data)\n\
+        return len(data)\n\
+\n\
+    def cancel_read(self):\n\
+        self._wakeup_write.send(b"\\x00")\n\
+\n\
+    def close(self):\n\
+        self.sock.close()\n\
+        self._wakeup_read.close()\n\
+        self._wakeup_write.close()\n\
+\n\
+class BGAPISimulator(object):\n\
+\n\
+    """A simulated BLED112 or WF121 (BGAPI device) that answers every command and can stream events.\n\
+\n\
+    Generated from the same API definitions as BGLib. Every command frame\n\
+    received is answered with a well-formed response: all fields zero (so\n\
+    \'result\' is success) and arrays empty, unless responses[(class ID,\n\
+    command ID)] holds the payload to send instead, or a function of the\n\
+    command payload that returns it. push() sends one event and stream()\n\
+    sends events from a background thread at a given rate, for example\n\
+\n\
+        sim, path = BGAPISimulator.open_pty()\n\
+        sim.stream(\'ble_evt_gap_scan_response\', rate=20000)\n\
+\n\
+    then open path as the serial port. Event payloads default to random\n\
+    field values, with arrays of up to array_size random bytes.\n\
+    """\n\
+\n\
+    def __init__(self, read, write, seed=None):\n\
+        self._read = read\n\
+        self._write = write\n\
+        self._write_lock = threading.Lock()\n\
+        self._stop = threading.Event()\n\
+        self._close = None\n\
+        self.responses = {}\n\
+        self.array_size = 31\n\
+        self.random = random.Random(seed)\n\
+        self.names = dict((event.name, key) for key, (decoder, event) in BGLib.bgapi_rx_dispatch.items())\n\
+        self.threads = [threading.Thread(target=self._run_commands, name=\'BGAPI simulator\', daemon=True)]\n\
+        self.threads[0].start()\n\
+\n\
+    @classmethod\n\
+    def open_pty(cls, seed=None):\n\
+\n\
+        """Start a simulator on a new pseudo-terminal (POSIX only).\n\
+\n\
+        Returns the simulator and the path of the terminal to open as the\n\
+        serial port.\n\
+        """\n\
+\n\
+        import pty\n\
+        import tty\n\
+        master, slave = pty.openpty()\n\
+        tty.setraw(master)\n\
+        tty.setraw(slave)\n\
+        def read(timeout):\n\
+            if select.select([master], [], [], timeout)[0]:\n\
+                return os.read(master, 65536)\n\
+            return None\n\
+        def write(data):\n\
+            view = memoryview(data)\n\
+            while len(view) > 0:\n\
+                view = view[os.write(master, view):]\n\
+        sim = cls(read, write, seed)\n\
+        sim._close = lambda: (os.close(master), os.close(slave))\n\
+        return sim, os.ttyname(slave)\n\
+\n\
+    @classmethod\n\
+    def socket_pair(cls, seed=None):\n\
+\n\
+        """Start a simulator on one end of a socket pair; returns the simulator\n\
+        and the other end, e.g. for BGAPISocketPort(sock) or AsyncBGLib."""\n\
+\n\
+        device, host = socket.socketpair()\n\
+        def read(timeout):\n\
+            if select.select([device], [], [], timeout)[0]:\n\
+                return device.recv(65536)\n\
+            return None\n\
+        sim = cls(read, device.sendall, seed)\n\
+        sim._close = device.close\n\
+        return sim, host\n\
+\n\
+    def payload(self, key, randomize=True):\n\
+\n\
+        """Return a payload for the message with dispatch key key, with random\n\
+        field values if randomize is set, otherwise all zero."""\n\
+\n\
+        layout, has_array = self.layouts[key]\n\
+        size = struct.calcsize(layout)\n\
+        if not randomize:\n\
+            return bytes(size)\n\
+        data = self.random.getrandbits(8 * size).to_bytes(size, \'little\') if size > 0 else b""\n\
+        if has_array:\n\
+            length = self.random.randint(0, self.array_size)\n\
+            data = data[:-1] + bytes([length]) + self.random.getrandbits(8 * length).to_bytes(length, \'little\')\n\
+        return data\n\
+\n\
+    def frame(self, name, payload=None):\n\
+\n\
+        """Return the packet for the named event or response, with the given\n\
+        or a random payload."""\n\
+\n\
+        key = self.names[name]\n\
+        if payload is None:\n\
+            payload = self.payload(key)\n\
+        return bytes([key[0] | (len(payload) >> 8) & 0x07, len(payload) & 0xFF, key[1], key[2]]) + payload\n\
+\n\
+    def send(self, data):\n\
+\n\
+        """Write raw bytes to the host, between whole packets of other writers."""\n\
+\n\
+        with self._write_lock:\n\
+            self._write(data)\n\
+\n\
+    def push(self, name, payload=None):\n\
+\n\
+        """Send one event (or response), e.g. push(\'ble_evt_gap_scan_response\')."""\n\
+\n\
+        self.send(self.frame(name, payload))\n\
+\n\
+    def stream(self, events, rate=None, count=None):\n\
+\n\
+        """Send events from a background thread; returns the thread.\n\
+\n\
+        events is either a name, sent repeatedly with random payloads, or an\n\
+        iterable of (name, payload) pairs (payload None for random) that is\n\
+        played once. rate is in events per second, None for as fast as\n\
+        possible; count limits the number of events. Events due at the same\n\
+        time go out in one write. Runs until done or close().\n\
+        """\n\
+\n\
+        if isinstance(events, str):\n\
+            events = itertools.repeat((events, None))\n\
+        if count is not None:\n\
+            events = itertools.islice(events, count)\n\
+        thread = threading.Thread(target=self._run_stream, args=(iter(events), rate), name=\'BGAPI simulator stream\', daemon=True)\n\
+        self.threads.append(thread)\n\
+        thread.start()\n\
+        return thread\n\
+\n\
+    def close(self):\n\
+\n\
+        """Stop all threads and close the simulator\'s end of the connection."""\n\
+\n\
+        self._stop.set()\n\
+        for thread in self.threads:\n\
+            if thread is not threading.current_thread():\n\
+                thread.join(1)\n\
+        if self._close is not None:\n\
+            self._close()\n\
+            self._close = None\n\
+\n\
+    def _run_stream(self, events, rate):\n\
+        start = time.monotonic()\n\
+        sent = 0\n\
+        while not self._stop.is_set():\n\
+            if rate is None:\n\
+                wanted = 64\n\
+            else:\n\
+                # event n is due n / rate seconds after the start\n\
+                wanted = int((time.monotonic() - start) * rate) + 1 - sent\n\
+            if wanted > 0:\n\
+                batch = [self.frame(name, payload) for name, payload in itertools.islice(events, wanted)]\n\
+                if len(batch) > 0:\n\
+                    self.send(b"".join(batch))\n\
+                    sent += len(batch)\n\
+                if len(batch) < wanted:\n\
+                    # out of events\n\
+                    return\n\
+            if rate is not None:\n\
+                time.sleep(min(0.001, max(0, sent / rate - (time.monotonic() - start))))\n\
+\n\
+    def _run_commands(self):\n\
+        buf = b""\n\
+        while not self._stop.is_set():\n\
+            try:\n\
+                data = self._read(0.1)\n\
+            except OSError:\n\
+                return\n\
+            if data is None:\n\
+                continue\n\
+            if len(data) == 0:\n\
+                return\n\
+            buf += data\n\
+            pos = 0\n\
+            while len(buf) - pos >= 4:\n\
+                length = 4 + (buf[pos] & 0x07) + buf[pos + 1]\n\
+                if len(buf) - pos < length:\n\
+                    break\n\
+                self._answer(buf[pos:pos + length])\n\
+                pos += length\n\
+            buf = buf[pos:]\n\
+\n\
+    def _answer(self, command):\n\
+        key = (command[0] & 0xf8, command[2], command[3])\n\
+        if key not in self.layouts:\n\
+            return\n\
+        response = self.responses.get(key[1:])\n\
+        if response is None:\n\
+            payload = self.payload(key, False)\n\
+        elif callable(response):\n\
+            payload = response(command[4:])\n\
+        else:\n\
+            payload = response\n\
+        self.send(bytes([key[0] | (len(payload) >> 8) & 0x07, len(payload) & 0xFF, key[1], key[2]]) + payload)\n\
+\n\
+    # (message type and technology type, class ID, command ID) => (struct format of the payload, whether it ends in a uint8array)\n\
+    layouts = {\n\
+        ' + ('\n        '.join(ble_response_sim_entries + ble_event_sim_entries + wifi_response_sim_entries + wifi_event_sim_entries)) + '\n\
+    }\n\
+\n\
+class BGAPICapture(object):\n\
+\n\
+    """Timestamped capture of the raw bytes a BGLib receives and sends.\n\
+\n\
+    Used through BGLib.start_capture(). The file starts with MAGIC and then\n\
+    holds one record per chunk: a \'<dBI\' header (time.monotonic(), RX or\n\
+    TX, length) followed by the bytes. Read it back with BGAPIReplay.\n\
+    """\n\
+\n\
+    MAGIC = b"BGAPIcap"\n\
+    RX = 0\n\
+    TX = 1\n\
+\n\
+    _record = struct.Struct(\'<dBI\')\n\
+\n\
+    def __init__(self, file):\n\
+        if isinstance(file, (str, bytes, os.PathLike)):\n\
+            self.file = open(file, \'wb\')\n\
+            self._owned = True\n\
+        else:\n\
+            self.file = file\n\
+            self._owned = False\n\
+        self._lock = threading.Lock()\n\
+        self.file.write(self.MAGIC)\n\
+\n\
+    def write(self, direction, data):\n\
+        if len(data) == 0:\n\
+            return\n\
+        with self._lock:\n\
+            self.file.write(self._record.pack(time.monotonic(), direction, len(data)))\n\
+            self.file.write(data)\n\
+\n\
+    def close(self):\n\
+        with self._lock:\n\
+            if self._owned:\n\
+                self.file.close()\n\
+            else:\n\
+                self.file.flush()\n\
+\n\
+\n\
+class BGAPIReplay(object):\n\
+\n\
+    """Play back a BGAPICapture file.\n\
+\n\
+    records() gives every (timestamp, direction, data) record. chunks()\n\
+    gives the received chunks at their original pace, speed times faster,\n\
+    or as fast as possible with speed None, and is a valid source for\n\
+    BGLib.iter_frames() and iter_packets(). feed() passes them to a BGLib\'s\n\
+    parse_bytes(), so its handlers run as they did when the capture was\n\
+    made:\n\
+\n\
+        BGAPIReplay(\'scan.cap\').feed(ble, speed=10)\n\
+    """\n\
+\n\
+    def __init__(self, file):\n\
+        self.file = file\n\
+\n\
+    def records(self):\n\
+        record = BGAPICapture._record\n\
+        if isinstance(self.file, (str, bytes, os.PathLike)):\n\
+            f = open(self.file, \'rb\')\n\
+        else:\n\
+            f = self.file\n\
+        try:\n\
+            if f.read(len(BGAPICapture.MAGIC)) != BGAPICapture.MAGIC:\n\
+                raise ValueError(\'not a BGAPI capture file\')\n\
+            while 1:\n\
+                header = f.read(record.size)\n\
+                if len(header) < record.size:\n\
+                    return\n\
+                timestamp, direction, length = record.unpack(header)\n\
+                yield timestamp, direction, f.read(length)\n\
+        finally:\n\
+            if f is not self.file:\n\
+                f.close()\n\
+\n\
+    def chunks(self, speed=1, direction=BGAPICapture.RX):\n\
+        start = None\n\
+        for timestamp, chunk_direction, data in self.records():\n\
+            if chunk_direction != direction:\n\
+                continue\n\
+            if speed:\n\
+                if start is None:\n\
+                    start = (timestamp, time.monotonic())\n\
+                delay = (timestamp - start[0]) / speed - (time.monotonic() - start[1])\n\
+                if delay > 0:\n\
+                    time.sleep(delay)\n\
+            yield data\n\
+\n\
+    def feed(self, lib, speed=1):\n\
+\n\
+        """Parse the received chunks with lib; returns the number of bytes fed."""\n\
+\n\
+        count = 0\n\
+        for data in self.chunks(speed):\n\
+            lib.parse_bytes(data)\n\
+            count += len(data)\n\
+        return count\n\
+\n\
+def _detach_args(args):\n\
+\n\
+    """(internal use) Copy of args with zero_copy views replaced by bytes."""\n\
+\n\
+    return type(args)(*[bytes(value) if isinstance(value, memoryview) else value\n\
+                        for value in [getattr(args, name) for name in args.__slots__]])\n\
+\n\
+\n\
+class BGAPIExecutorHandler(object):\n\
+\n\
+    """Event handler that runs func on an executor instead of the parser thread.\n\
+\n\
+        pool = concurrent.futures.ThreadPoolExecutor(8)\n\
+        ble.ble_evt_attclient_attribute_value += BGAPIExecutorHandler(store_value, pool, key=\'connection\')\n\
+\n\
+    Calls with the same key run one at a time, in the order they arrived,\n\
+    and calls with different keys run in parallel. key is an argument name\n\
+    such as \'connection\' or \'sender\', a function of the args record, or\n\
+    None to run every call in order. func(sender, args) is called as usual,\n\
+    except that on a ProcessPoolExecutor sender is None, because a BGLib\n\
+    cannot be pickled; args records pickle as they are. With zero_copy, the\n\
+    uint8array fields are copied before they are queued.\n\
+\n\
+    Exceptions raised by func are counted in errors, and the last one is\n\
+    kept in last_error. wait() blocks until everything submitted so far has\n\
+    run.\n\
+    """\n\
+\n\
+    def __init__(self, func, executor, key=None):\n\
+        self.func = func\n\
+        self.executor = executor\n\
+        self.key = key\n\
+        self.errors = 0\n\
+        self.last_error = None\n\
+        self._pass_sender = not isinstance(executor, concurrent.futures.ProcessPoolExecutor)\n\
+        self._pending = {}\n\
+        self._condition = threading.Condition()\n\
+\n\
+    def __call__(self, sender, args):\n\
+        if getattr(sender, \'zero_copy\', False):\n\
+            args = _detach_args(args)\n\
+        if self.key is None:\n\
+            key = None\n\
+        elif callable(self.key):\n\
+            key = self.key(args)\n\
+        else:\n\
+            key = args[self.key]\n\
+        with self._condition:\n\
+            waiting = self._pending.get(key)\n\
+            if waiting is not None:\n\
+                # an earlier call with this key is still running\n\
+                waiting.append((sender, args))\n\
+                return\n\
+            self._pending[key] = deque()\n\
+        self._submit(key, sender, args)\n\
+\n\
+    def _submit(self, key, sender, args):\n\
+\n\
+        """(internal use) Run one call; the next one with this key follows when it is done."""\n\
+\n\
+        try:\n\
+            future = self.executor.submit(self.func, sender if self._pass_sender else None, args)\n\
+        except BaseException:\n\
+            # the executor refused the call, e.g. after shutdown(); release the\n\
+            # key and the calls queued behind it so wait() does not block\n\
+            with self._condition:\n\
+                del self._pending[key]\n\
+                self._condition.notify_all()\n\
+            raise\n\
+        future.add_done_callback(lambda future: self._done(key, future))\n\
+\n\
+    def _done(self, key, future):\n\
+\n\
+        """(internal use) Record the outcome of a call and submit the next one with its key."""\n\
+\n\
+        if not future.cancelled() and future.exception() is not None:\n\
+            self.errors += 1\n\
+            self.last_error = future.exception()\n\
+        with self._condition:\n\
+            waiting = self._pending[key]\n\
+            if not waiting:\n\
+                del self._pending[key]\n\
+                self._condition.notify_all()\n\
+                return\n\
+            sender, args = waiting.popleft()\n\
+        self._submit(key, sender, args)\n\
+\n\
+    def wait(self, timeout=None):\n\
+\n\
+        """Wait until no call is running or queued; returns False on timeout."""\n\
+\n\
+        with self._condition:\n\
+            return self._condition.wait_for(lambda: not self._pending, timeout)\n\
+\n\
+\n\
+class _BatchFlusher(object):\n\
+\n\
+    """(internal use) The one thread that delivers batches whose max_delay has passed."""\n\
+\n\
+    def __init__(self):\n\
+        self._condition = threading.Condition()\n\
+        # heap of (deadline, sequence number, handler)\n\
+        self._deadlines = []\n\
+        self._sequence = itertools.count()\n\
+        self._thread = None\n\
+\n\
+    def schedule(self, handler, deadline):\n\
+        with self._condition:\n\
+            heapq.heappush(self._deadlines, (deadline, next(self._sequence), handler))\n\
+            if self._thread is None:\n\
+                self._thread = threading.Thread(target=self._run, name=\'BGLib batch flusher\', daemon=True)\n\
+                self._thread.start()\n\
+            self._condition.notify()\n\
+\n\
+    def _run(self):\n\
+        while True:\n\
+            with self._condition:\n\
+                while True:\n\
+                    if not self._deadlines:\n\
+                        self._condition.wait()\n\
+                        continue\n\
+                    remaining = self._deadlines[0][0] - time.monotonic()\n\
+                    if remaining <= 0:\n\
+                        break\n\
+                    self._condition.wait(remaining)\n\
+                deadline, sequence, handler = heapq.heappop(self._deadlines)\n\
+            handler._flush(deadline)\n\
+\n\
+\n\
+_batch_flusher = _BatchFlusher()\n\
+\n\
+\n\
+class BGAPIBatchHandler(object):\n\
+\n\
+    """Event handler that collects decoded args and delivers them in batches.\n\
+\n\
+    Created by BGLib.on_batch(). func(sender, batch) gets a list of args\n\
+    records or, with columnar set, a dict of one list per field. A batch is\n\
+    delivered once it holds max_items records, or max_delay seconds after\n\
+    its first record arrived (from a thread shared by all batch handlers),\n\
+    whichever comes first.\n\
+    flush() delivers whatever is collected now. Deliveries never overlap\n\
+    and keep arrival order.\n\
+    """\n\
+\n\
+    def __init__(self, func, max_items=512, max_delay=0.05, columnar=False):\n\
+        self.func = func\n\
+        self.max_items = max_items\n\
+        self.max_delay = max_delay\n\
+        self.columnar = columnar\n\
+        self._items = []\n\
+        self._sender = None\n\
+        self._deadline = None\n\
+        self._lock = threading.Lock()\n\
+        self._flush_lock = threading.Lock()\n\
+\n\
+    def __call__(self, sender, args):\n\
+        if sender.zero_copy:\n\
+            args = _detach_args(args)\n\
+        with self._lock:\n\
+            self._items.append(args)\n\
+            self._sender = sender\n\
+            count = len(self._items)\n\
+            if count == 1 and self.max_delay is not None:\n\
+                self._deadline = time.monotonic() + self.max_delay\n\
+                _batch_flusher.schedule(self, self._deadline)\n\
+        if count >= self.max_items:\n\
+            self.flush()\n\
+\n\
+    def flush(self):\n\
+        self._flush(None)\n\
+\n\
+    def _flush(self, deadline):\n\
+\n\
+        """(internal use) Deliver the batch; with a deadline, only if it is\n\
+        still the batch that deadline was set for."""\n\
+\n\
+        with self._flush_lock:\n\
+            with self._lock:\n\
+                if deadline is not None and deadline != self._deadline:\n\
+                    return\n\
+                items, self._items = self._items, []\n\
+                self._deadline = None\n\
+            if not items:\n\
+                return\n\
+            if self.columnar:\n\
+                self.func(self._sender, {name: [args[name] for args in items] for name in items[0]._fields})\n\
             else:\n\
-                # 0x88 = wifi event packet\n\
-                ' + ('\n                '.join(wifi_event_callback_parser_conditions)) + '\n\
+                self.func(self._sender, items)\n\
 \n\
 # ================================================================\n\
 \n\
@@ -3,6 +3,41 @@
 """ Bluegiga BGAPI/BGLib implementation
 
 Changelog:
+    2026-10-18 - Added parse_bytes() for parsing whole read chunks in one pass
+               - Added buffered_read mode to check_activity()
+               - Replaced the if/elif parser chain with table-driven dispatch
+               - Decoders use precompiled struct.Struct objects and unpack_from()
+               - Added zero_copy mode passing memoryviews for uint8array fields
+               - Packets are not decoded for events without handlers
+               - Slotted per-message argument records (BGAPIArgs) replace event dicts
+               - Add iter_frames() and iter_packets() pull-style iterators
+               - Add on_raw_frame hook with raw_frame_filter and raw_frame_only
+               - Add resync mode with plausibility checks and partial-frame timeouts
+               - Add start_reader()/stop() background reader thread with optional event queue
+               - Add AsyncBGLib asyncio protocol with awaitable commands and event streams
+               - Add submit() response-correlated command queue
+               - Add blocking call() returning the matched response args
+               - Add BGLibPool for staggered scanning across several adapters
+               - Add BGLibProcessPool with per-adapter processes and BGAPIRing shared-memory records
+               - Add BGAPIBridge socket server and BGAPISocketPort client port
+               - Add send_many() for coalesced command writes
+               - Add BGAPISimulator device simulator generated from the API definitions
+               - Add start_capture() and BGAPIReplay for timestamped capture and replay
+               - Cache event handlers per object and fire them from a tuple, so dispatch no longer allocates per packet
+               - Add subscribe_attribute() to route notifications by connection and handle before decoding
+               - Add on_any() and off_any() for wildcard handlers on decoded messages or raw frames
+               - Add BGAPIExecutorHandler to run handlers on an executor, in order per key
+               - Add on_batch() to deliver an event in lists or columnar blocks
+               - parse_bytes() can be re-entered from handlers (e.g. send_command() followed by check_activity() or call())
+               - check_activity() called from a handler parses the rest of that handler's chunk first
+               - call() from a handler on the reader thread reads the port itself instead of waiting on the blocked reader
+               - The reader thread survives handler exceptions, clears itself when it exits and no longer spins on non-blocking ports
+               - zero_copy passes memoryviews on every parse path
+               - Resolving a command future no longer fails when it was cancelled on another thread
+               - Faster key lookup and membership tests on argument records
+               - send_many() keeps command order with submit() and call()
+               - raw_frame_only no longer stops submit() and call() from getting their responses
+               - Captures made through parse() store one record per packet instead of one per byte
     2013-05-04 - Fixed single-item struct.unpack returns (@zwasson on Github)
     2013-04-28 - Fixed numerous uint8array/bd_addr command arg errors
                - Added 'debug' support
@@ -46,7 +81,24 @@ __license__ = "MIT"
 __version__ = "2013-05-04"
 __email__ = "jeff@rowberg.net"
 
+import asyncio
+import concurrent.futures
+import heapq
+import itertools
+import multiprocessing
+import operator
+import os
+import queue
+import random
+import select
+import socket
 import struct
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Mapping
+from multiprocessing import shared_memory
 
 
 # thanks to Masaaki Shibata for Python event handler code
@@ -54,13 +106,27 @@ import struct
 
 class BGAPIEvent(object):
 
+    name = None
+    kind = None
+
     def __init__(self, doc=None):
         self.__doc__ = doc
 
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.kind = 'response' if '_rsp_' in name else 'event'
+
     def __get__(self, obj, objtype=None):
         if obj is None:
             return self
-        return BGAPIEventHandler(self, obj)
+        try:
+            return obj.__eventhandlers__[self]
+        except AttributeError:
+            obj.__eventhandlers__ = {}
+        except KeyError:
+            pass
+        handler = obj.__eventhandlers__[self] = BGAPIEventHandler(self, obj)
+        return handler
 
     def __set__(self, obj, value):
         pass
@@ -68,20 +134,40 @@ class BGAPIEvent(object):
 
 class BGAPIEventHandler(object):
 
+    """The handlers of one event on one object.
+
+    There is one of these per object and event, created on first access.
+    The handler functions are kept as a tuple that add() and remove()
+    replace, so fire() is a plain loop over it. The same tuple is stored
+    in obj.__eventhandler__, where the receive path looks it up to decide
+    whether a packet needs decoding at all.
+    """
+
     def __init__(self, event, obj):
 
         self.event = event
         self.obj = obj
+        try:
+            eventhandler = obj.__eventhandler__
+        except AttributeError:
+            eventhandler = obj.__eventhandler__ = {}
+        self.functions = eventhandler.get(event, ())
 
     def _getfunctionlist(self):
 
         """(internal use) """
 
-        try:
-            eventhandler = self.obj.__eventhandler__
-        except AttributeError:
-            eventhandler = self.obj.__eventhandler__ = {}
-        return eventhandler.setdefault(self.event, [])
+        return self.functions
+
+    def _setfunctionlist(self, functions):
+
+        """(internal use) """
+
+        self.functions = functions
+        if functions:
+            self.obj.__eventhandler__[self.event] = functions
+        else:
+            self.obj.__eventhandler__.pop(self.event, None)
 
     def add(self, func):
 
@@ -91,7 +177,7 @@ class BGAPIEventHandler(object):
         You can add handler also by using '+=' operator.
         """
 
-        self._getfunctionlist().append(func)
+        self._setfunctionlist(self.functions + (func,))
         return self
 
     def remove(self, func):
@@ -101,7 +187,9 @@ class BGAPIEventHandler(object):
         You can remove handler also by using '-=' operator.
         """
 
-        self._getfunctionlist().remove(func)
+        functions = list(self.functions)
+        functions.remove(func)
+        self._setfunctionlist(tuple(functions))
         return self
 
     def fire(self, earg=None):
@@ -112,7 +200,7 @@ class BGAPIEventHandler(object):
         e.fire(earg).
         """
 
-        for func in self._getfunctionlist():
+        for func in self.functions:
             func(self.obj, earg)
 
     __iadd__ = add
@@ -120,6 +208,1728 @@ class BGAPIEventHandler(object):
     __call__ = fire
 
 
+class BGAPIArgs(Mapping):
+
+    """Base class for the argument records passed to event handlers.
+
+    Each response and event has its own slotted subclass, so a record
+    costs no per-instance dict. Arguments can be read as attributes
+    (args.rssi) or, as before, by key (args['rssi']); a record compares
+    equal to a dict with the same items and dict(args) makes a copy.
+    Fields that would shadow a Mapping method (e.g. 'keys') are only
+    stored under a trailing underscore (args.keys_), but keep their
+    original key.
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _getters = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # key => attribute getter, so that args[key] is one dict lookup (an
+        # unknown key raises KeyError from it), and 'key in args' is the
+        # dict's own __contains__, which is called without self
+        cls._getters = {key: operator.attrgetter(key if key in cls.__slots__ else key + '_') for key in cls._fields}
+        cls.__contains__ = cls._getters.__contains__
+
+    def __getitem__(self, key):
+        return self._getters[key](self)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __repr__(self):
+        return type(self).__name__ + '(' + ', '.join(['%s=%r' % (key, self[key]) for key in self._fields]) + ')'
+
+
+class BGAPIRawFrame(BGAPIArgs):
+
+    """Undecoded packet passed to on_raw_frame handlers."""
+
+    __slots__ = _fields = ('header', 'payload')
+
+    def __init__(self, header, payload):
+        self.header = header
+        self.payload = payload
+
+
+# packet payload decoders and argument records, one per response and event
+class ble_rsp_system_reset_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_system_reset(rx_buf, rx_start, rx_end):
+    return ble_rsp_system_reset_args()
+class ble_rsp_system_hello_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_system_hello(rx_buf, rx_start, rx_end):
+    return ble_rsp_system_hello_args()
+class ble_rsp_system_address_get_args(BGAPIArgs):
+    __slots__ = _fields = ('address',)
+    def __init__(self, address):
+        self.address = address
+_struct_ble_rsp_system_address_get = struct.Struct('<6s')
+def _decode_ble_rsp_system_address_get(rx_buf, rx_start, rx_end):
+    address = _struct_ble_rsp_system_address_get.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_system_address_get_args(address)
+class ble_rsp_system_reg_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_system_reg_write = struct.Struct('<H')
+def _decode_ble_rsp_system_reg_write(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_system_reg_write.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_system_reg_write_args(result)
+class ble_rsp_system_reg_read_args(BGAPIArgs):
+    __slots__ = _fields = ('address', 'value')
+    def __init__(self, address, value):
+        self.address = address
+        self.value = value
+_struct_ble_rsp_system_reg_read = struct.Struct('<HB')
+def _decode_ble_rsp_system_reg_read(rx_buf, rx_start, rx_end):
+    address, value = _struct_ble_rsp_system_reg_read.unpack_from(rx_buf, rx_start)
+    return ble_rsp_system_reg_read_args(address, value)
+class ble_rsp_system_get_counters_args(BGAPIArgs):
+    __slots__ = _fields = ('txok', 'txretry', 'rxok', 'rxfail', 'mbuf')
+    def __init__(self, txok, txretry, rxok, rxfail, mbuf):
+        self.txok = txok
+        self.txretry = txretry
+        self.rxok = rxok
+        self.rxfail = rxfail
+        self.mbuf = mbuf
+_struct_ble_rsp_system_get_counters = struct.Struct('<BBBBB')
+def _decode_ble_rsp_system_get_counters(rx_buf, rx_start, rx_end):
+    txok, txretry, rxok, rxfail, mbuf = _struct_ble_rsp_system_get_counters.unpack_from(rx_buf, rx_start)
+    return ble_rsp_system_get_counters_args(txok, txretry, rxok, rxfail, mbuf)
+class ble_rsp_system_get_connections_args(BGAPIArgs):
+    __slots__ = _fields = ('maxconn',)
+    def __init__(self, maxconn):
+        self.maxconn = maxconn
+_struct_ble_rsp_system_get_connections = struct.Struct('<B')
+def _decode_ble_rsp_system_get_connections(rx_buf, rx_start, rx_end):
+    maxconn = _struct_ble_rsp_system_get_connections.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_system_get_connections_args(maxconn)
+class ble_rsp_system_read_memory_args(BGAPIArgs):
+    __slots__ = _fields = ('address', 'data')
+    def __init__(self, address, data):
+        self.address = address
+        self.data = data
+_struct_ble_rsp_system_read_memory = struct.Struct('<IB')
+def _decode_ble_rsp_system_read_memory(rx_buf, rx_start, rx_end):
+    address, data_len = _struct_ble_rsp_system_read_memory.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 5:rx_end]
+    return ble_rsp_system_read_memory_args(address, data_data)
+class ble_rsp_system_get_info_args(BGAPIArgs):
+    __slots__ = _fields = ('major', 'minor', 'patch', 'build', 'll_version', 'protocol_version', 'hw')
+    def __init__(self, major, minor, patch, build, ll_version, protocol_version, hw):
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        self.build = build
+        self.ll_version = ll_version
+        self.protocol_version = protocol_version
+        self.hw = hw
+_struct_ble_rsp_system_get_info = struct.Struct('<HHHHHBB')
+def _decode_ble_rsp_system_get_info(rx_buf, rx_start, rx_end):
+    major, minor, patch, build, ll_version, protocol_version, hw = _struct_ble_rsp_system_get_info.unpack_from(rx_buf, rx_start)
+    return ble_rsp_system_get_info_args(major, minor, patch, build, ll_version, protocol_version, hw)
+class ble_rsp_system_endpoint_tx_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_system_endpoint_tx = struct.Struct('<H')
+def _decode_ble_rsp_system_endpoint_tx(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_system_endpoint_tx.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_system_endpoint_tx_args(result)
+class ble_rsp_system_whitelist_append_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_system_whitelist_append = struct.Struct('<H')
+def _decode_ble_rsp_system_whitelist_append(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_system_whitelist_append.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_system_whitelist_append_args(result)
+class ble_rsp_system_whitelist_remove_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_system_whitelist_remove = struct.Struct('<H')
+def _decode_ble_rsp_system_whitelist_remove(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_system_whitelist_remove.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_system_whitelist_remove_args(result)
+class ble_rsp_system_whitelist_clear_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_system_whitelist_clear(rx_buf, rx_start, rx_end):
+    return ble_rsp_system_whitelist_clear_args()
+class ble_rsp_system_endpoint_rx_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'data')
+    def __init__(self, result, data):
+        self.result = result
+        self.data = data
+_struct_ble_rsp_system_endpoint_rx = struct.Struct('<HB')
+def _decode_ble_rsp_system_endpoint_rx(rx_buf, rx_start, rx_end):
+    result, data_len = _struct_ble_rsp_system_endpoint_rx.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 3:rx_end]
+    return ble_rsp_system_endpoint_rx_args(result, data_data)
+class ble_rsp_system_endpoint_set_watermarks_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_system_endpoint_set_watermarks = struct.Struct('<H')
+def _decode_ble_rsp_system_endpoint_set_watermarks(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_system_endpoint_set_watermarks.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_system_endpoint_set_watermarks_args(result)
+class ble_rsp_flash_ps_defrag_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_flash_ps_defrag(rx_buf, rx_start, rx_end):
+    return ble_rsp_flash_ps_defrag_args()
+class ble_rsp_flash_ps_dump_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_flash_ps_dump(rx_buf, rx_start, rx_end):
+    return ble_rsp_flash_ps_dump_args()
+class ble_rsp_flash_ps_erase_all_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_flash_ps_erase_all(rx_buf, rx_start, rx_end):
+    return ble_rsp_flash_ps_erase_all_args()
+class ble_rsp_flash_ps_save_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_flash_ps_save = struct.Struct('<H')
+def _decode_ble_rsp_flash_ps_save(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_flash_ps_save.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_flash_ps_save_args(result)
+class ble_rsp_flash_ps_load_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'value')
+    def __init__(self, result, value):
+        self.result = result
+        self.value = value
+_struct_ble_rsp_flash_ps_load = struct.Struct('<HB')
+def _decode_ble_rsp_flash_ps_load(rx_buf, rx_start, rx_end):
+    result, value_len = _struct_ble_rsp_flash_ps_load.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 3:rx_end]
+    return ble_rsp_flash_ps_load_args(result, value_data)
+class ble_rsp_flash_ps_erase_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_flash_ps_erase(rx_buf, rx_start, rx_end):
+    return ble_rsp_flash_ps_erase_args()
+class ble_rsp_flash_erase_page_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_flash_erase_page = struct.Struct('<H')
+def _decode_ble_rsp_flash_erase_page(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_flash_erase_page.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_flash_erase_page_args(result)
+class ble_rsp_flash_write_words_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_flash_write_words(rx_buf, rx_start, rx_end):
+    return ble_rsp_flash_write_words_args()
+class ble_rsp_attributes_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_attributes_write = struct.Struct('<H')
+def _decode_ble_rsp_attributes_write(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_attributes_write.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_attributes_write_args(result)
+class ble_rsp_attributes_read_args(BGAPIArgs):
+    __slots__ = _fields = ('handle', 'offset', 'result', 'value')
+    def __init__(self, handle, offset, result, value):
+        self.handle = handle
+        self.offset = offset
+        self.result = result
+        self.value = value
+_struct_ble_rsp_attributes_read = struct.Struct('<HHHB')
+def _decode_ble_rsp_attributes_read(rx_buf, rx_start, rx_end):
+    handle, offset, result, value_len = _struct_ble_rsp_attributes_read.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 7:rx_end]
+    return ble_rsp_attributes_read_args(handle, offset, result, value_data)
+class ble_rsp_attributes_read_type_args(BGAPIArgs):
+    __slots__ = _fields = ('handle', 'result', 'value')
+    def __init__(self, handle, result, value):
+        self.handle = handle
+        self.result = result
+        self.value = value
+_struct_ble_rsp_attributes_read_type = struct.Struct('<HHB')
+def _decode_ble_rsp_attributes_read_type(rx_buf, rx_start, rx_end):
+    handle, result, value_len = _struct_ble_rsp_attributes_read_type.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 5:rx_end]
+    return ble_rsp_attributes_read_type_args(handle, result, value_data)
+class ble_rsp_attributes_user_read_response_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_attributes_user_read_response(rx_buf, rx_start, rx_end):
+    return ble_rsp_attributes_user_read_response_args()
+class ble_rsp_attributes_user_write_response_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_attributes_user_write_response(rx_buf, rx_start, rx_end):
+    return ble_rsp_attributes_user_write_response_args()
+class ble_rsp_connection_disconnect_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_connection_disconnect = struct.Struct('<BH')
+def _decode_ble_rsp_connection_disconnect(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_connection_disconnect.unpack_from(rx_buf, rx_start)
+    return ble_rsp_connection_disconnect_args(connection, result)
+class ble_rsp_connection_get_rssi_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'rssi')
+    def __init__(self, connection, rssi):
+        self.connection = connection
+        self.rssi = rssi
+_struct_ble_rsp_connection_get_rssi = struct.Struct('<Bb')
+def _decode_ble_rsp_connection_get_rssi(rx_buf, rx_start, rx_end):
+    connection, rssi = _struct_ble_rsp_connection_get_rssi.unpack_from(rx_buf, rx_start)
+    return ble_rsp_connection_get_rssi_args(connection, rssi)
+class ble_rsp_connection_update_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_connection_update = struct.Struct('<BH')
+def _decode_ble_rsp_connection_update(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_connection_update.unpack_from(rx_buf, rx_start)
+    return ble_rsp_connection_update_args(connection, result)
+class ble_rsp_connection_version_update_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_connection_version_update = struct.Struct('<BH')
+def _decode_ble_rsp_connection_version_update(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_connection_version_update.unpack_from(rx_buf, rx_start)
+    return ble_rsp_connection_version_update_args(connection, result)
+class ble_rsp_connection_channel_map_get_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'map')
+    def __init__(self, connection, map):
+        self.connection = connection
+        self.map = map
+_struct_ble_rsp_connection_channel_map_get = struct.Struct('<BB')
+def _decode_ble_rsp_connection_channel_map_get(rx_buf, rx_start, rx_end):
+    connection, map_len = _struct_ble_rsp_connection_channel_map_get.unpack_from(rx_buf, rx_start)
+    map_data = rx_buf[rx_start + 2:rx_end]
+    return ble_rsp_connection_channel_map_get_args(connection, map_data)
+class ble_rsp_connection_channel_map_set_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_connection_channel_map_set = struct.Struct('<BH')
+def _decode_ble_rsp_connection_channel_map_set(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_connection_channel_map_set.unpack_from(rx_buf, rx_start)
+    return ble_rsp_connection_channel_map_set_args(connection, result)
+class ble_rsp_connection_features_get_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_connection_features_get = struct.Struct('<BH')
+def _decode_ble_rsp_connection_features_get(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_connection_features_get.unpack_from(rx_buf, rx_start)
+    return ble_rsp_connection_features_get_args(connection, result)
+class ble_rsp_connection_get_status_args(BGAPIArgs):
+    __slots__ = _fields = ('connection',)
+    def __init__(self, connection):
+        self.connection = connection
+_struct_ble_rsp_connection_get_status = struct.Struct('<B')
+def _decode_ble_rsp_connection_get_status(rx_buf, rx_start, rx_end):
+    connection = _struct_ble_rsp_connection_get_status.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_connection_get_status_args(connection)
+class ble_rsp_connection_raw_tx_args(BGAPIArgs):
+    __slots__ = _fields = ('connection',)
+    def __init__(self, connection):
+        self.connection = connection
+_struct_ble_rsp_connection_raw_tx = struct.Struct('<B')
+def _decode_ble_rsp_connection_raw_tx(rx_buf, rx_start, rx_end):
+    connection = _struct_ble_rsp_connection_raw_tx.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_connection_raw_tx_args(connection)
+class ble_rsp_attclient_find_by_type_value_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_find_by_type_value = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_find_by_type_value(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_find_by_type_value.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_find_by_type_value_args(connection, result)
+class ble_rsp_attclient_read_by_group_type_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_read_by_group_type = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_read_by_group_type(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_read_by_group_type.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_read_by_group_type_args(connection, result)
+class ble_rsp_attclient_read_by_type_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_read_by_type = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_read_by_type(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_read_by_type.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_read_by_type_args(connection, result)
+class ble_rsp_attclient_find_information_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_find_information = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_find_information(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_find_information.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_find_information_args(connection, result)
+class ble_rsp_attclient_read_by_handle_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_read_by_handle = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_read_by_handle(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_read_by_handle.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_read_by_handle_args(connection, result)
+class ble_rsp_attclient_attribute_write_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_attribute_write = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_attribute_write(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_attribute_write.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_attribute_write_args(connection, result)
+class ble_rsp_attclient_write_command_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_write_command = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_write_command(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_write_command.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_write_command_args(connection, result)
+class ble_rsp_attclient_indicate_confirm_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_attclient_indicate_confirm = struct.Struct('<H')
+def _decode_ble_rsp_attclient_indicate_confirm(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_attclient_indicate_confirm.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_attclient_indicate_confirm_args(result)
+class ble_rsp_attclient_read_long_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_read_long = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_read_long(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_read_long.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_read_long_args(connection, result)
+class ble_rsp_attclient_prepare_write_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_prepare_write = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_prepare_write(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_prepare_write.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_prepare_write_args(connection, result)
+class ble_rsp_attclient_execute_write_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_execute_write = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_execute_write(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_execute_write.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_execute_write_args(connection, result)
+class ble_rsp_attclient_read_multiple_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result')
+    def __init__(self, connection, result):
+        self.connection = connection
+        self.result = result
+_struct_ble_rsp_attclient_read_multiple = struct.Struct('<BH')
+def _decode_ble_rsp_attclient_read_multiple(rx_buf, rx_start, rx_end):
+    connection, result = _struct_ble_rsp_attclient_read_multiple.unpack_from(rx_buf, rx_start)
+    return ble_rsp_attclient_read_multiple_args(connection, result)
+class ble_rsp_sm_encrypt_start_args(BGAPIArgs):
+    __slots__ = _fields = ('handle', 'result')
+    def __init__(self, handle, result):
+        self.handle = handle
+        self.result = result
+_struct_ble_rsp_sm_encrypt_start = struct.Struct('<BH')
+def _decode_ble_rsp_sm_encrypt_start(rx_buf, rx_start, rx_end):
+    handle, result = _struct_ble_rsp_sm_encrypt_start.unpack_from(rx_buf, rx_start)
+    return ble_rsp_sm_encrypt_start_args(handle, result)
+class ble_rsp_sm_set_bondable_mode_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_sm_set_bondable_mode(rx_buf, rx_start, rx_end):
+    return ble_rsp_sm_set_bondable_mode_args()
+class ble_rsp_sm_delete_bonding_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_sm_delete_bonding = struct.Struct('<H')
+def _decode_ble_rsp_sm_delete_bonding(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_sm_delete_bonding.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_sm_delete_bonding_args(result)
+class ble_rsp_sm_set_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_sm_set_parameters(rx_buf, rx_start, rx_end):
+    return ble_rsp_sm_set_parameters_args()
+class ble_rsp_sm_passkey_entry_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_sm_passkey_entry = struct.Struct('<H')
+def _decode_ble_rsp_sm_passkey_entry(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_sm_passkey_entry.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_sm_passkey_entry_args(result)
+class ble_rsp_sm_get_bonds_args(BGAPIArgs):
+    __slots__ = _fields = ('bonds',)
+    def __init__(self, bonds):
+        self.bonds = bonds
+_struct_ble_rsp_sm_get_bonds = struct.Struct('<B')
+def _decode_ble_rsp_sm_get_bonds(rx_buf, rx_start, rx_end):
+    bonds = _struct_ble_rsp_sm_get_bonds.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_sm_get_bonds_args(bonds)
+class ble_rsp_sm_set_oob_data_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_sm_set_oob_data(rx_buf, rx_start, rx_end):
+    return ble_rsp_sm_set_oob_data_args()
+class ble_rsp_gap_set_privacy_flags_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_gap_set_privacy_flags(rx_buf, rx_start, rx_end):
+    return ble_rsp_gap_set_privacy_flags_args()
+class ble_rsp_gap_set_mode_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_gap_set_mode = struct.Struct('<H')
+def _decode_ble_rsp_gap_set_mode(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_gap_set_mode.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_gap_set_mode_args(result)
+class ble_rsp_gap_discover_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_gap_discover = struct.Struct('<H')
+def _decode_ble_rsp_gap_discover(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_gap_discover.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_gap_discover_args(result)
+class ble_rsp_gap_connect_direct_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'connection_handle')
+    def __init__(self, result, connection_handle):
+        self.result = result
+        self.connection_handle = connection_handle
+_struct_ble_rsp_gap_connect_direct = struct.Struct('<HB')
+def _decode_ble_rsp_gap_connect_direct(rx_buf, rx_start, rx_end):
+    result, connection_handle = _struct_ble_rsp_gap_connect_direct.unpack_from(rx_buf, rx_start)
+    return ble_rsp_gap_connect_direct_args(result, connection_handle)
+class ble_rsp_gap_end_procedure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_gap_end_procedure = struct.Struct('<H')
+def _decode_ble_rsp_gap_end_procedure(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_gap_end_procedure.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_gap_end_procedure_args(result)
+class ble_rsp_gap_connect_selective_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'connection_handle')
+    def __init__(self, result, connection_handle):
+        self.result = result
+        self.connection_handle = connection_handle
+_struct_ble_rsp_gap_connect_selective = struct.Struct('<HB')
+def _decode_ble_rsp_gap_connect_selective(rx_buf, rx_start, rx_end):
+    result, connection_handle = _struct_ble_rsp_gap_connect_selective.unpack_from(rx_buf, rx_start)
+    return ble_rsp_gap_connect_selective_args(result, connection_handle)
+class ble_rsp_gap_set_filtering_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_gap_set_filtering = struct.Struct('<H')
+def _decode_ble_rsp_gap_set_filtering(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_gap_set_filtering.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_gap_set_filtering_args(result)
+class ble_rsp_gap_set_scan_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_gap_set_scan_parameters = struct.Struct('<H')
+def _decode_ble_rsp_gap_set_scan_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_gap_set_scan_parameters.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_gap_set_scan_parameters_args(result)
+class ble_rsp_gap_set_adv_parameters_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_gap_set_adv_parameters = struct.Struct('<H')
+def _decode_ble_rsp_gap_set_adv_parameters(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_gap_set_adv_parameters.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_gap_set_adv_parameters_args(result)
+class ble_rsp_gap_set_adv_data_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_gap_set_adv_data = struct.Struct('<H')
+def _decode_ble_rsp_gap_set_adv_data(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_gap_set_adv_data.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_gap_set_adv_data_args(result)
+class ble_rsp_gap_set_directed_connectable_mode_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_gap_set_directed_connectable_mode = struct.Struct('<H')
+def _decode_ble_rsp_gap_set_directed_connectable_mode(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_gap_set_directed_connectable_mode.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_gap_set_directed_connectable_mode_args(result)
+class ble_rsp_hardware_io_port_config_irq_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_io_port_config_irq = struct.Struct('<H')
+def _decode_ble_rsp_hardware_io_port_config_irq(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_io_port_config_irq.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_io_port_config_irq_args(result)
+class ble_rsp_hardware_set_soft_timer_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_set_soft_timer = struct.Struct('<H')
+def _decode_ble_rsp_hardware_set_soft_timer(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_set_soft_timer.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_set_soft_timer_args(result)
+class ble_rsp_hardware_adc_read_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_adc_read = struct.Struct('<H')
+def _decode_ble_rsp_hardware_adc_read(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_adc_read.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_adc_read_args(result)
+class ble_rsp_hardware_io_port_config_direction_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_io_port_config_direction = struct.Struct('<H')
+def _decode_ble_rsp_hardware_io_port_config_direction(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_io_port_config_direction.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_io_port_config_direction_args(result)
+class ble_rsp_hardware_io_port_config_function_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_io_port_config_function = struct.Struct('<H')
+def _decode_ble_rsp_hardware_io_port_config_function(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_io_port_config_function.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_io_port_config_function_args(result)
+class ble_rsp_hardware_io_port_config_pull_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_io_port_config_pull = struct.Struct('<H')
+def _decode_ble_rsp_hardware_io_port_config_pull(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_io_port_config_pull.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_io_port_config_pull_args(result)
+class ble_rsp_hardware_io_port_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_io_port_write = struct.Struct('<H')
+def _decode_ble_rsp_hardware_io_port_write(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_io_port_write.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_io_port_write_args(result)
+class ble_rsp_hardware_io_port_read_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'port', 'data')
+    def __init__(self, result, port, data):
+        self.result = result
+        self.port = port
+        self.data = data
+_struct_ble_rsp_hardware_io_port_read = struct.Struct('<HBB')
+def _decode_ble_rsp_hardware_io_port_read(rx_buf, rx_start, rx_end):
+    result, port, data = _struct_ble_rsp_hardware_io_port_read.unpack_from(rx_buf, rx_start)
+    return ble_rsp_hardware_io_port_read_args(result, port, data)
+class ble_rsp_hardware_spi_config_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_spi_config = struct.Struct('<H')
+def _decode_ble_rsp_hardware_spi_config(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_spi_config.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_spi_config_args(result)
+class ble_rsp_hardware_spi_transfer_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'channel', 'data')
+    def __init__(self, result, channel, data):
+        self.result = result
+        self.channel = channel
+        self.data = data
+_struct_ble_rsp_hardware_spi_transfer = struct.Struct('<HBB')
+def _decode_ble_rsp_hardware_spi_transfer(rx_buf, rx_start, rx_end):
+    result, channel, data_len = _struct_ble_rsp_hardware_spi_transfer.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 4:rx_end]
+    return ble_rsp_hardware_spi_transfer_args(result, channel, data_data)
+class ble_rsp_hardware_i2c_read_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'data')
+    def __init__(self, result, data):
+        self.result = result
+        self.data = data
+_struct_ble_rsp_hardware_i2c_read = struct.Struct('<HB')
+def _decode_ble_rsp_hardware_i2c_read(rx_buf, rx_start, rx_end):
+    result, data_len = _struct_ble_rsp_hardware_i2c_read.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 3:rx_end]
+    return ble_rsp_hardware_i2c_read_args(result, data_data)
+class ble_rsp_hardware_i2c_write_args(BGAPIArgs):
+    __slots__ = _fields = ('written',)
+    def __init__(self, written):
+        self.written = written
+_struct_ble_rsp_hardware_i2c_write = struct.Struct('<B')
+def _decode_ble_rsp_hardware_i2c_write(rx_buf, rx_start, rx_end):
+    written = _struct_ble_rsp_hardware_i2c_write.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_i2c_write_args(written)
+class ble_rsp_hardware_set_txpower_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_hardware_set_txpower(rx_buf, rx_start, rx_end):
+    return ble_rsp_hardware_set_txpower_args()
+class ble_rsp_hardware_timer_comparator_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_ble_rsp_hardware_timer_comparator = struct.Struct('<H')
+def _decode_ble_rsp_hardware_timer_comparator(rx_buf, rx_start, rx_end):
+    result = _struct_ble_rsp_hardware_timer_comparator.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_hardware_timer_comparator_args(result)
+class ble_rsp_test_phy_tx_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_test_phy_tx(rx_buf, rx_start, rx_end):
+    return ble_rsp_test_phy_tx_args()
+class ble_rsp_test_phy_rx_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_test_phy_rx(rx_buf, rx_start, rx_end):
+    return ble_rsp_test_phy_rx_args()
+class ble_rsp_test_phy_end_args(BGAPIArgs):
+    __slots__ = _fields = ('counter',)
+    def __init__(self, counter):
+        self.counter = counter
+_struct_ble_rsp_test_phy_end = struct.Struct('<H')
+def _decode_ble_rsp_test_phy_end(rx_buf, rx_start, rx_end):
+    counter = _struct_ble_rsp_test_phy_end.unpack_from(rx_buf, rx_start)[0]
+    return ble_rsp_test_phy_end_args(counter)
+class ble_rsp_test_phy_reset_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_rsp_test_phy_reset(rx_buf, rx_start, rx_end):
+    return ble_rsp_test_phy_reset_args()
+class ble_rsp_test_get_channel_map_args(BGAPIArgs):
+    __slots__ = _fields = ('channel_map',)
+    def __init__(self, channel_map):
+        self.channel_map = channel_map
+_struct_ble_rsp_test_get_channel_map = struct.Struct('<B')
+def _decode_ble_rsp_test_get_channel_map(rx_buf, rx_start, rx_end):
+    channel_map_len = _struct_ble_rsp_test_get_channel_map.unpack_from(rx_buf, rx_start)[0]
+    channel_map_data = rx_buf[rx_start + 1:rx_end]
+    return ble_rsp_test_get_channel_map_args(channel_map_data)
+class ble_rsp_test_debug_args(BGAPIArgs):
+    __slots__ = _fields = ('output',)
+    def __init__(self, output):
+        self.output = output
+_struct_ble_rsp_test_debug = struct.Struct('<B')
+def _decode_ble_rsp_test_debug(rx_buf, rx_start, rx_end):
+    output_len = _struct_ble_rsp_test_debug.unpack_from(rx_buf, rx_start)[0]
+    output_data = rx_buf[rx_start + 1:rx_end]
+    return ble_rsp_test_debug_args(output_data)
+class ble_evt_system_boot_args(BGAPIArgs):
+    __slots__ = _fields = ('major', 'minor', 'patch', 'build', 'll_version', 'protocol_version', 'hw')
+    def __init__(self, major, minor, patch, build, ll_version, protocol_version, hw):
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        self.build = build
+        self.ll_version = ll_version
+        self.protocol_version = protocol_version
+        self.hw = hw
+_struct_ble_evt_system_boot = struct.Struct('<HHHHHBB')
+def _decode_ble_evt_system_boot(rx_buf, rx_start, rx_end):
+    major, minor, patch, build, ll_version, protocol_version, hw = _struct_ble_evt_system_boot.unpack_from(rx_buf, rx_start)
+    return ble_evt_system_boot_args(major, minor, patch, build, ll_version, protocol_version, hw)
+class ble_evt_system_debug_args(BGAPIArgs):
+    __slots__ = _fields = ('data',)
+    def __init__(self, data):
+        self.data = data
+_struct_ble_evt_system_debug = struct.Struct('<B')
+def _decode_ble_evt_system_debug(rx_buf, rx_start, rx_end):
+    data_len = _struct_ble_evt_system_debug.unpack_from(rx_buf, rx_start)[0]
+    data_data = rx_buf[rx_start + 1:rx_end]
+    return ble_evt_system_debug_args(data_data)
+class ble_evt_system_endpoint_watermark_rx_args(BGAPIArgs):
+    __slots__ = _fields = ('endpoint', 'data')
+    def __init__(self, endpoint, data):
+        self.endpoint = endpoint
+        self.data = data
+_struct_ble_evt_system_endpoint_watermark_rx = struct.Struct('<BB')
+def _decode_ble_evt_system_endpoint_watermark_rx(rx_buf, rx_start, rx_end):
+    endpoint, data = _struct_ble_evt_system_endpoint_watermark_rx.unpack_from(rx_buf, rx_start)
+    return ble_evt_system_endpoint_watermark_rx_args(endpoint, data)
+class ble_evt_system_endpoint_watermark_tx_args(BGAPIArgs):
+    __slots__ = _fields = ('endpoint', 'data')
+    def __init__(self, endpoint, data):
+        self.endpoint = endpoint
+        self.data = data
+_struct_ble_evt_system_endpoint_watermark_tx = struct.Struct('<BB')
+def _decode_ble_evt_system_endpoint_watermark_tx(rx_buf, rx_start, rx_end):
+    endpoint, data = _struct_ble_evt_system_endpoint_watermark_tx.unpack_from(rx_buf, rx_start)
+    return ble_evt_system_endpoint_watermark_tx_args(endpoint, data)
+class ble_evt_system_script_failure_args(BGAPIArgs):
+    __slots__ = _fields = ('address', 'reason')
+    def __init__(self, address, reason):
+        self.address = address
+        self.reason = reason
+_struct_ble_evt_system_script_failure = struct.Struct('<HH')
+def _decode_ble_evt_system_script_failure(rx_buf, rx_start, rx_end):
+    address, reason = _struct_ble_evt_system_script_failure.unpack_from(rx_buf, rx_start)
+    return ble_evt_system_script_failure_args(address, reason)
+class ble_evt_system_no_license_key_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_ble_evt_system_no_license_key(rx_buf, rx_start, rx_end):
+    return ble_evt_system_no_license_key_args()
+class ble_evt_flash_ps_key_args(BGAPIArgs):
+    __slots__ = _fields = ('key', 'value')
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+_struct_ble_evt_flash_ps_key = struct.Struct('<HB')
+def _decode_ble_evt_flash_ps_key(rx_buf, rx_start, rx_end):
+    key, value_len = _struct_ble_evt_flash_ps_key.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 3:rx_end]
+    return ble_evt_flash_ps_key_args(key, value_data)
+class ble_evt_attributes_value_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'reason', 'handle', 'offset', 'value')
+    def __init__(self, connection, reason, handle, offset, value):
+        self.connection = connection
+        self.reason = reason
+        self.handle = handle
+        self.offset = offset
+        self.value = value
+_struct_ble_evt_attributes_value = struct.Struct('<BBHHB')
+def _decode_ble_evt_attributes_value(rx_buf, rx_start, rx_end):
+    connection, reason, handle, offset, value_len = _struct_ble_evt_attributes_value.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 7:rx_end]
+    return ble_evt_attributes_value_args(connection, reason, handle, offset, value_data)
+class ble_evt_attributes_user_read_request_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'handle', 'offset', 'maxsize')
+    def __init__(self, connection, handle, offset, maxsize):
+        self.connection = connection
+        self.handle = handle
+        self.offset = offset
+        self.maxsize = maxsize
+_struct_ble_evt_attributes_user_read_request = struct.Struct('<BHHB')
+def _decode_ble_evt_attributes_user_read_request(rx_buf, rx_start, rx_end):
+    connection, handle, offset, maxsize = _struct_ble_evt_attributes_user_read_request.unpack_from(rx_buf, rx_start)
+    return ble_evt_attributes_user_read_request_args(connection, handle, offset, maxsize)
+class ble_evt_attributes_status_args(BGAPIArgs):
+    __slots__ = _fields = ('handle', 'flags')
+    def __init__(self, handle, flags):
+        self.handle = handle
+        self.flags = flags
+_struct_ble_evt_attributes_status = struct.Struct('<HB')
+def _decode_ble_evt_attributes_status(rx_buf, rx_start, rx_end):
+    handle, flags = _struct_ble_evt_attributes_status.unpack_from(rx_buf, rx_start)
+    return ble_evt_attributes_status_args(handle, flags)
+class ble_evt_connection_status_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'flags', 'address', 'address_type', 'conn_interval', 'timeout', 'latency', 'bonding')
+    def __init__(self, connection, flags, address, address_type, conn_interval, timeout, latency, bonding):
+        self.connection = connection
+        self.flags = flags
+        self.address = address
+        self.address_type = address_type
+        self.conn_interval = conn_interval
+        self.timeout = timeout
+        self.latency = latency
+        self.bonding = bonding
+_struct_ble_evt_connection_status = struct.Struct('<BB6sBHHHB')
+def _decode_ble_evt_connection_status(rx_buf, rx_start, rx_end):
+    connection, flags, address, address_type, conn_interval, timeout, latency, bonding = _struct_ble_evt_connection_status.unpack_from(rx_buf, rx_start)
+    return ble_evt_connection_status_args(connection, flags, address, address_type, conn_interval, timeout, latency, bonding)
+class ble_evt_connection_version_ind_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'vers_nr', 'comp_id', 'sub_vers_nr')
+    def __init__(self, connection, vers_nr, comp_id, sub_vers_nr):
+        self.connection = connection
+        self.vers_nr = vers_nr
+        self.comp_id = comp_id
+        self.sub_vers_nr = sub_vers_nr
+_struct_ble_evt_connection_version_ind = struct.Struct('<BBHH')
+def _decode_ble_evt_connection_version_ind(rx_buf, rx_start, rx_end):
+    connection, vers_nr, comp_id, sub_vers_nr = _struct_ble_evt_connection_version_ind.unpack_from(rx_buf, rx_start)
+    return ble_evt_connection_version_ind_args(connection, vers_nr, comp_id, sub_vers_nr)
+class ble_evt_connection_feature_ind_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'features')
+    def __init__(self, connection, features):
+        self.connection = connection
+        self.features = features
+_struct_ble_evt_connection_feature_ind = struct.Struct('<BB')
+def _decode_ble_evt_connection_feature_ind(rx_buf, rx_start, rx_end):
+    connection, features_len = _struct_ble_evt_connection_feature_ind.unpack_from(rx_buf, rx_start)
+    features_data = rx_buf[rx_start + 2:rx_end]
+    return ble_evt_connection_feature_ind_args(connection, features_data)
+class ble_evt_connection_raw_rx_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'data')
+    def __init__(self, connection, data):
+        self.connection = connection
+        self.data = data
+_struct_ble_evt_connection_raw_rx = struct.Struct('<BB')
+def _decode_ble_evt_connection_raw_rx(rx_buf, rx_start, rx_end):
+    connection, data_len = _struct_ble_evt_connection_raw_rx.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 2:rx_end]
+    return ble_evt_connection_raw_rx_args(connection, data_data)
+class ble_evt_connection_disconnected_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'reason')
+    def __init__(self, connection, reason):
+        self.connection = connection
+        self.reason = reason
+_struct_ble_evt_connection_disconnected = struct.Struct('<BH')
+def _decode_ble_evt_connection_disconnected(rx_buf, rx_start, rx_end):
+    connection, reason = _struct_ble_evt_connection_disconnected.unpack_from(rx_buf, rx_start)
+    return ble_evt_connection_disconnected_args(connection, reason)
+class ble_evt_attclient_indicated_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'attrhandle')
+    def __init__(self, connection, attrhandle):
+        self.connection = connection
+        self.attrhandle = attrhandle
+_struct_ble_evt_attclient_indicated = struct.Struct('<BH')
+def _decode_ble_evt_attclient_indicated(rx_buf, rx_start, rx_end):
+    connection, attrhandle = _struct_ble_evt_attclient_indicated.unpack_from(rx_buf, rx_start)
+    return ble_evt_attclient_indicated_args(connection, attrhandle)
+class ble_evt_attclient_procedure_completed_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'result', 'chrhandle')
+    def __init__(self, connection, result, chrhandle):
+        self.connection = connection
+        self.result = result
+        self.chrhandle = chrhandle
+_struct_ble_evt_attclient_procedure_completed = struct.Struct('<BHH')
+def _decode_ble_evt_attclient_procedure_completed(rx_buf, rx_start, rx_end):
+    connection, result, chrhandle = _struct_ble_evt_attclient_procedure_completed.unpack_from(rx_buf, rx_start)
+    return ble_evt_attclient_procedure_completed_args(connection, result, chrhandle)
+class ble_evt_attclient_group_found_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'start', 'end', 'uuid')
+    def __init__(self, connection, start, end, uuid):
+        self.connection = connection
+        self.start = start
+        self.end = end
+        self.uuid = uuid
+_struct_ble_evt_attclient_group_found = struct.Struct('<BHHB')
+def _decode_ble_evt_attclient_group_found(rx_buf, rx_start, rx_end):
+    connection, start, end, uuid_len = _struct_ble_evt_attclient_group_found.unpack_from(rx_buf, rx_start)
+    uuid_data = rx_buf[rx_start + 6:rx_end]
+    return ble_evt_attclient_group_found_args(connection, start, end, uuid_data)
+class ble_evt_attclient_attribute_found_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'chrdecl', 'value', 'properties', 'uuid')
+    def __init__(self, connection, chrdecl, value, properties, uuid):
+        self.connection = connection
+        self.chrdecl = chrdecl
+        self.value = value
+        self.properties = properties
+        self.uuid = uuid
+_struct_ble_evt_attclient_attribute_found = struct.Struct('<BHHBB')
+def _decode_ble_evt_attclient_attribute_found(rx_buf, rx_start, rx_end):
+    connection, chrdecl, value, properties, uuid_len = _struct_ble_evt_attclient_attribute_found.unpack_from(rx_buf, rx_start)
+    uuid_data = rx_buf[rx_start + 7:rx_end]
+    return ble_evt_attclient_attribute_found_args(connection, chrdecl, value, properties, uuid_data)
+class ble_evt_attclient_find_information_found_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'chrhandle', 'uuid')
+    def __init__(self, connection, chrhandle, uuid):
+        self.connection = connection
+        self.chrhandle = chrhandle
+        self.uuid = uuid
+_struct_ble_evt_attclient_find_information_found = struct.Struct('<BHB')
+def _decode_ble_evt_attclient_find_information_found(rx_buf, rx_start, rx_end):
+    connection, chrhandle, uuid_len = _struct_ble_evt_attclient_find_information_found.unpack_from(rx_buf, rx_start)
+    uuid_data = rx_buf[rx_start + 4:rx_end]
+    return ble_evt_attclient_find_information_found_args(connection, chrhandle, uuid_data)
+class ble_evt_attclient_attribute_value_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'atthandle', 'type', 'value')
+    def __init__(self, connection, atthandle, type, value):
+        self.connection = connection
+        self.atthandle = atthandle
+        self.type = type
+        self.value = value
+_struct_ble_evt_attclient_attribute_value = struct.Struct('<BHBB')
+def _decode_ble_evt_attclient_attribute_value(rx_buf, rx_start, rx_end):
+    connection, atthandle, type, value_len = _struct_ble_evt_attclient_attribute_value.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 5:rx_end]
+    return ble_evt_attclient_attribute_value_args(connection, atthandle, type, value_data)
+class ble_evt_attclient_read_multiple_response_args(BGAPIArgs):
+    __slots__ = _fields = ('connection', 'handles')
+    def __init__(self, connection, handles):
+        self.connection = connection
+        self.handles = handles
+_struct_ble_evt_attclient_read_multiple_response = struct.Struct('<BB')
+def _decode_ble_evt_attclient_read_multiple_response(rx_buf, rx_start, rx_end):
+    connection, handles_len = _struct_ble_evt_attclient_read_multiple_response.unpack_from(rx_buf, rx_start)
+    handles_data = rx_buf[rx_start + 2:rx_end]
+    return ble_evt_attclient_read_multiple_response_args(connection, handles_data)
+class ble_evt_sm_smp_data_args(BGAPIArgs):
+    __slots__ = _fields = ('handle', 'packet', 'data')
+    def __init__(self, handle, packet, data):
+        self.handle = handle
+        self.packet = packet
+        self.data = data
+_struct_ble_evt_sm_smp_data = struct.Struct('<BBB')
+def _decode_ble_evt_sm_smp_data(rx_buf, rx_start, rx_end):
+    handle, packet, data_len = _struct_ble_evt_sm_smp_data.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 3:rx_end]
+    return ble_evt_sm_smp_data_args(handle, packet, data_data)
+class ble_evt_sm_bonding_fail_args(BGAPIArgs):
+    __slots__ = _fields = ('handle', 'result')
+    def __init__(self, handle, result):
+        self.handle = handle
+        self.result = result
+_struct_ble_evt_sm_bonding_fail = struct.Struct('<BH')
+def _decode_ble_evt_sm_bonding_fail(rx_buf, rx_start, rx_end):
+    handle, result = _struct_ble_evt_sm_bonding_fail.unpack_from(rx_buf, rx_start)
+    return ble_evt_sm_bonding_fail_args(handle, result)
+class ble_evt_sm_passkey_display_args(BGAPIArgs):
+    __slots__ = _fields = ('handle', 'passkey')
+    def __init__(self, handle, passkey):
+        self.handle = handle
+        self.passkey = passkey
+_struct_ble_evt_sm_passkey_display = struct.Struct('<BI')
+def _decode_ble_evt_sm_passkey_display(rx_buf, rx_start, rx_end):
+    handle, passkey = _struct_ble_evt_sm_passkey_display.unpack_from(rx_buf, rx_start)
+    return ble_evt_sm_passkey_display_args(handle, passkey)
+class ble_evt_sm_passkey_request_args(BGAPIArgs):
+    __slots__ = _fields = ('handle',)
+    def __init__(self, handle):
+        self.handle = handle
+_struct_ble_evt_sm_passkey_request = struct.Struct('<B')
+def _decode_ble_evt_sm_passkey_request(rx_buf, rx_start, rx_end):
+    handle = _struct_ble_evt_sm_passkey_request.unpack_from(rx_buf, rx_start)[0]
+    return ble_evt_sm_passkey_request_args(handle)
+class ble_evt_sm_bond_status_args(BGAPIArgs):
+    __slots__ = ('bond', 'keysize', 'mitm', 'keys_')
+    _fields = ('bond', 'keysize', 'mitm', 'keys')
+    def __init__(self, bond, keysize, mitm, keys):
+        self.bond = bond
+        self.keysize = keysize
+        self.mitm = mitm
+        self.keys_ = keys
+_struct_ble_evt_sm_bond_status = struct.Struct('<BBBB')
+def _decode_ble_evt_sm_bond_status(rx_buf, rx_start, rx_end):
+    bond, keysize, mitm, keys = _struct_ble_evt_sm_bond_status.unpack_from(rx_buf, rx_start)
+    return ble_evt_sm_bond_status_args(bond, keysize, mitm, keys)
+class ble_evt_gap_scan_response_args(BGAPIArgs):
+    __slots__ = _fields = ('rssi', 'packet_type', 'sender', 'address_type', 'bond', 'data')
+    def __init__(self, rssi, packet_type, sender, address_type, bond, data):
+        self.rssi = rssi
+        self.packet_type = packet_type
+        self.sender = sender
+        self.address_type = address_type
+        self.bond = bond
+        self.data = data
+_struct_ble_evt_gap_scan_response = struct.Struct('<bB6sBBB')
+def _decode_ble_evt_gap_scan_response(rx_buf, rx_start, rx_end):
+    rssi, packet_type, sender, address_type, bond, data_len = _struct_ble_evt_gap_scan_response.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 11:rx_end]
+    return ble_evt_gap_scan_response_args(rssi, packet_type, sender, address_type, bond, data_data)
+class ble_evt_gap_mode_changed_args(BGAPIArgs):
+    __slots__ = _fields = ('discover', 'connect')
+    def __init__(self, discover, connect):
+        self.discover = discover
+        self.connect = connect
+_struct_ble_evt_gap_mode_changed = struct.Struct('<BB')
+def _decode_ble_evt_gap_mode_changed(rx_buf, rx_start, rx_end):
+    discover, connect = _struct_ble_evt_gap_mode_changed.unpack_from(rx_buf, rx_start)
+    return ble_evt_gap_mode_changed_args(discover, connect)
+class ble_evt_hardware_io_port_status_args(BGAPIArgs):
+    __slots__ = _fields = ('timestamp', 'port', 'irq', 'state')
+    def __init__(self, timestamp, port, irq, state):
+        self.timestamp = timestamp
+        self.port = port
+        self.irq = irq
+        self.state = state
+_struct_ble_evt_hardware_io_port_status = struct.Struct('<IBBB')
+def _decode_ble_evt_hardware_io_port_status(rx_buf, rx_start, rx_end):
+    timestamp, port, irq, state = _struct_ble_evt_hardware_io_port_status.unpack_from(rx_buf, rx_start)
+    return ble_evt_hardware_io_port_status_args(timestamp, port, irq, state)
+class ble_evt_hardware_soft_timer_args(BGAPIArgs):
+    __slots__ = _fields = ('handle',)
+    def __init__(self, handle):
+        self.handle = handle
+_struct_ble_evt_hardware_soft_timer = struct.Struct('<B')
+def _decode_ble_evt_hardware_soft_timer(rx_buf, rx_start, rx_end):
+    handle = _struct_ble_evt_hardware_soft_timer.unpack_from(rx_buf, rx_start)[0]
+    return ble_evt_hardware_soft_timer_args(handle)
+class ble_evt_hardware_adc_result_args(BGAPIArgs):
+    __slots__ = _fields = ('input', 'value')
+    def __init__(self, input, value):
+        self.input = input
+        self.value = value
+_struct_ble_evt_hardware_adc_result = struct.Struct('<Bh')
+def _decode_ble_evt_hardware_adc_result(rx_buf, rx_start, rx_end):
+    input, value = _struct_ble_evt_hardware_adc_result.unpack_from(rx_buf, rx_start)
+    return ble_evt_hardware_adc_result_args(input, value)
+class wifi_rsp_dfu_reset_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_wifi_rsp_dfu_reset(rx_buf, rx_start, rx_end):
+    return wifi_rsp_dfu_reset_args()
+class wifi_rsp_dfu_flash_set_address_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_dfu_flash_set_address = struct.Struct('<H')
+def _decode_wifi_rsp_dfu_flash_set_address(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_dfu_flash_set_address.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_dfu_flash_set_address_args(result)
+class wifi_rsp_dfu_flash_upload_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_dfu_flash_upload = struct.Struct('<H')
+def _decode_wifi_rsp_dfu_flash_upload(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_dfu_flash_upload.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_dfu_flash_upload_args(result)
+class wifi_rsp_dfu_flash_upload_finish_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_dfu_flash_upload_finish = struct.Struct('<H')
+def _decode_wifi_rsp_dfu_flash_upload_finish(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_dfu_flash_upload_finish.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_dfu_flash_upload_finish_args(result)
+class wifi_rsp_system_sync_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_wifi_rsp_system_sync(rx_buf, rx_start, rx_end):
+    return wifi_rsp_system_sync_args()
+class wifi_rsp_system_reset_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_wifi_rsp_system_reset(rx_buf, rx_start, rx_end):
+    return wifi_rsp_system_reset_args()
+class wifi_rsp_system_hello_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_wifi_rsp_system_hello(rx_buf, rx_start, rx_end):
+    return wifi_rsp_system_hello_args()
+class wifi_rsp_system_set_max_power_saving_state_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_system_set_max_power_saving_state = struct.Struct('<H')
+def _decode_wifi_rsp_system_set_max_power_saving_state(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_system_set_max_power_saving_state.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_system_set_max_power_saving_state_args(result)
+class wifi_rsp_config_get_mac_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'hw_interface')
+    def __init__(self, result, hw_interface):
+        self.result = result
+        self.hw_interface = hw_interface
+_struct_wifi_rsp_config_get_mac = struct.Struct('<HB')
+def _decode_wifi_rsp_config_get_mac(rx_buf, rx_start, rx_end):
+    result, hw_interface = _struct_wifi_rsp_config_get_mac.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_config_get_mac_args(result, hw_interface)
+class wifi_rsp_config_set_mac_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'hw_interface')
+    def __init__(self, result, hw_interface):
+        self.result = result
+        self.hw_interface = hw_interface
+_struct_wifi_rsp_config_set_mac = struct.Struct('<HB')
+def _decode_wifi_rsp_config_set_mac(rx_buf, rx_start, rx_end):
+    result, hw_interface = _struct_wifi_rsp_config_set_mac.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_config_set_mac_args(result, hw_interface)
+class wifi_rsp_sme_wifi_on_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_sme_wifi_on = struct.Struct('<H')
+def _decode_wifi_rsp_sme_wifi_on(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_sme_wifi_on.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_sme_wifi_on_args(result)
+class wifi_rsp_sme_wifi_off_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_sme_wifi_off = struct.Struct('<H')
+def _decode_wifi_rsp_sme_wifi_off(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_sme_wifi_off.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_sme_wifi_off_args(result)
+class wifi_rsp_sme_power_on_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_sme_power_on = struct.Struct('<H')
+def _decode_wifi_rsp_sme_power_on(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_sme_power_on.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_sme_power_on_args(result)
+class wifi_rsp_sme_start_scan_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_sme_start_scan = struct.Struct('<H')
+def _decode_wifi_rsp_sme_start_scan(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_sme_start_scan.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_sme_start_scan_args(result)
+class wifi_rsp_sme_stop_scan_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_sme_stop_scan = struct.Struct('<H')
+def _decode_wifi_rsp_sme_stop_scan(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_sme_stop_scan.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_sme_stop_scan_args(result)
+class wifi_rsp_sme_set_password_args(BGAPIArgs):
+    __slots__ = _fields = ('status',)
+    def __init__(self, status):
+        self.status = status
+_struct_wifi_rsp_sme_set_password = struct.Struct('<B')
+def _decode_wifi_rsp_sme_set_password(rx_buf, rx_start, rx_end):
+    status = _struct_wifi_rsp_sme_set_password.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_sme_set_password_args(status)
+class wifi_rsp_sme_connect_bssid_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'hw_interface')
+    def __init__(self, result, hw_interface):
+        self.result = result
+        self.hw_interface = hw_interface
+_struct_wifi_rsp_sme_connect_bssid = struct.Struct('<HB')
+def _decode_wifi_rsp_sme_connect_bssid(rx_buf, rx_start, rx_end):
+    result, hw_interface = _struct_wifi_rsp_sme_connect_bssid.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_sme_connect_bssid_args(result, hw_interface)
+class wifi_rsp_sme_connect_ssid_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'hw_interface')
+    def __init__(self, result, hw_interface):
+        self.result = result
+        self.hw_interface = hw_interface
+_struct_wifi_rsp_sme_connect_ssid = struct.Struct('<HB')
+def _decode_wifi_rsp_sme_connect_ssid(rx_buf, rx_start, rx_end):
+    result, hw_interface = _struct_wifi_rsp_sme_connect_ssid.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_sme_connect_ssid_args(result, hw_interface)
+class wifi_rsp_sme_disconnect_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'hw_interface')
+    def __init__(self, result, hw_interface):
+        self.result = result
+        self.hw_interface = hw_interface
+_struct_wifi_rsp_sme_disconnect = struct.Struct('<HB')
+def _decode_wifi_rsp_sme_disconnect(rx_buf, rx_start, rx_end):
+    result, hw_interface = _struct_wifi_rsp_sme_disconnect.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_sme_disconnect_args(result, hw_interface)
+class wifi_rsp_sme_set_scan_channels_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_sme_set_scan_channels = struct.Struct('<H')
+def _decode_wifi_rsp_sme_set_scan_channels(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_sme_set_scan_channels.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_sme_set_scan_channels_args(result)
+class wifi_rsp_tcpip_start_tcp_server_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_tcpip_start_tcp_server = struct.Struct('<HB')
+def _decode_wifi_rsp_tcpip_start_tcp_server(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_tcpip_start_tcp_server.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_tcpip_start_tcp_server_args(result, endpoint)
+class wifi_rsp_tcpip_tcp_connect_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_tcpip_tcp_connect = struct.Struct('<HB')
+def _decode_wifi_rsp_tcpip_tcp_connect(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_tcpip_tcp_connect.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_tcpip_tcp_connect_args(result, endpoint)
+class wifi_rsp_tcpip_start_udp_server_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_tcpip_start_udp_server = struct.Struct('<HB')
+def _decode_wifi_rsp_tcpip_start_udp_server(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_tcpip_start_udp_server.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_tcpip_start_udp_server_args(result, endpoint)
+class wifi_rsp_tcpip_udp_connect_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_tcpip_udp_connect = struct.Struct('<HB')
+def _decode_wifi_rsp_tcpip_udp_connect(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_tcpip_udp_connect.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_tcpip_udp_connect_args(result, endpoint)
+class wifi_rsp_tcpip_configure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_tcpip_configure = struct.Struct('<H')
+def _decode_wifi_rsp_tcpip_configure(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_tcpip_configure.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_tcpip_configure_args(result)
+class wifi_rsp_tcpip_dns_configure_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_tcpip_dns_configure = struct.Struct('<H')
+def _decode_wifi_rsp_tcpip_dns_configure(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_tcpip_dns_configure.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_tcpip_dns_configure_args(result)
+class wifi_rsp_tcpip_dns_gethostbyname_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_tcpip_dns_gethostbyname = struct.Struct('<H')
+def _decode_wifi_rsp_tcpip_dns_gethostbyname(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_tcpip_dns_gethostbyname.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_tcpip_dns_gethostbyname_args(result)
+class wifi_rsp_endpoint_send_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_endpoint_send = struct.Struct('<HB')
+def _decode_wifi_rsp_endpoint_send(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_endpoint_send.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_endpoint_send_args(result, endpoint)
+class wifi_rsp_endpoint_set_streaming_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_endpoint_set_streaming = struct.Struct('<HB')
+def _decode_wifi_rsp_endpoint_set_streaming(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_endpoint_set_streaming.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_endpoint_set_streaming_args(result, endpoint)
+class wifi_rsp_endpoint_set_active_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_endpoint_set_active = struct.Struct('<HB')
+def _decode_wifi_rsp_endpoint_set_active(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_endpoint_set_active.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_endpoint_set_active_args(result, endpoint)
+class wifi_rsp_endpoint_set_streaming_destination_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_endpoint_set_streaming_destination = struct.Struct('<HB')
+def _decode_wifi_rsp_endpoint_set_streaming_destination(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_endpoint_set_streaming_destination.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_endpoint_set_streaming_destination_args(result, endpoint)
+class wifi_rsp_endpoint_close_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'endpoint')
+    def __init__(self, result, endpoint):
+        self.result = result
+        self.endpoint = endpoint
+_struct_wifi_rsp_endpoint_close = struct.Struct('<HB')
+def _decode_wifi_rsp_endpoint_close(rx_buf, rx_start, rx_end):
+    result, endpoint = _struct_wifi_rsp_endpoint_close.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_endpoint_close_args(result, endpoint)
+class wifi_rsp_hardware_set_soft_timer_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_hardware_set_soft_timer = struct.Struct('<H')
+def _decode_wifi_rsp_hardware_set_soft_timer(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_hardware_set_soft_timer.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_hardware_set_soft_timer_args(result)
+class wifi_rsp_hardware_external_interrupt_config_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_hardware_external_interrupt_config = struct.Struct('<H')
+def _decode_wifi_rsp_hardware_external_interrupt_config(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_hardware_external_interrupt_config.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_hardware_external_interrupt_config_args(result)
+class wifi_rsp_hardware_change_notification_config_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_hardware_change_notification_config = struct.Struct('<H')
+def _decode_wifi_rsp_hardware_change_notification_config(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_hardware_change_notification_config.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_hardware_change_notification_config_args(result)
+class wifi_rsp_hardware_change_notification_pullup_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_hardware_change_notification_pullup = struct.Struct('<H')
+def _decode_wifi_rsp_hardware_change_notification_pullup(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_hardware_change_notification_pullup.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_hardware_change_notification_pullup_args(result)
+class wifi_rsp_hardware_io_port_config_direction_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_hardware_io_port_config_direction = struct.Struct('<H')
+def _decode_wifi_rsp_hardware_io_port_config_direction(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_hardware_io_port_config_direction.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_hardware_io_port_config_direction_args(result)
+class wifi_rsp_hardware_io_port_config_open_drain_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_hardware_io_port_config_open_drain = struct.Struct('<H')
+def _decode_wifi_rsp_hardware_io_port_config_open_drain(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_hardware_io_port_config_open_drain.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_hardware_io_port_config_open_drain_args(result)
+class wifi_rsp_hardware_io_port_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_hardware_io_port_write = struct.Struct('<H')
+def _decode_wifi_rsp_hardware_io_port_write(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_hardware_io_port_write.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_hardware_io_port_write_args(result)
+class wifi_rsp_hardware_io_port_read_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'port', 'data')
+    def __init__(self, result, port, data):
+        self.result = result
+        self.port = port
+        self.data = data
+_struct_wifi_rsp_hardware_io_port_read = struct.Struct('<HBH')
+def _decode_wifi_rsp_hardware_io_port_read(rx_buf, rx_start, rx_end):
+    result, port, data = _struct_wifi_rsp_hardware_io_port_read.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_hardware_io_port_read_args(result, port, data)
+class wifi_rsp_hardware_output_compare_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_hardware_output_compare = struct.Struct('<H')
+def _decode_wifi_rsp_hardware_output_compare(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_hardware_output_compare.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_hardware_output_compare_args(result)
+class wifi_rsp_hardware_adc_read_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'input', 'value')
+    def __init__(self, result, input, value):
+        self.result = result
+        self.input = input
+        self.value = value
+_struct_wifi_rsp_hardware_adc_read = struct.Struct('<HBH')
+def _decode_wifi_rsp_hardware_adc_read(rx_buf, rx_start, rx_end):
+    result, input, value = _struct_wifi_rsp_hardware_adc_read.unpack_from(rx_buf, rx_start)
+    return wifi_rsp_hardware_adc_read_args(result, input, value)
+class wifi_rsp_flash_ps_defrag_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_flash_ps_defrag = struct.Struct('<H')
+def _decode_wifi_rsp_flash_ps_defrag(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_flash_ps_defrag.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_flash_ps_defrag_args(result)
+class wifi_rsp_flash_ps_dump_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_flash_ps_dump = struct.Struct('<H')
+def _decode_wifi_rsp_flash_ps_dump(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_flash_ps_dump.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_flash_ps_dump_args(result)
+class wifi_rsp_flash_ps_erase_all_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_flash_ps_erase_all = struct.Struct('<H')
+def _decode_wifi_rsp_flash_ps_erase_all(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_flash_ps_erase_all.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_flash_ps_erase_all_args(result)
+class wifi_rsp_flash_ps_save_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_flash_ps_save = struct.Struct('<H')
+def _decode_wifi_rsp_flash_ps_save(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_flash_ps_save.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_flash_ps_save_args(result)
+class wifi_rsp_flash_ps_load_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'value')
+    def __init__(self, result, value):
+        self.result = result
+        self.value = value
+_struct_wifi_rsp_flash_ps_load = struct.Struct('<HB')
+def _decode_wifi_rsp_flash_ps_load(rx_buf, rx_start, rx_end):
+    result, value_len = _struct_wifi_rsp_flash_ps_load.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 3:rx_end]
+    return wifi_rsp_flash_ps_load_args(result, value_data)
+class wifi_rsp_flash_ps_erase_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_flash_ps_erase = struct.Struct('<H')
+def _decode_wifi_rsp_flash_ps_erase(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_flash_ps_erase.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_flash_ps_erase_args(result)
+class wifi_rsp_i2c_start_read_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_i2c_start_read = struct.Struct('<H')
+def _decode_wifi_rsp_i2c_start_read(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_i2c_start_read.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_i2c_start_read_args(result)
+class wifi_rsp_i2c_start_write_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_i2c_start_write = struct.Struct('<H')
+def _decode_wifi_rsp_i2c_start_write(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_i2c_start_write.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_i2c_start_write_args(result)
+class wifi_rsp_i2c_stop_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_rsp_i2c_stop = struct.Struct('<H')
+def _decode_wifi_rsp_i2c_stop(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_rsp_i2c_stop.unpack_from(rx_buf, rx_start)[0]
+    return wifi_rsp_i2c_stop_args(result)
+class wifi_evt_dfu_boot_args(BGAPIArgs):
+    __slots__ = _fields = ('version',)
+    def __init__(self, version):
+        self.version = version
+_struct_wifi_evt_dfu_boot = struct.Struct('<I')
+def _decode_wifi_evt_dfu_boot(rx_buf, rx_start, rx_end):
+    version = _struct_wifi_evt_dfu_boot.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_dfu_boot_args(version)
+class wifi_evt_system_boot_args(BGAPIArgs):
+    __slots__ = _fields = ('major', 'minor', 'patch', 'build', 'bootloader_version', 'tcpip_version', 'hw')
+    def __init__(self, major, minor, patch, build, bootloader_version, tcpip_version, hw):
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        self.build = build
+        self.bootloader_version = bootloader_version
+        self.tcpip_version = tcpip_version
+        self.hw = hw
+_struct_wifi_evt_system_boot = struct.Struct('<HHHHHHH')
+def _decode_wifi_evt_system_boot(rx_buf, rx_start, rx_end):
+    major, minor, patch, build, bootloader_version, tcpip_version, hw = _struct_wifi_evt_system_boot.unpack_from(rx_buf, rx_start)
+    return wifi_evt_system_boot_args(major, minor, patch, build, bootloader_version, tcpip_version, hw)
+class wifi_evt_system_state_args(BGAPIArgs):
+    __slots__ = _fields = ('state',)
+    def __init__(self, state):
+        self.state = state
+_struct_wifi_evt_system_state = struct.Struct('<H')
+def _decode_wifi_evt_system_state(rx_buf, rx_start, rx_end):
+    state = _struct_wifi_evt_system_state.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_system_state_args(state)
+class wifi_evt_system_sw_exception_args(BGAPIArgs):
+    __slots__ = _fields = ('address', 'type')
+    def __init__(self, address, type):
+        self.address = address
+        self.type = type
+_struct_wifi_evt_system_sw_exception = struct.Struct('<IB')
+def _decode_wifi_evt_system_sw_exception(rx_buf, rx_start, rx_end):
+    address, type = _struct_wifi_evt_system_sw_exception.unpack_from(rx_buf, rx_start)
+    return wifi_evt_system_sw_exception_args(address, type)
+class wifi_evt_system_power_saving_state_args(BGAPIArgs):
+    __slots__ = _fields = ('state',)
+    def __init__(self, state):
+        self.state = state
+_struct_wifi_evt_system_power_saving_state = struct.Struct('<B')
+def _decode_wifi_evt_system_power_saving_state(rx_buf, rx_start, rx_end):
+    state = _struct_wifi_evt_system_power_saving_state.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_system_power_saving_state_args(state)
+class wifi_evt_config_mac_address_args(BGAPIArgs):
+    __slots__ = _fields = ('hw_interface',)
+    def __init__(self, hw_interface):
+        self.hw_interface = hw_interface
+_struct_wifi_evt_config_mac_address = struct.Struct('<B')
+def _decode_wifi_evt_config_mac_address(rx_buf, rx_start, rx_end):
+    hw_interface = _struct_wifi_evt_config_mac_address.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_config_mac_address_args(hw_interface)
+class wifi_evt_sme_wifi_is_on_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_evt_sme_wifi_is_on = struct.Struct('<H')
+def _decode_wifi_evt_sme_wifi_is_on(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_evt_sme_wifi_is_on.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_sme_wifi_is_on_args(result)
+class wifi_evt_sme_wifi_is_off_args(BGAPIArgs):
+    __slots__ = _fields = ('result',)
+    def __init__(self, result):
+        self.result = result
+_struct_wifi_evt_sme_wifi_is_off = struct.Struct('<H')
+def _decode_wifi_evt_sme_wifi_is_off(rx_buf, rx_start, rx_end):
+    result = _struct_wifi_evt_sme_wifi_is_off.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_sme_wifi_is_off_args(result)
+class wifi_evt_sme_scan_result_args(BGAPIArgs):
+    __slots__ = _fields = ('channel', 'rssi', 'snr', 'secure', 'ssid')
+    def __init__(self, channel, rssi, snr, secure, ssid):
+        self.channel = channel
+        self.rssi = rssi
+        self.snr = snr
+        self.secure = secure
+        self.ssid = ssid
+_struct_wifi_evt_sme_scan_result = struct.Struct('<bhbBB')
+def _decode_wifi_evt_sme_scan_result(rx_buf, rx_start, rx_end):
+    channel, rssi, snr, secure, ssid_len = _struct_wifi_evt_sme_scan_result.unpack_from(rx_buf, rx_start)
+    ssid_data = rx_buf[rx_start + 6:rx_end]
+    return wifi_evt_sme_scan_result_args(channel, rssi, snr, secure, ssid_data)
+class wifi_evt_sme_scan_result_drop_args(BGAPIArgs):
+    __slots__ = _fields = ()
+def _decode_wifi_evt_sme_scan_result_drop(rx_buf, rx_start, rx_end):
+    return wifi_evt_sme_scan_result_drop_args()
+class wifi_evt_sme_scanned_args(BGAPIArgs):
+    __slots__ = _fields = ('status',)
+    def __init__(self, status):
+        self.status = status
+_struct_wifi_evt_sme_scanned = struct.Struct('<b')
+def _decode_wifi_evt_sme_scanned(rx_buf, rx_start, rx_end):
+    status = _struct_wifi_evt_sme_scanned.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_sme_scanned_args(status)
+class wifi_evt_sme_connected_args(BGAPIArgs):
+    __slots__ = _fields = ('status', 'hw_interface')
+    def __init__(self, status, hw_interface):
+        self.status = status
+        self.hw_interface = hw_interface
+_struct_wifi_evt_sme_connected = struct.Struct('<bB')
+def _decode_wifi_evt_sme_connected(rx_buf, rx_start, rx_end):
+    status, hw_interface = _struct_wifi_evt_sme_connected.unpack_from(rx_buf, rx_start)
+    return wifi_evt_sme_connected_args(status, hw_interface)
+class wifi_evt_sme_disconnected_args(BGAPIArgs):
+    __slots__ = _fields = ('reason', 'hw_interface')
+    def __init__(self, reason, hw_interface):
+        self.reason = reason
+        self.hw_interface = hw_interface
+_struct_wifi_evt_sme_disconnected = struct.Struct('<HB')
+def _decode_wifi_evt_sme_disconnected(rx_buf, rx_start, rx_end):
+    reason, hw_interface = _struct_wifi_evt_sme_disconnected.unpack_from(rx_buf, rx_start)
+    return wifi_evt_sme_disconnected_args(reason, hw_interface)
+class wifi_evt_sme_interface_status_args(BGAPIArgs):
+    __slots__ = _fields = ('hw_interface', 'status')
+    def __init__(self, hw_interface, status):
+        self.hw_interface = hw_interface
+        self.status = status
+_struct_wifi_evt_sme_interface_status = struct.Struct('<BB')
+def _decode_wifi_evt_sme_interface_status(rx_buf, rx_start, rx_end):
+    hw_interface, status = _struct_wifi_evt_sme_interface_status.unpack_from(rx_buf, rx_start)
+    return wifi_evt_sme_interface_status_args(hw_interface, status)
+class wifi_evt_sme_connect_failed_args(BGAPIArgs):
+    __slots__ = _fields = ('reason', 'hw_interface')
+    def __init__(self, reason, hw_interface):
+        self.reason = reason
+        self.hw_interface = hw_interface
+_struct_wifi_evt_sme_connect_failed = struct.Struct('<HB')
+def _decode_wifi_evt_sme_connect_failed(rx_buf, rx_start, rx_end):
+    reason, hw_interface = _struct_wifi_evt_sme_connect_failed.unpack_from(rx_buf, rx_start)
+    return wifi_evt_sme_connect_failed_args(reason, hw_interface)
+class wifi_evt_sme_connect_retry_args(BGAPIArgs):
+    __slots__ = _fields = ('hw_interface',)
+    def __init__(self, hw_interface):
+        self.hw_interface = hw_interface
+_struct_wifi_evt_sme_connect_retry = struct.Struct('<B')
+def _decode_wifi_evt_sme_connect_retry(rx_buf, rx_start, rx_end):
+    hw_interface = _struct_wifi_evt_sme_connect_retry.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_sme_connect_retry_args(hw_interface)
+class wifi_evt_tcpip_configuration_args(BGAPIArgs):
+    __slots__ = _fields = ('use_dhcp',)
+    def __init__(self, use_dhcp):
+        self.use_dhcp = use_dhcp
+_struct_wifi_evt_tcpip_configuration = struct.Struct('<B')
+def _decode_wifi_evt_tcpip_configuration(rx_buf, rx_start, rx_end):
+    use_dhcp = _struct_wifi_evt_tcpip_configuration.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_tcpip_configuration_args(use_dhcp)
+class wifi_evt_tcpip_dns_configuration_args(BGAPIArgs):
+    __slots__ = _fields = ('index',)
+    def __init__(self, index):
+        self.index = index
+_struct_wifi_evt_tcpip_dns_configuration = struct.Struct('<B')
+def _decode_wifi_evt_tcpip_dns_configuration(rx_buf, rx_start, rx_end):
+    index = _struct_wifi_evt_tcpip_dns_configuration.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_tcpip_dns_configuration_args(index)
+class wifi_evt_tcpip_endpoint_status_args(BGAPIArgs):
+    __slots__ = _fields = ('endpoint', 'local_port', 'remote_port')
+    def __init__(self, endpoint, local_port, remote_port):
+        self.endpoint = endpoint
+        self.local_port = local_port
+        self.remote_port = remote_port
+_struct_wifi_evt_tcpip_endpoint_status = struct.Struct('<BHH')
+def _decode_wifi_evt_tcpip_endpoint_status(rx_buf, rx_start, rx_end):
+    endpoint, local_port, remote_port = _struct_wifi_evt_tcpip_endpoint_status.unpack_from(rx_buf, rx_start)
+    return wifi_evt_tcpip_endpoint_status_args(endpoint, local_port, remote_port)
+class wifi_evt_tcpip_dns_gethostbyname_result_args(BGAPIArgs):
+    __slots__ = _fields = ('result', 'name')
+    def __init__(self, result, name):
+        self.result = result
+        self.name = name
+_struct_wifi_evt_tcpip_dns_gethostbyname_result = struct.Struct('<HB')
+def _decode_wifi_evt_tcpip_dns_gethostbyname_result(rx_buf, rx_start, rx_end):
+    result, name_len = _struct_wifi_evt_tcpip_dns_gethostbyname_result.unpack_from(rx_buf, rx_start)
+    name_data = rx_buf[rx_start + 3:rx_end]
+    return wifi_evt_tcpip_dns_gethostbyname_result_args(result, name_data)
+class wifi_evt_endpoint_syntax_error_args(BGAPIArgs):
+    __slots__ = _fields = ('endpoint',)
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+_struct_wifi_evt_endpoint_syntax_error = struct.Struct('<B')
+def _decode_wifi_evt_endpoint_syntax_error(rx_buf, rx_start, rx_end):
+    endpoint = _struct_wifi_evt_endpoint_syntax_error.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_endpoint_syntax_error_args(endpoint)
+class wifi_evt_endpoint_data_args(BGAPIArgs):
+    __slots__ = _fields = ('endpoint', 'data')
+    def __init__(self, endpoint, data):
+        self.endpoint = endpoint
+        self.data = data
+_struct_wifi_evt_endpoint_data = struct.Struct('<BB')
+def _decode_wifi_evt_endpoint_data(rx_buf, rx_start, rx_end):
+    endpoint, data_len = _struct_wifi_evt_endpoint_data.unpack_from(rx_buf, rx_start)
+    data_data = rx_buf[rx_start + 2:rx_end]
+    return wifi_evt_endpoint_data_args(endpoint, data_data)
+class wifi_evt_endpoint_status_args(BGAPIArgs):
+    __slots__ = _fields = ('endpoint', 'type', 'streaming', 'destination', 'active')
+    def __init__(self, endpoint, type, streaming, destination, active):
+        self.endpoint = endpoint
+        self.type = type
+        self.streaming = streaming
+        self.destination = destination
+        self.active = active
+_struct_wifi_evt_endpoint_status = struct.Struct('<BIBbB')
+def _decode_wifi_evt_endpoint_status(rx_buf, rx_start, rx_end):
+    endpoint, type, streaming, destination, active = _struct_wifi_evt_endpoint_status.unpack_from(rx_buf, rx_start)
+    return wifi_evt_endpoint_status_args(endpoint, type, streaming, destination, active)
+class wifi_evt_endpoint_closing_args(BGAPIArgs):
+    __slots__ = _fields = ('reason', 'endpoint')
+    def __init__(self, reason, endpoint):
+        self.reason = reason
+        self.endpoint = endpoint
+_struct_wifi_evt_endpoint_closing = struct.Struct('<HB')
+def _decode_wifi_evt_endpoint_closing(rx_buf, rx_start, rx_end):
+    reason, endpoint = _struct_wifi_evt_endpoint_closing.unpack_from(rx_buf, rx_start)
+    return wifi_evt_endpoint_closing_args(reason, endpoint)
+class wifi_evt_hardware_soft_timer_args(BGAPIArgs):
+    __slots__ = _fields = ('handle',)
+    def __init__(self, handle):
+        self.handle = handle
+_struct_wifi_evt_hardware_soft_timer = struct.Struct('<B')
+def _decode_wifi_evt_hardware_soft_timer(rx_buf, rx_start, rx_end):
+    handle = _struct_wifi_evt_hardware_soft_timer.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_hardware_soft_timer_args(handle)
+class wifi_evt_hardware_change_notification_args(BGAPIArgs):
+    __slots__ = _fields = ('timestamp',)
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+_struct_wifi_evt_hardware_change_notification = struct.Struct('<I')
+def _decode_wifi_evt_hardware_change_notification(rx_buf, rx_start, rx_end):
+    timestamp = _struct_wifi_evt_hardware_change_notification.unpack_from(rx_buf, rx_start)[0]
+    return wifi_evt_hardware_change_notification_args(timestamp)
+class wifi_evt_hardware_external_interrupt_args(BGAPIArgs):
+    __slots__ = _fields = ('irq', 'timestamp')
+    def __init__(self, irq, timestamp):
+        self.irq = irq
+        self.timestamp = timestamp
+_struct_wifi_evt_hardware_external_interrupt = struct.Struct('<BI')
+def _decode_wifi_evt_hardware_external_interrupt(rx_buf, rx_start, rx_end):
+    irq, timestamp = _struct_wifi_evt_hardware_external_interrupt.unpack_from(rx_buf, rx_start)
+    return wifi_evt_hardware_external_interrupt_args(irq, timestamp)
+class wifi_evt_flash_ps_key_args(BGAPIArgs):
+    __slots__ = _fields = ('key', 'value')
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+_struct_wifi_evt_flash_ps_key = struct.Struct('<HB')
+def _decode_wifi_evt_flash_ps_key(rx_buf, rx_start, rx_end):
+    key, value_len = _struct_wifi_evt_flash_ps_key.unpack_from(rx_buf, rx_start)
+    value_data = rx_buf[rx_start + 3:rx_end]
+    return wifi_evt_flash_ps_key_args(key, value_data)
+
+
 class BGLib(object):
 
     def ble_cmd_system_reset(self, boot_in_dfu):
@@ -607,12 +2417,78 @@ class BGLib(object):
     on_timeout = BGAPIEvent()
     on_before_tx_command = BGAPIEvent()
     on_tx_command_complete = BGAPIEvent()
+    on_raw_frame = BGAPIEvent()
 
     bgapi_rx_buffer = b""
     bgapi_rx_expected_length = 0
+    bgapi_rx_recycled = b""
+    bgapi_rx_partial_time = 0
     busy = False
+    zero_copy = False
+    buffered_read = False
     packet_mode = False
+    resync = False
+    resync_timeout = 0.05
+    rx_discarded_bytes = 0
+    rx_partial_timeouts = 0
+    event_queue = None
+    rx_dropped_events = 0
+    rx_handler_errors = 0
+    raw_frame_filter = None
+    capture = None
+    raw_frame_only = False
     debug = False
+    _reader = None
+    _rx_chunk = None
+    _rx_pos = 0
+    _rx_depth = 0
+    _attribute_event = None
+
+    def __new__(cls, *args, **kwargs):
+        # per-instance state is set up here rather than in __init__(), so a
+        # subclass whose __init__() does not call BGLib.__init__() still parses
+        self = super().__new__(cls)
+        self.__eventhandler__ = {}
+        self.__eventhandlers__ = {}
+        self._any_handlers = {}
+        self._raw_frame_handler = self.on_raw_frame
+        self._response_waiters = {}
+        self._command_queue = deque()
+        self._command_pending = None
+        self._command_lock = threading.Lock()
+        return self
+
+    def __init__(self, zero_copy=False):
+
+        """Create a BGLib parser.
+
+        With zero_copy set, uint8array fields such as 'data', 'value' and
+        'handles' are passed to handlers as read-only memoryviews rather than
+        as new bytes objects, whichever way the data is parsed. From
+        parse_bytes() they view a receive buffer that is recycled by the next
+        call, so a view is only valid until the handler returns; call
+        .tobytes() on it to keep the contents.
+
+        on_raw_frame handlers get a BGAPIRawFrame with the undecoded 4-byte
+        header and payload of every received packet, or only of those matching
+        raw_frame_filter, a set of class IDs and/or (class ID, command ID)
+        pairs. With raw_frame_only set, those packets are not decoded and
+        their own events do not fire; busy/idle tracking is unaffected, and a
+        response that a submit() or call() is waiting for is still decoded to
+        complete it.
+
+        With resync set, parse_bytes() only accepts a header whose message
+        type, class and command are in bgapi_rx_dispatch and whose length fits
+        bgapi_rx_lengths, otherwise it steps one byte and searches on through
+        the received data for the next plausible header. A partial frame still
+        incomplete after resync_timeout seconds is given up the same way;
+        check_activity() shortens its reads and the start_reader() thread
+        waits at most that long for more data, so that this happens even on
+        a port opened without a read timeout. rx_discarded_bytes and rx_partial_timeouts count the bytes
+        skipped and the partial frames given up.
+        """
+
+        self.zero_copy = zero_copy
 
     def send_command(self, ser, packet):
         if self.packet_mode: packet = chr(len(packet) & 0xFF) + packet
@@ -621,26 +2497,461 @@ class BGLib(object):
         self.busy = True
         self.on_busy()
         ser.write(packet)
+        if self.capture is not None: self.capture.write(BGAPICapture.TX, packet)
         self.on_tx_command_complete()
 
+    def send_many(self, ser, packets):
+
+        """Send several command packets, in order, with a single ser.write().
+
+        For streams of commands whose responses are not waited for one by one,
+        e.g. ble_cmd_attclient_write_command. on_before_tx_command, on_busy and
+        on_tx_command_complete fire once for the whole batch, and the
+        responses are parsed as usual when they arrive. To keep commands in
+        order with submit() and call(), raises RuntimeError while a submitted
+        command is still waiting for its response, and commands submitted
+        while the batch is written are sent after it. Returns the number of
+        packets sent.
+        """
+
+        if self.packet_mode:
+            packets = [bytes([len(packet) & 0xFF]) + packet for packet in packets]
+        else:
+            packets = list(packets)
+        if len(packets) == 0:
+            return 0
+        batch = concurrent.futures.Future()
+        with self._command_lock:
+            if self._command_pending is not None:
+                raise RuntimeError('a submitted command is still waiting for its response')
+            # submit() queues behind the batch until it has been written
+            self._command_pending = batch
+        try:
+            if self.debug:
+                for packet in packets: print('=>[ ' + ' '.join(['%02X' % b for b in packet]) + ' ]')
+            self.on_before_tx_command()
+            self.busy = True
+            self.on_busy()
+            data = b"".join(packets)
+            ser.write(data)
+            if self.capture is not None: self.capture.write(BGAPICapture.TX, data)
+            self.on_tx_command_complete()
+        finally:
+            self._command_done(batch)
+        return len(packets)
+
     def check_activity(self, ser, timeout=0):
+
+        """Read and parse pending serial data.
+
+        With buffered_read set, each read takes everything the port has waiting
+        (blocking for the first byte only when a timeout is given) and hands
+        the whole chunk to parse_bytes() instead of reading one byte per call.
+        Called from a handler, it first parses the rest of the data that
+        handler's packet arrived with, and returns at once if that completes
+        the command being waited for.
+        """
+
+        if self._rx_chunk is not None:
+            busy = self.busy
+            self.parse_bytes(b"")
+            if busy and not self.busy:
+                return self.busy
         if timeout > 0:
-            ser.timeout = timeout
+            ser.timeout = read_timeout = timeout
             while 1:
-                x = ser.read()
+                if self.resync:
+                    # wait no longer than the partial frame time limit
+                    if len(self.bgapi_rx_buffer) > 0 and self.resync_timeout < timeout:
+                        if read_timeout != self.resync_timeout:
+                            ser.timeout = read_timeout = self.resync_timeout
+                    elif read_timeout != timeout:
+                        ser.timeout = read_timeout = timeout
+                if self.buffered_read or self.resync:
+                    x = ser.read(ser.inWaiting() or 1)
+                else:
+                    x = ser.read()
                 if len(x) > 0:
-                    self.parse(x)
+                    if self.buffered_read or self.resync:
+                        self.parse_bytes(x)
+                    else:
+                        self.parse(x)
+                elif self.resync and len(self.bgapi_rx_buffer) > 0:
+                    # partial frame timed out, resync after its first byte
+                    self._parse_bytes_resync(b"", True)
                 else: # timeout
                     self.busy = False
                     self.on_idle()
                     self.on_timeout()
+                    self._timeout_command()
                 if not self.busy: # finished
                     break
+        elif self.buffered_read or self.resync:
+            while ser.inWaiting(): self.parse_bytes(ser.read(ser.inWaiting()))
         else:
             while ser.inWaiting(): self.parse(ser.read())
         return self.busy
 
+    def start_reader(self, ser, queue_size=0):
+
+        """Read and parse ser on a background daemon thread until stop() is called.
+
+        The thread blocks on the port and hands whatever each read returns to
+        parse_bytes(), so packets are handled as soon as they arrive instead of
+        at the next check_activity() poll. By default, handlers run in place on
+        the reader thread. With queue_size > 0, decoded responses and events
+        are put on event_queue, a queue.Queue of (event, args) pairs bounded to
+        queue_size entries, and their handlers run when process_events() is
+        called; the reader waits while the queue is full. on_idle, on_timeout
+        and on_raw_frame always fire on the reader thread. Do not call
+        check_activity() or parse() on ser while the reader is running.
+
+        An exception raised by a handler on the reader thread is printed and
+        counted in rx_handler_errors, and reading goes on. If reading the port
+        fails, the thread exits and commands waiting for a response fail with
+        that error.
+        """
+
+        if self._reader is not None:
+            raise RuntimeError('reader thread already running')
+        if queue_size > 0 and self.zero_copy:
+            # zero_copy views would be overwritten before the handlers run
+            raise ValueError('queue_size cannot be used with zero_copy')
+        self.event_queue = queue.Queue(queue_size) if queue_size > 0 else None
+        self._reader_port = ser
+        self._reader_stop = threading.Event()
+        self._reader = threading.Thread(target=self._run_reader, args=(ser, self._reader_stop), name='BGLib reader')
+        self._reader.daemon = True
+        self._reader.start()
+        return self._reader
+
+    def stop(self, timeout=None):
+
+        """Stop the reader thread started by start_reader() and wait for it to exit.
+
+        A blocked read is interrupted with ser.cancel_read() where the port
+        supports it, otherwise the thread exits after its current read returns
+        (after at most ser.timeout). Events still on event_queue are kept for
+        process_events(). Returns True once the thread has exited.
+        """
+
+        reader = self._reader
+        if reader is None:
+            return True
+        self._reader_stop.set()
+        if hasattr(self._reader_port, 'cancel_read'):
+            self._reader_port.cancel_read()
+        reader.join(timeout)
+        if reader.is_alive():
+            return False
+        self._reader = None
+        self._reader_port = None
+        return True
+
+    def process_events(self, timeout=None):
+
+        """Run the handlers of events queued by the reader thread, on the calling thread.
+
+        Waits up to timeout seconds (forever if None, not at all if 0) for the
+        first event, then handles everything already queued without waiting
+        again. Returns the number of events handled.
+        """
+
+        if self.event_queue is None:
+            return 0
+        try:
+            event, args = self.event_queue.get(timeout != 0, timeout)
+        except queue.Empty:
+            return 0
+        count = 0
+        while 1:
+            self._run_handlers(event, args)
+            count += 1
+            try:
+                event, args = self.event_queue.get_nowait()
+            except queue.Empty:
+                return count
+
+    def submit(self, ser, packet):
+
+        """Queue a command packet and return a concurrent.futures.Future for its response.
+
+        Submitted commands are written one at a time: the next one goes out as
+        soon as the response to the previous one, matched by class and command
+        ID, has been parsed, whether by check_activity(), the reader thread or
+        parse_bytes(). The future's result() is the args of the response, so a
+        sequence of commands takes as long as the device needs to answer them
+        rather than a check_activity() timeout each. If check_activity() times
+        out first, the pending command fails with TimeoutError and the next
+        one is sent. Commands sent directly with send_command() bypass the
+        queue.
+        """
+
+        future = concurrent.futures.Future()
+        self._queue_command(ser, packet, future)
+        return future
+
+    def call(self, ser, packet, timeout=1):
+
+        """Send a command and block until its response arrives; return the response args.
+
+        For example, ble.call(ser, ble.ble_cmd_system_address_get()).address. The command
+        is queued as with submit(). Unless the reader thread is running, the
+        port is read and parsed here (so events arriving meanwhile are handled
+        too), waiting on the port's file descriptor where it has one. So is it
+        when call() is made from a handler running on the reader thread, which
+        is blocked until the handler returns. The port timeout and other
+        settings are left as they are. Raises TimeoutError
+        if no response arrives within timeout seconds; the command is then
+        dropped and on_timeout fires.
+        """
+
+        future = self.submit(ser, packet)
+        deadline = time.monotonic() + timeout
+        if self._reader is None or threading.current_thread() is self._reader:
+            if self._rx_chunk is not None:
+                # called from a handler, the rest of its chunk comes first
+                self.parse_bytes(b"")
+            while not future.done():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if ser.inWaiting():
+                    self.parse_bytes(ser.read(ser.inWaiting()))
+                else:
+                    self._wait_readable(ser, remaining)
+        try:
+            return future.result(max(0, deadline - time.monotonic()))
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            if self._command_pending is None:
+                self.busy = False
+                self.on_idle()
+            self.on_timeout()
+            raise TimeoutError('no response to command within %s s' % timeout)
+
+    def _wait_readable(self, ser, timeout):
+
+        """(internal use) Wait up to timeout seconds for ser to have data to read."""
+
+        try:
+            fd = ser.fileno()
+        except (AttributeError, OSError, ValueError):
+            # no file descriptor to wait on (e.g. Windows), poll instead
+            time.sleep(min(timeout, 0.001))
+            return
+        select.select([fd], [], [], timeout)
+
+    def cancel_commands(self, exc=None):
+
+        """Drop all submitted commands that have not completed yet.
+
+        Their futures are failed with exc, or cancelled if exc is None.
+        """
+
+        with self._command_lock:
+            futures = [future for ser, packet, future in self._command_queue]
+            self._command_queue.clear()
+            for waiters in self._response_waiters.values():
+                futures.extend(future for future in waiters if future is not None)
+        for future in futures:
+            if exc is None:
+                future.cancel()
+            else:
+                try:
+                    future.set_exception(exc)
+                except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+                    pass
+
+    def _run_reader(self, ser, stop):
+
+        """(internal use) Reader thread body, see start_reader()."""
+
+        try:
+            while not stop.is_set():
+                if self._rx_chunk is not None:
+                    # a handler failed partway through a chunk, parse the rest
+                    x = b""
+                else:
+                    waiting = ser.inWaiting()
+                    partial = self.resync and len(self.bgapi_rx_buffer) > 0
+                    if waiting == 0 and (partial or getattr(ser, 'timeout', None) == 0):
+                        # wait here rather than spin on a non-blocking read(),
+                        # or block on a partial frame past resync_timeout
+                        self._wait_readable(ser, self.resync_timeout)
+                        waiting = ser.inWaiting()
+                    if waiting == 0 and partial:
+                        x = b""
+                    else:
+                        x = ser.read(waiting or 1)
+                try:
+                    if len(x) > 0 or self._rx_chunk is not None:
+                        self.parse_bytes(x)
+                    elif self.resync and len(self.bgapi_rx_buffer) > 0 and not stop.is_set():
+                        # nothing arrived to complete a partial frame
+                        self.parse_bytes(b"")
+                except Exception:
+                    self.rx_handler_errors += 1
+                    traceback.print_exc()
+        except Exception as exc:
+            # the port failed, no response can arrive any more
+            self.cancel_commands(exc)
+            raise
+        finally:
+            if self._reader is threading.current_thread():
+                self._reader = None
+
+    def _fire_event(self, event, args):
+
+        """(internal use) Run the handlers of a decoded packet, or queue them for
+        process_events(), waiting while event_queue is full."""
+
+        if self.event_queue is None:
+            self._run_handlers(event, args)
+            return
+        while 1:
+            try:
+                self.event_queue.put((event, args), True, 0.1)
+                return
+            except queue.Full:
+                if self._reader is not None and self._reader_stop.is_set():
+                    # stopping, nobody may be draining the queue
+                    self.rx_dropped_events += 1
+                    return
+
+    def on_batch(self, name, func, max_items=512, max_delay=0.05, columnar=False):
+
+        """Subscribe func(sender, batch) to batches of the event called name.
+
+        One call covers up to max_items packets, collected for at most
+        max_delay seconds (None waits for max_items), as a list of args
+        records or, with columnar, as a dict of one list per field:
+
+            ble.on_batch('ble_evt_gap_scan_response', store, columnar=True)
+
+        Returns the BGAPIBatchHandler; remove it with -= on the event and
+        call its flush() to deliver what is left.
+        """
+
+        handler = BGAPIBatchHandler(func, max_items, max_delay, columnar)
+        getattr(self, name).add(handler)
+        return handler
+
+    def _run_handlers(self, event, args):
+
+        """(internal use) Call the handlers of event, then the matching on_any() handlers."""
+
+        for func in self.__eventhandler__.get(event, ()):
+            func(self, args)
+        if self._any_handlers:
+            for func in self._any_handlers.get(getattr(event, 'kind', None), ()):
+                func(self, event.name, args)
+
+    def on_any(self, func, kinds=('response', 'event')):
+
+        """Call func(sender, name, args) for every message of the given kinds.
+
+        kinds may include 'response' and 'event' for decoded messages, where
+        name is the event attribute name, and 'raw_frame' for every frame
+        on_raw_frame would see, with name 'on_raw_frame' and args a
+        BGAPIRawFrame. Decoded handlers run wherever the message's own
+        handlers run (see start_reader()). With no on_any() handlers the
+        receive path only checks one empty dict.
+        """
+
+        for kind in kinds:
+            if kind not in ('response', 'event', 'raw_frame'):
+                raise ValueError('unknown message kind %r' % (kind,))
+        for kind in kinds:
+            self._any_handlers[kind] = self._any_handlers.get(kind, ()) + (func,)
+
+    def off_any(self, func):
+
+        """Remove func from every kind it was added to with on_any()."""
+
+        for kind, functions in list(self._any_handlers.items()):
+            functions = tuple(f for f in functions if f != func)
+            if functions:
+                self._any_handlers[kind] = functions
+            else:
+                del self._any_handlers[kind]
+
+    def subscribe_attribute(self, connection, handle, func):
+
+        """Call func(sender, args) for each ble_evt_attclient_attribute_value of one
+        connection and atthandle only.
+
+        Packets are routed on the connection and handle bytes before they
+        are decoded, so the cost per notification does not grow with the
+        number of subscriptions, and one that nobody subscribed to is not
+        decoded at all. Handlers added to ble_evt_attclient_attribute_value itself
+        still see every notification.
+        """
+
+        key = (BGLib.ble_evt_attclient_attribute_value, connection, handle)
+        self.__eventhandler__[key] = self.__eventhandler__.get(key, ()) + (func,)
+        self._attribute_event = BGLib.ble_evt_attclient_attribute_value
+
+    def unsubscribe_attribute(self, connection, handle, func):
+
+        """Remove a func added with subscribe_attribute() for this connection and handle."""
+
+        key = (BGLib.ble_evt_attclient_attribute_value, connection, handle)
+        functions = list(self.__eventhandler__.get(key, ()))
+        functions.remove(func)
+        if functions:
+            self.__eventhandler__[key] = tuple(functions)
+        else:
+            del self.__eventhandler__[key]
+
+    def _route_attribute(self, decoder, event, buf, start, end):
+
+        """(internal use) Fire the subscribe_attribute() handlers of one
+        notification, keyed on its connection and handle bytes."""
+
+        key = (event, buf[start + 4], buf[start + 5] | buf[start + 6] << 8)
+        routed = self.__eventhandler__.get(key)
+        if routed or self.__eventhandler__.get(event) or self._any_handlers:
+            args = decoder(buf, start + 4, end)
+            if routed:
+                self._fire_event(key, args)
+            if self.__eventhandler__.get(event) or self._any_handlers:
+                self._fire_event(event, args)
+
+    def start_capture(self, file):
+
+        """Record every chunk parsed and command sent from now on to file, a
+        path or binary file object (see BGAPICapture); returns the capture.
+
+        Bytes given to parse() one at a time are recorded together, once a
+        packet is complete.
+        """
+
+        self.stop_capture()
+        self._capture_rx = bytearray()
+        self.capture = BGAPICapture(file)
+        return self.capture
+
+    def stop_capture(self):
+        if self.capture is not None:
+            self._write_capture_rx()
+            capture, self.capture = self.capture, None
+            capture.close()
+
+    def _write_capture_rx(self):
+
+        """(internal use) Record the bytes parse() has collected for the capture."""
+
+        if len(self._capture_rx) > 0:
+            self.capture.write(BGAPICapture.RX, self._capture_rx)
+            self._capture_rx = bytearray()
+
     def parse(self, barray):
+        if self._rx_chunk is not None:
+            # called from a handler while parse_bytes() is working through a
+            # chunk; the rest of that chunk comes first
+            return self.parse_bytes(barray[:1])
+        if self.capture is not None: self._capture_rx += barray[:1]
         b=barray[0]
         if len(self.bgapi_rx_buffer) == 0 and (b == 0x00 or b == 0x80 or b == 0x08 or b == 0x88):
             self.bgapi_rx_buffer+=bytes([b])
@@ -664,664 +2975,2188 @@ class BGLib(object):
 
         #print'%02X: %d, %d' % (b, len(self.bgapi_rx_buffer), self.bgapi_rx_expected_length)
         if self.bgapi_rx_expected_length > 0 and len(self.bgapi_rx_buffer) == self.bgapi_rx_expected_length:
-            if self.debug: print('<=[ ' + ' '.join(['%02X' % b for b in self.bgapi_rx_buffer ]) + ' ]')
-            packet_type, payload_length, packet_class, packet_command = self.bgapi_rx_buffer[:4]
-            self.bgapi_rx_payload = self.bgapi_rx_buffer[4:]
+            packet = self.bgapi_rx_buffer
             self.bgapi_rx_buffer = b""
-            if packet_type & 0x88 == 0x00:
-                # 0x00 = BLE response packet
-                if packet_class == 0:
-                    if packet_command == 0: # ble_rsp_system_reset
-                        self.ble_rsp_system_reset({  })
-                        self.busy = False
-                        self.on_idle()
-                    elif packet_command == 1: # ble_rsp_system_hello
-                        self.ble_rsp_system_hello({  })
-                    elif packet_command == 2: # ble_rsp_system_address_get
-                        address = struct.unpack('<6s', self.bgapi_rx_payload[:6])[0]
-                        address = address
-                        self.ble_rsp_system_address_get({ 'address': address })
-                    elif packet_command == 3: # ble_rsp_system_reg_write
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_system_reg_write({ 'result': result })
-                    elif packet_command == 4: # ble_rsp_system_reg_read
-                        address, value = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_system_reg_read({ 'address': address, 'value': value })
-                    elif packet_command == 5: # ble_rsp_system_get_counters
-                        txok, txretry, rxok, rxfail, mbuf = struct.unpack('<BBBBB', self.bgapi_rx_payload[:5])
-                        self.ble_rsp_system_get_counters({ 'txok': txok, 'txretry': txretry, 'rxok': rxok, 'rxfail': rxfail, 'mbuf': mbuf })
-                    elif packet_command == 6: # ble_rsp_system_get_connections
-                        maxconn = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.ble_rsp_system_get_connections({ 'maxconn': maxconn })
-                    elif packet_command == 7: # ble_rsp_system_read_memory
-                        address, data_len = struct.unpack('<IB', self.bgapi_rx_payload[:5])
-                        data_data = self.bgapi_rx_payload[5:]
-                        self.ble_rsp_system_read_memory({ 'address': address, 'data': data_data })
-                    elif packet_command == 8: # ble_rsp_system_get_info
-                        major, minor, patch, build, ll_version, protocol_version, hw = struct.unpack('<HHHHHBB', self.bgapi_rx_payload[:12])
-                        self.ble_rsp_system_get_info({ 'major': major, 'minor': minor, 'patch': patch, 'build': build, 'll_version': ll_version, 'protocol_version': protocol_version, 'hw': hw })
-                    elif packet_command == 9: # ble_rsp_system_endpoint_tx
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_system_endpoint_tx({ 'result': result })
-                    elif packet_command == 10: # ble_rsp_system_whitelist_append
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_system_whitelist_append({ 'result': result })
-                    elif packet_command == 11: # ble_rsp_system_whitelist_remove
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_system_whitelist_remove({ 'result': result })
-                    elif packet_command == 12: # ble_rsp_system_whitelist_clear
-                        self.ble_rsp_system_whitelist_clear({  })
-                    elif packet_command == 13: # ble_rsp_system_endpoint_rx
-                        result, data_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        data_data = self.bgapi_rx_payload[3:]
-                        self.ble_rsp_system_endpoint_rx({ 'result': result, 'data': data_data })
-                    elif packet_command == 14: # ble_rsp_system_endpoint_set_watermarks
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_system_endpoint_set_watermarks({ 'result': result })
-                elif packet_class == 1:
-                    if packet_command == 0: # ble_rsp_flash_ps_defrag
-                        self.ble_rsp_flash_ps_defrag({  })
-                    elif packet_command == 1: # ble_rsp_flash_ps_dump
-                        self.ble_rsp_flash_ps_dump({  })
-                    elif packet_command == 2: # ble_rsp_flash_ps_erase_all
-                        self.ble_rsp_flash_ps_erase_all({  })
-                    elif packet_command == 3: # ble_rsp_flash_ps_save
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_flash_ps_save({ 'result': result })
-                    elif packet_command == 4: # ble_rsp_flash_ps_load
-                        result, value_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        value_data = self.bgapi_rx_payload[3:]
-                        self.ble_rsp_flash_ps_load({ 'result': result, 'value': value_data })
-                    elif packet_command == 5: # ble_rsp_flash_ps_erase
-                        self.ble_rsp_flash_ps_erase({  })
-                    elif packet_command == 6: # ble_rsp_flash_erase_page
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_flash_erase_page({ 'result': result })
-                    elif packet_command == 7: # ble_rsp_flash_write_words
-                        self.ble_rsp_flash_write_words({  })
-                elif packet_class == 2:
-                    if packet_command == 0: # ble_rsp_attributes_write
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_attributes_write({ 'result': result })
-                    elif packet_command == 1: # ble_rsp_attributes_read
-                        handle, offset, result, value_len = struct.unpack('<HHHB', self.bgapi_rx_payload[:7])
-                        value_data = self.bgapi_rx_payload[7:]
-                        self.ble_rsp_attributes_read({ 'handle': handle, 'offset': offset, 'result': result, 'value': value_data })
-                    elif packet_command == 2: # ble_rsp_attributes_read_type
-                        handle, result, value_len = struct.unpack('<HHB', self.bgapi_rx_payload[:5])
-                        value_data = self.bgapi_rx_payload[5:]
-                        self.ble_rsp_attributes_read_type({ 'handle': handle, 'result': result, 'value': value_data })
-                    elif packet_command == 3: # ble_rsp_attributes_user_read_response
-                        self.ble_rsp_attributes_user_read_response({  })
-                    elif packet_command == 4: # ble_rsp_attributes_user_write_response
-                        self.ble_rsp_attributes_user_write_response({  })
-                elif packet_class == 3:
-                    if packet_command == 0: # ble_rsp_connection_disconnect
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_connection_disconnect({ 'connection': connection, 'result': result })
-                    elif packet_command == 1: # ble_rsp_connection_get_rssi
-                        connection, rssi = struct.unpack('<Bb', self.bgapi_rx_payload[:2])
-                        self.ble_rsp_connection_get_rssi({ 'connection': connection, 'rssi': rssi })
-                    elif packet_command == 2: # ble_rsp_connection_update
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_connection_update({ 'connection': connection, 'result': result })
-                    elif packet_command == 3: # ble_rsp_connection_version_update
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_connection_version_update({ 'connection': connection, 'result': result })
-                    elif packet_command == 4: # ble_rsp_connection_channel_map_get
-                        connection, map_len = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        map_data = self.bgapi_rx_payload[2:]
-                        self.ble_rsp_connection_channel_map_get({ 'connection': connection, 'map': map_data })
-                    elif packet_command == 5: # ble_rsp_connection_channel_map_set
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_connection_channel_map_set({ 'connection': connection, 'result': result })
-                    elif packet_command == 6: # ble_rsp_connection_features_get
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_connection_features_get({ 'connection': connection, 'result': result })
-                    elif packet_command == 7: # ble_rsp_connection_get_status
-                        connection = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.ble_rsp_connection_get_status({ 'connection': connection })
-                    elif packet_command == 8: # ble_rsp_connection_raw_tx
-                        connection = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.ble_rsp_connection_raw_tx({ 'connection': connection })
-                elif packet_class == 4:
-                    if packet_command == 0: # ble_rsp_attclient_find_by_type_value
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_find_by_type_value({ 'connection': connection, 'result': result })
-                    elif packet_command == 1: # ble_rsp_attclient_read_by_group_type
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_read_by_group_type({ 'connection': connection, 'result': result })
-                    elif packet_command == 2: # ble_rsp_attclient_read_by_type
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_read_by_type({ 'connection': connection, 'result': result })
-                    elif packet_command == 3: # ble_rsp_attclient_find_information
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_find_information({ 'connection': connection, 'result': result })
-                    elif packet_command == 4: # ble_rsp_attclient_read_by_handle
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_read_by_handle({ 'connection': connection, 'result': result })
-                    elif packet_command == 5: # ble_rsp_attclient_attribute_write
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_attribute_write({ 'connection': connection, 'result': result })
-                    elif packet_command == 6: # ble_rsp_attclient_write_command
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_write_command({ 'connection': connection, 'result': result })
-                    elif packet_command == 7: # ble_rsp_attclient_indicate_confirm
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_attclient_indicate_confirm({ 'result': result })
-                    elif packet_command == 8: # ble_rsp_attclient_read_long
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_read_long({ 'connection': connection, 'result': result })
-                    elif packet_command == 9: # ble_rsp_attclient_prepare_write
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_prepare_write({ 'connection': connection, 'result': result })
-                    elif packet_command == 10: # ble_rsp_attclient_execute_write
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_execute_write({ 'connection': connection, 'result': result })
-                    elif packet_command == 11: # ble_rsp_attclient_read_multiple
-                        connection, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_attclient_read_multiple({ 'connection': connection, 'result': result })
-                elif packet_class == 5:
-                    if packet_command == 0: # ble_rsp_sm_encrypt_start
-                        handle, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_sm_encrypt_start({ 'handle': handle, 'result': result })
-                    elif packet_command == 1: # ble_rsp_sm_set_bondable_mode
-                        self.ble_rsp_sm_set_bondable_mode({  })
-                    elif packet_command == 2: # ble_rsp_sm_delete_bonding
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_sm_delete_bonding({ 'result': result })
-                    elif packet_command == 3: # ble_rsp_sm_set_parameters
-                        self.ble_rsp_sm_set_parameters({  })
-                    elif packet_command == 4: # ble_rsp_sm_passkey_entry
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_sm_passkey_entry({ 'result': result })
-                    elif packet_command == 5: # ble_rsp_sm_get_bonds
-                        bonds = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.ble_rsp_sm_get_bonds({ 'bonds': bonds })
-                    elif packet_command == 6: # ble_rsp_sm_set_oob_data
-                        self.ble_rsp_sm_set_oob_data({  })
-                elif packet_class == 6:
-                    if packet_command == 0: # ble_rsp_gap_set_privacy_flags
-                        self.ble_rsp_gap_set_privacy_flags({  })
-                    elif packet_command == 1: # ble_rsp_gap_set_mode
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_gap_set_mode({ 'result': result })
-                    elif packet_command == 2: # ble_rsp_gap_discover
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_gap_discover({ 'result': result })
-                    elif packet_command == 3: # ble_rsp_gap_connect_direct
-                        result, connection_handle = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_gap_connect_direct({ 'result': result, 'connection_handle': connection_handle })
-                    elif packet_command == 4: # ble_rsp_gap_end_procedure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_gap_end_procedure({ 'result': result })
-                    elif packet_command == 5: # ble_rsp_gap_connect_selective
-                        result, connection_handle = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.ble_rsp_gap_connect_selective({ 'result': result, 'connection_handle': connection_handle })
-                    elif packet_command == 6: # ble_rsp_gap_set_filtering
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_gap_set_filtering({ 'result': result })
-                    elif packet_command == 7: # ble_rsp_gap_set_scan_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_gap_set_scan_parameters({ 'result': result })
-                    elif packet_command == 8: # ble_rsp_gap_set_adv_parameters
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_gap_set_adv_parameters({ 'result': result })
-                    elif packet_command == 9: # ble_rsp_gap_set_adv_data
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_gap_set_adv_data({ 'result': result })
-                    elif packet_command == 10: # ble_rsp_gap_set_directed_connectable_mode
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_gap_set_directed_connectable_mode({ 'result': result })
-                elif packet_class == 7:
-                    if packet_command == 0: # ble_rsp_hardware_io_port_config_irq
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_io_port_config_irq({ 'result': result })
-                    elif packet_command == 1: # ble_rsp_hardware_set_soft_timer
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_set_soft_timer({ 'result': result })
-                    elif packet_command == 2: # ble_rsp_hardware_adc_read
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_adc_read({ 'result': result })
-                    elif packet_command == 3: # ble_rsp_hardware_io_port_config_direction
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_io_port_config_direction({ 'result': result })
-                    elif packet_command == 4: # ble_rsp_hardware_io_port_config_function
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_io_port_config_function({ 'result': result })
-                    elif packet_command == 5: # ble_rsp_hardware_io_port_config_pull
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_io_port_config_pull({ 'result': result })
-                    elif packet_command == 6: # ble_rsp_hardware_io_port_write
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_io_port_write({ 'result': result })
-                    elif packet_command == 7: # ble_rsp_hardware_io_port_read
-                        result, port, data = struct.unpack('<HBB', self.bgapi_rx_payload[:4])
-                        self.ble_rsp_hardware_io_port_read({ 'result': result, 'port': port, 'data': data })
-                    elif packet_command == 8: # ble_rsp_hardware_spi_config
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_spi_config({ 'result': result })
-                    elif packet_command == 9: # ble_rsp_hardware_spi_transfer
-                        result, channel, data_len = struct.unpack('<HBB', self.bgapi_rx_payload[:4])
-                        data_data = self.bgapi_rx_payload[4:]
-                        self.ble_rsp_hardware_spi_transfer({ 'result': result, 'channel': channel, 'data': data_data })
-                    elif packet_command == 10: # ble_rsp_hardware_i2c_read
-                        result, data_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        data_data = self.bgapi_rx_payload[3:]
-                        self.ble_rsp_hardware_i2c_read({ 'result': result, 'data': data_data })
-                    elif packet_command == 11: # ble_rsp_hardware_i2c_write
-                        written = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.ble_rsp_hardware_i2c_write({ 'written': written })
-                    elif packet_command == 12: # ble_rsp_hardware_set_txpower
-                        self.ble_rsp_hardware_set_txpower({  })
-                    elif packet_command == 13: # ble_rsp_hardware_timer_comparator
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_hardware_timer_comparator({ 'result': result })
-                elif packet_class == 8:
-                    if packet_command == 0: # ble_rsp_test_phy_tx
-                        self.ble_rsp_test_phy_tx({  })
-                    elif packet_command == 1: # ble_rsp_test_phy_rx
-                        self.ble_rsp_test_phy_rx({  })
-                    elif packet_command == 2: # ble_rsp_test_phy_end
-                        counter = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.ble_rsp_test_phy_end({ 'counter': counter })
-                    elif packet_command == 3: # ble_rsp_test_phy_reset
-                        self.ble_rsp_test_phy_reset({  })
-                    elif packet_command == 4: # ble_rsp_test_get_channel_map
-                        channel_map_len = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        channel_map_data = self.bgapi_rx_payload[1:]
-                        self.ble_rsp_test_get_channel_map({ 'channel_map': channel_map_data })
-                    elif packet_command == 5: # ble_rsp_test_debug
-                        output_len = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        output_data = self.bgapi_rx_payload[1:]
-                        self.ble_rsp_test_debug({ 'output': output_data })
-                self.busy = False
-                self.on_idle()
-            elif packet_type & 0x88 == 0x80:
-                # 0x80 = BLE event packet
-                if packet_class == 0:
-                    if packet_command == 0: # ble_evt_system_boot
-                        major, minor, patch, build, ll_version, protocol_version, hw = struct.unpack('<HHHHHBB', self.bgapi_rx_payload[:12])
-                        self.ble_evt_system_boot({ 'major': major, 'minor': minor, 'patch': patch, 'build': build, 'll_version': ll_version, 'protocol_version': protocol_version, 'hw': hw })
-                        self.busy = False
-                        self.on_idle()
-                    elif packet_command == 1: # ble_evt_system_debug
-                        data_len = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        data_data = self.bgapi_rx_payload[1:]
-                        self.ble_evt_system_debug({ 'data': data_data })
-                    elif packet_command == 2: # ble_evt_system_endpoint_watermark_rx
-                        endpoint, data = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        self.ble_evt_system_endpoint_watermark_rx({ 'endpoint': endpoint, 'data': data })
-                    elif packet_command == 3: # ble_evt_system_endpoint_watermark_tx
-                        endpoint, data = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        self.ble_evt_system_endpoint_watermark_tx({ 'endpoint': endpoint, 'data': data })
-                    elif packet_command == 4: # ble_evt_system_script_failure
-                        address, reason = struct.unpack('<HH', self.bgapi_rx_payload[:4])
-                        self.ble_evt_system_script_failure({ 'address': address, 'reason': reason })
-                    elif packet_command == 5: # ble_evt_system_no_license_key
-                        self.ble_evt_system_no_license_key({  })
-                elif packet_class == 1:
-                    if packet_command == 0: # ble_evt_flash_ps_key
-                        key, value_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        value_data = self.bgapi_rx_payload[3:]
-                        self.ble_evt_flash_ps_key({ 'key': key, 'value': value_data })
-                elif packet_class == 2:
-                    if packet_command == 0: # ble_evt_attributes_value
-                        connection, reason, handle, offset, value_len = struct.unpack('<BBHHB', self.bgapi_rx_payload[:7])
-                        value_data = self.bgapi_rx_payload[7:]
-                        self.ble_evt_attributes_value({ 'connection': connection, 'reason': reason, 'handle': handle, 'offset': offset, 'value': value_data })
-                    elif packet_command == 1: # ble_evt_attributes_user_read_request
-                        connection, handle, offset, maxsize = struct.unpack('<BHHB', self.bgapi_rx_payload[:6])
-                        self.ble_evt_attributes_user_read_request({ 'connection': connection, 'handle': handle, 'offset': offset, 'maxsize': maxsize })
-                    elif packet_command == 2: # ble_evt_attributes_status
-                        handle, flags = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.ble_evt_attributes_status({ 'handle': handle, 'flags': flags })
-                elif packet_class == 3:
-                    if packet_command == 0: # ble_evt_connection_status
-                        connection, flags, address, address_type, conn_interval, timeout, latency, bonding = struct.unpack('<BB6sBHHHB', self.bgapi_rx_payload[:16])
-                        address = address
-                        self.ble_evt_connection_status({ 'connection': connection, 'flags': flags, 'address': address, 'address_type': address_type, 'conn_interval': conn_interval, 'timeout': timeout, 'latency': latency, 'bonding': bonding })
-                    elif packet_command == 1: # ble_evt_connection_version_ind
-                        connection, vers_nr, comp_id, sub_vers_nr = struct.unpack('<BBHH', self.bgapi_rx_payload[:6])
-                        self.ble_evt_connection_version_ind({ 'connection': connection, 'vers_nr': vers_nr, 'comp_id': comp_id, 'sub_vers_nr': sub_vers_nr })
-                    elif packet_command == 2: # ble_evt_connection_feature_ind
-                        connection, features_len = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        features_data = self.bgapi_rx_payload[2:]
-                        self.ble_evt_connection_feature_ind({ 'connection': connection, 'features': features_data })
-                    elif packet_command == 3: # ble_evt_connection_raw_rx
-                        connection, data_len = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        data_data = self.bgapi_rx_payload[2:]
-                        self.ble_evt_connection_raw_rx({ 'connection': connection, 'data': data_data })
-                    elif packet_command == 4: # ble_evt_connection_disconnected
-                        connection, reason = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_evt_connection_disconnected({ 'connection': connection, 'reason': reason })
-                elif packet_class == 4:
-                    if packet_command == 0: # ble_evt_attclient_indicated
-                        connection, attrhandle = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_evt_attclient_indicated({ 'connection': connection, 'attrhandle': attrhandle })
-                    elif packet_command == 1: # ble_evt_attclient_procedure_completed
-                        connection, result, chrhandle = struct.unpack('<BHH', self.bgapi_rx_payload[:5])
-                        self.ble_evt_attclient_procedure_completed({ 'connection': connection, 'result': result, 'chrhandle': chrhandle })
-                    elif packet_command == 2: # ble_evt_attclient_group_found
-                        connection, start, end, uuid_len = struct.unpack('<BHHB', self.bgapi_rx_payload[:6])
-                        uuid_data = self.bgapi_rx_payload[6:]
-                        self.ble_evt_attclient_group_found({ 'connection': connection, 'start': start, 'end': end, 'uuid': uuid_data })
-                    elif packet_command == 3: # ble_evt_attclient_attribute_found
-                        connection, chrdecl, value, properties, uuid_len = struct.unpack('<BHHBB', self.bgapi_rx_payload[:7])
-                        uuid_data = self.bgapi_rx_payload[7:]
-                        self.ble_evt_attclient_attribute_found({ 'connection': connection, 'chrdecl': chrdecl, 'value': value, 'properties': properties, 'uuid': uuid_data })
-                    elif packet_command == 4: # ble_evt_attclient_find_information_found
-                        connection, chrhandle, uuid_len = struct.unpack('<BHB', self.bgapi_rx_payload[:4])
-                        uuid_data = self.bgapi_rx_payload[4:]
-                        self.ble_evt_attclient_find_information_found({ 'connection': connection, 'chrhandle': chrhandle, 'uuid': uuid_data })
-                    elif packet_command == 5: # ble_evt_attclient_attribute_value
-                        connection, atthandle, type, value_len = struct.unpack('<BHBB', self.bgapi_rx_payload[:5])
-                        value_data = self.bgapi_rx_payload[5:]
-                        self.ble_evt_attclient_attribute_value({ 'connection': connection, 'atthandle': atthandle, 'type': type, 'value': value_data })
-                    elif packet_command == 6: # ble_evt_attclient_read_multiple_response
-                        connection, handles_len = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        handles_data = self.bgapi_rx_payload[2:]
-                        self.ble_evt_attclient_read_multiple_response({ 'connection': connection, 'handles': handles_data })
-                elif packet_class == 5:
-                    if packet_command == 0: # ble_evt_sm_smp_data
-                        handle, packet, data_len = struct.unpack('<BBB', self.bgapi_rx_payload[:3])
-                        data_data = self.bgapi_rx_payload[3:]
-                        self.ble_evt_sm_smp_data({ 'handle': handle, 'packet': packet, 'data': data_data })
-                    elif packet_command == 1: # ble_evt_sm_bonding_fail
-                        handle, result = struct.unpack('<BH', self.bgapi_rx_payload[:3])
-                        self.ble_evt_sm_bonding_fail({ 'handle': handle, 'result': result })
-                    elif packet_command == 2: # ble_evt_sm_passkey_display
-                        handle, passkey = struct.unpack('<BI', self.bgapi_rx_payload[:5])
-                        self.ble_evt_sm_passkey_display({ 'handle': handle, 'passkey': passkey })
-                    elif packet_command == 3: # ble_evt_sm_passkey_request
-                        handle = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.ble_evt_sm_passkey_request({ 'handle': handle })
-                    elif packet_command == 4: # ble_evt_sm_bond_status
-                        bond, keysize, mitm, keys = struct.unpack('<BBBB', self.bgapi_rx_payload[:4])
-                        self.ble_evt_sm_bond_status({ 'bond': bond, 'keysize': keysize, 'mitm': mitm, 'keys': keys })
-                elif packet_class == 6:
-                    if packet_command == 0: # ble_evt_gap_scan_response
-                        rssi, packet_type, sender, address_type, bond, data_len = struct.unpack('<bB6sBBB', self.bgapi_rx_payload[:11])
-                        sender = sender
-                        data_data = self.bgapi_rx_payload[11:]
-                        self.ble_evt_gap_scan_response({ 'rssi': rssi, 'packet_type': packet_type, 'sender': sender, 'address_type': address_type, 'bond': bond, 'data': data_data })
-                    elif packet_command == 1: # ble_evt_gap_mode_changed
-                        discover, connect = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        self.ble_evt_gap_mode_changed({ 'discover': discover, 'connect': connect })
-                elif packet_class == 7:
-                    if packet_command == 0: # ble_evt_hardware_io_port_status
-                        timestamp, port, irq, state = struct.unpack('<IBBB', self.bgapi_rx_payload[:7])
-                        self.ble_evt_hardware_io_port_status({ 'timestamp': timestamp, 'port': port, 'irq': irq, 'state': state })
-                    elif packet_command == 1: # ble_evt_hardware_soft_timer
-                        handle = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.ble_evt_hardware_soft_timer({ 'handle': handle })
-                    elif packet_command == 2: # ble_evt_hardware_adc_result
-                        input, value = struct.unpack('<Bh', self.bgapi_rx_payload[:3])
-                        self.ble_evt_hardware_adc_result({ 'input': input, 'value': value })
-            elif packet_type & 0x88 == 0x08:
-                # 0x08 = wifi response packet
-                if packet_class == 0:
-                    if packet_command == 0: # wifi_rsp_dfu_reset
-                        self.wifi_rsp_dfu_reset({  })
-                        self.busy = False
-                        self.on_idle()
-                    elif packet_command == 1: # wifi_rsp_dfu_flash_set_address
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_dfu_flash_set_address({ 'result': result })
-                    elif packet_command == 2: # wifi_rsp_dfu_flash_upload
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_dfu_flash_upload({ 'result': result })
-                    elif packet_command == 3: # wifi_rsp_dfu_flash_upload_finish
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_dfu_flash_upload_finish({ 'result': result })
-                elif packet_class == 1:
-                    if packet_command == 0: # wifi_rsp_system_sync
-                        self.wifi_rsp_system_sync({  })
-                    elif packet_command == 1: # wifi_rsp_system_reset
-                        self.wifi_rsp_system_reset({  })
-                    elif packet_command == 2: # wifi_rsp_system_hello
-                        self.wifi_rsp_system_hello({  })
-                    elif packet_command == 3: # wifi_rsp_system_set_max_power_saving_state
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_system_set_max_power_saving_state({ 'result': result })
-                elif packet_class == 2:
-                    if packet_command == 0: # wifi_rsp_config_get_mac
-                        result, hw_interface = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_config_get_mac({ 'result': result, 'hw_interface': hw_interface })
-                    elif packet_command == 1: # wifi_rsp_config_set_mac
-                        result, hw_interface = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_config_set_mac({ 'result': result, 'hw_interface': hw_interface })
-                elif packet_class == 3:
-                    if packet_command == 0: # wifi_rsp_sme_wifi_on
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_sme_wifi_on({ 'result': result })
-                    elif packet_command == 1: # wifi_rsp_sme_wifi_off
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_sme_wifi_off({ 'result': result })
-                    elif packet_command == 2: # wifi_rsp_sme_power_on
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_sme_power_on({ 'result': result })
-                    elif packet_command == 3: # wifi_rsp_sme_start_scan
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_sme_start_scan({ 'result': result })
-                    elif packet_command == 4: # wifi_rsp_sme_stop_scan
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_sme_stop_scan({ 'result': result })
-                    elif packet_command == 5: # wifi_rsp_sme_set_password
-                        status = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_rsp_sme_set_password({ 'status': status })
-                    elif packet_command == 6: # wifi_rsp_sme_connect_bssid
-                        result, hw_interface = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_sme_connect_bssid({ 'result': result, 'hw_interface': hw_interface })
-                    elif packet_command == 7: # wifi_rsp_sme_connect_ssid
-                        result, hw_interface = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_sme_connect_ssid({ 'result': result, 'hw_interface': hw_interface })
-                    elif packet_command == 8: # wifi_rsp_sme_disconnect
-                        result, hw_interface = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_sme_disconnect({ 'result': result, 'hw_interface': hw_interface })
-                    elif packet_command == 9: # wifi_rsp_sme_set_scan_channels
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_sme_set_scan_channels({ 'result': result })
-                elif packet_class == 4:
-                    if packet_command == 0: # wifi_rsp_tcpip_start_tcp_server
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_tcpip_start_tcp_server({ 'result': result, 'endpoint': endpoint })
-                    elif packet_command == 1: # wifi_rsp_tcpip_tcp_connect
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_tcpip_tcp_connect({ 'result': result, 'endpoint': endpoint })
-                    elif packet_command == 2: # wifi_rsp_tcpip_start_udp_server
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_tcpip_start_udp_server({ 'result': result, 'endpoint': endpoint })
-                    elif packet_command == 3: # wifi_rsp_tcpip_udp_connect
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_tcpip_udp_connect({ 'result': result, 'endpoint': endpoint })
-                    elif packet_command == 4: # wifi_rsp_tcpip_configure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_tcpip_configure({ 'result': result })
-                    elif packet_command == 5: # wifi_rsp_tcpip_dns_configure
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_tcpip_dns_configure({ 'result': result })
-                    elif packet_command == 6: # wifi_rsp_tcpip_dns_gethostbyname
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_tcpip_dns_gethostbyname({ 'result': result })
-                elif packet_class == 5:
-                    if packet_command == 0: # wifi_rsp_endpoint_send
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_endpoint_send({ 'result': result, 'endpoint': endpoint })
-                    elif packet_command == 1: # wifi_rsp_endpoint_set_streaming
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_endpoint_set_streaming({ 'result': result, 'endpoint': endpoint })
-                    elif packet_command == 2: # wifi_rsp_endpoint_set_active
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_endpoint_set_active({ 'result': result, 'endpoint': endpoint })
-                    elif packet_command == 3: # wifi_rsp_endpoint_set_streaming_destination
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_endpoint_set_streaming_destination({ 'result': result, 'endpoint': endpoint })
-                    elif packet_command == 4: # wifi_rsp_endpoint_close
-                        result, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_rsp_endpoint_close({ 'result': result, 'endpoint': endpoint })
-                elif packet_class == 6:
-                    if packet_command == 0: # wifi_rsp_hardware_set_soft_timer
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_hardware_set_soft_timer({ 'result': result })
-                    elif packet_command == 1: # wifi_rsp_hardware_external_interrupt_config
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_hardware_external_interrupt_config({ 'result': result })
-                    elif packet_command == 2: # wifi_rsp_hardware_change_notification_config
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_hardware_change_notification_config({ 'result': result })
-                    elif packet_command == 3: # wifi_rsp_hardware_change_notification_pullup
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_hardware_change_notification_pullup({ 'result': result })
-                    elif packet_command == 4: # wifi_rsp_hardware_io_port_config_direction
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_hardware_io_port_config_direction({ 'result': result })
-                    elif packet_command == 5: # wifi_rsp_hardware_io_port_config_open_drain
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_hardware_io_port_config_open_drain({ 'result': result })
-                    elif packet_command == 6: # wifi_rsp_hardware_io_port_write
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_hardware_io_port_write({ 'result': result })
-                    elif packet_command == 7: # wifi_rsp_hardware_io_port_read
-                        result, port, data = struct.unpack('<HBH', self.bgapi_rx_payload[:5])
-                        self.wifi_rsp_hardware_io_port_read({ 'result': result, 'port': port, 'data': data })
-                    elif packet_command == 8: # wifi_rsp_hardware_output_compare
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_hardware_output_compare({ 'result': result })
-                    elif packet_command == 9: # wifi_rsp_hardware_adc_read
-                        result, input, value = struct.unpack('<HBH', self.bgapi_rx_payload[:5])
-                        self.wifi_rsp_hardware_adc_read({ 'result': result, 'input': input, 'value': value })
-                elif packet_class == 7:
-                    if packet_command == 0: # wifi_rsp_flash_ps_defrag
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_flash_ps_defrag({ 'result': result })
-                    elif packet_command == 1: # wifi_rsp_flash_ps_dump
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_flash_ps_dump({ 'result': result })
-                    elif packet_command == 2: # wifi_rsp_flash_ps_erase_all
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_flash_ps_erase_all({ 'result': result })
-                    elif packet_command == 3: # wifi_rsp_flash_ps_save
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_flash_ps_save({ 'result': result })
-                    elif packet_command == 4: # wifi_rsp_flash_ps_load
-                        result, value_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        value_data = self.bgapi_rx_payload[3:]
-                        self.wifi_rsp_flash_ps_load({ 'result': result, 'value': value_data })
-                    elif packet_command == 5: # wifi_rsp_flash_ps_erase
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_flash_ps_erase({ 'result': result })
-                elif packet_class == 8:
-                    if packet_command == 0: # wifi_rsp_i2c_start_read
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_i2c_start_read({ 'result': result })
-                    elif packet_command == 1: # wifi_rsp_i2c_start_write
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_i2c_start_write({ 'result': result })
-                    elif packet_command == 2: # wifi_rsp_i2c_stop
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_rsp_i2c_stop({ 'result': result })
-                self.busy = False
-                self.on_idle()
+            if self.capture is not None: self._write_capture_rx()
+            if self.zero_copy:
+                packet = memoryview(packet)
+            self._parse_packet(packet, 0, len(packet))
+
+    def parse_bytes(self, buf):
+
+        """Parse a whole chunk of received bytes, e.g. everything one ser.read() returned.
+
+        Packet boundaries are found from the length in each 4-byte header and
+        every complete packet in the chunk is decoded in one pass. A trailing
+        partial packet is kept in bgapi_rx_buffer and completed by the next
+        call (or by parse(), which shares the same buffer). Handlers may parse
+        again, e.g. through check_activity() or call(): the nested call
+        continues with the rest of this chunk, and this one returns once the
+        handler does.
+        """
+
+        if self.capture is not None:
+            self._write_capture_rx()
+            self.capture.write(BGAPICapture.RX, buf)
+        if self.resync:
+            return self._parse_bytes_resync(buf)
+        buf = self._take_rx_buffer(buf)
+        pos = 0
+        end = len(buf)
+        self._rx_chunk = buf
+        self._rx_depth += 1
+        try:
+            while pos < end:
+                b = buf[pos]
+                if not (b == 0x00 or b == 0x80 or b == 0x08 or b == 0x88):
+                    pos += 1
+                    continue
+                if end - pos < 2:
+                    break
+                length = 4 + (b & 0x07) + buf[pos + 1]
+                if end - pos < length:
+                    break
+                self._rx_pos = pos + length
+                self._parse_packet(buf, pos, pos + length)
+                if self._rx_chunk is not buf:
+                    # a handler parsed again, which took over the rest of buf
+                    return
+                pos += length
+        finally:
+            self._rx_depth -= 1
+        self._rx_chunk = None
+        self._keep_rx_partial(buf, pos)
+
+    def _parse_bytes_resync(self, buf, expire=False):
+
+        """(internal use) parse_bytes() with the resync checks described in __init__().
+
+        With expire set, the partial frame at the front of the buffer is given
+        up regardless of its age.
+        """
+
+        now = time.monotonic()
+        partial = self._rx_chunk is None and len(self.bgapi_rx_buffer) > 0
+        if partial and not expire:
+            expire = now - self.bgapi_rx_partial_time >= self.resync_timeout
+        buf = self._take_rx_buffer(buf)
+        pos = 0
+        if partial and expire:
+            self.rx_partial_timeouts += 1
+            self.rx_discarded_bytes += 1
+            pos = 1
+        end = len(buf)
+        lengths = self.bgapi_rx_lengths
+        self._rx_chunk = buf
+        self._rx_depth += 1
+        try:
+            while pos < end:
+                b = buf[pos]
+                if b == 0x00 or b == 0x80 or b == 0x08 or b == 0x88:
+                    if end - pos < 4:
+                        break
+                    length = 4 + (b & 0x07) + buf[pos + 1]
+                    limits = lengths.get((b & 0xf8, buf[pos + 2], buf[pos + 3]))
+                    if limits is not None and limits[0] <= length - 4 <= limits[1]:
+                        if end - pos < length:
+                            break
+                        self._rx_pos = pos + length
+                        self._parse_packet(buf, pos, pos + length)
+                        if self._rx_chunk is not buf:
+                            # a handler parsed again, which took over the rest of buf
+                            return
+                        pos += length
+                        continue
+                pos += 1
+                self.rx_discarded_bytes += 1
+        finally:
+            self._rx_depth -= 1
+        self._rx_chunk = None
+        if pos > 0 or not partial:
+            # a new partial frame (if any) starts now
+            self.bgapi_rx_partial_time = now
+        self._keep_rx_partial(buf, pos)
+
+    def _take_rx_buffer(self, buf):
+
+        """(internal use) Take over the received bytes not parsed yet and return
+        them followed by buf.
+
+        Those are a partial packet carried over in bgapi_rx_buffer or, when a
+        handler parses again while parse_bytes() is working through a chunk,
+        the rest of that chunk after the packet being handled. That call then
+        stops once the handler returns and leaves the rest to this one.
+        """
+
+        nested = self._rx_depth > 0
+        if self._rx_chunk is not None:
+            carry = self._rx_chunk[self._rx_pos:]
+            self._rx_chunk = None
+            nested = True
+        else:
+            carry = self.bgapi_rx_buffer
+        self.bgapi_rx_buffer = b""
+        self.bgapi_rx_expected_length = 0
+        if self.zero_copy:
+            return self._recycle_rx_buffer(carry, buf, nested)
+        if len(carry) > 0:
+            return bytes(carry) + buf
+        if type(buf) is not bytes:
+            return bytes(buf)
+        return buf
+
+    def _keep_rx_partial(self, buf, pos):
+
+        """(internal use) Carry the partial packet at buf[pos:] over to the next call."""
+
+        self.bgapi_rx_buffer = bytes(buf[pos:])
+        if len(buf) - pos > 1:
+            self.bgapi_rx_expected_length = 4 + (buf[pos] & 0x07) + buf[pos + 1]
+        else:
+            self.bgapi_rx_expected_length = 0
+
+    def iter_frames(self, source):
+
+        """Lazily yield each complete BGAPI packet in source as a bytes object.
+
+        source may be a serial port (read until the caller stops iterating), a
+        file opened in binary mode (read to the end), a bytes-like object or
+        any iterable of bytes-like chunks. Bytes that cannot start a packet are
+        skipped as in parse(), and a trailing partial packet is dropped. This
+        does not touch the receive buffer, busy flag or event handlers.
+        """
+
+        buf = b""
+        for chunk in self._iter_chunks(source):
+            buf = buf + chunk if len(buf) > 0 else bytes(chunk)
+            pos = 0
+            end = len(buf)
+            while pos < end:
+                b = buf[pos]
+                if not (b == 0x00 or b == 0x80 or b == 0x08 or b == 0x88):
+                    pos += 1
+                    continue
+                if end - pos < 2:
+                    break
+                length = 4 + (b & 0x07) + buf[pos + 1]
+                if end - pos < length:
+                    break
+                yield buf[pos:pos + length]
+                pos += length
+            buf = buf[pos:]
+
+    def iter_packets(self, source):
+
+        """Lazily yield a (name, args) pair for each packet in source.
+
+        name is the event attribute name, e.g. 'ble_evt_gap_scan_response', and
+        args is the record its handlers would be given. Sources are as for
+        iter_frames(); packets without a decoder are skipped and no events fire.
+        """
+
+        for frame in self.iter_frames(source):
+            handler = self.bgapi_rx_dispatch.get((frame[0] & 0xf8, frame[2], frame[3]))
+            if handler is not None:
+                decoder, event = handler
+                yield event.name, decoder(frame, 4, len(frame))
+
+    def _iter_chunks(self, source):
+
+        """(internal use) Yield received byte chunks from a port, file or iterable."""
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            yield source
+        elif hasattr(source, 'inWaiting'):
+            while 1:
+                yield source.read(source.inWaiting() or 1)
+        elif hasattr(source, 'read'):
+            while 1:
+                chunk = source.read(4096)
+                if len(chunk) == 0:
+                    break
+                yield chunk
+        else:
+            for chunk in source:
+                yield bytes((chunk,)) if isinstance(chunk, int) else chunk
+
+    def _recycle_rx_buffer(self, carry, buf, nested=False):
+
+        """(internal use) Copy carry and buf into the recycled receive buffer,
+        and return a read-only view of the used part.
+
+        The buffer is overwritten in place rather than resized, so views that
+        handlers kept past their lifetime see new data instead of raising. A
+        nested parse gets a buffer of its own instead, as the handler that
+        started it, or a parse_bytes() call further up the stack, may still be
+        reading the recycled one.
+        """
+
+        length = len(carry) + len(buf)
+        if nested:
+            recycled = bytearray(length)
+        else:
+            if length > len(self.bgapi_rx_recycled):
+                self.bgapi_rx_recycled = bytearray(max(length, 4096))
+            recycled = self.bgapi_rx_recycled
+        recycled[:len(carry)] = carry
+        recycled[len(carry):length] = buf
+        return memoryview(recycled).toreadonly()[:length]
+
+    def _parse_packet(self, buf, start, end):
+
+        """(internal use) Decode the packet in buf[start:end] without copying it out."""
+
+        if self.debug: print('<=[ ' + ' '.join(['%02X' % b for b in buf[start:end] ]) + ' ]')
+        waited = False
+        packet_type = buf[start]
+        packet_class = buf[start + 2]
+        packet_command = buf[start + 3]
+        handler = self.bgapi_rx_dispatch.get((packet_type & 0xf8, packet_class, packet_command))
+        if self._raw_frame_handler.functions or (self._any_handlers and 'raw_frame' in self._any_handlers):
+            raw_frame_filter = self.raw_frame_filter
+            if raw_frame_filter is None or packet_class in raw_frame_filter or (packet_class, packet_command) in raw_frame_filter:
+                frame = BGAPIRawFrame(buf[start:start + 4], buf[start + 4:end])
+                self.on_raw_frame(frame)
+                for func in self._any_handlers.get('raw_frame', ()):
+                    func(self, 'on_raw_frame', frame)
+                if self.raw_frame_only:
+                    if handler is not None and packet_type & 0x80 == 0x00 and self._response_waiters:
+                        # its event does not fire, but a submitted command
+                        # waiting for this response still gets its args
+                        args = self._decode_response(handler[0], buf, start, end)
+                        waited = True
+                    handler = None
+        if handler is not None:
+            decoder, event = handler
+            if packet_type & 0x80 == 0x00 and self._response_waiters:
+                args = self._decode_response(decoder, buf, start, end)
+                waited = True
+                if self.__eventhandler__.get(event) or self._any_handlers:
+                    self._fire_event(event, args)
+            elif event is self._attribute_event:
+                self._route_attribute(decoder, event, buf, start, end)
+            # only decode when something is subscribed (add() and remove()
+            # keep these tuples current), but always do the busy bookkeeping
+            elif self.__eventhandler__.get(event) or (self._any_handlers and event.kind in self._any_handlers):
+                self._fire_event(event, decoder(buf, start + 4, end))
+        if packet_type & 0x80 == 0x00:
+            # response packet, the command has completed
+            self.busy = False
+            self.on_idle()
+            if waited:
+                # may send the next queued command
+                self._complete_command(packet_class, packet_command, args)
+        elif packet_class == 0 and packet_command == 0:
+            # boot event
+            self.busy = False
+            self.on_idle()
+
+    def _decode_response(self, decoder, buf, start, end):
+
+        """(internal use) Decode a response a command may be waiting for; its
+        args must outlive the receive buffer."""
+
+        if self.zero_copy:
+            return decoder(memoryview(bytes(buf[start:end])), 4, end - start)
+        return decoder(buf, start + 4, end)
+
+    def _complete_command(self, packet_class, packet_command, args):
+
+        """(internal use) Resolve the oldest future waiting for this response."""
+
+        with self._command_lock:
+            waiters = self._response_waiters.get((packet_class, packet_command))
+            if not waiters:
+                return
+            future = waiters.popleft()
+            if not waiters:
+                del self._response_waiters[(packet_class, packet_command)]
+        if future is None:
+            # the late answer to a command that timed out or was cancelled
+            return
+        try:
+            future.set_result(args)
+        except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+            # cancelled meanwhile, e.g. by call() giving up on another thread,
+            # or an AsyncBGLib future cancelled before its callback ran
+            pass
+
+    def _queue_command(self, ser, packet, future):
+
+        """(internal use) Send packet now if no submitted command is pending, else queue it."""
+
+        with self._command_lock:
+            if self._command_pending is not None:
+                self._command_queue.append((ser, packet, future))
+                return
+            self._command_pending = future
+        self._send_queued_command(ser, packet, future)
+
+    def _send_queued_command(self, ser, packet, future):
+
+        """(internal use) Send a command that is now the pending one."""
+
+        with self._command_lock:
+            self._response_waiters.setdefault((packet[2], packet[3]), deque()).append(future)
+        future.add_done_callback(self._command_done)
+        self.send_command(ser, packet)
+
+    def _command_done(self, future):
+
+        """(internal use) Release the next queued command once the pending one is done,
+        whether by its response, a timeout, cancellation or cancel_commands()."""
+
+        with self._command_lock:
+            if future is not self._command_pending:
+                return
+            self._command_pending = None
+            for waiters in self._response_waiters.values():
+                # not completed by a response; keep its place, so that a late
+                # one is dropped instead of answering the next such command
+                if future in waiters:
+                    waiters[waiters.index(future)] = None
+            while self._command_queue:
+                ser, packet, future = self._command_queue.popleft()
+                if not future.cancelled():
+                    self._command_pending = future
+                    break
+            else:
+                return
+        self._send_queued_command(ser, packet, future)
+
+    def _timeout_command(self):
+
+        """(internal use) Fail the pending submitted command after check_activity() timed out."""
+
+        future = self._command_pending
+        if future is not None:
+            try:
+                future.set_exception(TimeoutError('no response to command'))
+            except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+                pass
+
+    # (message type and technology type, class ID, command ID) => (decoder, event)
+    bgapi_rx_dispatch = {
+        (0x00, 0, 0): (_decode_ble_rsp_system_reset, ble_rsp_system_reset),
+        (0x00, 0, 1): (_decode_ble_rsp_system_hello, ble_rsp_system_hello),
+        (0x00, 0, 2): (_decode_ble_rsp_system_address_get, ble_rsp_system_address_get),
+        (0x00, 0, 3): (_decode_ble_rsp_system_reg_write, ble_rsp_system_reg_write),
+        (0x00, 0, 4): (_decode_ble_rsp_system_reg_read, ble_rsp_system_reg_read),
+        (0x00, 0, 5): (_decode_ble_rsp_system_get_counters, ble_rsp_system_get_counters),
+        (0x00, 0, 6): (_decode_ble_rsp_system_get_connections, ble_rsp_system_get_connections),
+        (0x00, 0, 7): (_decode_ble_rsp_system_read_memory, ble_rsp_system_read_memory),
+        (0x00, 0, 8): (_decode_ble_rsp_system_get_info, ble_rsp_system_get_info),
+        (0x00, 0, 9): (_decode_ble_rsp_system_endpoint_tx, ble_rsp_system_endpoint_tx),
+        (0x00, 0, 10): (_decode_ble_rsp_system_whitelist_append, ble_rsp_system_whitelist_append),
+        (0x00, 0, 11): (_decode_ble_rsp_system_whitelist_remove, ble_rsp_system_whitelist_remove),
+        (0x00, 0, 12): (_decode_ble_rsp_system_whitelist_clear, ble_rsp_system_whitelist_clear),
+        (0x00, 0, 13): (_decode_ble_rsp_system_endpoint_rx, ble_rsp_system_endpoint_rx),
+        (0x00, 0, 14): (_decode_ble_rsp_system_endpoint_set_watermarks, ble_rsp_system_endpoint_set_watermarks),
+        (0x00, 1, 0): (_decode_ble_rsp_flash_ps_defrag, ble_rsp_flash_ps_defrag),
+        (0x00, 1, 1): (_decode_ble_rsp_flash_ps_dump, ble_rsp_flash_ps_dump),
+        (0x00, 1, 2): (_decode_ble_rsp_flash_ps_erase_all, ble_rsp_flash_ps_erase_all),
+        (0x00, 1, 3): (_decode_ble_rsp_flash_ps_save, ble_rsp_flash_ps_save),
+        (0x00, 1, 4): (_decode_ble_rsp_flash_ps_load, ble_rsp_flash_ps_load),
+        (0x00, 1, 5): (_decode_ble_rsp_flash_ps_erase, ble_rsp_flash_ps_erase),
+        (0x00, 1, 6): (_decode_ble_rsp_flash_erase_page, ble_rsp_flash_erase_page),
+        (0x00, 1, 7): (_decode_ble_rsp_flash_write_words, ble_rsp_flash_write_words),
+        (0x00, 2, 0): (_decode_ble_rsp_attributes_write, ble_rsp_attributes_write),
+        (0x00, 2, 1): (_decode_ble_rsp_attributes_read, ble_rsp_attributes_read),
+        (0x00, 2, 2): (_decode_ble_rsp_attributes_read_type, ble_rsp_attributes_read_type),
+        (0x00, 2, 3): (_decode_ble_rsp_attributes_user_read_response, ble_rsp_attributes_user_read_response),
+        (0x00, 2, 4): (_decode_ble_rsp_attributes_user_write_response, ble_rsp_attributes_user_write_response),
+        (0x00, 3, 0): (_decode_ble_rsp_connection_disconnect, ble_rsp_connection_disconnect),
+        (0x00, 3, 1): (_decode_ble_rsp_connection_get_rssi, ble_rsp_connection_get_rssi),
+        (0x00, 3, 2): (_decode_ble_rsp_connection_update, ble_rsp_connection_update),
+        (0x00, 3, 3): (_decode_ble_rsp_connection_version_update, ble_rsp_connection_version_update),
+        (0x00, 3, 4): (_decode_ble_rsp_connection_channel_map_get, ble_rsp_connection_channel_map_get),
+        (0x00, 3, 5): (_decode_ble_rsp_connection_channel_map_set, ble_rsp_connection_channel_map_set),
+        (0x00, 3, 6): (_decode_ble_rsp_connection_features_get, ble_rsp_connection_features_get),
+        (0x00, 3, 7): (_decode_ble_rsp_connection_get_status, ble_rsp_connection_get_status),
+        (0x00, 3, 8): (_decode_ble_rsp_connection_raw_tx, ble_rsp_connection_raw_tx),
+        (0x00, 4, 0): (_decode_ble_rsp_attclient_find_by_type_value, ble_rsp_attclient_find_by_type_value),
+        (0x00, 4, 1): (_decode_ble_rsp_attclient_read_by_group_type, ble_rsp_attclient_read_by_group_type),
+        (0x00, 4, 2): (_decode_ble_rsp_attclient_read_by_type, ble_rsp_attclient_read_by_type),
+        (0x00, 4, 3): (_decode_ble_rsp_attclient_find_information, ble_rsp_attclient_find_information),
+        (0x00, 4, 4): (_decode_ble_rsp_attclient_read_by_handle, ble_rsp_attclient_read_by_handle),
+        (0x00, 4, 5): (_decode_ble_rsp_attclient_attribute_write, ble_rsp_attclient_attribute_write),
+        (0x00, 4, 6): (_decode_ble_rsp_attclient_write_command, ble_rsp_attclient_write_command),
+        (0x00, 4, 7): (_decode_ble_rsp_attclient_indicate_confirm, ble_rsp_attclient_indicate_confirm),
+        (0x00, 4, 8): (_decode_ble_rsp_attclient_read_long, ble_rsp_attclient_read_long),
+        (0x00, 4, 9): (_decode_ble_rsp_attclient_prepare_write, ble_rsp_attclient_prepare_write),
+        (0x00, 4, 10): (_decode_ble_rsp_attclient_execute_write, ble_rsp_attclient_execute_write),
+        (0x00, 4, 11): (_decode_ble_rsp_attclient_read_multiple, ble_rsp_attclient_read_multiple),
+        (0x00, 5, 0): (_decode_ble_rsp_sm_encrypt_start, ble_rsp_sm_encrypt_start),
+        (0x00, 5, 1): (_decode_ble_rsp_sm_set_bondable_mode, ble_rsp_sm_set_bondable_mode),
+        (0x00, 5, 2): (_decode_ble_rsp_sm_delete_bonding, ble_rsp_sm_delete_bonding),
+        (0x00, 5, 3): (_decode_ble_rsp_sm_set_parameters, ble_rsp_sm_set_parameters),
+        (0x00, 5, 4): (_decode_ble_rsp_sm_passkey_entry, ble_rsp_sm_passkey_entry),
+        (0x00, 5, 5): (_decode_ble_rsp_sm_get_bonds, ble_rsp_sm_get_bonds),
+        (0x00, 5, 6): (_decode_ble_rsp_sm_set_oob_data, ble_rsp_sm_set_oob_data),
+        (0x00, 6, 0): (_decode_ble_rsp_gap_set_privacy_flags, ble_rsp_gap_set_privacy_flags),
+        (0x00, 6, 1): (_decode_ble_rsp_gap_set_mode, ble_rsp_gap_set_mode),
+        (0x00, 6, 2): (_decode_ble_rsp_gap_discover, ble_rsp_gap_discover),
+        (0x00, 6, 3): (_decode_ble_rsp_gap_connect_direct, ble_rsp_gap_connect_direct),
+        (0x00, 6, 4): (_decode_ble_rsp_gap_end_procedure, ble_rsp_gap_end_procedure),
+        (0x00, 6, 5): (_decode_ble_rsp_gap_connect_selective, ble_rsp_gap_connect_selective),
+        (0x00, 6, 6): (_decode_ble_rsp_gap_set_filtering, ble_rsp_gap_set_filtering),
+        (0x00, 6, 7): (_decode_ble_rsp_gap_set_scan_parameters, ble_rsp_gap_set_scan_parameters),
+        (0x00, 6, 8): (_decode_ble_rsp_gap_set_adv_parameters, ble_rsp_gap_set_adv_parameters),
+        (0x00, 6, 9): (_decode_ble_rsp_gap_set_adv_data, ble_rsp_gap_set_adv_data),
+        (0x00, 6, 10): (_decode_ble_rsp_gap_set_directed_connectable_mode, ble_rsp_gap_set_directed_connectable_mode),
+        (0x00, 7, 0): (_decode_ble_rsp_hardware_io_port_config_irq, ble_rsp_hardware_io_port_config_irq),
+        (0x00, 7, 1): (_decode_ble_rsp_hardware_set_soft_timer, ble_rsp_hardware_set_soft_timer),
+        (0x00, 7, 2): (_decode_ble_rsp_hardware_adc_read, ble_rsp_hardware_adc_read),
+        (0x00, 7, 3): (_decode_ble_rsp_hardware_io_port_config_direction, ble_rsp_hardware_io_port_config_direction),
+        (0x00, 7, 4): (_decode_ble_rsp_hardware_io_port_config_function, ble_rsp_hardware_io_port_config_function),
+        (0x00, 7, 5): (_decode_ble_rsp_hardware_io_port_config_pull, ble_rsp_hardware_io_port_config_pull),
+        (0x00, 7, 6): (_decode_ble_rsp_hardware_io_port_write, ble_rsp_hardware_io_port_write),
+        (0x00, 7, 7): (_decode_ble_rsp_hardware_io_port_read, ble_rsp_hardware_io_port_read),
+        (0x00, 7, 8): (_decode_ble_rsp_hardware_spi_config, ble_rsp_hardware_spi_config),
+        (0x00, 7, 9): (_decode_ble_rsp_hardware_spi_transfer, ble_rsp_hardware_spi_transfer),
+        (0x00, 7, 10): (_decode_ble_rsp_hardware_i2c_read, ble_rsp_hardware_i2c_read),
+        (0x00, 7, 11): (_decode_ble_rsp_hardware_i2c_write, ble_rsp_hardware_i2c_write),
+        (0x00, 7, 12): (_decode_ble_rsp_hardware_set_txpower, ble_rsp_hardware_set_txpower),
+        (0x00, 7, 13): (_decode_ble_rsp_hardware_timer_comparator, ble_rsp_hardware_timer_comparator),
+        (0x00, 8, 0): (_decode_ble_rsp_test_phy_tx, ble_rsp_test_phy_tx),
+        (0x00, 8, 1): (_decode_ble_rsp_test_phy_rx, ble_rsp_test_phy_rx),
+        (0x00, 8, 2): (_decode_ble_rsp_test_phy_end, ble_rsp_test_phy_end),
+        (0x00, 8, 3): (_decode_ble_rsp_test_phy_reset, ble_rsp_test_phy_reset),
+        (0x00, 8, 4): (_decode_ble_rsp_test_get_channel_map, ble_rsp_test_get_channel_map),
+        (0x00, 8, 5): (_decode_ble_rsp_test_debug, ble_rsp_test_debug),
+        (0x80, 0, 0): (_decode_ble_evt_system_boot, ble_evt_system_boot),
+        (0x80, 0, 1): (_decode_ble_evt_system_debug, ble_evt_system_debug),
+        (0x80, 0, 2): (_decode_ble_evt_system_endpoint_watermark_rx, ble_evt_system_endpoint_watermark_rx),
+        (0x80, 0, 3): (_decode_ble_evt_system_endpoint_watermark_tx, ble_evt_system_endpoint_watermark_tx),
+        (0x80, 0, 4): (_decode_ble_evt_system_script_failure, ble_evt_system_script_failure),
+        (0x80, 0, 5): (_decode_ble_evt_system_no_license_key, ble_evt_system_no_license_key),
+        (0x80, 1, 0): (_decode_ble_evt_flash_ps_key, ble_evt_flash_ps_key),
+        (0x80, 2, 0): (_decode_ble_evt_attributes_value, ble_evt_attributes_value),
+        (0x80, 2, 1): (_decode_ble_evt_attributes_user_read_request, ble_evt_attributes_user_read_request),
+        (0x80, 2, 2): (_decode_ble_evt_attributes_status, ble_evt_attributes_status),
+        (0x80, 3, 0): (_decode_ble_evt_connection_status, ble_evt_connection_status),
+        (0x80, 3, 1): (_decode_ble_evt_connection_version_ind, ble_evt_connection_version_ind),
+        (0x80, 3, 2): (_decode_ble_evt_connection_feature_ind, ble_evt_connection_feature_ind),
+        (0x80, 3, 3): (_decode_ble_evt_connection_raw_rx, ble_evt_connection_raw_rx),
+        (0x80, 3, 4): (_decode_ble_evt_connection_disconnected, ble_evt_connection_disconnected),
+        (0x80, 4, 0): (_decode_ble_evt_attclient_indicated, ble_evt_attclient_indicated),
+        (0x80, 4, 1): (_decode_ble_evt_attclient_procedure_completed, ble_evt_attclient_procedure_completed),
+        (0x80, 4, 2): (_decode_ble_evt_attclient_group_found, ble_evt_attclient_group_found),
+        (0x80, 4, 3): (_decode_ble_evt_attclient_attribute_found, ble_evt_attclient_attribute_found),
+        (0x80, 4, 4): (_decode_ble_evt_attclient_find_information_found, ble_evt_attclient_find_information_found),
+        (0x80, 4, 5): (_decode_ble_evt_attclient_attribute_value, ble_evt_attclient_attribute_value),
+        (0x80, 4, 6): (_decode_ble_evt_attclient_read_multiple_response, ble_evt_attclient_read_multiple_response),
+        (0x80, 5, 0): (_decode_ble_evt_sm_smp_data, ble_evt_sm_smp_data),
+        (0x80, 5, 1): (_decode_ble_evt_sm_bonding_fail, ble_evt_sm_bonding_fail),
+        (0x80, 5, 2): (_decode_ble_evt_sm_passkey_display, ble_evt_sm_passkey_display),
+        (0x80, 5, 3): (_decode_ble_evt_sm_passkey_request, ble_evt_sm_passkey_request),
+        (0x80, 5, 4): (_decode_ble_evt_sm_bond_status, ble_evt_sm_bond_status),
+        (0x80, 6, 0): (_decode_ble_evt_gap_scan_response, ble_evt_gap_scan_response),
+        (0x80, 6, 1): (_decode_ble_evt_gap_mode_changed, ble_evt_gap_mode_changed),
+        (0x80, 7, 0): (_decode_ble_evt_hardware_io_port_status, ble_evt_hardware_io_port_status),
+        (0x80, 7, 1): (_decode_ble_evt_hardware_soft_timer, ble_evt_hardware_soft_timer),
+        (0x80, 7, 2): (_decode_ble_evt_hardware_adc_result, ble_evt_hardware_adc_result),
+        (0x08, 0, 0): (_decode_wifi_rsp_dfu_reset, wifi_rsp_dfu_reset),
+        (0x08, 0, 1): (_decode_wifi_rsp_dfu_flash_set_address, wifi_rsp_dfu_flash_set_address),
+        (0x08, 0, 2): (_decode_wifi_rsp_dfu_flash_upload, wifi_rsp_dfu_flash_upload),
+        (0x08, 0, 3): (_decode_wifi_rsp_dfu_flash_upload_finish, wifi_rsp_dfu_flash_upload_finish),
+        (0x08, 1, 0): (_decode_wifi_rsp_system_sync, wifi_rsp_system_sync),
+        (0x08, 1, 1): (_decode_wifi_rsp_system_reset, wifi_rsp_system_reset),
+        (0x08, 1, 2): (_decode_wifi_rsp_system_hello, wifi_rsp_system_hello),
+        (0x08, 1, 3): (_decode_wifi_rsp_system_set_max_power_saving_state, wifi_rsp_system_set_max_power_saving_state),
+        (0x08, 2, 0): (_decode_wifi_rsp_config_get_mac, wifi_rsp_config_get_mac),
+        (0x08, 2, 1): (_decode_wifi_rsp_config_set_mac, wifi_rsp_config_set_mac),
+        (0x08, 3, 0): (_decode_wifi_rsp_sme_wifi_on, wifi_rsp_sme_wifi_on),
+        (0x08, 3, 1): (_decode_wifi_rsp_sme_wifi_off, wifi_rsp_sme_wifi_off),
+        (0x08, 3, 2): (_decode_wifi_rsp_sme_power_on, wifi_rsp_sme_power_on),
+        (0x08, 3, 3): (_decode_wifi_rsp_sme_start_scan, wifi_rsp_sme_start_scan),
+        (0x08, 3, 4): (_decode_wifi_rsp_sme_stop_scan, wifi_rsp_sme_stop_scan),
+        (0x08, 3, 5): (_decode_wifi_rsp_sme_set_password, wifi_rsp_sme_set_password),
+        (0x08, 3, 6): (_decode_wifi_rsp_sme_connect_bssid, wifi_rsp_sme_connect_bssid),
+        (0x08, 3, 7): (_decode_wifi_rsp_sme_connect_ssid, wifi_rsp_sme_connect_ssid),
+        (0x08, 3, 8): (_decode_wifi_rsp_sme_disconnect, wifi_rsp_sme_disconnect),
+        (0x08, 3, 9): (_decode_wifi_rsp_sme_set_scan_channels, wifi_rsp_sme_set_scan_channels),
+        (0x08, 4, 0): (_decode_wifi_rsp_tcpip_start_tcp_server, wifi_rsp_tcpip_start_tcp_server),
+        (0x08, 4, 1): (_decode_wifi_rsp_tcpip_tcp_connect, wifi_rsp_tcpip_tcp_connect),
+        (0x08, 4, 2): (_decode_wifi_rsp_tcpip_start_udp_server, wifi_rsp_tcpip_start_udp_server),
+        (0x08, 4, 3): (_decode_wifi_rsp_tcpip_udp_connect, wifi_rsp_tcpip_udp_connect),
+        (0x08, 4, 4): (_decode_wifi_rsp_tcpip_configure, wifi_rsp_tcpip_configure),
+        (0x08, 4, 5): (_decode_wifi_rsp_tcpip_dns_configure, wifi_rsp_tcpip_dns_configure),
+        (0x08, 4, 6): (_decode_wifi_rsp_tcpip_dns_gethostbyname, wifi_rsp_tcpip_dns_gethostbyname),
+        (0x08, 5, 0): (_decode_wifi_rsp_endpoint_send, wifi_rsp_endpoint_send),
+        (0x08, 5, 1): (_decode_wifi_rsp_endpoint_set_streaming, wifi_rsp_endpoint_set_streaming),
+        (0x08, 5, 2): (_decode_wifi_rsp_endpoint_set_active, wifi_rsp_endpoint_set_active),
+        (0x08, 5, 3): (_decode_wifi_rsp_endpoint_set_streaming_destination, wifi_rsp_endpoint_set_streaming_destination),
+        (0x08, 5, 4): (_decode_wifi_rsp_endpoint_close, wifi_rsp_endpoint_close),
+        (0x08, 6, 0): (_decode_wifi_rsp_hardware_set_soft_timer, wifi_rsp_hardware_set_soft_timer),
+        (0x08, 6, 1): (_decode_wifi_rsp_hardware_external_interrupt_config, wifi_rsp_hardware_external_interrupt_config),
+        (0x08, 6, 2): (_decode_wifi_rsp_hardware_change_notification_config, wifi_rsp_hardware_change_notification_config),
+        (0x08, 6, 3): (_decode_wifi_rsp_hardware_change_notification_pullup, wifi_rsp_hardware_change_notification_pullup),
+        (0x08, 6, 4): (_decode_wifi_rsp_hardware_io_port_config_direction, wifi_rsp_hardware_io_port_config_direction),
+        (0x08, 6, 5): (_decode_wifi_rsp_hardware_io_port_config_open_drain, wifi_rsp_hardware_io_port_config_open_drain),
+        (0x08, 6, 6): (_decode_wifi_rsp_hardware_io_port_write, wifi_rsp_hardware_io_port_write),
+        (0x08, 6, 7): (_decode_wifi_rsp_hardware_io_port_read, wifi_rsp_hardware_io_port_read),
+        (0x08, 6, 8): (_decode_wifi_rsp_hardware_output_compare, wifi_rsp_hardware_output_compare),
+        (0x08, 6, 9): (_decode_wifi_rsp_hardware_adc_read, wifi_rsp_hardware_adc_read),
+        (0x08, 7, 0): (_decode_wifi_rsp_flash_ps_defrag, wifi_rsp_flash_ps_defrag),
+        (0x08, 7, 1): (_decode_wifi_rsp_flash_ps_dump, wifi_rsp_flash_ps_dump),
+        (0x08, 7, 2): (_decode_wifi_rsp_flash_ps_erase_all, wifi_rsp_flash_ps_erase_all),
+        (0x08, 7, 3): (_decode_wifi_rsp_flash_ps_save, wifi_rsp_flash_ps_save),
+        (0x08, 7, 4): (_decode_wifi_rsp_flash_ps_load, wifi_rsp_flash_ps_load),
+        (0x08, 7, 5): (_decode_wifi_rsp_flash_ps_erase, wifi_rsp_flash_ps_erase),
+        (0x08, 8, 0): (_decode_wifi_rsp_i2c_start_read, wifi_rsp_i2c_start_read),
+        (0x08, 8, 1): (_decode_wifi_rsp_i2c_start_write, wifi_rsp_i2c_start_write),
+        (0x08, 8, 2): (_decode_wifi_rsp_i2c_stop, wifi_rsp_i2c_stop),
+        (0x88, 0, 0): (_decode_wifi_evt_dfu_boot, wifi_evt_dfu_boot),
+        (0x88, 1, 0): (_decode_wifi_evt_system_boot, wifi_evt_system_boot),
+        (0x88, 1, 1): (_decode_wifi_evt_system_state, wifi_evt_system_state),
+        (0x88, 1, 2): (_decode_wifi_evt_system_sw_exception, wifi_evt_system_sw_exception),
+        (0x88, 1, 3): (_decode_wifi_evt_system_power_saving_state, wifi_evt_system_power_saving_state),
+        (0x88, 2, 0): (_decode_wifi_evt_config_mac_address, wifi_evt_config_mac_address),
+        (0x88, 3, 0): (_decode_wifi_evt_sme_wifi_is_on, wifi_evt_sme_wifi_is_on),
+        (0x88, 3, 1): (_decode_wifi_evt_sme_wifi_is_off, wifi_evt_sme_wifi_is_off),
+        (0x88, 3, 2): (_decode_wifi_evt_sme_scan_result, wifi_evt_sme_scan_result),
+        (0x88, 3, 3): (_decode_wifi_evt_sme_scan_result_drop, wifi_evt_sme_scan_result_drop),
+        (0x88, 3, 4): (_decode_wifi_evt_sme_scanned, wifi_evt_sme_scanned),
+        (0x88, 3, 5): (_decode_wifi_evt_sme_connected, wifi_evt_sme_connected),
+        (0x88, 3, 6): (_decode_wifi_evt_sme_disconnected, wifi_evt_sme_disconnected),
+        (0x88, 3, 7): (_decode_wifi_evt_sme_interface_status, wifi_evt_sme_interface_status),
+        (0x88, 3, 8): (_decode_wifi_evt_sme_connect_failed, wifi_evt_sme_connect_failed),
+        (0x88, 3, 9): (_decode_wifi_evt_sme_connect_retry, wifi_evt_sme_connect_retry),
+        (0x88, 4, 0): (_decode_wifi_evt_tcpip_configuration, wifi_evt_tcpip_configuration),
+        (0x88, 4, 1): (_decode_wifi_evt_tcpip_dns_configuration, wifi_evt_tcpip_dns_configuration),
+        (0x88, 4, 2): (_decode_wifi_evt_tcpip_endpoint_status, wifi_evt_tcpip_endpoint_status),
+        (0x88, 4, 3): (_decode_wifi_evt_tcpip_dns_gethostbyname_result, wifi_evt_tcpip_dns_gethostbyname_result),
+        (0x88, 5, 0): (_decode_wifi_evt_endpoint_syntax_error, wifi_evt_endpoint_syntax_error),
+        (0x88, 5, 1): (_decode_wifi_evt_endpoint_data, wifi_evt_endpoint_data),
+        (0x88, 5, 2): (_decode_wifi_evt_endpoint_status, wifi_evt_endpoint_status),
+        (0x88, 5, 3): (_decode_wifi_evt_endpoint_closing, wifi_evt_endpoint_closing),
+        (0x88, 6, 0): (_decode_wifi_evt_hardware_soft_timer, wifi_evt_hardware_soft_timer),
+        (0x88, 6, 1): (_decode_wifi_evt_hardware_change_notification, wifi_evt_hardware_change_notification),
+        (0x88, 6, 2): (_decode_wifi_evt_hardware_external_interrupt, wifi_evt_hardware_external_interrupt),
+        (0x88, 7, 0): (_decode_wifi_evt_flash_ps_key, wifi_evt_flash_ps_key),
+    }
+
+    # (message type and technology type, class ID, command ID) => (min payload length, max payload length)
+    bgapi_rx_lengths = {
+        (0x00, 0, 0): (0, 0),
+        (0x00, 0, 1): (0, 0),
+        (0x00, 0, 2): (6, 6),
+        (0x00, 0, 3): (2, 2),
+        (0x00, 0, 4): (3, 3),
+        (0x00, 0, 5): (5, 5),
+        (0x00, 0, 6): (1, 1),
+        (0x00, 0, 7): (5, 260),
+        (0x00, 0, 8): (12, 12),
+        (0x00, 0, 9): (2, 2),
+        (0x00, 0, 10): (2, 2),
+        (0x00, 0, 11): (2, 2),
+        (0x00, 0, 12): (0, 0),
+        (0x00, 0, 13): (3, 258),
+        (0x00, 0, 14): (2, 2),
+        (0x00, 1, 0): (0, 0),
+        (0x00, 1, 1): (0, 0),
+        (0x00, 1, 2): (0, 0),
+        (0x00, 1, 3): (2, 2),
+        (0x00, 1, 4): (3, 258),
+        (0x00, 1, 5): (0, 0),
+        (0x00, 1, 6): (2, 2),
+        (0x00, 1, 7): (0, 0),
+        (0x00, 2, 0): (2, 2),
+        (0x00, 2, 1): (7, 262),
+        (0x00, 2, 2): (5, 260),
+        (0x00, 2, 3): (0, 0),
+        (0x00, 2, 4): (0, 0),
+        (0x00, 3, 0): (3, 3),
+        (0x00, 3, 1): (2, 2),
+        (0x00, 3, 2): (3, 3),
+        (0x00, 3, 3): (3, 3),
+        (0x00, 3, 4): (2, 257),
+        (0x00, 3, 5): (3, 3),
+        (0x00, 3, 6): (3, 3),
+        (0x00, 3, 7): (1, 1),
+        (0x00, 3, 8): (1, 1),
+        (0x00, 4, 0): (3, 3),
+        (0x00, 4, 1): (3, 3),
+        (0x00, 4, 2): (3, 3),
+        (0x00, 4, 3): (3, 3),
+        (0x00, 4, 4): (3, 3),
+        (0x00, 4, 5): (3, 3),
+        (0x00, 4, 6): (3, 3),
+        (0x00, 4, 7): (2, 2),
+        (0x00, 4, 8): (3, 3),
+        (0x00, 4, 9): (3, 3),
+        (0x00, 4, 10): (3, 3),
+        (0x00, 4, 11): (3, 3),
+        (0x00, 5, 0): (3, 3),
+        (0x00, 5, 1): (0, 0),
+        (0x00, 5, 2): (2, 2),
+        (0x00, 5, 3): (0, 0),
+        (0x00, 5, 4): (2, 2),
+        (0x00, 5, 5): (1, 1),
+        (0x00, 5, 6): (0, 0),
+        (0x00, 6, 0): (0, 0),
+        (0x00, 6, 1): (2, 2),
+        (0x00, 6, 2): (2, 2),
+        (0x00, 6, 3): (3, 3),
+        (0x00, 6, 4): (2, 2),
+        (0x00, 6, 5): (3, 3),
+        (0x00, 6, 6): (2, 2),
+        (0x00, 6, 7): (2, 2),
+        (0x00, 6, 8): (2, 2),
+        (0x00, 6, 9): (2, 2),
+        (0x00, 6, 10): (2, 2),
+        (0x00, 7, 0): (2, 2),
+        (0x00, 7, 1): (2, 2),
+        (0x00, 7, 2): (2, 2),
+        (0x00, 7, 3): (2, 2),
+        (0x00, 7, 4): (2, 2),
+        (0x00, 7, 5): (2, 2),
+        (0x00, 7, 6): (2, 2),
+        (0x00, 7, 7): (4, 4),
+        (0x00, 7, 8): (2, 2),
+        (0x00, 7, 9): (4, 259),
+        (0x00, 7, 10): (3, 258),
+        (0x00, 7, 11): (1, 1),
+        (0x00, 7, 12): (0, 0),
+        (0x00, 7, 13): (2, 2),
+        (0x00, 8, 0): (0, 0),
+        (0x00, 8, 1): (0, 0),
+        (0x00, 8, 2): (2, 2),
+        (0x00, 8, 3): (0, 0),
+        (0x00, 8, 4): (1, 256),
+        (0x00, 8, 5): (1, 256),
+        (0x80, 0, 0): (12, 12),
+        (0x80, 0, 1): (1, 256),
+        (0x80, 0, 2): (2, 2),
+        (0x80, 0, 3): (2, 2),
+        (0x80, 0, 4): (4, 4),
+        (0x80, 0, 5): (0, 0),
+        (0x80, 1, 0): (3, 258),
+        (0x80, 2, 0): (7, 262),
+        (0x80, 2, 1): (6, 6),
+        (0x80, 2, 2): (3, 3),
+        (0x80, 3, 0): (16, 16),
+        (0x80, 3, 1): (6, 6),
+        (0x80, 3, 2): (2, 257),
+        (0x80, 3, 3): (2, 257),
+        (0x80, 3, 4): (3, 3),
+        (0x80, 4, 0): (3, 3),
+        (0x80, 4, 1): (5, 5),
+        (0x80, 4, 2): (6, 261),
+        (0x80, 4, 3): (7, 262),
+        (0x80, 4, 4): (4, 259),
+        (0x80, 4, 5): (5, 260),
+        (0x80, 4, 6): (2, 257),
+        (0x80, 5, 0): (3, 258),
+        (0x80, 5, 1): (3, 3),
+        (0x80, 5, 2): (5, 5),
+        (0x80, 5, 3): (1, 1),
+        (0x80, 5, 4): (4, 4),
+        (0x80, 6, 0): (11, 266),
+        (0x80, 6, 1): (2, 2),
+        (0x80, 7, 0): (7, 7),
+        (0x80, 7, 1): (1, 1),
+        (0x80, 7, 2): (3, 3),
+        (0x08, 0, 0): (0, 0),
+        (0x08, 0, 1): (2, 2),
+        (0x08, 0, 2): (2, 2),
+        (0x08, 0, 3): (2, 2),
+        (0x08, 1, 0): (0, 0),
+        (0x08, 1, 1): (0, 0),
+        (0x08, 1, 2): (0, 0),
+        (0x08, 1, 3): (2, 2),
+        (0x08, 2, 0): (3, 3),
+        (0x08, 2, 1): (3, 3),
+        (0x08, 3, 0): (2, 2),
+        (0x08, 3, 1): (2, 2),
+        (0x08, 3, 2): (2, 2),
+        (0x08, 3, 3): (2, 2),
+        (0x08, 3, 4): (2, 2),
+        (0x08, 3, 5): (1, 1),
+        (0x08, 3, 6): (3, 2047),
+        (0x08, 3, 7): (3, 2047),
+        (0x08, 3, 8): (3, 3),
+        (0x08, 3, 9): (2, 2),
+        (0x08, 4, 0): (3, 3),
+        (0x08, 4, 1): (3, 3),
+        (0x08, 4, 2): (3, 3),
+        (0x08, 4, 3): (3, 3),
+        (0x08, 4, 4): (2, 2),
+        (0x08, 4, 5): (2, 2),
+        (0x08, 4, 6): (2, 2),
+        (0x08, 5, 0): (3, 3),
+        (0x08, 5, 1): (3, 3),
+        (0x08, 5, 2): (3, 3),
+        (0x08, 5, 3): (3, 3),
+        (0x08, 5, 4): (3, 3),
+        (0x08, 6, 0): (2, 2),
+        (0x08, 6, 1): (2, 2),
+        (0x08, 6, 2): (2, 2),
+        (0x08, 6, 3): (2, 2),
+        (0x08, 6, 4): (2, 2),
+        (0x08, 6, 5): (2, 2),
+        (0x08, 6, 6): (2, 2),
+        (0x08, 6, 7): (5, 5),
+        (0x08, 6, 8): (2, 2),
+        (0x08, 6, 9): (5, 5),
+        (0x08, 7, 0): (2, 2),
+        (0x08, 7, 1): (2, 2),
+        (0x08, 7, 2): (2, 2),
+        (0x08, 7, 3): (2, 2),
+        (0x08, 7, 4): (3, 258),
+        (0x08, 7, 5): (2, 2),
+        (0x08, 8, 0): (2, 2),
+        (0x08, 8, 1): (2, 2),
+        (0x08, 8, 2): (2, 2),
+        (0x88, 0, 0): (4, 4),
+        (0x88, 1, 0): (14, 14),
+        (0x88, 1, 1): (2, 2),
+        (0x88, 1, 2): (5, 5),
+        (0x88, 1, 3): (1, 1),
+        (0x88, 2, 0): (1, 2047),
+        (0x88, 3, 0): (2, 2),
+        (0x88, 3, 1): (2, 2),
+        (0x88, 3, 2): (6, 2047),
+        (0x88, 3, 3): (0, 2047),
+        (0x88, 3, 4): (1, 1),
+        (0x88, 3, 5): (2, 2047),
+        (0x88, 3, 6): (3, 3),
+        (0x88, 3, 7): (2, 2),
+        (0x88, 3, 8): (3, 3),
+        (0x88, 3, 9): (1, 1),
+        (0x88, 4, 0): (1, 2047),
+        (0x88, 4, 1): (1, 2047),
+        (0x88, 4, 2): (5, 2047),
+        (0x88, 4, 3): (3, 2047),
+        (0x88, 5, 0): (1, 1),
+        (0x88, 5, 1): (2, 257),
+        (0x88, 5, 2): (8, 8),
+        (0x88, 5, 3): (3, 3),
+        (0x88, 6, 0): (1, 1),
+        (0x88, 6, 1): (4, 4),
+        (0x88, 6, 2): (5, 5),
+        (0x88, 7, 0): (3, 258),
+    }
+
+
+class AsyncBGLib(BGLib, asyncio.Protocol):
+
+    """BGLib driven by an asyncio transport, e.g. from serial_asyncio's
+    create_serial_connection(), loop.create_connection() or
+    loop.create_unix_connection().
+
+    Received data goes straight to parse_bytes(), so handlers added with
+    '+=' still work. Command methods queue the command for the transport as
+    submit() does and return a future that resolves to the args of its
+    response, so that
+
+        address = (await ble.ble_cmd_system_address_get()).address
+
+    works; wrap it in asyncio.wait_for() for a time limit, which also
+    releases the next queued command. events() gives an async iterator over
+    decoded events.
+    """
+
+    def __init__(self, zero_copy=False):
+        BGLib.__init__(self, zero_copy)
+        self.transport = None
+        self._loop = None
+        self._event_streams = set()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self._loop = asyncio.get_running_loop()
+
+    def data_received(self, data):
+        self.parse_bytes(data)
+
+    def connection_lost(self, exc):
+        self.transport = None
+        if exc is None:
+            exc = ConnectionError('connection lost')
+        self.cancel_commands(exc)
+        for stream in list(self._event_streams):
+            stream.close()
+
+    def send(self, packet):
+
+        """Queue a command packet as submit() does and return an asyncio future
+        for its response args."""
+
+        if self.transport is None:
+            raise ConnectionError('not connected')
+        future = self._loop.create_future()
+        self._queue_command(self.transport, packet, future)
+        return future
+
+    def events(self, *names, maxsize=0):
+
+        """Return an async iterator over (name, args) for the named events.
+
+        For example:
+
+            async for name, args in ble.events('ble_evt_gap_scan_response'):
+                ...
+
+        Events are collected from the moment events() is called. Once maxsize
+        (if > 0) events are waiting, further ones are counted in
+        rx_dropped_events and dropped. The iterator ends after close() or when
+        the connection is lost.
+        """
+
+        if self.zero_copy:
+            # zero_copy views would be overwritten before they are consumed
+            raise ValueError('events() cannot be used with zero_copy')
+        return BGAPIEventStream(self, names, maxsize)
+
+
+def _async_command(build):
+    def command(self, *args):
+        return self.send(build(self, *args))
+    command.__name__ = build.__name__
+    command.__doc__ = build.__doc__
+    return command
+
+for _name, _build in list(BGLib.__dict__.items()):
+    if _name.startswith(('ble_cmd_', 'wifi_cmd_')):
+        setattr(AsyncBGLib, _name, _async_command(_build))
+del _name, _build
+
+
+class BGAPIEventStream(object):
+
+    """Async iterator over (name, args) of events, see AsyncBGLib.events()."""
+
+    def __init__(self, lib, names, maxsize=0):
+        self.lib = lib
+        self.queue = asyncio.Queue(maxsize)
+        self.closed = False
+        self.handlers = [(name, self._handler(name)) for name in names]
+        for name, handler in self.handlers:
+            getattr(lib, name).add(handler)
+        lib._event_streams.add(self)
+
+    def _handler(self, name):
+        def handler(sender, args):
+            try:
+                self.queue.put_nowait((name, args))
+            except asyncio.QueueFull:
+                self.lib.rx_dropped_events += 1
+        return handler
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed and self.queue.empty():
+            raise StopAsyncIteration
+        item = await self.queue.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+    def close(self):
+
+        """Unsubscribe; the iterator ends once the events already queued are consumed."""
+
+        if self.closed:
+            return
+        self.closed = True
+        for name, handler in self.handlers:
+            getattr(self.lib, name).remove(handler)
+        self.lib._event_streams.discard(self)
+        try:
+            # wake a pending __anext__()
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+class BGLibPool(object):
+
+    """Several adapters working as one, each with its own BGLib parser.
+
+    ports are open serial ports, one per adapter; libs[i] parses ports[i].
+    start() gives every adapter a reader thread (see BGLib.start_reader()).
+    Events named with subscribe() are time-stamped as they are parsed and
+    merged into a single stream of (timestamp, adapter index, name, args)
+    tuples, read in timestamp order with get() or by iterating over the pool.
+    An event is held back for reorder_delay seconds so that one parsed a
+    little later on another adapter's thread can still be put before it.
+    """
+
+    def __init__(self, ports, reorder_delay=0.005, queue_size=0):
+        self.ports = list(ports)
+        self.libs = [BGLib() for port in self.ports]
+        self.reorder_delay = reorder_delay
+        self._queue = queue.Queue(queue_size)
+        self._pending = []
+        self._sequence = itertools.count()
+
+    def subscribe(self, *names):
+
+        """Add the named responses or events of every adapter to the merged stream."""
+
+        for index, lib in enumerate(self.libs):
+            for name in names:
+                getattr(lib, name).add(self._handler(index, name))
+
+    def _handler(self, index, name):
+        put = self._queue.put
+        def handler(sender, args):
+            put((time.monotonic(), index, name, args))
+        return handler
+
+    def start(self):
+
+        """Start the reader thread of every adapter that is not running yet."""
+
+        for lib, port in zip(self.libs, self.ports):
+            if lib._reader is None:
+                lib.start_reader(port)
+
+    def stop(self, timeout=None):
+
+        """Stop all reader threads; returns True once all have exited."""
+
+        stopped = True
+        for lib in self.libs:
+            stopped = lib.stop(timeout) and stopped
+        return stopped
+
+    def get(self, timeout=None):
+
+        """Return the next (timestamp, adapter index, name, args) in timestamp order.
+
+        timestamp is time.monotonic() when the event was parsed. Raises
+        queue.Empty if nothing is ready within timeout seconds (None waits
+        forever).
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while 1:
+            now = time.monotonic()
+            if self._pending:
+                ready = self._pending[0][0] + self.reorder_delay
+                if ready <= now:
+                    return heapq.heappop(self._pending)[2]
+                wait = ready - now
+                if deadline is not None:
+                    wait = min(wait, deadline - now)
+            elif deadline is not None:
+                wait = deadline - now
+            else:
+                wait = None
+            if wait is not None and wait <= 0:
+                raise queue.Empty
+            try:
+                item = self._queue.get(True, wait)
+            except queue.Empty:
+                continue
+            while 1:
+                heapq.heappush(self._pending, (item[0], next(self._sequence), item))
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+    def __iter__(self):
+        while 1:
+            yield self.get()
+
+    def start_scan(self, scan_interval=0x4b, active=0, mode=2, timeout=1):
+
+        """Start discovery on every adapter with staggered scan windows.
+
+        Each of the N adapters scans for 1/N of every scan_interval (in units
+        of 0.625 ms, at least 4 units), and adapter i starts i/N of an
+        interval after the first, so that together the windows cover the
+        interval once instead of all adapters listening at the same time.
+        mode is the gap_discover mode (2 = observation). Starts the reader
+        threads if needed; returns the gap_discover response args of every
+        adapter.
+        """
+
+        self.start()
+        count = len(self.libs)
+        window = max(4, scan_interval // count)
+        for lib, port in zip(self.libs, self.ports):
+            lib.call(port, lib.ble_cmd_gap_set_scan_parameters(scan_interval, window, active), timeout)
+        start = time.monotonic()
+        futures = []
+        for index, (lib, port) in enumerate(zip(self.libs, self.ports)):
+            delay = start + index * scan_interval * 0.000625 / count - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(lib.submit(port, lib.ble_cmd_gap_discover(mode)))
+        return [future.result(timeout) for future in futures]
+
+    def end_scan(self, timeout=1):
+
+        """Stop discovery on every adapter; returns their response args."""
+
+        return [lib.call(port, lib.ble_cmd_gap_end_procedure(), timeout) for lib, port in zip(self.libs, self.ports)]
+
+class BGAPIRing(object):
+
+    """Fixed-size record ring buffer in multiprocessing shared memory.
+
+    One process writes records with put() and one other process reads them
+    with drain(). The write and read positions live in the shared block
+    itself, so no lock or pipe is involved. Each record is a tuple of the
+    fields named in BGAPIRing.fields:
+
+        timestamp     time.monotonic() when the packet was decoded
+        adapter       adapter index given to put()
+        kind          SCAN_RESPONSE, ATTRIBUTE_VALUE, CONNECTION_STATUS or DISCONNECTED
+        connection    connection handle, 0xff for scan responses
+        address_type  remote address type
+        rssi          scan response RSSI
+        flags         packet type, attribute value type or connection flags
+        handle        attribute handle, connection interval or disconnect reason
+        address       6-byte remote address
+        length        full length of data
+        data          the first data_size bytes of data, zero padded
+
+    When the ring is full, put() drops the record and counts it in dropped.
+    """
+
+    SCAN_RESPONSE = 1
+    ATTRIBUTE_VALUE = 2
+    CONNECTION_STATUS = 3
+    DISCONNECTED = 4
+
+    fields = ('timestamp', 'adapter', 'kind', 'connection', 'address_type', 'rssi', 'flags', 'handle', 'address', 'length', 'data')
+
+    # write position, dropped count | read position (in its own cache line)
+    _header = 128
+
+    def __init__(self, slots=4096, data_size=64, name=None):
+        self.slots = slots
+        self.data_size = data_size
+        self.record = struct.Struct('<dBBBBbBH6sH%ds' % data_size)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=self._header + slots * self.record.size)
+            self.shm.buf[:self._header] = bytes(self._header)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.owner = name is None
+        self._position = struct.Struct('<Q')
+
+    @property
+    def dropped(self):
+        return self._position.unpack_from(self.shm.buf, 8)[0]
+
+    def put(self, adapter, kind, connection, address_type, rssi, flags, handle, address, data):
+
+        """Append a record; returns False if the ring was full and it was dropped."""
+
+        buf = self.shm.buf
+        position = self._position
+        write = position.unpack_from(buf, 0)[0]
+        if write - position.unpack_from(buf, 64)[0] >= self.slots:
+            position.pack_into(buf, 8, position.unpack_from(buf, 8)[0] + 1)
+            return False
+        self.record.pack_into(buf, self._header + (write % self.slots) * self.record.size, time.monotonic(), adapter, kind, connection, address_type, rssi, flags, handle, address, len(data), data)
+        # publish the record only after it has been written
+        position.pack_into(buf, 0, write + 1)
+        return True
+
+    def drain(self, max_items=None):
+
+        """Remove and return up to max_items (all if None) records, oldest first."""
+
+        buf = self.shm.buf
+        position = self._position
+        read = position.unpack_from(buf, 64)[0]
+        count = position.unpack_from(buf, 0)[0] - read
+        if max_items is not None:
+            count = min(count, max_items)
+        if count <= 0:
+            return []
+        size = self.record.size
+        first = read % self.slots
+        # at most two contiguous runs, before and after the wrap
+        head = min(count, self.slots - first)
+        records = list(self.record.iter_unpack(buf[self._header + first * size:self._header + (first + head) * size]))
+        if head < count:
+            records.extend(self.record.iter_unpack(buf[self._header:self._header + (count - head) * size]))
+        position.pack_into(buf, 64, read + count)
+        return records
+
+    def close(self):
+
+        """Detach from the shared memory, and free it if this object created it."""
+
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _open_serial_port(port):
+    import serial
+    return serial.Serial(port, 115200, timeout=0.1)
+
+
+def _run_ring_reader(ring_name, slots, data_size, adapter, port, opener, commands, stop, errors):
+
+    """(internal use) Body of a BGLibProcessPool adapter process."""
+
+    ring = BGAPIRing(slots, data_size, ring_name)
+    ser = None
+    try:
+        ser = opener(port)
+        lib = BGLib()
+        _ring_subscribe(lib, ring, adapter)
+        for packet in commands:
+            lib.call(ser, packet)
+        while not stop.is_set():
+            x = ser.read(ser.inWaiting() or 1)
+            if len(x) > 0:
+                lib.parse_bytes(x)
+    except Exception:
+        # tell the parent why this adapter stopped; drain() raises it there
+        errors.put((adapter, traceback.format_exc()))
+        raise
+    finally:
+        if ser is not None:
+            ser.close()
+        ring.shm.close()
+
+
+class BGLibProcessPool(object):
+
+    """Several adapters, each read and decoded in a process of its own.
+
+    For when one process (and its GIL) cannot keep up with the adapters.
+    Each adapter process opens its port with opener(port) (by default a
+    pyserial Serial at 115200 baud), sends the given command packets, e.g.
+    scan parameters and gap_discover, and from then on writes scan
+    responses, attribute values and connection status changes to its own
+    BGAPIRing as fixed-size records. drain() collects them in the main
+    process in batches. opener must be picklable, e.g. a module-level
+    function or functools.partial(serial.Serial, baudrate=...).
+
+    If an adapter process fails, for instance because its port cannot be
+    opened or a setup command times out, the next drain() raises a
+    RuntimeError carrying the traceback from that process.
+    """
+
+    def __init__(self, ports, opener=None, commands=(), slots=4096, data_size=64):
+        self.ports = list(ports)
+        self.rings = [BGAPIRing(slots, data_size) for port in self.ports]
+        self._stop = multiprocessing.Event()
+        self._errors = multiprocessing.Queue()
+        self.processes = [multiprocessing.Process(
+            target=_run_ring_reader,
+            args=(ring.name, slots, data_size, index, port, opener or _open_serial_port, list(commands), self._stop, self._errors),
+            name='BGLib adapter %d' % index,
+            daemon=True) for index, (ring, port) in enumerate(zip(self.rings, self.ports))]
+
+    def start(self):
+        for process in self.processes:
+            process.start()
+
+    def drain(self, max_items=None, sort=False):
+
+        """Return the records waiting in all rings (see BGAPIRing) as one list.
+
+        max_items limits the records taken from each ring. With sort set the
+        list is put in timestamp order; otherwise it holds each adapter's
+        records in order, one adapter after another.
+        """
+
+        try:
+            adapter, error = self._errors.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            raise RuntimeError('BGLib adapter %d (%s) failed:\n%s' % (adapter, self.ports[adapter], error))
+        records = []
+        for ring in self.rings:
+            records.extend(ring.drain(max_items))
+        if sort:
+            records.sort(key=lambda record: record[0])
+        return records
+
+    def stop(self, timeout=None):
+
+        """Stop the adapter processes; returns True once all have exited."""
+
+        self._stop.set()
+        for process in self.processes:
+            process.join(timeout)
+        return not any(process.is_alive() for process in self.processes)
+
+    def close(self):
+
+        """Stop the adapter processes and free the rings."""
+
+        if not self.stop(1):
+            for process in self.processes:
+                process.terminate()
+        for ring in self.rings:
+            ring.close()
+
+
+def _ring_subscribe(lib, ring, adapter):
+
+    """(internal use) Write the events kept by BGLibProcessPool to ring."""
+
+    def scan_response(sender, args):
+        ring.put(adapter, BGAPIRing.SCAN_RESPONSE, 0xff, args.address_type, args.rssi, args.packet_type, 0, args.sender, args.data)
+    def attribute_value(sender, args):
+        ring.put(adapter, BGAPIRing.ATTRIBUTE_VALUE, args.connection, 0, 0, args.type, args.atthandle, b'', args.value)
+    def connection_status(sender, args):
+        # timeout, latency and bonding go in data
+        ring.put(adapter, BGAPIRing.CONNECTION_STATUS, args.connection, args.address_type, 0, args.flags, args.conn_interval, args.address, struct.pack('<HHB', args.timeout, args.latency, args.bonding))
+    def disconnected(sender, args):
+        ring.put(adapter, BGAPIRing.DISCONNECTED, args.connection, 0, 0, 0, args.reason, b'', b'')
+    lib.ble_evt_gap_scan_response += scan_response
+    lib.ble_evt_attclient_attribute_value += attribute_value
+    lib.ble_evt_connection_status += connection_status
+    lib.ble_evt_connection_disconnected += disconnected
+
+class BGAPIBridge(object):
+
+    """Share one adapter among several clients over TCP or a Unix socket.
+
+    The bridge owns the port: it runs a BGLib reader thread on it and speaks
+    plain BGAPI to its clients, so a client is an ordinary BGLib used with
+    a BGAPISocketPort, or an AsyncBGLib connected with
+    loop.create_connection(). Commands from all clients go through
+    BGLib.submit()'s queue, so they reach the adapter one at a time, and
+    each response is sent only to the client whose command it answers.
+    Events are passed on undecoded to every client, or only to those that
+    subscribed to their class or (class, command) pair with a
+    subscribe_frame(). A client whose send buffer is over max_buffer bytes
+    misses events until it catches up. Commands still unanswered
+    command_timeout seconds after they arrived are dropped, and so is a
+    response that arrives for one of them later.
+    """
+
+    # first header byte of bridge control frames (message type 0, technology type 1111)
+    CONTROL = 0x78
+
+    def __init__(self, ser, command_timeout=1, max_buffer=1 << 20):
+        self.ser = ser
+        self.lib = BGLib()
+        self.command_timeout = command_timeout
+        self.max_buffer = max_buffer
+        self.clients = set()
+        self._command_clients = {}
+        self._loop = None
+        self.lib.on_raw_frame += self._raw_frame
+
+    @staticmethod
+    def subscribe_frame(*filters):
+
+        """Return the control frame that limits a client to the given events.
+
+        filters are class IDs and (class ID, command ID) pairs; with none, the
+        client gets all events again (as it does before subscribing).
+        """
+
+        payload = []
+        for item in filters:
+            if isinstance(item, tuple):
+                payload.extend(item)
+            else:
+                payload.extend((item, 0xff))
+        return bytes([BGAPIBridge.CONTROL, len(payload), 0, 0] + payload)
+
+    async def start(self, address):
+
+        """Start the reader thread and listen on address, a (host, port) pair
+        for TCP or a path for a Unix socket; returns the asyncio server."""
+
+        self._loop = asyncio.get_running_loop()
+        if self.lib._reader is None:
+            self.lib.start_reader(self.ser)
+        if isinstance(address, str):
+            return await self._loop.create_unix_server(lambda: _BridgeClient(self), address)
+        return await self._loop.create_server(lambda: _BridgeClient(self), address[0], address[1])
+
+    def serve_forever(self, address):
+
+        """Run the bridge on address (see start()) until interrupted."""
+
+        async def serve():
+            server = await self.start(address)
+            async with server:
+                await server.serve_forever()
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.lib.stop(1)
+
+    def _command(self, client, packet):
+
+        """(internal use) Queue a command packet from a client."""
+
+        future = concurrent.futures.Future()
+        self._command_clients[future] = (client, packet[2], packet[3])
+        self._loop.call_later(self.command_timeout, self._expire_command, future)
+        self.lib._queue_command(self.ser, packet, future)
+
+    def _expire_command(self, future):
+        self._command_clients.pop(future, None)
+        future.cancel()
+
+    def _raw_frame(self, sender, frame):
+
+        """(internal use) Pass a received packet on, from the reader thread."""
+
+        header = frame.header
+        data = bytes(header) + bytes(frame.payload)
+        if header[0] & 0x80:
+            self._loop.call_soon_threadsafe(self._fan_out, header[2], header[3], data)
+            return
+        # a response, to the oldest command waiting for it (resolved right
+        # after this); None in its place marks one that has been dropped
+        waiters = self.lib._response_waiters.get((header[2], header[3]))
+        command = self._command_clients.pop(waiters[0], None) if waiters else None
+        if command is not None and command[1:] == (header[2], header[3]):
+            self._loop.call_soon_threadsafe(command[0].send, data)
+
+    def _fan_out(self, packet_class, packet_command, data):
+        for client in self.clients:
+            filters = client.filters
+            if filters is None or packet_class in filters or (packet_class, packet_command) in filters:
+                if client.transport.get_write_buffer_size() > self.max_buffer:
+                    client.dropped += 1
+                else:
+                    client.send(data)
+
+
+class _BridgeClient(asyncio.Protocol):
+
+    """(internal use) One client connection of a BGAPIBridge."""
+
+    def __init__(self, bridge):
+        self.bridge = bridge
+        self.transport = None
+        self.filters = None
+        self.dropped = 0
+        self.buffer = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.bridge.clients.add(self)
+
+    def connection_lost(self, exc):
+        self.bridge.clients.discard(self)
+        for future, command in list(self.bridge._command_clients.items()):
+            if command[0] is self:
+                self.bridge._expire_command(future)
+
+    def send(self, data):
+        if not self.transport.is_closing():
+            self.transport.write(data)
+
+    def data_received(self, data):
+        buf = self.buffer + data
+        pos = 0
+        end = len(buf)
+        while end - pos >= 4:
+            length = 4 + (buf[pos] & 0x07) + buf[pos + 1]
+            if end - pos < length:
+                break
+            if buf[pos] == BGAPIBridge.CONTROL:
+                self._control(buf[pos + 2], buf[pos + 3], buf[pos + 4:pos + length])
+            else:
+                self.bridge._command(self, buf[pos:pos + length])
+            pos += length
+        self.buffer = buf[pos:]
+
+    def _control(self, control_class, control_command, payload):
+        if control_class == 0 and control_command == 0:
+            # subscribe
+            if len(payload) == 0:
+                self.filters = None
+                return
+            self.filters = set()
+            for i in range(0, len(payload) - 1, 2):
+                if payload[i + 1] == 0xff:
+                    self.filters.add(payload[i])
+                else:
+                    self.filters.add((payload[i], payload[i + 1]))
+
+
+class BGAPISocketPort(object):
+
+    """A socket connection to a BGAPIBridge that looks like a pyserial port.
+
+    It provides read(), write(), inWaiting(), fileno(), timeout, cancel_read()
+    and close(), so the blocking BGLib API (check_activity(), call(),
+    start_reader()) works over it unchanged:
+
+        port = BGAPISocketPort.connect(('localhost', 9000))
+        port.subscribe(6)   # only gap events
+        ble.call(port, ble.ble_cmd_gap_discover(1))
+    """
+
+    def __init__(self, sock, timeout=None):
+        self.sock = sock
+        self.timeout = timeout
+        self._buffer = b""
+        self._wakeup_read, self._wakeup_write = socket.socketpair()
+
+    @classmethod
+    def connect(cls, address, timeout=None):
+
+        """Connect to a bridge at a (host, port) pair or a Unix socket path."""
+
+        if isinstance(address, str):
+            sock = socket.socket(socket.AF_UNIX)
+            sock.connect(address)
+        else:
+            sock = socket.create_connection(address)
+        return cls(sock, timeout)
+
+    def subscribe(self, *filters):
+
+        """Receive only the given events, see BGAPIBridge.subscribe_frame()."""
+
+        self.sock.sendall(BGAPIBridge.subscribe_frame(*filters))
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def inWaiting(self):
+        if len(self._buffer) == 0:
+            self._fill(0)
+        return len(self._buffer)
+
+    def read(self, size=1):
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while len(self._buffer) < size:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            if not self._fill(remaining):
+                break
+        data = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return data
+
+    def _fill(self, timeout):
+
+        """(internal use) Wait up to timeout seconds for data; False if cancelled or timed out."""
+
+        readable = select.select([self.sock, self._wakeup_read], [], [], timeout)[0]
+        if self._wakeup_read in readable:
+            self._wakeup_read.recv(64)
+            return False
+        if not readable:
+            return False
+        data = self.sock.recv(65536)
+        if len(data) == 0:
+            raise ConnectionError('bridge closed the connection')
+        self._buffer += data
+        return True
+
+    def write(self, data):
+        self.sock.sendall(data)
+        return len(data)
+
+    def cancel_read(self):
+        self._wakeup_write.send(b"\x00")
+
+    def close(self):
+        self.sock.close()
+        self._wakeup_read.close()
+        self._wakeup_write.close()
+
+class BGAPISimulator(object):
+
+    """A simulated BLED112 or WF121 (BGAPI device) that answers every command and can stream events.
+
+    Generated from the same API definitions as BGLib. Every command frame
+    received is answered with a well-formed response: all fields zero (so
+    'result' is success) and arrays empty, unless responses[(class ID,
+    command ID)] holds the payload to send instead, or a function of the
+    command payload that returns it. push() sends one event and stream()
+    sends events from a background thread at a given rate, for example
+
+        sim, path = BGAPISimulator.open_pty()
+        sim.stream('ble_evt_gap_scan_response', rate=20000)
+
+    then open path as the serial port. Event payloads default to random
+    field values, with arrays of up to array_size random bytes.
+    """
+
+    def __init__(self, read, write, seed=None):
+        self._read = read
+        self._write = write
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._close = None
+        self.responses = {}
+        self.array_size = 31
+        self.random = random.Random(seed)
+        self.names = dict((event.name, key) for key, (decoder, event) in BGLib.bgapi_rx_dispatch.items())
+        self.threads = [threading.Thread(target=self._run_commands, name='BGAPI simulator', daemon=True)]
+        self.threads[0].start()
+
+    @classmethod
+    def open_pty(cls, seed=None):
+
+        """Start a simulator on a new pseudo-terminal (POSIX only).
+
+        Returns the simulator and the path of the terminal to open as the
+        serial port.
+        """
+
+        import pty
+        import tty
+        master, slave = pty.openpty()
+        tty.setraw(master)
+        tty.setraw(slave)
+        def read(timeout):
+            if select.select([master], [], [], timeout)[0]:
+                return os.read(master, 65536)
+            return None
+        def write(data):
+            view = memoryview(data)
+            while len(view) > 0:
+                view = view[os.write(master, view):]
+        sim = cls(read, write, seed)
+        sim._close = lambda: (os.close(master), os.close(slave))
+        return sim, os.ttyname(slave)
+
+    @classmethod
+    def socket_pair(cls, seed=None):
+
+        """Start a simulator on one end of a socket pair; returns the simulator
+        and the other end, e.g. for BGAPISocketPort(sock) or AsyncBGLib."""
+
+        device, host = socket.socketpair()
+        def read(timeout):
+            if select.select([device], [], [], timeout)[0]:
+                return device.recv(65536)
+            return None
+        sim = cls(read, device.sendall, seed)
+        sim._close = device.close
+        return sim, host
+
+    def payload(self, key, randomize=True):
+
+        """Return a payload for the message with dispatch key key, with random
+        field values if randomize is set, otherwise all zero."""
+
+        layout, has_array = self.layouts[key]
+        size = struct.calcsize(layout)
+        if not randomize:
+            return bytes(size)
+        data = self.random.getrandbits(8 * size).to_bytes(size, 'little') if size > 0 else b""
+        if has_array:
+            length = self.random.randint(0, self.array_size)
+            data = data[:-1] + bytes([length]) + self.random.getrandbits(8 * length).to_bytes(length, 'little')
+        return data
+
+    def frame(self, name, payload=None):
+
+        """Return the packet for the named event or response, with the given
+        or a random payload."""
+
+        key = self.names[name]
+        if payload is None:
+            payload = self.payload(key)
+        return bytes([key[0] | (len(payload) >> 8) & 0x07, len(payload) & 0xFF, key[1], key[2]]) + payload
+
+    def send(self, data):
+
+        """Write raw bytes to the host, between whole packets of other writers."""
+
+        with self._write_lock:
+            self._write(data)
+
+    def push(self, name, payload=None):
+
+        """Send one event (or response), e.g. push('ble_evt_gap_scan_response')."""
+
+        self.send(self.frame(name, payload))
+
+    def stream(self, events, rate=None, count=None):
+
+        """Send events from a background thread; returns the thread.
+
+        events is either a name, sent repeatedly with random payloads, or an
+        iterable of (name, payload) pairs (payload None for random) that is
+        played once. rate is in events per second, None for as fast as
+        possible; count limits the number of events. Events due at the same
+        time go out in one write. Runs until done or close().
+        """
+
+        if isinstance(events, str):
+            events = itertools.repeat((events, None))
+        if count is not None:
+            events = itertools.islice(events, count)
+        thread = threading.Thread(target=self._run_stream, args=(iter(events), rate), name='BGAPI simulator stream', daemon=True)
+        self.threads.append(thread)
+        thread.start()
+        return thread
+
+    def close(self):
+
+        """Stop all threads and close the simulator's end of the connection."""
+
+        self._stop.set()
+        for thread in self.threads:
+            if thread is not threading.current_thread():
+                thread.join(1)
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def _run_stream(self, events, rate):
+        start = time.monotonic()
+        sent = 0
+        while not self._stop.is_set():
+            if rate is None:
+                wanted = 64
+            else:
+                # event n is due n / rate seconds after the start
+                wanted = int((time.monotonic() - start) * rate) + 1 - sent
+            if wanted > 0:
+                batch = [self.frame(name, payload) for name, payload in itertools.islice(events, wanted)]
+                if len(batch) > 0:
+                    self.send(b"".join(batch))
+                    sent += len(batch)
+                if len(batch) < wanted:
+                    # out of events
+                    return
+            if rate is not None:
+                time.sleep(min(0.001, max(0, sent / rate - (time.monotonic() - start))))
+
+    def _run_commands(self):
+        buf = b""
+        while not self._stop.is_set():
+            try:
+                data = self._read(0.1)
+            except OSError:
+                return
+            if data is None:
+                continue
+            if len(data) == 0:
+                return
+            buf += data
+            pos = 0
+            while len(buf) - pos >= 4:
+                length = 4 + (buf[pos] & 0x07) + buf[pos + 1]
+                if len(buf) - pos < length:
+                    break
+                self._answer(buf[pos:pos + length])
+                pos += length
+            buf = buf[pos:]
+
+    def _answer(self, command):
+        key = (command[0] & 0xf8, command[2], command[3])
+        if key not in self.layouts:
+            return
+        response = self.responses.get(key[1:])
+        if response is None:
+            payload = self.payload(key, False)
+        elif callable(response):
+            payload = response(command[4:])
+        else:
+            payload = response
+        self.send(bytes([key[0] | (len(payload) >> 8) & 0x07, len(payload) & 0xFF, key[1], key[2]]) + payload)
+
+    # (message type and technology type, class ID, command ID) => (struct format of the payload, whether it ends in a uint8array)
+    layouts = {
+        (0x00, 0, 0): ('<', False),
+        (0x00, 0, 1): ('<', False),
+        (0x00, 0, 2): ('<6s', False),
+        (0x00, 0, 3): ('<H', False),
+        (0x00, 0, 4): ('<HB', False),
+        (0x00, 0, 5): ('<BBBBB', False),
+        (0x00, 0, 6): ('<B', False),
+        (0x00, 0, 7): ('<IB', True),
+        (0x00, 0, 8): ('<HHHHHBB', False),
+        (0x00, 0, 9): ('<H', False),
+        (0x00, 0, 10): ('<H', False),
+        (0x00, 0, 11): ('<H', False),
+        (0x00, 0, 12): ('<', False),
+        (0x00, 0, 13): ('<HB', True),
+        (0x00, 0, 14): ('<H', False),
+        (0x00, 1, 0): ('<', False),
+        (0x00, 1, 1): ('<', False),
+        (0x00, 1, 2): ('<', False),
+        (0x00, 1, 3): ('<H', False),
+        (0x00, 1, 4): ('<HB', True),
+        (0x00, 1, 5): ('<', False),
+        (0x00, 1, 6): ('<H', False),
+        (0x00, 1, 7): ('<', False),
+        (0x00, 2, 0): ('<H', False),
+        (0x00, 2, 1): ('<HHHB', True),
+        (0x00, 2, 2): ('<HHB', True),
+        (0x00, 2, 3): ('<', False),
+        (0x00, 2, 4): ('<', False),
+        (0x00, 3, 0): ('<BH', False),
+        (0x00, 3, 1): ('<Bb', False),
+        (0x00, 3, 2): ('<BH', False),
+        (0x00, 3, 3): ('<BH', False),
+        (0x00, 3, 4): ('<BB', True),
+        (0x00, 3, 5): ('<BH', False),
+        (0x00, 3, 6): ('<BH', False),
+        (0x00, 3, 7): ('<B', False),
+        (0x00, 3, 8): ('<B', False),
+        (0x00, 4, 0): ('<BH', False),
+        (0x00, 4, 1): ('<BH', False),
+        (0x00, 4, 2): ('<BH', False),
+        (0x00, 4, 3): ('<BH', False),
+        (0x00, 4, 4): ('<BH', False),
+        (0x00, 4, 5): ('<BH', False),
+        (0x00, 4, 6): ('<BH', False),
+        (0x00, 4, 7): ('<H', False),
+        (0x00, 4, 8): ('<BH', False),
+        (0x00, 4, 9): ('<BH', False),
+        (0x00, 4, 10): ('<BH', False),
+        (0x00, 4, 11): ('<BH', False),
+        (0x00, 5, 0): ('<BH', False),
+        (0x00, 5, 1): ('<', False),
+        (0x00, 5, 2): ('<H', False),
+        (0x00, 5, 3): ('<', False),
+        (0x00, 5, 4): ('<H', False),
+        (0x00, 5, 5): ('<B', False),
+        (0x00, 5, 6): ('<', False),
+        (0x00, 6, 0): ('<', False),
+        (0x00, 6, 1): ('<H', False),
+        (0x00, 6, 2): ('<H', False),
+        (0x00, 6, 3): ('<HB', False),
+        (0x00, 6, 4): ('<H', False),
+        (0x00, 6, 5): ('<HB', False),
+        (0x00, 6, 6): ('<H', False),
+        (0x00, 6, 7): ('<H', False),
+        (0x00, 6, 8): ('<H', False),
+        (0x00, 6, 9): ('<H', False),
+        (0x00, 6, 10): ('<H', False),
+        (0x00, 7, 0): ('<H', False),
+        (0x00, 7, 1): ('<H', False),
+        (0x00, 7, 2): ('<H', False),
+        (0x00, 7, 3): ('<H', False),
+        (0x00, 7, 4): ('<H', False),
+        (0x00, 7, 5): ('<H', False),
+        (0x00, 7, 6): ('<H', False),
+        (0x00, 7, 7): ('<HBB', False),
+        (0x00, 7, 8): ('<H', False),
+        (0x00, 7, 9): ('<HBB', True),
+        (0x00, 7, 10): ('<HB', True),
+        (0x00, 7, 11): ('<B', False),
+        (0x00, 7, 12): ('<', False),
+        (0x00, 7, 13): ('<H', False),
+        (0x00, 8, 0): ('<', False),
+        (0x00, 8, 1): ('<', False),
+        (0x00, 8, 2): ('<H', False),
+        (0x00, 8, 3): ('<', False),
+        (0x00, 8, 4): ('<B', True),
+        (0x00, 8, 5): ('<B', True),
+        (0x80, 0, 0): ('<HHHHHBB', False),
+        (0x80, 0, 1): ('<B', True),
+        (0x80, 0, 2): ('<BB', False),
+        (0x80, 0, 3): ('<BB', False),
+        (0x80, 0, 4): ('<HH', False),
+        (0x80, 0, 5): ('<', False),
+        (0x80, 1, 0): ('<HB', True),
+        (0x80, 2, 0): ('<BBHHB', True),
+        (0x80, 2, 1): ('<BHHB', False),
+        (0x80, 2, 2): ('<HB', False),
+        (0x80, 3, 0): ('<BB6sBHHHB', False),
+        (0x80, 3, 1): ('<BBHH', False),
+        (0x80, 3, 2): ('<BB', True),
+        (0x80, 3, 3): ('<BB', True),
+        (0x80, 3, 4): ('<BH', False),
+        (0x80, 4, 0): ('<BH', False),
+        (0x80, 4, 1): ('<BHH', False),
+        (0x80, 4, 2): ('<BHHB', True),
+        (0x80, 4, 3): ('<BHHBB', True),
+        (0x80, 4, 4): ('<BHB', True),
+        (0x80, 4, 5): ('<BHBB', True),
+        (0x80, 4, 6): ('<BB', True),
+        (0x80, 5, 0): ('<BBB', True),
+        (0x80, 5, 1): ('<BH', False),
+        (0x80, 5, 2): ('<BI', False),
+        (0x80, 5, 3): ('<B', False),
+        (0x80, 5, 4): ('<BBBB', False),
+        (0x80, 6, 0): ('<bB6sBBB', True),
+        (0x80, 6, 1): ('<BB', False),
+        (0x80, 7, 0): ('<IBBB', False),
+        (0x80, 7, 1): ('<B', False),
+        (0x80, 7, 2): ('<Bh', False),
+        (0x08, 0, 0): ('<', False),
+        (0x08, 0, 1): ('<H', False),
+        (0x08, 0, 2): ('<H', False),
+        (0x08, 0, 3): ('<H', False),
+        (0x08, 1, 0): ('<', False),
+        (0x08, 1, 1): ('<', False),
+        (0x08, 1, 2): ('<', False),
+        (0x08, 1, 3): ('<H', False),
+        (0x08, 2, 0): ('<HB', False),
+        (0x08, 2, 1): ('<HB', False),
+        (0x08, 3, 0): ('<H', False),
+        (0x08, 3, 1): ('<H', False),
+        (0x08, 3, 2): ('<H', False),
+        (0x08, 3, 3): ('<H', False),
+        (0x08, 3, 4): ('<H', False),
+        (0x08, 3, 5): ('<B', False),
+        (0x08, 3, 6): ('<HB6s', False),
+        (0x08, 3, 7): ('<HB6s', False),
+        (0x08, 3, 8): ('<HB', False),
+        (0x08, 3, 9): ('<H', False),
+        (0x08, 4, 0): ('<HB', False),
+        (0x08, 4, 1): ('<HB', False),
+        (0x08, 4, 2): ('<HB', False),
+        (0x08, 4, 3): ('<HB', False),
+        (0x08, 4, 4): ('<H', False),
+        (0x08, 4, 5): ('<H', False),
+        (0x08, 4, 6): ('<H', False),
+        (0x08, 5, 0): ('<HB', False),
+        (0x08, 5, 1): ('<HB', False),
+        (0x08, 5, 2): ('<HB', False),
+        (0x08, 5, 3): ('<HB', False),
+        (0x08, 5, 4): ('<HB', False),
+        (0x08, 6, 0): ('<H', False),
+        (0x08, 6, 1): ('<H', False),
+        (0x08, 6, 2): ('<H', False),
+        (0x08, 6, 3): ('<H', False),
+        (0x08, 6, 4): ('<H', False),
+        (0x08, 6, 5): ('<H', False),
+        (0x08, 6, 6): ('<H', False),
+        (0x08, 6, 7): ('<HBH', False),
+        (0x08, 6, 8): ('<H', False),
+        (0x08, 6, 9): ('<HBH', False),
+        (0x08, 7, 0): ('<H', False),
+        (0x08, 7, 1): ('<H', False),
+        (0x08, 7, 2): ('<H', False),
+        (0x08, 7, 3): ('<H', False),
+        (0x08, 7, 4): ('<HB', True),
+        (0x08, 7, 5): ('<H', False),
+        (0x08, 8, 0): ('<H', False),
+        (0x08, 8, 1): ('<H', False),
+        (0x08, 8, 2): ('<H', False),
+        (0x88, 0, 0): ('<I', False),
+        (0x88, 1, 0): ('<HHHHHHH', False),
+        (0x88, 1, 1): ('<H', False),
+        (0x88, 1, 2): ('<IB', False),
+        (0x88, 1, 3): ('<B', False),
+        (0x88, 2, 0): ('<B6s', False),
+        (0x88, 3, 0): ('<H', False),
+        (0x88, 3, 1): ('<H', False),
+        (0x88, 3, 2): ('<6sbhbBB', True),
+        (0x88, 3, 3): ('<6s', False),
+        (0x88, 3, 4): ('<b', False),
+        (0x88, 3, 5): ('<bB6s', False),
+        (0x88, 3, 6): ('<HB', False),
+        (0x88, 3, 7): ('<BB', False),
+        (0x88, 3, 8): ('<HB', False),
+        (0x88, 3, 9): ('<B', False),
+        (0x88, 4, 0): ('<4s4s4sB', False),
+        (0x88, 4, 1): ('<B4s', False),
+        (0x88, 4, 2): ('<B4sH4sH', False),
+        (0x88, 4, 3): ('<H4sB', True),
+        (0x88, 5, 0): ('<B', False),
+        (0x88, 5, 1): ('<BB', True),
+        (0x88, 5, 2): ('<BIBbB', False),
+        (0x88, 5, 3): ('<HB', False),
+        (0x88, 6, 0): ('<B', False),
+        (0x88, 6, 1): ('<I', False),
+        (0x88, 6, 2): ('<BI', False),
+        (0x88, 7, 0): ('<HB', True),
+    }
+
+class BGAPICapture(object):
+
+    """Timestamped capture of the raw bytes a BGLib receives and sends.
+
+    Used through BGLib.start_capture(). The file starts with MAGIC and then
+    holds one record per chunk: a '<dBI' header (time.monotonic(), RX or
+    TX, length) followed by the bytes. Read it back with BGAPIReplay.
+    """
+
+    MAGIC = b"BGAPIcap"
+    RX = 0
+    TX = 1
+
+    _record = struct.Struct('<dBI')
+
+    def __init__(self, file):
+        if isinstance(file, (str, bytes, os.PathLike)):
+            self.file = open(file, 'wb')
+            self._owned = True
+        else:
+            self.file = file
+            self._owned = False
+        self._lock = threading.Lock()
+        self.file.write(self.MAGIC)
+
+    def write(self, direction, data):
+        if len(data) == 0:
+            return
+        with self._lock:
+            self.file.write(self._record.pack(time.monotonic(), direction, len(data)))
+            self.file.write(data)
+
+    def close(self):
+        with self._lock:
+            if self._owned:
+                self.file.close()
+            else:
+                self.file.flush()
+
+
+class BGAPIReplay(object):
+
+    """Play back a BGAPICapture file.
+
+    records() gives every (timestamp, direction, data) record. chunks()
+    gives the received chunks at their original pace, speed times faster,
+    or as fast as possible with speed None, and is a valid source for
+    BGLib.iter_frames() and iter_packets(). feed() passes them to a BGLib's
+    parse_bytes(), so its handlers run as they did when the capture was
+    made:
+
+        BGAPIReplay('scan.cap').feed(ble, speed=10)
+    """
+
+    def __init__(self, file):
+        self.file = file
+
+    def records(self):
+        record = BGAPICapture._record
+        if isinstance(self.file, (str, bytes, os.PathLike)):
+            f = open(self.file, 'rb')
+        else:
+            f = self.file
+        try:
+            if f.read(len(BGAPICapture.MAGIC)) != BGAPICapture.MAGIC:
+                raise ValueError('not a BGAPI capture file')
+            while 1:
+                header = f.read(record.size)
+                if len(header) < record.size:
+                    return
+                timestamp, direction, length = record.unpack(header)
+                yield timestamp, direction, f.read(length)
+        finally:
+            if f is not self.file:
+                f.close()
+
+    def chunks(self, speed=1, direction=BGAPICapture.RX):
+        start = None
+        for timestamp, chunk_direction, data in self.records():
+            if chunk_direction != direction:
+                continue
+            if speed:
+                if start is None:
+                    start = (timestamp, time.monotonic())
+                delay = (timestamp - start[0]) / speed - (time.monotonic() - start[1])
+                if delay > 0:
+                    time.sleep(delay)
+            yield data
+
+    def feed(self, lib, speed=1):
+
+        """Parse the received chunks with lib; returns the number of bytes fed."""
+
+        count = 0
+        for data in self.chunks(speed):
+            lib.parse_bytes(data)
+            count += len(data)
+        return count
+
+def _detach_args(args):
+
+    """(internal use) Copy of args with zero_copy views replaced by bytes."""
+
+    return type(args)(*[bytes(value) if isinstance(value, memoryview) else value
+                        for value in [getattr(args, name) for name in args.__slots__]])
+
+
+class BGAPIExecutorHandler(object):
+
+    """Event handler that runs func on an executor instead of the parser thread.
+
+        pool = concurrent.futures.ThreadPoolExecutor(8)
+        ble.ble_evt_attclient_attribute_value += BGAPIExecutorHandler(store_value, pool, key='connection')
+
+    Calls with the same key run one at a time, in the order they arrived,
+    and calls with different keys run in parallel. key is an argument name
+    such as 'connection' or 'sender', a function of the args record, or
+    None to run every call in order. func(sender, args) is called as usual,
+    except that on a ProcessPoolExecutor sender is None, because a BGLib
+    cannot be pickled; args records pickle as they are. With zero_copy, the
+    uint8array fields are copied before they are queued.
+
+    Exceptions raised by func are counted in errors, and the last one is
+    kept in last_error. wait() blocks until everything submitted so far has
+    run.
+    """
+
+    def __init__(self, func, executor, key=None):
+        self.func = func
+        self.executor = executor
+        self.key = key
+        self.errors = 0
+        self.last_error = None
+        self._pass_sender = not isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+        self._pending = {}
+        self._condition = threading.Condition()
+
+    def __call__(self, sender, args):
+        if getattr(sender, 'zero_copy', False):
+            args = _detach_args(args)
+        if self.key is None:
+            key = None
+        elif callable(self.key):
+            key = self.key(args)
+        else:
+            key = args[self.key]
+        with self._condition:
+            waiting = self._pending.get(key)
+            if waiting is not None:
+                # an earlier call with this key is still running
+                waiting.append((sender, args))
+                return
+            self._pending[key] = deque()
+        self._submit(key, sender, args)
+
+    def _submit(self, key, sender, args):
+
+        """(internal use) Run one call; the next one with this key follows when it is done."""
+
+        try:
+            future = self.executor.submit(self.func, sender if self._pass_sender else None, args)
+        except BaseException:
+            # the executor refused the call, e.g. after shutdown(); release the
+            # key and the calls queued behind it so wait() does not block
+            with self._condition:
+                del self._pending[key]
+                self._condition.notify_all()
+            raise
+        future.add_done_callback(lambda future: self._done(key, future))
+
+    def _done(self, key, future):
+
+        """(internal use) Record the outcome of a call and submit the next one with its key."""
+
+        if not future.cancelled() and future.exception() is not None:
+            self.errors += 1
+            self.last_error = future.exception()
+        with self._condition:
+            waiting = self._pending[key]
+            if not waiting:
+                del self._pending[key]
+                self._condition.notify_all()
+                return
+            sender, args = waiting.popleft()
+        self._submit(key, sender, args)
+
+    def wait(self, timeout=None):
+
+        """Wait until no call is running or queued; returns False on timeout."""
+
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending, timeout)
+
+
+class _BatchFlusher(object):
+
+    """(internal use) The one thread that delivers batches whose max_delay has passed."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        # heap of (deadline, sequence number, handler)
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._thread = None
+
+    def schedule(self, handler, deadline):
+        with self._condition:
+            heapq.heappush(self._deadlines, (deadline, next(self._sequence), handler))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='BGLib batch flusher', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._deadlines:
+                        self._condition.wait()
+                        continue
+                    remaining = self._deadlines[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                deadline, sequence, handler = heapq.heappop(self._deadlines)
+            handler._flush(deadline)
+
+
+_batch_flusher = _BatchFlusher()
+
+
+class BGAPIBatchHandler(object):
+
+    """Event handler that collects decoded args and delivers them in batches.
+
+    Created by BGLib.on_batch(). func(sender, batch) gets a list of args
+    records or, with columnar set, a dict of one list per field. A batch is
+    delivered once it holds max_items records, or max_delay seconds after
+    its first record arrived (from a thread shared by all batch handlers),
+    whichever comes first.
+    flush() delivers whatever is collected now. Deliveries never overlap
+    and keep arrival order.
+    """
+
+    def __init__(self, func, max_items=512, max_delay=0.05, columnar=False):
+        self.func = func
+        self.max_items = max_items
+        self.max_delay = max_delay
+        self.columnar = columnar
+        self._items = []
+        self._sender = None
+        self._deadline = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def __call__(self, sender, args):
+        if sender.zero_copy:
+            args = _detach_args(args)
+        with self._lock:
+            self._items.append(args)
+            self._sender = sender
+            count = len(self._items)
+            if count == 1 and self.max_delay is not None:
+                self._deadline = time.monotonic() + self.max_delay
+                _batch_flusher.schedule(self, self._deadline)
+        if count >= self.max_items:
+            self.flush()
+
+    def flush(self):
+        self._flush(None)
+
+    def _flush(self, deadline):
+
+        """(internal use) Deliver the batch; with a deadline, only if it is
+        still the batch that deadline was set for."""
+
+        with self._flush_lock:
+            with self._lock:
+                if deadline is not None and deadline != self._deadline:
+                    return
+                items, self._items = self._items, []
+                self._deadline = None
+            if not items:
+                return
+            if self.columnar:
+                self.func(self._sender, {name: [args[name] for args in items] for name in items[0]._fields})
             else:
-                # 0x88 = wifi event packet
-                if packet_class == 0:
-                    if packet_command == 0: # wifi_evt_dfu_boot
-                        version = struct.unpack('<I', self.bgapi_rx_payload[:4])[0]
-                        self.wifi_evt_dfu_boot({ 'version': version })
-                        self.busy = False
-                        self.on_idle()
-                elif packet_class == 1:
-                    if packet_command == 0: # wifi_evt_system_boot
-                        major, minor, patch, build, bootloader_version, tcpip_version, hw = struct.unpack('<HHHHHHH', self.bgapi_rx_payload[:14])
-                        self.wifi_evt_system_boot({ 'major': major, 'minor': minor, 'patch': patch, 'build': build, 'bootloader_version': bootloader_version, 'tcpip_version': tcpip_version, 'hw': hw })
-                    elif packet_command == 1: # wifi_evt_system_state
-                        state = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_evt_system_state({ 'state': state })
-                    elif packet_command == 2: # wifi_evt_system_sw_exception
-                        address, type = struct.unpack('<IB', self.bgapi_rx_payload[:5])
-                        self.wifi_evt_system_sw_exception({ 'address': address, 'type': type })
-                    elif packet_command == 3: # wifi_evt_system_power_saving_state
-                        state = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_evt_system_power_saving_state({ 'state': state })
-                elif packet_class == 2:
-                    if packet_command == 0: # wifi_evt_config_mac_address
-                        hw_interface = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_evt_config_mac_address({ 'hw_interface': hw_interface })
-                elif packet_class == 3:
-                    if packet_command == 0: # wifi_evt_sme_wifi_is_on
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_evt_sme_wifi_is_on({ 'result': result })
-                    elif packet_command == 1: # wifi_evt_sme_wifi_is_off
-                        result = struct.unpack('<H', self.bgapi_rx_payload[:2])[0]
-                        self.wifi_evt_sme_wifi_is_off({ 'result': result })
-                    elif packet_command == 2: # wifi_evt_sme_scan_result
-                        channel, rssi, snr, secure, ssid_len = struct.unpack('<bhbBB', self.bgapi_rx_payload[:6])
-                        ssid_data = self.bgapi_rx_payload[6:]
-                        self.wifi_evt_sme_scan_result({ 'channel': channel, 'rssi': rssi, 'snr': snr, 'secure': secure, 'ssid': ssid_data })
-                    elif packet_command == 3: # wifi_evt_sme_scan_result_drop
-                        self.wifi_evt_sme_scan_result_drop({  })
-                    elif packet_command == 4: # wifi_evt_sme_scanned
-                        status = struct.unpack('<b', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_evt_sme_scanned({ 'status': status })
-                    elif packet_command == 5: # wifi_evt_sme_connected
-                        status, hw_interface = struct.unpack('<bB', self.bgapi_rx_payload[:2])
-                        self.wifi_evt_sme_connected({ 'status': status, 'hw_interface': hw_interface })
-                    elif packet_command == 6: # wifi_evt_sme_disconnected
-                        reason, hw_interface = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_evt_sme_disconnected({ 'reason': reason, 'hw_interface': hw_interface })
-                    elif packet_command == 7: # wifi_evt_sme_interface_status
-                        hw_interface, status = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        self.wifi_evt_sme_interface_status({ 'hw_interface': hw_interface, 'status': status })
-                    elif packet_command == 8: # wifi_evt_sme_connect_failed
-                        reason, hw_interface = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_evt_sme_connect_failed({ 'reason': reason, 'hw_interface': hw_interface })
-                    elif packet_command == 9: # wifi_evt_sme_connect_retry
-                        hw_interface = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_evt_sme_connect_retry({ 'hw_interface': hw_interface })
-                elif packet_class == 4:
-                    if packet_command == 0: # wifi_evt_tcpip_configuration
-                        use_dhcp = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_evt_tcpip_configuration({ 'use_dhcp': use_dhcp })
-                    elif packet_command == 1: # wifi_evt_tcpip_dns_configuration
-                        index = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_evt_tcpip_dns_configuration({ 'index': index })
-                    elif packet_command == 2: # wifi_evt_tcpip_endpoint_status
-                        endpoint, local_port, remote_port = struct.unpack('<BHH', self.bgapi_rx_payload[:5])
-                        self.wifi_evt_tcpip_endpoint_status({ 'endpoint': endpoint, 'local_port': local_port, 'remote_port': remote_port })
-                    elif packet_command == 3: # wifi_evt_tcpip_dns_gethostbyname_result
-                        result, name_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        name_data = self.bgapi_rx_payload[3:]
-                        self.wifi_evt_tcpip_dns_gethostbyname_result({ 'result': result, 'name': name_data })
-                elif packet_class == 5:
-                    if packet_command == 0: # wifi_evt_endpoint_syntax_error
-                        endpoint = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_evt_endpoint_syntax_error({ 'endpoint': endpoint })
-                    elif packet_command == 1: # wifi_evt_endpoint_data
-                        endpoint, data_len = struct.unpack('<BB', self.bgapi_rx_payload[:2])
-                        data_data = self.bgapi_rx_payload[2:]
-                        self.wifi_evt_endpoint_data({ 'endpoint': endpoint, 'data': data_data })
-                    elif packet_command == 2: # wifi_evt_endpoint_status
-                        endpoint, type, streaming, destination, active = struct.unpack('<BIBbB', self.bgapi_rx_payload[:8])
-                        self.wifi_evt_endpoint_status({ 'endpoint': endpoint, 'type': type, 'streaming': streaming, 'destination': destination, 'active': active })
-                    elif packet_command == 3: # wifi_evt_endpoint_closing
-                        reason, endpoint = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        self.wifi_evt_endpoint_closing({ 'reason': reason, 'endpoint': endpoint })
-                elif packet_class == 6:
-                    if packet_command == 0: # wifi_evt_hardware_soft_timer
-                        handle = struct.unpack('<B', self.bgapi_rx_payload[:1])[0]
-                        self.wifi_evt_hardware_soft_timer({ 'handle': handle })
-                    elif packet_command == 1: # wifi_evt_hardware_change_notification
-                        timestamp = struct.unpack('<I', self.bgapi_rx_payload[:4])[0]
-                        self.wifi_evt_hardware_change_notification({ 'timestamp': timestamp })
-                    elif packet_command == 2: # wifi_evt_hardware_external_interrupt
-                        irq, timestamp = struct.unpack('<BI', self.bgapi_rx_payload[:5])
-                        self.wifi_evt_hardware_external_interrupt({ 'irq': irq, 'timestamp': timestamp })
-                elif packet_class == 7:
-                    if packet_command == 0: # wifi_evt_flash_ps_key
-                        key, value_len = struct.unpack('<HB', self.bgapi_rx_payload[:3])
-                        value_data = self.bgapi_rx_payload[3:]
-                        self.wifi_evt_flash_ps_key({ 'key': key, 'value': value_data })
+                self.func(self._sender, items)
 
 # ================================================================
 